@@ -0,0 +1,139 @@
+# =============================================================================
+# BENCHMARK (host) - Assignacions de memòria per tick de cada mode
+# =============================================================================
+# Comprova que un tick en estat estacionari de cada mode (ModeLoader.
+# execute_mode: ControlFrame + tick() + music/algorithms) no crea cap objecte
+# al heap. Per a cada mode recorre una graella de CVs, amb i sense caos:
+# després d'uns ticks d'escalfament (patrons euclidians, quantitzacions
+# memoritzades), traça els ticks mesurats opcode a opcode i, a cada pas
+# dins del firmware (modes/, music/, core/), busca objectes nous:
+#   - contenidors (llistes, tuples, dicts, iteradors...): generació jove del
+#     GC, congelada (gc.freeze) després de cada pas
+#   - la resta (str, bytes, taules internes de dict/list): traces de
+#     tracemalloc amb fitxer del firmware
+# Els enters i floats no compten: a CircuitPython són immediats (no van al
+# heap), a CPython sí. El MIDI és un port nul: MidiHandler i els registres
+# de l'emulador queden fora (al dispositiu, cfg.alloc_audit ho mesura tot).
+#
+# Surt amb error si algun tick assigna: el pressupost és 0 bytes.
+#
+# Ús (des de l'arrel del repositori):
+#   python bench/bench_allocations.py
+# =============================================================================
+import gc
+import os
+import sys
+import tracemalloc
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from core import config as cfg  # noqa: E402
+from modes.loader import ModeLoader, MODE_REGISTRY  # noqa: E402
+
+FIRMWARE = tuple(os.path.join(ROOT, name) + os.sep for name in ("modes", "music", "core"))
+NUMBER_SIZES = (sys.getsizeof(1.0), sys.getsizeof(1000), sys.getsizeof(2 ** 40))
+CV_GRID = (0.3, 1.0, 1.65, 2.3, 3.0)
+WARMUP_TICKS = 16
+MEASURED_TICKS = 4
+
+
+class _NullMidi:
+    """MidiHandler que no fa res (mateixa signatura, sense *args)"""
+
+    def play_note_full(self, note, play, octava, periode, duty=0, freq1=0, freq2=0):
+        pass
+
+    def play_note_full_multi(self, nota_pwm1, nota_pwm2, nota_pwm3, play, octava, periode,
+                             duty=0, freq1=0, freq2=0):
+        pass
+
+
+class AllocationAudit:
+    """Objectes creats pel firmware durant una crida, per línia i tipus"""
+
+    def __init__(self):
+        self.found = {}  # (fitxer, línia, tipus) -> vegades
+        self._trace = self._tracer  # Mètode lligat un sol cop (no compta)
+
+    def _note(self, frame, kind):
+        key = (os.path.relpath(frame.f_code.co_filename, ROOT), frame.f_lineno, kind)
+        self.found[key] = self.found.get(key, 0) + 1
+
+    def _tracer(self, frame, event, arg):
+        if not frame.f_code.co_filename.startswith(FIRMWARE):
+            return None
+        frame.f_trace_opcodes = True
+        if event != "call":
+            young = gc.get_objects(0)
+            for obj in young:
+                if obj is not young and type(obj) is not types.FrameType:
+                    self._note(frame, type(obj).__name__)
+            del young
+            if tracemalloc.get_traced_memory()[0]:
+                for trace in tracemalloc.take_snapshot().traces:
+                    if (trace.traceback[0].filename.startswith(FIRMWARE)
+                            and trace.size not in NUMBER_SIZES):
+                        self._note(frame, f"{trace.size} B")
+        # Tot el que ja existeix (inclòs el que ha creat el traçat) queda fora
+        tracemalloc.clear_traces()
+        gc.freeze()
+        return self._trace
+
+    def run(self, func, *args):
+        gc.disable()
+        gc.freeze()
+        tracemalloc.start(1)
+        sys.settrace(self._trace)
+        try:
+            func(*args)
+        finally:
+            sys.settrace(None)
+            tracemalloc.stop()
+            gc.unfreeze()
+            gc.enable()
+
+
+def audit_mode(loader, mode_num):
+    """Retorna (ticks mesurats, AllocationAudit) d'un mode"""
+    audit = AllocationAudit()
+    ticks = 0
+    for caos in (0, 1):
+        cfg.caos = caos
+        cfg.caos_note = 1
+        for x in CV_GRID:
+            for y in CV_GRID:
+                cfg.z = y
+                cx, cy = x - 1.65, y - 1.65
+                for i in range(WARMUP_TICKS + MEASURED_TICKS):
+                    if i < WARMUP_TICKS:
+                        loader.execute_mode(mode_num, x, y, 0.125, cx, cy)
+                    else:
+                        audit.run(loader.execute_mode, mode_num, x, y, 0.125, cx, cy)
+                        ticks += 1
+                    if mode_num not in (6, 8):
+                        cfg.iteration = (cfg.iteration + 1) % 60000
+    cfg.caos = 0
+    return ticks, audit
+
+
+def main():
+    loader = ModeLoader(None, cfg, _NullMidi())
+    print(f"{'mode':<4} {'nom':<11} {'ticks':>5} {'deteccions':>10}")
+    failures = 0
+    for number, name, _, _ in MODE_REGISTRY:
+        ticks, audit = audit_mode(loader, number)
+        total = sum(audit.found.values())
+        print(f"{number:<4} {name:<11} {ticks:>5} {total:>10}")
+        for (path, line, kind), count in sorted(audit.found.items()):
+            print(f"       {path}:{line} {kind} x{count}")
+        if total:
+            failures += 1
+    if failures:
+        sys.exit(f"ERROR: {failures} modes assignen memòria en estat estacionari")
+    print("OK: cap tick en estat estacionari assigna memòria (pressupost 0 bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+# =============================================================================
+# BENCHMARK (host) - Botons per PIO amb esdeveniments vs DigitalInOut
+# =============================================================================
+# Simula polsacions amb rebots mecànics (diversos flancs en 0-4 ms a cada
+# premuda i deixada) i compara:
+#   - GPIO: sis DigitalInOut llegits cada 5 ms (com el bucle principal)
+#   - PIO:  ButtonPIOManager (rp2pio fals que interpreta el programa PIO real)
+#           consultat a cada iteració del bucle (~1 ms)
+# Tots dos camins passen per ButtonEvents. Es mesura:
+#   - correcció: PRESS/RELEASE detectats vs polsacions reals (sense dobles)
+#   - latència des del primer flanc real fins a l'esdeveniment
+#   - iteracions que fan feina (amb esdeveniments) i cost de scan() a les
+#     que no (la lectura del rp2pio fals no compta: és el cost de l'emulador)
+# Al final executa main.py amb l'emulador amb tots dos camins i compara
+# l'estat resultant (octava, mode, configuració).
+#
+# Ús (des de l'arrel del repositori):
+#   python bench/bench_buttons.py
+# =============================================================================
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from emulator import install, uninstall, runtime  # noqa: E402
+from emulator.scenario import Scenario, BUTTON_PINS  # noqa: E402
+
+SECONDS = 20.0
+LOOP_PERIOD = 0.001
+GPIO_PERIOD = 0.005
+ORDER = ("crueta_1", "crueta_2", "crueta_3", "crueta_4", "extra_1", "extra_2")
+
+
+def bouncy_presses(rng, seconds):
+    """(botons per a l'escenari, llista de (índex, t_premut, t_deixat))"""
+    intervals = []
+    presses = []
+    t = 0.3
+    while t < seconds - 1.0:
+        index = rng.randrange(len(ORDER))
+        name = ORDER[index]
+        hold = rng.uniform(0.06, 0.4)
+        down, up = t, t + hold
+        presses.append((index, down, up))
+        # Rebots: polsos curts abans d'assentar-se (premuda i deixada)
+        edge = down
+        for _ in range(rng.randint(0, 4)):
+            width = rng.uniform(0.0002, 0.001)
+            intervals.append((name, edge, edge + width))
+            edge += width + rng.uniform(0.0002, 0.001)
+        settle_up = up
+        intervals.append((name, edge, settle_up))
+        edge = settle_up
+        for _ in range(rng.randint(0, 4)):
+            gap = rng.uniform(0.0002, 0.001)
+            width = rng.uniform(0.0002, 0.001)
+            intervals.append((name, edge + gap, edge + gap + width))
+            edge += gap + width
+        t = up + rng.uniform(0.08, 0.5)
+    return intervals, presses
+
+
+def simulate(use_pio, intervals, presses):
+    from core.button_events import ButtonEvents, PRESS, RELEASE, BUTTON_MASK, EVENT_SHIFT
+
+    emu = install(Scenario(buttons=intervals))
+    try:
+        import board
+        pins = [getattr(board, BUTTON_PINS[name]) for name in ORDER]
+        if use_pio:
+            from core.pio_buttons import ButtonPIOManager
+            manager = ButtonPIOManager(pins)
+
+            def read():
+                manager.update()
+                return manager.mask
+            period = LOOP_PERIOD
+        else:
+            import digitalio
+            buttons = [digitalio.DigitalInOut(pin) for pin in pins]
+
+            def read():
+                mask = 0
+                for i, button in enumerate(buttons):
+                    if button.value:
+                        mask |= 1 << i
+                return mask
+            period = GPIO_PERIOD
+
+        events = ButtonEvents(6, 20, (0,) * 6, (0,) * 6, (0,) * 6)
+        detected = []
+        idle_host = 0.0
+        idle_loops = 0
+        busy_loops = 0
+        while emu.clock.now < SECONDS:
+            now = emu.clock.now
+            mask = read()
+            start = time.perf_counter()
+            pending = events.scan(mask, int(now * 1000))
+            elapsed = time.perf_counter() - start
+            if pending:
+                busy_loops += 1
+                while events.pending:
+                    event = events.pop()
+                    detected.append((event & BUTTON_MASK, event >> EVENT_SHIFT, now))
+            else:
+                idle_loops += 1
+                idle_host += elapsed
+            emu.clock.advance(period)
+    finally:
+        uninstall()
+
+    # Aparellar cada polsació real amb el PRESS/RELEASE detectats
+    press_lat = []
+    release_lat = []
+    extra = 0
+    for index, down, up in presses:
+        got = [(kind, t) for button, kind, t in detected
+               if button == index and down - 0.001 <= t < up + 0.06]
+        kinds = [kind for kind, _ in got]
+        if kinds.count(PRESS) != 1 or kinds.count(RELEASE) != 1:
+            extra += abs(kinds.count(PRESS) - 1) + abs(kinds.count(RELEASE) - 1)
+        for kind, t in got:
+            if kind == PRESS:
+                press_lat.append((t - down) * 1000.0)
+            elif kind == RELEASE:
+                release_lat.append((t - up) * 1000.0)
+    return {
+        "presses": len(presses),
+        "events": len(detected),
+        "errors": extra,
+        "press": press_lat,
+        "release": release_lat,
+        "busy": busy_loops,
+        "idle": idle_loops,
+        "idle_us": idle_host / max(1, idle_loops) * 1e6,
+    }
+
+
+def run_emulated(use_pio):
+    from emulator.run import run_firmware
+
+    buttons = [("crueta_1", 1.0, 1.05), ("crueta_1", 1.3, 1.35), ("crueta_2", 1.6, 1.9),
+               ("crueta_4", 2.0, 2.5), ("extra_1", 2.7, 2.8), ("crueta_4", 3.0, 3.02),
+               ("extra_1", 3.3, 3.4), ("crueta_3", 3.6, 3.62), ("extra_2", 4.0, 4.1)]
+    run_firmware(Scenario(buttons=buttons), seconds=5.0, mode=3, skip_intro=True,
+                 config={"pio_buttons": use_pio})
+    from core import config as cfg
+    return (cfg.octava, cfg.loop_mode, cfg.configout, cfg.duty1, cfg.duty2)
+
+
+def main():
+    rng = random.Random(11)
+    intervals, presses = bouncy_presses(rng, SECONDS)
+    print(f"{len(presses)} polsacions amb rebots en {SECONDS:.0f} s virtuals")
+    print(f"{'camí':>5} {'esdev':>6} {'errors':>6} {'premut ms':>15} {'deixat ms':>15} "
+          f"{'iter feina':>10} {'iter buides':>11} {'us/buida':>8}")
+    for name, use_pio in (("GPIO", False), ("PIO", True)):
+        r = simulate(use_pio, intervals, presses)
+        press = sorted(r["press"])
+        release = sorted(r["release"])
+        print(f"{name:>5} {r['events']:>6} {r['errors']:>6} "
+              f"{sum(press) / len(press):>6.2f} / {press[-1]:>6.2f} "
+              f"{sum(release) / len(release):>6.2f} / {release[-1]:>6.2f} "
+              f"{r['busy']:>10} {r['idle']:>11} {r['idle_us']:>8.2f}")
+    print("(latència: mitjana / màxim)")
+    print()
+
+    gpio = run_emulated(False)
+    pio = run_emulated(True)
+    print(f"emulador main.py (octava, mode, configout, duty1, duty2): GPIO {gpio}  PIO {pio}")
+    assert gpio[:3] == pio[:3], (gpio, pio)
+
+
+if __name__ == "__main__":
+    main()
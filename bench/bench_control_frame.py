@@ -0,0 +1,86 @@
+# =============================================================================
+# BENCHMARK (host) - Paràmetres dels modes: normalize() per tick vs ControlFrame
+# =============================================================================
+# Reprodueix la feina de conversió de CVs del mode Cosmos (el que més
+# normalitza: 3 vegades x i 3 vegades y per tick) i del mode Escala:
+#   - abans: converters.normalize() a cada accés
+#   - ara:   ControlFrame.update() + nx/ny i qx()/qy() memoritzats
+# amb CVs fixos (cas habitual: ningú toca els potes) i amb CVs que canvien a
+# cada tick (pitjor cas).
+#
+# Ús (des de l'arrel del repositori):
+#   python bench/bench_control_frame.py
+# =============================================================================
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from core.control_frame import ControlFrame  # noqa: E402
+from music import converters  # noqa: E402
+
+TICKS = 100000
+
+
+def _cfg():
+    return SimpleNamespace(cv1_min=0.2, cv1_max=3.0, cv2_min=0.1, cv2_max=3.2)
+
+
+def legacy(cfg, inputs):
+    total = 0
+    for x, y in inputs:
+        # Cosmos
+        freq_ona = converters.normalize(x, cfg.cv1_min, cfg.cv1_max) * 127
+        amplitude_ona = converters.normalize(y, cfg.cv2_min, cfg.cv2_max) * 2
+        perfil = int(converters.normalize(x, cfg.cv1_min, cfg.cv1_max) * 10.999)
+        tensio = int(converters.normalize(y, cfg.cv2_min, cfg.cv2_max) * 10.999)
+        pulsos = int(converters.normalize(x, cfg.cv1_min, cfg.cv1_max) * 35.999) + 1
+        steps_ritme = int(converters.normalize(y, cfg.cv2_min, cfg.cv2_max) * 35.999) + 2
+        # Escala
+        tonalidad = int(converters.normalize(x, cfg.cv1_min, cfg.cv1_max) * 6.999)
+        salto = int(converters.normalize(y, cfg.cv2_min, cfg.cv2_max) * 31.999) + 1
+        total += perfil + tensio + pulsos + steps_ritme + tonalidad + salto
+        total += int(freq_ona + amplitude_ona)
+    return total
+
+
+def framed(cfg, inputs):
+    frame = ControlFrame(cfg)
+    total = 0
+    for x, y in inputs:
+        frame.update(x, y)
+        freq_ona = frame.nx * 127
+        amplitude_ona = frame.ny * 2
+        perfil = frame.qx(11)
+        tensio = frame.qy(11)
+        pulsos = frame.qx(36) + 1
+        steps_ritme = frame.qy(36) + 2
+        tonalidad = frame.qx(7)
+        salto = frame.qy(32) + 1
+        total += perfil + tensio + pulsos + steps_ritme + tonalidad + salto
+        total += int(freq_ona + amplitude_ona)
+    return total
+
+
+def measure(fn, inputs):
+    cfg = _cfg()
+    start = time.perf_counter()
+    result = fn(cfg, inputs)
+    return (time.perf_counter() - start) / len(inputs) * 1e6, result
+
+
+def main():
+    steady = [(1.3, 2.1)] * TICKS
+    moving = [(0.2 + 2.8 * i / TICKS, 3.2 - 3.1 * i / TICKS) for i in range(TICKS)]
+    print(f"{'CVs':>8} {'normalize us/tick':>18} {'frame us/tick':>14} {'iguals':>7}")
+    for name, inputs in (("fixos", steady), ("canviant", moving)):
+        before, a = measure(legacy, inputs)
+        after, b = measure(framed, inputs)
+        print(f"{name:>8} {before:>18.3f} {after:>14.3f} {str(a == b):>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# =============================================================================
+# BENCHMARK (host) - Conversions nota -> PWM: fórmula vs taules precalculades
+# =============================================================================
+# Verifica que les taules de music.converters donen exactament el mateix
+# resultat que les fórmules originals i mesura el cost per crida del camí
+# complet que fa MidiHandler.play_note_full per a cada PWM.
+#
+# Ús (des de l'arrel del repositori):
+#   python bench/bench_converters.py
+# =============================================================================
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from music import converters  # noqa: E402
+
+ROUNDS = 200
+
+
+# --- Implementacions anteriors (referència) ---------------------------------
+def legacy_midi_to_frequency(midi_note):
+    return round(440 * (2 ** ((midi_note - 69) / 12)))
+
+
+def legacy_apply_harmonic_interval(note, harmonic_type):
+    harmonic_intervals = {
+        0: 0, 1: 1, 2: 2, 3: 3, 4: 4, 5: 5, 6: 6,
+        7: 7, 8: 8, 9: 9, 10: 10, 11: 11, 12: 12,
+    }
+    harmonic = harmonic_intervals.get(harmonic_type, 0)
+    nota_modificada = note + harmonic
+    if nota_modificada >= 127:
+        nota_modificada = note
+    return nota_modificada
+
+
+def legacy_duty_percent_to_cycle(percent):
+    return int((percent / 100.0) * 65535)
+
+
+# --- Verificació ------------------------------------------------------------
+def check_identical():
+    for note in range(-12, 140):
+        assert converters.midi_to_frequency(note) == legacy_midi_to_frequency(note), note
+        for harm in range(-2, 16):
+            assert converters.apply_harmonic_interval(note, harm) == \
+                legacy_apply_harmonic_interval(note, harm), (note, harm)
+    for percent in range(0, 101):
+        assert converters.duty_percent_to_cycle(percent) == \
+            legacy_duty_percent_to_cycle(percent), percent
+
+
+# --- Mesura -----------------------------------------------------------------
+def _note_path(to_freq, harmonic, to_duty):
+    start = time.perf_counter_ns()
+    for _ in range(ROUNDS):
+        for note in range(128):
+            for harm in range(13):
+                to_freq(harmonic(note, harm))
+                to_duty(50)
+    return (time.perf_counter_ns() - start) / (ROUNDS * 128 * 13)
+
+
+def main():
+    check_identical()
+    print("OK: taules idèntiques a les fórmules originals")
+
+    legacy_ns = _note_path(
+        legacy_midi_to_frequency,
+        legacy_apply_harmonic_interval,
+        legacy_duty_percent_to_cycle,
+    )
+    table_ns = _note_path(
+        converters.midi_to_frequency,
+        converters.apply_harmonic_interval,
+        converters.duty_percent_to_cycle,
+    )
+    print(f"fórmula: {legacy_ns:7.0f} ns/PWM")
+    print(f"taules:  {table_ns:7.0f} ns/PWM  (x{legacy_ns / table_ns:.1f})")
+
+
+if __name__ == "__main__":
+    main()
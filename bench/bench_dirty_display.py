@@ -0,0 +1,80 @@
+# =============================================================================
+# BENCHMARK (host) - Bytes I2C per frame: show() complet vs DirtyDisplay
+# =============================================================================
+# Simula la pantalla principal (_mostrar_param_actual) mentre canvien la nota
+# i l'octava, i compta els bytes que arriben al bus I2C. Verifica també que
+# la memòria de vídeo del panell simulat acaba idèntica al framebuffer, també
+# amb l'enviament per porcions (deferred + flush_step(), com al planificador).
+#
+# Ús (des de l'arrel del repositori):
+#   python bench/bench_dirty_display.py
+# =============================================================================
+import os
+import sys
+from types import SimpleNamespace
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from emulator.circuitpython.adafruit_ssd1306 import SSD1306_I2C  # noqa: E402
+from display.dirty_display import DirtyDisplay  # noqa: E402
+from display.screens import ScreenManager  # noqa: E402
+
+FRAMES = 200
+I2C_HZ = 400000  # Bus I2C a 400 kHz (9 bits per byte)
+
+
+def _run(display, after_frame=None):
+    hw = SimpleNamespace(display=display)
+    cfg = SimpleNamespace(configout=0, loop_mode=3, octava=5, nota_actual=60,
+                          duty1=50, duty2=50, duty3=50, freqharm_base=0,
+                          freqharm1=0, freqharm2=0)
+    screen = ScreenManager(hw, cfg)
+    for frame in range(FRAMES):
+        cfg.nota_actual = 48 + (frame * 5) % 24
+        if frame % 50 == 0:
+            cfg.octava = 3 + (frame // 50) % 4
+        screen._mostrar_param_actual()
+        if after_frame is not None:
+            after_frame()
+
+
+def main():
+    full = SSD1306_I2C(128, 64, None)
+    _run(full)
+
+    raw = SSD1306_I2C(128, 64, None)
+    dirty = DirtyDisplay(raw)
+    _run(dirty)
+    assert raw.i2c_device.ram == raw.buffer[1:], "GDDRAM diferent del framebuffer"
+
+    for label, panel in (("show() complet", full.i2c_device), ("DirtyDisplay", raw.i2c_device)):
+        per_frame = panel.bytes / FRAMES
+        ms = per_frame * 9 * 1000 / I2C_HZ
+        print(f"{label:15} {per_frame:7.0f} bytes/frame  ~{ms:5.2f} ms I2C a 400 kHz")
+    print(f"pàgines enviades: {dirty.pages_sent} de {dirty.flushes * dirty.pages}")
+
+    # Per porcions: una finestra de com a molt chunk_columns per flush_step()
+    raw = SSD1306_I2C(128, 64, None)
+    sliced = DirtyDisplay(raw)
+    sliced.deferred = True
+    slices = []
+
+    def flush():
+        more = True
+        while more:
+            before = raw.i2c_device.bytes
+            more = sliced.flush_step()
+            if raw.i2c_device.bytes > before:
+                slices.append(raw.i2c_device.bytes - before)
+
+    _run(sliced, flush)
+    assert raw.i2c_device.ram == raw.buffer[1:], "GDDRAM diferent del framebuffer (porcions)"
+    worst = max(slices)
+    print(f"per porcions:   {len(slices) / FRAMES:7.1f} porcions/frame, pitjor {worst} bytes "
+          f"(~{worst * 9 * 1000 / I2C_HZ:.2f} ms a 400 kHz, ~{worst * 9 * 1000 / 100000:.2f} ms a 100 kHz)")
+    print("OK: memòria del panell idèntica al framebuffer")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# =============================================================================
+# BENCHMARK (host) - Patrons euclidians: generació per tick vs cache LRU
+# =============================================================================
+# Verifica que algorithms.euclid_pattern() dona els mateixos patrons que
+# generar_ritmo_euclideo() (també amb rotació) i mesura el cost per tick del
+# Mode 8 Cosmos quan els CVs no es mouen i quan es mouen contínuament.
+#
+# Ús (des de l'arrel del repositori):
+#   python bench/bench_euclid_cache.py
+# =============================================================================
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from music import algorithms  # noqa: E402
+
+ITERATIONS = 20000
+
+
+def check_identical():
+    for steps in range(1, 40):
+        for pulses in range(0, steps + 3):
+            base = algorithms.generar_ritmo_euclideo(pulses, steps)
+            for rotation in range(steps):
+                expected = [base[(i + rotation) % steps] for i in range(steps)]
+                got = algorithms.euclid_pattern(pulses, steps, rotation)
+                assert list(got) == expected, (pulses, steps, rotation)
+    assert len(algorithms._euclid_cache) <= algorithms.EUCLID_CACHE_SIZE
+    assert len(algorithms._euclid_order) == len(algorithms._euclid_cache)
+
+
+def _time(lookup, params):
+    count = len(params)
+    start = time.perf_counter_ns()
+    for i in range(ITERATIONS):
+        pulses, steps = params[i % count]
+        pattern = lookup(pulses, steps)
+        pattern[i % len(pattern)]
+    return (time.perf_counter_ns() - start) / ITERATIONS
+
+
+def main():
+    check_identical()
+    print("OK: patrons idèntics a generar_ritmo_euclideo (amb rotació)")
+
+    # Cosmos: pulsos 1-36, steps 2-37 segons CV1/CV2
+    static = [(9, 23)]
+    sweep = [(1 + (i % 36), 2 + ((i * 7) % 36)) for i in range(24)]
+
+    for label, params in (("CVs quiets", static), ("CVs en moviment", sweep)):
+        algorithms.euclid_cache_clear()
+        legacy_ns = _time(algorithms.generar_ritmo_euclideo, params)
+        cached_ns = _time(algorithms.euclid_pattern, params)
+        print(f"{label:16} generar: {legacy_ns:7.0f} ns  cache: {cached_ns:6.0f} ns"
+              f"  (x{legacy_ns / cached_ns:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# =============================================================================
+# BENCHMARK (host) - Imatges grans: renderització procedural vs FrameCache
+# =============================================================================
+# Per cada mode compara el cost de _renderitzar_imatge_gran() amb la còpia
+# des de la cache de framebuffers i verifica que el resultat és idèntic
+# píxel a píxel.
+#
+# Ús (des de l'arrel del repositori):
+#   python bench/bench_frame_cache.py
+# =============================================================================
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from emulator.circuitpython.adafruit_ssd1306 import SSD1306_I2C  # noqa: E402
+from display.screens import ScreenManager  # noqa: E402
+
+ROUNDS = 20
+
+
+def _draw(screen, mode, seed):
+    screen.hw.display.fill(0)
+    random.seed(seed)
+    start = time.perf_counter_ns()
+    screen._dibuixar_imatge_gran(mode)
+    return time.perf_counter_ns() - start
+
+
+def main():
+    display = SSD1306_I2C(128, 64, None)
+    hw = SimpleNamespace(display=display)
+    cfg = SimpleNamespace(loop_mode=1)
+
+    print(f"{'mode':>4} {'procedural us':>14} {'cache us':>9} {'ràtio':>6}")
+    for mode in range(1, 15):
+        reference = ScreenManager(hw, cfg)
+        reference.image_cache.capacity = 0  # sense cache: sempre renderitza
+        cached = ScreenManager(hw, cfg)
+
+        render_ns = min(_draw(reference, mode, n) for n in range(ROUNDS))
+        _draw(cached, mode, 0)  # Primera vegada: renderitza i desa
+        blit_ns = min(_draw(cached, mode, n) for n in range(ROUNDS))
+
+        for seed in (1, 2):
+            reference.image_cache.clear()
+            _draw(reference, mode, seed)
+            expected = bytes(display.buffer)
+            _draw(cached, mode, seed)
+            assert bytes(display.buffer) == expected, f"mode {mode}: imatge diferent"
+
+        print(f"{mode:>4} {render_ns / 1000:>14.0f} {blit_ns / 1000:>9.0f} "
+              f"{render_ns / blit_ns:>6.0f}")
+    print("OK: imatges de la cache idèntiques a la renderització procedural")
+
+
+if __name__ == "__main__":
+    main()
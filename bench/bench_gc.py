@@ -0,0 +1,74 @@
+# =============================================================================
+# BENCHMARK (host) - Recol·leccions del GC fora del compàs
+# =============================================================================
+# Executa main.py amb l'emulador i un heap virtual (emulator/heap.py: bytes
+# assignats per lectura del rellotge, pausa proporcional al heap) i compara
+# el retard dels ticks (tick_late) i el jitter dels TimingClock (clk_jit):
+#
+#   auto     - cfg.gc_managed = False: la VM recol·lecta quan el heap
+#              s'omple, sigui on sigui del bucle
+#   gestor   - GCManager: GC automàtic desactivat i gc.collect() al marge
+#              abans del pròxim tick (sostre de seguretat a gc_max_heap)
+#
+# "pausa" és la pausa màxima del model del heap virtual; "sobre" compta les
+# recol·leccions que han caigut a sobre d'un TimingClock (el pols arriba
+# durant la pausa o a menys de guard_us del final).
+#
+# Ús (des de l'arrel del repositori):
+#   python bench/bench_gc.py [segons] [bytes_per_lectura]
+# =============================================================================
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from emulator.heap import VirtualHeap  # noqa: E402
+from emulator.run import run_firmware  # noqa: E402
+from emulator.scenario import Scenario, sine, ramp  # noqa: E402
+
+
+def run(seconds, bytes_per_read, managed):
+    heap = VirtualHeap(bytes_per_read=bytes_per_read)
+    scenario = Scenario(cv1=sine(1.5, 1.2, 0.3), cv2=ramp(0.2, 3.0, seconds))
+    config = {"midi_clock_out": True, "gc_managed": managed}
+    emu = run_firmware(scenario, seconds=seconds, mode=3, skip_intro=True,
+                       config=config, heap=heap)
+    from core import config as cfg
+    from core import profiler as prof
+    p = cfg.profiler
+    # Deadlines musicals: TimingClock enviats (els ticks cauen a sobre)
+    pulses = emu.realtime()
+    guard = cfg.scheduler_guard_us / 1000000
+    on_beat = 0
+    for start, pause, _ in heap.collections:
+        if any(start <= t <= start + pause + guard for t in pulses):
+            on_beat += 1
+    return {
+        "collections": len(heap.collections),
+        "auto": sum(1 for c in heap.collections if c[2]),
+        "forced": cfg.gc_manager.forced,
+        "pause": max((c[1] for c in heap.collections), default=0.0) * 1000000,
+        "hits": on_beat,
+        "late": [p.percentile(prof.STAGE_TICK_LATE, f) for f in (0.5, 0.99, 1.0)],
+        "jit": [p.percentile(prof.STAGE_CLOCK_JITTER, f) for f in (0.99, 1.0)],
+        "ticks": p.counts[prof.STAGE_TICK_LATE],
+    }
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 8.0
+    bytes_per_read = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    print(f"{seconds:.0f} s virtuals, {bytes_per_read} B per lectura del rellotge (temps en us)")
+    print(f"{'GC':<7} {'ticks':>5} {'collect':>7} {'auto':>5} {'forç':>4} {'pausa':>6} {'sobre':>5} "
+          f"{'late p50':>8} {'p99':>7} {'max':>7} {'jit p99':>7} {'max':>7}")
+    for label, managed in (("auto", False), ("gestor", True)):
+        r = run(seconds, bytes_per_read, managed)
+        late = r["late"]
+        print(f"{label:<7} {r['ticks']:>5} {r['collections']:>7} {r['auto']:>5} {r['forced']:>4} "
+              f"{r['pause']:>6.0f} {r['hits']:>5} {late[0]:>8} {late[1]:>7} {late[2]:>7} "
+              f"{r['jit'][0]:>7} {r['jit'][1]:>7}")
+
+
+if __name__ == "__main__":
+    main()
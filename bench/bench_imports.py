@@ -0,0 +1,117 @@
+# =============================================================================
+# BENCHMARK (host) - Imports de l'arrencada fins al bucle principal
+# =============================================================================
+# Arrenca main.py amb l'emulador dins d'un ImportProfiler (core/
+# import_profiler.py) amb rellotge real (perf_counter) i heap de tracemalloc,
+# i mesura els imports del firmware (core, display, modes, music i
+# adafruit_midi) fins que main.py entra al bucle:
+#
+#   arrencada  - imports fets abans del bucle (amb els diferits de
+#                core/lazy.py sense carregar)
+#   diferits   - core.calibration, que abans s'importava a l'arrencada i
+#                ara només en activar la calibració
+#   anticipat  - arrencada + diferits (el que costava abans)
+#
+# Cada mesura s'executa en un intèrpret nou sense la memòria cau de bytecode
+# (PYTHONPYCACHEPREFIX buit i -B): cada .py es compila, com a CircuitPython.
+# Els mòduls estàndard que a CircuitPython són integrats (math, random,
+# struct...) es carreguen abans de mesurar.
+#
+# Ús (des de l'arrel del repositori):
+#   python bench/bench_imports.py [intèrprets]
+# =============================================================================
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DEFERRED = ("core.calibration",)
+
+# Executat en un intèrpret nou: imprimeix els registres en JSON
+CHILD = r"""
+import json, sys, time, tracemalloc
+sys.path.insert(0, ROOT)
+import binascii, gc, math, random, struct  # Integrats a CircuitPython: fora de la mesura
+from core.import_profiler import ImportProfiler
+from emulator.run import run_firmware
+tracemalloc.start()
+profiler = ImportProfiler(clock=time.perf_counter_ns,
+                          mem_alloc=lambda: tracemalloc.get_traced_memory()[0])
+profiler.start()
+run_firmware(seconds=0.5, mode=3, skip_intro=True)
+boot = len(profiler.records)
+loaded = [name for name in DEFERRED if name in sys.modules]
+for name in DEFERRED:
+    __import__(name)
+profiler.stop()
+print(json.dumps({"records": profiler.records, "boot": boot, "loaded": loaded}))
+"""
+
+
+def firmware(name):
+    top = name.split(".")[0]
+    return top in ("core", "display", "modes", "music", "adafruit_midi")
+
+
+def measure():
+    code = CHILD.replace("ROOT", repr(ROOT)).replace("DEFERRED", repr(DEFERRED))
+    with tempfile.TemporaryDirectory() as cache:
+        env = dict(os.environ, PYTHONPYCACHEPREFIX=cache)
+        out = subprocess.run([sys.executable, "-B", "-c", code], capture_output=True,
+                             text=True, check=True, env=env)
+    return json.loads(out.stdout.splitlines()[-1])
+
+
+def totals(records):
+    """(mòduls, us, bytes) dels imports del firmware que no són dins d'un altre"""
+    count = us = used = 0
+    inside = -1  # Profunditat del registre del firmware que conté els següents
+    for name, depth, total_us, _, total_bytes, _ in records:
+        if inside >= 0 and depth > inside:
+            count += firmware(name)
+            continue
+        inside = -1
+        if firmware(name):
+            count += 1
+            us += total_us
+            used += total_bytes
+            inside = depth
+    return count, us, used
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    results = []
+    for _ in range(runs):
+        result = measure()
+        records = result["records"]
+        boot = records[:result["boot"]]
+        deferred = records[result["boot"]:]
+        results.append((totals(boot), totals(deferred), boot, result["loaded"]))
+    results.sort(key=lambda r: r[0][1])
+    boot_totals, deferred_totals, boot, loaded = results[len(results) // 2]  # Mediana
+
+    print(f"imports del firmware fins al bucle (host sense bytecode, mediana de {runs})")
+    print(f"{'':<11} {'mòduls':>6} {'ms':>7} {'KB':>7}")
+    eager = tuple(a + b for a, b in zip(boot_totals, deferred_totals))
+    for label, (count, us, used) in (("arrencada", boot_totals), ("diferits", deferred_totals),
+                                     ("anticipat", eager)):
+        print(f"{label:<11} {count:>6} {us / 1000:>7.1f} {used / 1024:>7.1f}")
+    print(f"reducció: {(1 - boot_totals[1] / eager[1]) * 100:.0f}% temps, "
+          f"{(1 - boot_totals[2] / eager[2]) * 100:.0f}% heap")
+    print()
+    print("mòduls amb més temps propi a l'arrencada")
+    print(f"{'propi ms':>8} {'total ms':>8} {'propi KB':>8}  mòdul")
+    ranked = sorted((r for r in boot if firmware(r[0])), key=lambda r: r[3], reverse=True)
+    for name, depth, total_us, self_us, _, self_bytes in ranked[:12]:
+        print(f"{self_us / 1000:>8.1f} {total_us / 1000:>8.1f} {self_bytes / 1024:>8.1f}  {name}")
+    if loaded:
+        sys.exit(f"ERROR: mòduls diferits carregats a l'arrencada: {', '.join(loaded)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+# =============================================================================
+# BENCHMARK (host) - Lectura directa dels ADC vs InputSampler
+# =============================================================================
+# ADC simulat amb soroll gaussià i pics ocasionals (com l'ADC del RP2040).
+# Compara, per iteració del bucle principal:
+#   - abans: 3 x hw.get_voltage() + clamp a cada iteració
+#   - ara:   InputSampler.update() (200 Hz, 5 lectures, mediana)
+# el cost de CPU, el soroll de x (CV1) amb una entrada fixa, quantes
+# iteracions veuen un valor nou i el retard davant d'un salt de l'entrada.
+# Al final executa main.py amb l'emulador (CPU host escalada) i mostra les
+# iteracions/s del bucle i l'etapa inputs del profiler.
+#
+# Ús (des de l'arrel del repositori):
+#   python bench/bench_input_sampler.py
+# =============================================================================
+import math
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from core.input_sampler import InputSampler  # noqa: E402
+from music.converters import get_voltage_calibrated  # noqa: E402
+
+LOOP_PERIOD = 0.0007  # ~1400 iteracions/s (com el bucle real)
+SECONDS = 4.0
+NOISE_SD = 0.006      # Volts
+SPIKE_PROB = 0.01
+SPIKE_VOLTS = 0.08
+
+
+class _NoisyPin:
+    """AnalogIn simulat: voltatge(t) + soroll, en comptes de 16 bits"""
+
+    def __init__(self, clock, curve, rng):
+        self.clock = clock
+        self.curve = curve
+        self.rng = rng
+
+    @property
+    def value(self):
+        volts = self.curve(self.clock.now) + self.rng.gauss(0.0, NOISE_SD)
+        if self.rng.random() < SPIKE_PROB:
+            volts += SPIKE_VOLTS if self.rng.random() < 0.5 else -SPIKE_VOLTS
+        return max(0, min(65535, int(volts / 3.3 * 65536)))
+
+
+def _make(curve, seed=5):
+    rng = random.Random(seed)
+    clock = SimpleNamespace(now=0.0)
+    hw = SimpleNamespace(
+        slider=_NoisyPin(clock, lambda t: 1.65, rng),
+        cv1_pote=_NoisyPin(clock, curve, rng),
+        cv2_ldr=_NoisyPin(clock, lambda t: 1.0, rng),
+        get_voltage=lambda pin: (pin.value * 3.3) / 65536,
+    )
+    cfg = SimpleNamespace(
+        cv1_min=0.0, cv1_max=3.3, cv2_min=0.0, cv2_max=3.3,
+        input_sample_rate=200, input_oversample=5, input_filter="median",
+        input_change_threshold=0.01,
+    )
+    return clock, hw, cfg
+
+
+def run_legacy(curve):
+    clock, hw, cfg = _make(curve)
+    xs = []
+    steps = int(SECONDS / LOOP_PERIOD)
+    start = time.perf_counter()
+    for i in range(steps):
+        clock.now = i * LOOP_PERIOD
+        z = hw.get_voltage(hw.slider)
+        x_raw = hw.get_voltage(hw.cv1_pote)
+        y_raw = hw.get_voltage(hw.cv2_ldr)
+        x = get_voltage_calibrated(x_raw, cfg.cv1_min, cfg.cv1_max)
+        get_voltage_calibrated(y_raw, cfg.cv2_min, cfg.cv2_max)
+        xs.append(x)
+    elapsed = time.perf_counter() - start
+    return xs, elapsed / steps, steps, steps * 3
+
+
+def run_sampler(curve, **options):
+    clock, hw, cfg = _make(curve)
+    sampler = InputSampler(hw, cfg, **options)
+    xs = []
+    updates = 0
+    steps = int(SECONDS / LOOP_PERIOD)
+    start = time.perf_counter()
+    for i in range(steps):
+        clock.now = i * LOOP_PERIOD
+        if sampler.update(clock.now):
+            updates += 1
+        xs.append(sampler.x_buffered)
+    elapsed = time.perf_counter() - start
+    return xs, elapsed / steps, updates, sampler.samples * 3 * sampler.oversample
+
+
+def noise(xs, skip=100):
+    values = xs[skip:]
+    mean = sum(values) / len(values)
+    sd = math.sqrt(sum((v - mean) ** 2 for v in values) / len(values))
+    return sd * 1000.0, (max(values) - min(values)) * 1000.0
+
+
+def step_latency(xs, t_step=2.0, target=2.0):
+    """ms des del salt fins que x arriba a prop del valor nou"""
+    first = int(t_step / LOOP_PERIOD)
+    for i in range(first, len(xs)):
+        if abs(xs[i] - target) < 0.02:
+            return (i - first) * LOOP_PERIOD * 1000.0
+    return float("inf")
+
+
+def run_emulated(cpu_scale=20.0, seconds=5.0):
+    from emulator.run import run_firmware
+    from core import profiler as prof
+
+    run_firmware(seconds=seconds, mode=3, skip_intro=True, cpu_scale=cpu_scale)
+    from core import config as cfg
+    profiler = cfg.profiler
+    loops = profiler.counts[prof.STAGE_LOOP]
+    inputs = prof.STAGE_NAMES.index("inputs")
+    print(f"emulador (CPU host x{cpu_scale:g}): {loops / seconds:.0f} iteracions/s, "
+          f"inputs p50 {profiler.percentile(inputs, 0.5)} us "
+          f"p99 {profiler.percentile(inputs, 0.99)} us, "
+          f"{cfg.input_version} canvis publicats")
+
+
+def main():
+    steady = lambda t: 1.2  # noqa: E731
+    jump = lambda t: 1.2 if t < 2.0 else 2.0  # noqa: E731
+
+    print(f"{'lectura':>22} {'us/it':>7} {'ADC/s':>7} {'valors nous':>11} "
+          f"{'sd mV':>6} {'pp mV':>6} {'salt ms':>7}")
+    cases = (
+        ("directa (abans)", lambda c: run_legacy(c)),
+        ("sampler mediana x5", lambda c: run_sampler(c)),
+        ("sampler retallada x5", lambda c: run_sampler(c, filter_mode="trimmed")),
+        ("sampler mediana x9", lambda c: run_sampler(c, oversample=9)),
+    )
+    for name, runner in cases:
+        xs, per_iteration, updates, adc_reads = runner(steady)
+        sd, pp = noise(xs)
+        jump_xs = runner(jump)[0]
+        latency = step_latency(jump_xs)
+        print(f"{name:>22} {per_iteration * 1e6:>7.2f} {adc_reads / SECONDS:>7.0f} "
+              f"{updates:>11} {sd:>6.2f} {pp:>6.1f} {latency:>7.1f}")
+    print()
+    run_emulated()
+
+
+if __name__ == "__main__":
+    main()
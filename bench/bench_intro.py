@@ -0,0 +1,75 @@
+# =============================================================================
+# BENCHMARK (host) - Temps fins a la primera nota: intro bloquejant vs cooperativa
+# =============================================================================
+# Abans, la intro dormia entre passos i el bucle principal no arrencava fins
+# que acabava. Ara cada pas s'executa des del bucle: el temps fins a poder
+# tocar és el d'un sol pas, i el cost màxim d'un pas és el jitter afegit.
+#
+# Ús (des de l'arrel del repositori):
+#   python bench/bench_intro.py
+# =============================================================================
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from emulator.circuitpython.adafruit_ssd1306 import SSD1306_I2C  # noqa: E402
+from display.intro import IntroAnimation  # noqa: E402
+
+
+class _Led:
+    value = False
+
+
+class _FakeHardware:
+    def __init__(self):
+        self.display = SSD1306_I2C(128, 64, None)
+        self.leds = [_Led() for _ in range(7)]
+
+    def all_leds_on(self):
+        for led in self.leds:
+            led.value = True
+
+    def all_leds_off(self):
+        for led in self.leds:
+            led.value = False
+
+
+def main():
+    hw = _FakeHardware()
+    intro = IntroAnimation(hw)
+
+    # Executar tots els passos sense esperar: suma de pauses i cost de cada pas
+    intro.start(0.0)
+    steps = intro._steps
+    sleep_total = 0.0
+    step_costs = []
+    while True:
+        start = time.perf_counter_ns()
+        try:
+            delay = next(steps)
+        except StopIteration:
+            break
+        step_costs.append(time.perf_counter_ns() - start)
+        sleep_total += delay
+    render_total = sum(step_costs) / 1e9
+
+    print(f"passos de la intro:          {len(step_costs)}")
+    print(f"abans (bloquejant):          {(sleep_total + render_total) * 1000:7.0f} ms fins al bucle")
+    print(f"ara (cooperativa):           {step_costs[0] / 1e6:7.2f} ms fins al bucle (1 pas)")
+    print(f"pas més llarg (jitter host): {max(step_costs) / 1e6:7.2f} ms")
+
+    # Simulació: un botó a t=0.5s atura la intro
+    intro.start(0.0)
+    now = 0.0
+    while intro.update(now) and now < 0.5:
+        now += 0.001
+    intro.stop()
+    assert not intro.active and not any(led.value for led in hw.leds)
+    print("OK: la intro s'atura en qualsevol moment i deixa els LEDs apagats")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# =============================================================================
+# BENCHMARK (host) - Nota fractal: càlcul exacte vs graella quantitzada
+# =============================================================================
+# Comprova la precisió de algorithms.mandelbrot_grid_note() respecte
+# mandelbrot_to_midi() (nearest i bilineal) amb punts aleatoris de l'espai
+# de control [-1.5, 1.5]², i mesura el cost per consulta.
+#
+# Ús (des de l'arrel del repositori):
+#   python bench/bench_mandelbrot_grid.py
+# =============================================================================
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from music import algorithms  # noqa: E402
+
+SAMPLES = 20000
+# Pas d'un LSB de la graella en unitats del fractal (~ soroll de l'ADC)
+CELL = (algorithms.MANDEL_MAX - algorithms.MANDEL_MIN) / (algorithms.MANDEL_GRID_SIZE - 1)
+
+
+def _note_distance(a, b):
+    """Distància entre notes dins del cicle de 60 de mandelbrot_to_midi"""
+    d = abs(a - b) % 60
+    return min(d, 60 - d)
+
+
+def check_grid_points():
+    """Als punts exactes de la graella, nearest ha de coincidir sempre"""
+    for iy in range(0, algorithms.MANDEL_GRID_SIZE, 3):
+        for ix in range(0, algorithms.MANDEL_GRID_SIZE, 3):
+            cx = algorithms.MANDEL_MIN + ix * CELL
+            cy = algorithms.MANDEL_MIN + iy * CELL
+            assert algorithms.mandelbrot_grid_note(cx, cy) == \
+                algorithms.mandelbrot_to_midi(cx, cy), (ix, iy)
+
+
+def accuracy(points, bilinear):
+    exact = 0
+    noise = 0
+    within2 = 0
+    for cx, cy in points:
+        ref = algorithms.mandelbrot_to_midi(cx, cy)
+        got = algorithms.mandelbrot_grid_note(cx, cy, bilinear)
+        if got == ref:
+            exact += 1
+        if _note_distance(got, ref) <= 2:
+            within2 += 1
+        # Mateixa nota que algun punt a menys d'una cel·la (soroll de l'ADC)?
+        for dx, dy in ((0, 0), (CELL, 0), (-CELL, 0), (0, CELL), (0, -CELL)):
+            if algorithms.mandelbrot_to_midi(cx + dx, cy + dy) == got:
+                noise += 1
+                break
+    n = len(points)
+    return 100.0 * exact / n, 100.0 * within2 / n, 100.0 * noise / n
+
+
+def _time(fn, points):
+    start = time.perf_counter_ns()
+    for cx, cy in points:
+        fn(cx, cy)
+    return (time.perf_counter_ns() - start) / len(points)
+
+
+def main():
+    random.seed(1234)
+    points = [(random.uniform(-1.5, 1.5), random.uniform(-1.5, 1.5)) for _ in range(SAMPLES)]
+
+    start = time.perf_counter()
+    algorithms.mandelbrot_grid_alloc()
+    algorithms.mandelbrot_grid_fill(algorithms.MANDEL_GRID_SIZE ** 2)
+    print(f"graella completa: {(time.perf_counter() - start) * 1000:.0f} ms (host)")
+
+    check_grid_points()
+    print("OK: nearest idèntic al càlcul exacte als punts de la graella")
+
+    print(f"{'mode':9} {'exacte':>7} {'±2 notes':>9} {'dins soroll':>12}")
+    for label, bilinear in (("nearest", False), ("bilineal", True)):
+        exact, within2, noise = accuracy(points, bilinear)
+        print(f"{label:9} {exact:6.1f}% {within2:8.1f}% {noise:11.1f}%")
+
+    exact_ns = _time(algorithms.mandelbrot_to_midi, points)
+    near_ns = _time(algorithms.mandelbrot_grid_note, points)
+    bil_ns = _time(lambda cx, cy: algorithms.mandelbrot_grid_note(cx, cy, True), points)
+    print(f"exacte:   {exact_ns:7.0f} ns/consulta")
+    print(f"nearest:  {near_ns:7.0f} ns/consulta  (x{exact_ns / near_ns:.1f})")
+    print(f"bilineal: {bil_ns:7.0f} ns/consulta  (x{exact_ns / bil_ns:.1f})")
+
+
+if __name__ == "__main__":
+    main()
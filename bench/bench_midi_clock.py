@@ -0,0 +1,149 @@
+# =============================================================================
+# BENCHMARK (host) - Error de fase dels ticks amb rellotge MIDI extern
+# =============================================================================
+# Font de rellotge simulada a 24 ppqn amb el jitter d'un enllaç USB real:
+# soroll gaussià del host, quantització a trames USB d'1 ms i el bucle
+# principal que només llegeix el port cada ~2 ms (amb variació).
+#
+# Compara l'error de fase de cada tick (corxera) respecte a l'hora ideal:
+#   - ingenu: tick quan el bucle veu arribar el 12è pols
+#   - PLL:    MasterClock + MidiClockFollower (tick a l'hora estimada)
+#   - estimat: l'hora del tick que rep el mode (sense la quantització del bucle)
+#
+# Al final executa main.py amb l'emulador rebent rellotge a 100 BPM.
+#
+# Ús (des de l'arrel del repositori):
+#   python bench/bench_midi_clock.py
+# =============================================================================
+import math
+import os
+import random
+import sys
+from types import SimpleNamespace
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "lib"))
+
+from adafruit_midi.timing_clock import TimingClock  # noqa: E402
+from adafruit_midi.start import Start  # noqa: E402
+from core.clock import MasterClock  # noqa: E402
+from core.midi_sync import MidiClockFollower, PULSES_PER_TICK  # noqa: E402
+
+SECONDS = 60.0
+CLOCK = TimingClock()
+
+
+def clock_source(bpm_at, seconds, jitter_sd, rng):
+    """Llista de (hora ideal, hora d'arribada) de cada pols"""
+    pulses = []
+    t = 0.5
+    while t < seconds:
+        arrival = t + 0.002 + abs(rng.gauss(0.0, jitter_sd))
+        arrival = math.ceil(arrival * 1000.0) / 1000.0  # Trames USB d'1 ms
+        pulses.append((t, arrival))
+        t += 60.0 / (bpm_at(t) * 24)
+    # L'USB no reordena
+    for i in range(1, len(pulses)):
+        if pulses[i][1] < pulses[i - 1][1]:
+            pulses[i] = (pulses[i][0], pulses[i - 1][1])
+    return pulses
+
+
+def poll_times(seconds, rng):
+    t = 0.0
+    while t < seconds:
+        yield t
+        t += rng.uniform(0.001, 0.003)
+
+
+def simulate(pulses, seconds, rng):
+    cfg = SimpleNamespace(
+        filtered_bpm=120, bpm=120, bpm_raw=120, bpm_smoothing=0.4,
+        current_sleep_time=0.25, midi_clock_follow=True, midi_clock_active=False,
+    )
+    sync = MidiClockFollower(cfg)
+    clock = MasterClock(cfg, sync=sync)
+    ideal_ticks = [ideal for ideal, _ in pulses[::PULSES_PER_TICK]]
+
+    naive = []
+    pll = []
+    estimated = []
+    index = 0
+    seen = 0
+    sync.on_message(Start(), 0.0)
+    for now in poll_times(seconds, rng):
+        while index < len(pulses) and pulses[index][1] <= now:
+            sync.on_message(CLOCK, now)
+            if seen % PULSES_PER_TICK == 0:
+                naive.append(now)
+            seen += 1
+            index += 1
+        if sync.active:
+            sync.poll(SimpleNamespace(receive_all=lambda cb: 0), now)
+        clock.update(120, now)
+        if clock.external:
+            for tick_time in clock.consume_ticks(now):
+                pll.append(now)  # Hora real d'execució del tick
+                estimated.append(tick_time)
+    return ideal_ticks, naive, pll, estimated
+
+
+def phase_stats(ideal, fired, skip=4):
+    """Error de fase (ms): mitjana, desviació i p99 de |error - mitjana|"""
+    # Aparellar cada tick amb l'ideal més proper
+    errors = []
+    j = 0
+    for t in fired[skip:]:
+        while j + 1 < len(ideal) and abs(ideal[j + 1] - t) < abs(ideal[j] - t):
+            j += 1
+        errors.append((t - ideal[j]) * 1000.0)
+    mean = sum(errors) / len(errors)
+    sd = math.sqrt(sum((e - mean) ** 2 for e in errors) / len(errors))
+    dev = sorted(abs(e - mean) for e in errors)
+    p99 = dev[int(len(dev) * 0.99) - 1]
+    return len(errors), mean, sd, p99
+
+
+def run_case(name, bpm_at, jitter_sd, seed=3):
+    rng = random.Random(seed)
+    pulses = clock_source(bpm_at, SECONDS, jitter_sd, rng)
+    ideal, naive, pll, estimated = simulate(pulses, SECONDS, rng)
+    for label, fired in (("ingenu", naive), ("PLL", pll), ("estimat", estimated)):
+        n, mean, sd, p99 = phase_stats(ideal, fired)
+        print(f"{name:>22} {label:>7} {n:>6} {mean:>8.2f} {sd:>7.2f} {p99:>7.2f}")
+
+
+def run_emulated():
+    from emulator.run import run_firmware
+    from emulator.scenario import Scenario, constant
+
+    bpm = 100.0
+    period = 60.0 / (bpm * 24)
+    events = [(0.2, b"\xfa")]
+    t = 0.2
+    while t < 6.0:
+        events.append((t, b"\xf8"))
+        t += period
+    # Slider a un altre tempo: els ticks han de seguir el rellotge MIDI
+    scenario = Scenario(slider=constant(3.0), midi_in=events)
+    emu = run_firmware(scenario, seconds=6.0, mode=3, skip_intro=True)
+    from core import config as cfg
+    print(f"emulador: rellotge MIDI a {bpm:.0f} BPM, slider a 3.0 V -> "
+          f"cfg.bpm={cfg.bpm}, actiu={cfg.midi_clock_active}, "
+          f"{len(emu.note_ons())} NoteOn")
+    assert abs(cfg.bpm - bpm) <= 1, cfg.bpm
+
+
+def main():
+    print(f"{'cas':>22} {'ticks':>7} {'n':>6} {'mitj ms':>8} {'sd ms':>7} {'p99 ms':>7}")
+    run_case("120 BPM, jitter 1 ms", lambda t: 120.0, 0.001)
+    run_case("120 BPM, jitter 3 ms", lambda t: 120.0, 0.003)
+    run_case("90 BPM, jitter 2 ms", lambda t: 90.0, 0.002)
+    run_case("rampa 100->140 BPM", lambda t: 100.0 + 40.0 * t / SECONDS, 0.002)
+    print()
+    run_emulated()
+
+
+if __name__ == "__main__":
+    main()
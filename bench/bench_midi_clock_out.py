@@ -0,0 +1,143 @@
+# =============================================================================
+# BENCHMARK (host) - Jitter del rellotge MIDI de sortida
+# =============================================================================
+# Executa main.py amb l'emulador en diversos modes i mesura els intervals
+# entre TimingClock enviats (hores virtuals dels writes USB MIDI):
+#   - compte de polsos: 12 per tick, Start al principi
+#   - interval nominal, desviació mitjana, p99 i màxim de |interval - nominal|
+# També mostra les etapes clk_int / clk_jit del profiler (el mateix informe
+# que s'obté per sèrie amb "p").
+#
+# I comprova, amb el RTOS i un port MIDI fals (pas de 1 ms), que:
+#   - stop_all_notes() entre dos polsos (com fan els botons de duty,
+#     harmònics i canvi de mode) no atura els polsos ni provoca ràfegues
+#   - un tick que arriba abans d'hora (tempo accelerat) reparteix els polsos
+#     que falten dins del tick següent en lloc d'enviar-los de cop
+#
+# Ús (des de l'arrel del repositori):
+#   python bench/bench_midi_clock_out.py [segons] [cpu_scale]
+# =============================================================================
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from core import config as cfg  # noqa: E402
+from core.midi_clock_out import MidiClockOutput, TIMING_CLOCK  # noqa: E402
+from core.rtos import RTOSManager  # noqa: E402
+from emulator.run import run_firmware  # noqa: E402
+
+MODES = (1, 3, 7, 9, 13)
+
+
+def measure(mode, seconds, cpu_scale):
+    emu = run_firmware(seconds=seconds, mode=mode, skip_intro=True, cpu_scale=cpu_scale)
+    from core import config as cfg
+    clocks = emu.realtime(0xF8)
+    starts = emu.realtime(0xFA)
+    assert len(starts) == 1, starts
+    assert clocks and clocks[0] >= starts[0]
+
+    nominal = 30.0 / cfg.bpm / 12 * 1000.0
+    # Ignorar els primers polsos (el BPM filtrat encara s'està assentant)
+    intervals = [(b - a) * 1000.0 for a, b in zip(clocks[24:], clocks[25:])]
+    jitter = sorted(abs(i - nominal) for i in intervals)
+    mean = sum(jitter) / len(jitter)
+    p99 = jitter[int(len(jitter) * 0.99) - 1]
+    lines = cfg.profiler.report().splitlines()
+    return len(clocks), nominal, mean, p99, jitter[-1], lines[-2:]
+
+
+class _Pin:
+    value = False
+
+
+class _Midi:
+    def __init__(self, clock):
+        self.clock = clock
+        self.pulses = []
+
+    def send_realtime(self, byte):
+        if byte == TIMING_CLOCK:
+            self.pulses.append(self.clock[0])
+
+    def send_note_off(self, note, velocity):
+        pass
+
+
+class _Hardware:
+    def __init__(self, clock):
+        self.midi = _Midi(clock)
+        self.out_jack = _Pin()
+        self.led_2 = _Pin()
+
+
+def simulate(tick_times, tick_period, stops=(), end=None):
+    """Polsos enviats (hores en s) amb ticks a tick_times i stop_all_notes a stops"""
+    now = [0.0]
+    hw = _Hardware(now)
+    rtos = RTOSManager(hw, cfg)
+    out = MidiClockOutput(hw, rtos.timers)
+    rtos.clock_output = out
+    out.start()
+    ticks = list(tick_times)
+    stops = list(stops)
+    end = end if end is not None else ticks[-1] + tick_period
+    for step in range(int(end * 1000) + 1):
+        now[0] = step / 1000.0
+        while ticks and ticks[0] <= now[0]:
+            out.on_tick(ticks.pop(0), tick_period)
+        while stops and stops[0] <= now[0]:
+            stops.pop(0)
+            rtos.stop_all_notes()
+        rtos.update(now[0])
+    return hw.midi.pulses
+
+
+def check_stop_all_notes():
+    """stop_all_notes() entre polsos cada 5 ms (botó mantingut): interval màxim"""
+    period = 0.25  # 120 BPM
+    ticks = [i * period for i in range(8)]
+    stops = [0.03 + i * 0.005 for i in range(100)]  # 0.03-0.53 s
+    pulses = simulate(ticks, period, stops)
+    intervals = [(b - a) * 1000.0 for a, b in zip(pulses, pulses[1:])]
+    return len(pulses), len(ticks) * 12, max(intervals), min(intervals)
+
+
+def check_tempo_jump():
+    """Tick que arriba a mig tick anterior: màxim de polsos al mateix ms"""
+    period = 0.25
+    ticks = [0.0, 0.25, 0.375, 0.625, 0.875]
+    pulses = simulate(ticks, period)
+    burst = max(pulses.count(t) for t in pulses)
+    return len(pulses), len(ticks) * 12, burst
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 6.0
+    cpu_scale = float(sys.argv[2]) if len(sys.argv) > 2 else 0.0
+    print(f"{seconds:.0f} s virtuals per mode, CPU host x{cpu_scale:g}")
+    print(f"{'mode':>4} {'polsos':>7} {'nominal ms':>10} {'mitj ms':>8} {'p99 ms':>7} {'max ms':>7}")
+    reports = []
+    for mode in MODES:
+        count, nominal, mean, p99, worst, report = measure(mode, seconds, cpu_scale)
+        print(f"{mode:>4} {count:>7} {nominal:>10.2f} {mean:>8.2f} {p99:>7.2f} {worst:>7.2f}")
+        reports.append((mode, report))
+    print()
+    for mode, report in reports:
+        print(f"mode {mode}: " + " | ".join(" ".join(line.split()) for line in report))
+    print()
+    count, expected, longest, shortest = check_stop_all_notes()
+    stop_ok = count == expected and longest < 22.0 and shortest > 19.0
+    print(f"stop_all_notes cada 5 ms: {count}/{expected} polsos, interval {shortest:.0f}-{longest:.0f} ms "
+          f"(nominal 20.8) ({'OK' if stop_ok else 'ERROR'})")
+    count, expected, burst = check_tempo_jump()
+    jump_ok = count == expected and burst == 1
+    print(f"tick avançat: {count}/{expected} polsos, màxim {burst} al mateix ms ({'OK' if jump_ok else 'ERROR'})")
+    if not stop_ok or not jump_ok:
+        sys.exit("ERROR: polsos de rellotge perduts o en ràfega")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+# =============================================================================
+# BENCHMARK (host) - MIDI.receive() d'adafruit_midi vs buffer circular
+# =============================================================================
+# Flux d'entrada típic amb rellotge a 24 ppqn: TimingClock intercalats amb
+# NoteOn/NoteOff, CC i algun SysEx. Comprova que tots dos parsers donen els
+# mateixos missatges i compara temps per byte. Després comprova els casos
+# que l'antic no tracta: running status i temps real enmig d'un missatge.
+#
+# Ús (des de l'arrel del repositori):
+#   python bench/bench_midi_in.py
+# =============================================================================
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "lib"))
+
+from adafruit_midi import MIDI  # noqa: E402
+from core.midi_out import FastMIDI  # noqa: E402
+
+MESSAGES = 20000
+
+
+class _StreamPort:
+    """Port d'entrada que lliura el flux en trossos de mida aleatòria"""
+
+    def __init__(self, data, seed=1):
+        self.data = bytes(data)
+        self.pos = 0
+        self.rng = random.Random(seed)
+
+    def read(self, nbytes=1):
+        size = min(nbytes, self.rng.randint(1, 16))
+        out = self.data[self.pos:self.pos + size]
+        self.pos += len(out)
+        return out or None
+
+    def readinto(self, buf, nbytes=None):
+        data = self.read(len(buf) if nbytes is None else nbytes)
+        if not data:
+            return None
+        buf[:len(data)] = data
+        return len(data)
+
+
+class _Sink:
+    def write(self, buf, nbytes):
+        return nbytes
+
+
+def make_stream(count, seed=7):
+    rng = random.Random(seed)
+    data = bytearray()
+    for i in range(count):
+        kind = rng.random()
+        channel = rng.randint(0, 15)
+        if kind < 0.5:
+            data += bytes((0xF8,))
+        elif kind < 0.75:
+            data += bytes((0x90 | channel, rng.randint(0, 127), rng.randint(0, 127)))
+        elif kind < 0.9:
+            data += bytes((0x80 | channel, rng.randint(0, 127), 0))
+        elif kind < 0.98:
+            data += bytes((0xB0 | channel, rng.randint(0, 127), rng.randint(0, 127)))
+        else:
+            data += bytes((0xF0, 0x7D, 1, 2, 3, 0xF7))
+    return data
+
+
+def describe(msg):
+    """Tipus + atributs públics (per comparar missatges dels dos parsers)"""
+    fields = tuple(
+        (name, value if not isinstance(value, (bytes, bytearray)) else bytes(value))
+        for name, value in sorted(vars(msg).items())
+        if not name.startswith("__")
+    )
+    return (type(msg).__name__, fields)
+
+
+def drain_legacy(data):
+    midi = MIDI(midi_in=_StreamPort(data), midi_out=_Sink())
+    messages = []
+    idle = 0
+    while idle < 4:
+        msg = midi.receive()
+        if msg is None:
+            idle += 1
+            continue
+        idle = 0
+        messages.append(msg)
+    return messages
+
+
+def drain_ring(data):
+    midi = FastMIDI(midi_in=_StreamPort(data), midi_out=_Sink())
+    messages = []
+    idle = 0
+    while idle < 4:
+        count = midi.receive_all(messages.append)
+        idle = idle + 1 if count == 0 else 0
+    return messages
+
+
+def check_extras():
+    # Running status: un sol 0x90 per tres notes
+    midi = FastMIDI(midi_in=_StreamPort(b"\x90\x3c\x64\x40\x64\x43\x64"), midi_out=_Sink())
+    notes = [msg.note for msg in midi.receive_all()]
+    assert notes == [60, 64, 67], notes
+
+    # TimingClock enmig d'un NoteOn i instància compartida
+    midi = FastMIDI(midi_in=_StreamPort(b"\x90\x3c\xf8\x64\xf8"), midi_out=_Sink())
+    messages = midi.receive_all()
+    names = [type(msg).__name__ for msg in messages]
+    assert names == ["TimingClock", "NoteOn", "TimingClock"], names
+    assert messages[0] is messages[2]
+    assert messages[1].velocity == 100
+
+    # Filtre de canal
+    midi = FastMIDI(midi_in=_StreamPort(b"\x90\x3c\x64\x91\x3c\x64"), midi_out=_Sink(),
+                    in_channel=1)
+    assert [msg.channel for msg in midi.receive_all()] == [1]
+
+
+def main():
+    data = make_stream(MESSAGES)
+
+    start = time.perf_counter()
+    legacy = drain_legacy(data)
+    legacy_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ring = drain_ring(data)
+    ring_s = time.perf_counter() - start
+
+    assert len(legacy) == len(ring), (len(legacy), len(ring))
+    for old, new in zip(legacy, ring):
+        assert describe(old) == describe(new), (old, new)
+    check_extras()
+
+    print(f"OK: {len(ring)} missatges idèntics ({len(data)} bytes)")
+    print(f"MIDI.receive():        {legacy_s * 1e9 / len(data):8.0f} ns/byte")
+    print(f"FastMIDI.receive_all(): {ring_s * 1e9 / len(data):7.0f} ns/byte")
+    print(f"ràtio:                 {legacy_s / ring_s:8.1f}x")
+    print("OK: running status, temps real intercalat, filtre de canal")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+# =============================================================================
+# BENCHMARK (host) - MIDI.send(NoteOn(...)) vs FastMIDI.send_note_on(...)
+# =============================================================================
+# Comprova que els bytes enviats són idèntics per a totes les notes,
+# velocitats i canals, i compara temps i assignacions (tracemalloc) per nota.
+# Després compara writes i bytes per iteració amb la cua (begin_batch/flush),
+# amb i sense running status, i executa main.py amb l'emulador.
+#
+# Ús (des de l'arrel del repositori):
+#   python bench/bench_midi_out.py
+# =============================================================================
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "lib"))
+
+from adafruit_midi import MIDI  # noqa: E402
+from adafruit_midi.note_on import NoteOn  # noqa: E402
+from adafruit_midi.note_off import NoteOff  # noqa: E402
+from adafruit_midi.control_change import ControlChange  # noqa: E402
+from core.midi_out import FastMIDI  # noqa: E402
+
+ITERATIONS = 50000
+
+
+class _Port:
+    """Port de sortida que guarda una còpia de cada write()"""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.writes = 0
+
+    def write(self, buf, nbytes):
+        self.data.extend(buf[:nbytes])
+        self.writes += 1
+
+
+class _NullPort:
+    def write(self, buf, nbytes):
+        return nbytes
+
+
+def check_identity():
+    legacy = MIDI(midi_out=_Port(), out_channel=0)
+    fast = FastMIDI(midi_out=_Port(), out_channel=0)
+    for channel in range(16):
+        for note in range(128):
+            for velocity in (0, 1, 64, 100, 127):
+                legacy.send(NoteOn(note, velocity), channel)
+                fast.send_note_on(note, velocity, channel)
+                legacy.send(NoteOff(note, velocity), channel)
+                fast.send_note_off(note, velocity, channel)
+                legacy.send(ControlChange(note, velocity), channel)
+                fast.send_control_change(note, velocity, channel)
+    # Canal per defecte (out_channel)
+    legacy.out_channel = fast.out_channel = 9
+    legacy.send(NoteOn(60, 100))
+    fast.send_note_on(60, 100)
+    assert legacy._midi_out.data == fast._midi_out.data, "bytes diferents"
+    for bad in (-1, 128):
+        try:
+            fast.send_note_on(bad, 100)
+        except ValueError:
+            continue
+        raise AssertionError("nota fora de rang acceptada")
+    return len(fast._midi_out.data)
+
+
+def legacy_notes(midi):
+    for i in range(ITERATIONS):
+        note = i & 0x7F
+        midi.send(NoteOn(note, 100))
+        midi.send(NoteOff(note, 0))
+
+
+def fast_notes(midi):
+    for i in range(ITERATIONS):
+        note = i & 0x7F
+        midi.send_note_on(note, 100)
+        midi.send_note_off(note, 0)
+
+
+def measure(func, midi):
+    start = time.perf_counter_ns()
+    func(midi)
+    return (time.perf_counter_ns() - start) / ITERATIONS
+
+
+def arpeggio_iteration(midi, base, count):
+    """Iteració tipus llamp de Tempesta: NoteOff anteriors + arpegi nou"""
+    for i in range(count):
+        midi.send_note_off(base - 12 + i * 4, 0)
+    for i in range(count):
+        midi.send_note_on(base + i * 4, 100)
+
+
+def compare_batching():
+    print(f"{'notes/tick':>10} {'mode':>16} {'writes':>7} {'bytes':>6}")
+    for count in (1, 2, 4, 8):
+        direct = FastMIDI(midi_out=_Port())
+        batched = FastMIDI(midi_out=_Port())
+        running = FastMIDI(midi_out=_Port(), running_status=True)
+        for iteration in range(10):
+            base = 48 + iteration
+            arpeggio_iteration(direct, base, count)
+            batched.begin_batch()
+            arpeggio_iteration(batched, base, count)
+            batched.flush()
+            running.begin_batch()
+            arpeggio_iteration(running, base, count)
+            running.flush()
+        assert batched._midi_out.data == direct._midi_out.data, "lot diferent"
+        for name, midi in (("directe", direct), ("lot", batched), ("lot+running", running)):
+            port = midi._midi_out
+            print(f"{count:>10} {name:>16} {port.writes:>7} {len(port.data):>6}")
+
+
+def compare_firmware(mode=3, seconds=5.0):
+    from emulator.run import run_firmware
+    emu = run_firmware(seconds=seconds, mode=mode, skip_intro=True)
+    from core import config as cfg
+    writes = len(emu.midi_out)
+    midi = emu.midi_bytes()
+    print(f"main.py mode {mode} ({seconds:.0f} s): {writes} writes, {len(midi)} bytes, "
+          f"{len(emu.note_ons())} NoteOn, {cfg.midi_error_count} errors MIDI")
+
+
+def main():
+    total = check_identity()
+    print(f"OK: {total} bytes idèntics (NoteOn, NoteOff, CC, 16 canals)")
+
+    legacy_ns = measure(legacy_notes, MIDI(midi_out=_NullPort()))
+    fast_ns = measure(fast_notes, FastMIDI(midi_out=_NullPort()))
+    print(f"send(NoteOn)+send(NoteOff):       {legacy_ns:8.0f} ns/nota")
+    print(f"send_note_on()+send_note_off():   {fast_ns:8.0f} ns/nota")
+    print(f"ràtio:                            {legacy_ns / fast_ns:8.1f}x")
+
+    # Assignacions per nota: blocs assignats durant N notes
+    for name, func, midi in (
+        ("legacy", legacy_notes, MIDI(midi_out=_NullPort())),
+        ("fast", fast_notes, FastMIDI(midi_out=_NullPort())),
+    ):
+        tracemalloc.start()
+        func(midi)  # escalfar
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        func(midi)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"pic de heap extra ({name:6s}):       {peak - current:8d} bytes")
+
+    print()
+    compare_batching()
+    print()
+    compare_firmware()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+# =============================================================================
+# BENCHMARK (host) - Càrrega de modes sota demanda
+# =============================================================================
+# Compara l'arrencada de ModeLoader amb el registre de modes (modes/loader.py:
+# cap mode importat fins que se selecciona) amb la càrrega anticipada
+# d'abans (importar i instanciar tots els modes en crear el ModeLoader), amb
+# els 14 modes del firmware i amb 40 (26 modes generats copiant el codi dels
+# existents amb els noms de config/tecla_config.json: Neural, Biomímesi...).
+#
+#   temps   - importar modes.loader + ModeLoader() + el primer mode (host)
+#   heap    - memòria retinguda després (tracemalloc, amb gc.collect())
+#
+# Cada mesura s'executa en un intèrpret nou. Després recorre els 40 modes
+# dues vegades amb modes_max_loaded = 8 i comprova que la memòria retinguda
+# queda acotada (descàrrega LRU) respecte a no descarregar-ne cap.
+#
+# Ús (des de l'arrel del repositori):
+#   python bench/bench_modes.py
+# =============================================================================
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+EXTRA_MODES = 26
+PACKAGE = "bench_modes"  # Paquet temporal amb els modes generats
+
+
+def extra_names():
+    """Noms de config/tecla_config.json que no són modes del firmware"""
+    from modes.loader import MODE_REGISTRY
+    existing = {entry[1] for entry in MODE_REGISTRY}
+    with open(os.path.join(ROOT, "config", "tecla_config.json")) as f:
+        banks = json.load(f)["banks"]
+    names = []
+    for bank in banks:
+        for name in bank["modes"]:
+            if name not in existing and name not in names and name != "Silenci":
+                names.append(name)
+    while len(names) < EXTRA_MODES:
+        names.append(f"Extra {len(names) + 1}")
+    return names[:EXTRA_MODES]
+
+
+def generate(tmp):
+    """Escriu 26 mòduls de mode a tmp/bench_modes i retorna el registre de 40"""
+    from modes.loader import MODE_REGISTRY
+    package = os.path.join(tmp, PACKAGE)
+    os.makedirs(package)
+    open(os.path.join(package, "__init__.py"), "w").close()
+    registry = list(MODE_REGISTRY)
+    for i, name in enumerate(extra_names()):
+        number = len(MODE_REGISTRY) + 1 + i
+        _, _, module_name, class_name = MODE_REGISTRY[i % len(MODE_REGISTRY)]
+        with open(os.path.join(ROOT, *module_name.split(".")) + ".py") as f:
+            source = f.read()
+        new_class = f"ModeGen{number}"
+        source = source.replace(class_name, new_class)
+        source = re.sub(r"\n    NUMBER = \d+", f"\n    NUMBER = {number}", source)
+        source = re.sub(r'\n    NAME = "[^"]*"', f'\n    NAME = "{name}"', source)
+        leaf = f"gen{number}"
+        with open(os.path.join(package, leaf + ".py"), "w") as f:
+            f.write(source)
+        registry.append((number, name, f"{PACKAGE}.{leaf}", new_class))
+    return registry
+
+
+# Executat en un intèrpret nou: imprimeix "temps_us heap_bytes carregats descàrregues"
+CHILD = r"""
+import gc, json, sys, time, tracemalloc
+sys.path[:0] = [ROOT, TMP]
+import math, random  # Mòduls integrats a CircuitPython: fora de la mesura
+tracemalloc.start()
+from core import config as cfg
+gc.collect()
+base = tracemalloc.get_traced_memory()[0]
+start = time.perf_counter()
+from modes.loader import ModeLoader
+cfg.modes_max_loaded = MAX_LOADED
+loader = ModeLoader(None, cfg, None, registry=REGISTRY)
+if EAGER:
+    for entry in REGISTRY:
+        loader.get_mode(entry[0])
+else:
+    loader.switch_mode(3)
+elapsed = (time.perf_counter() - start) * 1e6
+for _ in range(CYCLES):
+    for entry in REGISTRY:
+        loader.switch_mode(entry[0])
+gc.collect()
+heap = tracemalloc.get_traced_memory()[0] - base
+print(int(elapsed), heap, loader.loaded, loader.unloads)
+"""
+
+
+def measure(registry, tmp, eager, max_loaded=0, cycles=0):
+    code = (CHILD.replace("ROOT", repr(ROOT)).replace("TMP", repr(tmp))
+            .replace("MAX_LOADED", str(max_loaded)).replace("REGISTRY", repr(tuple(registry)))
+            .replace("EAGER", str(eager)).replace("CYCLES", str(cycles)))
+    runs = []
+    for _ in range(5):
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        runs.append([int(v) for v in out.stdout.split()])
+    runs.sort()
+    return runs[len(runs) // 2]  # Mediana pel temps
+
+
+def main():
+    from modes.loader import MODE_REGISTRY
+    with tempfile.TemporaryDirectory() as tmp:
+        registry40 = generate(tmp)
+        print("arrencada (host, mediana de 5 intèrprets nous)")
+        print(f"{'modes':>5} {'càrrega':<11} {'temps us':>9} {'heap KB':>8} {'carregats':>9}")
+        for registry in (MODE_REGISTRY, registry40):
+            for label, eager in (("anticipada", True), ("sota demanda", False)):
+                us, heap, loaded, _ = measure(registry, tmp, eager)
+                print(f"{len(registry):>5} {label:<11} {us:>9} {heap / 1024:>8.1f} {loaded:>9}")
+        print()
+        print("recorregut dels 40 modes x2")
+        print(f"{'límit':>5} {'heap KB':>8} {'carregats':>9} {'descàrregues':>12}")
+        for max_loaded in (0, 8):
+            _, heap, loaded, unloads = measure(registry40, tmp, False, max_loaded, cycles=2)
+            print(f"{max_loaded or '-':>5} {heap / 1024:>8.1f} {loaded:>9} {unloads:>12}")
+            if max_loaded and loaded > max_loaded:
+                sys.exit("ERROR: més modes carregats que modes_max_loaded")
+
+
+if __name__ == "__main__":
+    main()
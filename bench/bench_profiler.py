@@ -0,0 +1,77 @@
+# =============================================================================
+# BENCHMARK (host) - Profiler del bucle principal
+# =============================================================================
+# 1) Cost d'un lap() (activat i desactivat) comparat amb una iteració buida.
+# 2) Executa main.py amb l'emulador (temps de CPU del host escalat) i mostra
+#    l'informe p50/p99/max per etapa que es veuria per sèrie amb "p".
+#
+# Ús (des de l'arrel del repositori):
+#   python bench/bench_profiler.py [mode] [segons] [cpu_scale]
+# =============================================================================
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from core import profiler as prof  # noqa: E402
+from emulator.run import run_firmware  # noqa: E402
+
+N = 200000
+
+
+def bench_lap(enabled):
+    profiler = prof.LoopProfiler(enabled)
+    lap = profiler.lap
+    stage = prof.STAGE_MODES
+    profiler.mark()
+    start = time.perf_counter()
+    for _ in range(N):
+        lap(stage)
+    return (time.perf_counter() - start) / N * 1e9
+
+
+def bench_empty():
+    start = time.perf_counter()
+    for _ in range(N):
+        pass
+    return (time.perf_counter() - start) / N * 1e9
+
+
+def check_buckets():
+    """Cada valor ha de caure dins dels límits del seu bucket"""
+    previous = 0
+    for us in range(0, 1 << 20, 7):
+        index = prof.bucket_index(us)
+        assert index >= previous
+        assert us < prof.bucket_upper_us(index)
+        if index > 0:
+            assert us >= prof.bucket_upper_us(index - 1)
+        previous = index
+
+
+def main():
+    mode = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 5.0
+    cpu_scale = float(sys.argv[3]) if len(sys.argv) > 3 else 20.0
+
+    check_buckets()
+    empty = bench_empty()
+    on = bench_lap(True) - empty
+    off = bench_lap(False) - empty
+    print(f"lap() activat:    {on:8.0f} ns/crida (host)")
+    print(f"lap() desactivat: {off:8.0f} ns/crida (host)")
+    print(f"8 laps/iteració:  {on * 8 / 1000:8.2f} us (host)")
+    print()
+
+    emu = run_firmware(seconds=seconds, mode=mode, skip_intro=True,
+                       cpu_scale=cpu_scale)
+    from core import config as cfg
+    print(f"mode {mode}, {seconds:.1f} s virtuals, CPU host x{cpu_scale:g}, "
+          f"{len(emu.note_ons())} NoteOn")
+    print(cfg.profiler.report())
+
+
+if __name__ == "__main__":
+    main()
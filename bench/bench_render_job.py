@@ -0,0 +1,66 @@
+# =============================================================================
+# BENCHMARK (host) - Dibuix de pantalla per porcions (RenderJob)
+# =============================================================================
+# Executa main.py amb l'emulador (temps de CPU del host escalat, perquè el
+# cost del dibuix compti) en un escenari on la pantalla treballa molt: Extra1
+# mantingut (resum complet amb imatge gran) mentre es canvia de mode cada
+# 0.4 s, de manera que cada imatge nova s'ha de renderitzar sense cache
+# (Fractal, Espiral, Narval...). Compara:
+#   - monolític: cada frame es dibuixa sencer en una porció
+#                (display_slice_us molt gran)
+#   - porcions:  el generador avança com a molt display_slice_us per porció
+# i mostra el retard dels ticks, la iteració més llarga del bucle (el retard
+# màxim amb què es pot servir un pols de rellotge, un NoteOff o el gate), la
+# porció de pantalla més llarga i els frames dibuixats.
+#
+# Ús (des de l'arrel del repositori):
+#   python bench/bench_render_job.py [segons] [cpu_scale]
+# =============================================================================
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from emulator.run import run_firmware  # noqa: E402
+from emulator.scenario import Scenario, sine, constant  # noqa: E402
+
+
+def run(seconds, cpu_scale, slice_us):
+    buttons = [("extra_1", 0.5, seconds)]
+    t = 2.2
+    while t < seconds - 0.5:
+        buttons.append(("crueta_4", t, t + 0.2))  # >150 ms: un canvi de mode
+        t += 0.4
+    scenario = Scenario(cv1=sine(1.5, 1.2, 0.3), cv2=constant(1.5), buttons=buttons)
+    run_firmware(scenario, seconds=seconds, mode=1, skip_intro=True, cpu_scale=cpu_scale,
+                 config={"midi_clock_out": True, "display_slice_us": slice_us})
+    from core import config as cfg
+    from core import profiler as prof
+    p = cfg.profiler
+    return {
+        "ticks": p.counts[prof.STAGE_TICK_LATE],
+        "late": [p.percentile(prof.STAGE_TICK_LATE, f) for f in (0.5, 0.99, 1.0)],
+        "display": p.max_us[prof.STAGE_DISPLAY],
+        "loop": [p.percentile(prof.STAGE_LOOP, 0.99), p.max_us[prof.STAGE_LOOP]],
+        "frames": cfg.render_job.frames,
+        "steps": cfg.render_job.steps,
+    }
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 8.0
+    cpu_scale = float(sys.argv[2]) if len(sys.argv) > 2 else 20.0
+    print(f"{seconds:.0f} s virtuals, CPU host x{cpu_scale:g} (temps en us)")
+    print(f"{'dibuix':<10} {'ticks':>5} {'late p50':>8} {'p99':>7} {'max':>7} "
+          f"{'loop p99':>8} {'max':>7} {'disp max':>8} {'frames':>6} {'passos':>6}")
+    for label, slice_us in (("monolític", 10 ** 9), ("porcions", 2000)):
+        r = run(seconds, cpu_scale, slice_us)
+        late = r["late"]
+        print(f"{label:<10} {r['ticks']:>5} {late[0]:>8} {late[1]:>7} {late[2]:>7} "
+              f"{r['loop'][0]:>8} {r['loop'][1]:>7} {r['display']:>8} "
+              f"{r['frames']:>6} {r['steps']:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# =============================================================================
+# BENCHMARK (host) - Cost de RTOSManager.update segons notes pendents
+# =============================================================================
+# Compara l'escaneig lineal antic de cfg.note_off_schedule amb la cua de
+# temporitzadors (TimerQueue) quan cap deadline ha vençut, que és el cas
+# habitual de cada passada del bucle principal.
+#
+# Ús (des de l'arrel del repositori):
+#   python bench/bench_rtos_timers.py
+# =============================================================================
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "lib"))
+
+from adafruit_midi.note_off import NoteOff  # noqa: E402
+from core.rtos import RTOSManager, GATE_TIMER  # noqa: E402
+
+ITERATIONS = 20000
+PENDING_COUNTS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+
+class _Pin:
+    value = False
+
+
+class _Midi:
+    def send(self, msg):
+        pass
+
+    def send_note_off(self, note, velocity=0, channel=None):
+        pass
+
+
+def _make_hw():
+    return SimpleNamespace(out_jack=_Pin(), led_2=_Pin(), midi=_Midi())
+
+
+def _make_cfg():
+    return SimpleNamespace(
+        gate_active=False,
+        gate_off_time=0.0,
+        note_off_schedule={},
+        playing_notes=set(),
+        timer_queue=None,
+    )
+
+
+def _legacy_update(hw, cfg, current_time):
+    """Còpia de l'algorisme anterior (escaneig lineal del diccionari)"""
+    if cfg.gate_active and current_time >= cfg.gate_off_time:
+        hw.out_jack.value = False
+        hw.led_2.value = False
+        cfg.gate_active = False
+    if cfg.note_off_schedule:
+        notes_to_remove = []
+        for note, off_time in cfg.note_off_schedule.items():
+            if current_time >= off_time:
+                hw.midi.send(NoteOff(note, 0))
+                if note in cfg.playing_notes:
+                    cfg.playing_notes.remove(note)
+                notes_to_remove.append(note)
+        for note in notes_to_remove:
+            del cfg.note_off_schedule[note]
+
+
+def _fill(cfg, pending, now):
+    cfg.gate_active = True
+    cfg.gate_off_time = now + 10.0
+    if cfg.timer_queue is not None:
+        cfg.timer_queue.push(cfg.gate_off_time, GATE_TIMER)
+    for note in range(pending):
+        off_time = now + 10.0 + note * 0.001
+        cfg.note_off_schedule[note] = off_time
+        cfg.playing_notes.add(note)
+        if cfg.timer_queue is not None:
+            cfg.timer_queue.push(off_time, note)
+
+
+def _time_loop(update, now):
+    start = time.perf_counter_ns()
+    for _ in range(ITERATIONS):
+        update(now)
+    return (time.perf_counter_ns() - start) / ITERATIONS
+
+
+def main():
+    print(f"{'pendents':>8} {'lineal ns':>10} {'heap ns':>10} {'ràtio':>6}")
+    for pending in PENDING_COUNTS:
+        now = 1000.0
+
+        hw = _make_hw()
+        cfg = _make_cfg()
+        _fill(cfg, pending, now)
+        legacy_ns = _time_loop(lambda t: _legacy_update(hw, cfg, t), now)
+
+        hw = _make_hw()
+        cfg = _make_cfg()
+        rtos = RTOSManager(hw, cfg)
+        _fill(cfg, pending, now)
+        heap_ns = _time_loop(rtos.update, now)
+
+        print(f"{pending:>8} {legacy_ns:>10.0f} {heap_ns:>10.0f} {legacy_ns / heap_ns:>6.1f}")
+
+    # Comprovació de correcció: tots els NoteOff surten en ordre de deadline
+    hw = _make_hw()
+    sent = []
+    hw.midi.send_note_off = lambda note, velocity=0: sent.append(note)
+    cfg = _make_cfg()
+    rtos = RTOSManager(hw, cfg)
+    _fill(cfg, 128, 0.0)
+    rtos.update(100.0)
+    assert sent == list(range(128)), "ordre de NoteOff incorrecte"
+    assert not cfg.note_off_schedule and not cfg.playing_notes and not cfg.gate_active
+    print("OK: 128 NoteOff en ordre, gate apagat")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# =============================================================================
+# BENCHMARK (host) - Planificador cooperatiu amb deadlines
+# =============================================================================
+# Executa main.py amb l'emulador mentre la pantalla treballa i compara el
+# retard dels ticks del MasterClock (tick_late) i el jitter dels TimingClock
+# (clk_jit) amb el planificador deadline-aware i sense (scheduler_max_defer
+# = 0: LEDs i pantalla s'executen sempre, com l'antiga cadena d'ifs).
+#
+# Escenaris (mode 3, CVs en moviment, sortida de rellotge MIDI activa):
+#   info  - pantalla d'informació del mode cada 150 ms
+#   resum - Extra1 mantingut: resum complet (frame gran)
+#   caos  - octava per sobre de 8: mode caos amb el raig a cada nota
+#
+# Amb cpu_scale = 0 només compta el temps de l'I2C (reproduïble); amb
+# cpu_scale > 0 s'hi afegeix el temps de CPU del host escalat.
+#
+# Ús (des de l'arrel del repositori):
+#   python bench/bench_scheduler.py [segons] [cpu_scale]
+# =============================================================================
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from emulator.run import run_firmware  # noqa: E402
+from emulator.scenario import Scenario, sine, ramp  # noqa: E402
+
+SCENARIOS = (
+    ("info", []),
+    ("resum", [("extra_1", 1.0, 6.0)]),
+    ("caos", [("crueta_1", 0.5 + 0.2 * i, 0.6 + 0.2 * i) for i in range(5)]),
+)
+
+
+def run(buttons, seconds, cpu_scale, deadline_aware):
+    scenario = Scenario(cv1=sine(1.5, 1.2, 0.3), cv2=ramp(0.2, 3.0, seconds), buttons=buttons)
+    config = {"midi_clock_out": True}
+    if not deadline_aware:
+        config["scheduler_max_defer"] = 0.0
+    emu = run_firmware(scenario, seconds=seconds, mode=3, skip_intro=True,
+                       config=config, cpu_scale=cpu_scale)
+    from core import config as cfg
+    from core import profiler as prof
+    p = cfg.profiler
+    display = cfg.scheduler.tasks[-1]
+    return {
+        "ticks": p.counts[prof.STAGE_TICK_LATE],
+        "notes": len(emu.note_ons()),
+        "late": [p.percentile(prof.STAGE_TICK_LATE, f) for f in (0.5, 0.99, 1.0)],
+        "jit": [p.percentile(prof.STAGE_CLOCK_JITTER, f) for f in (0.99, 1.0)],
+        "display": p.percentile(prof.STAGE_DISPLAY, 1.0),
+        "deferrals": display.deferrals,
+        "forced": display.forced,
+    }
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 8.0
+    cpu_scale = float(sys.argv[2]) if len(sys.argv) > 2 else 0.0
+    print(f"{seconds:.0f} s virtuals, CPU host x{cpu_scale:g} (temps en us)")
+    print(f"{'escenari':<8} {'planif':<9} {'ticks':>5} {'notes':>5} {'late p50':>8} {'p99':>7} {'max':>7} "
+          f"{'jit p99':>7} {'max':>7} {'disp max':>8} {'ajorn':>6} {'forç':>4}")
+    for name, buttons in SCENARIOS:
+        for label, aware in (("fixa", False), ("deadline", True)):
+            r = run(buttons, seconds, cpu_scale, aware)
+            late = r["late"]
+            print(f"{name:<8} {label:<9} {r['ticks']:>5} {r['notes']:>5} {late[0]:>8} {late[1]:>7} {late[2]:>7} "
+                  f"{r['jit'][0]:>7} {r['jit'][1]:>7} {r['display']:>8} "
+                  f"{r['deferrals']:>6} {r['forced']:>4}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+# =============================================================================
+# BENCHMARK (host) - Configuració persistent: registre binari vs JSON
+# =============================================================================
+# Compara SettingsStore (core/settings_store.py: registres de 26 bytes amb
+# struct + CRC32 en un registre circular a nvm) amb el camí JSON de
+# ConfigManager (json.dump amb indent=2 a un .tmp + rename):
+#
+#   - temps de càrrega (registre circular ple: es validen totes les posicions)
+#   - temps i bytes escrits per desada
+#
+# I comprova el comportament del registre:
+#   - agrupació: un botó mantingut 3 s (un canvi cada 50 ms) = 1 escriptura
+#   - escriptura tallada: mig registre escrit -> es carrega l'anterior
+#   - seq de 16 bits que dona la volta: es carrega el més recent
+#   - calibració dels CV: es desa en sortir de calibració (request_save) i
+#     en carregar té prioritat sobre el preset; sense canvis no s'escriu
+#   - registre de la versió 1 (18 bytes): es descarta i s'aplica el preset
+#
+# Ús (des de l'arrel del repositori):
+#   python bench/bench_settings.py [repeticions]
+# =============================================================================
+import json
+import os
+import struct
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from core import config as cfg  # noqa: E402
+from core.config_manager import ConfigManager  # noqa: E402
+from core.settings_store import (  # noqa: E402
+    FIELDS, HEADER, MAGIC, SLOT_SIZE, SLOTS, SettingsStore,
+)
+
+
+def new_nvm():
+    return bytearray(b"\xff" * 4096)
+
+
+def set_values(**values):
+    for name in FIELDS:
+        setattr(cfg, name, values.get(name, getattr(cfg, name)))
+
+
+def current():
+    return {name: getattr(cfg, name) for name in FIELDS}
+
+
+def timed(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000000
+
+
+def bench_load_save(repeat):
+    nvm = new_nvm()
+    store = SettingsStore(cfg, nvm)
+    store.load()
+    for i in range(SLOTS):
+        cfg.duty1 = 10 + i
+        store.save()
+    binary_load = timed(store.load, repeat)
+    binary_save = timed(store.save, repeat)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = ConfigManager(os.path.join(tmp, "config", "tecla_config.json"))
+        manager.config.update(current())
+        manager.save_config()
+        json_size = os.path.getsize(manager.config_path)
+        json_load = timed(manager._load_config, repeat)
+        json_save = timed(manager.save_config, repeat)
+        with open(os.path.join(ROOT, "config", "tecla_config.json")) as f:
+            real = json.load(f)
+        manager.config = real
+        manager.save_config()
+        real_size = os.path.getsize(manager.config_path)
+        real_load = timed(manager._load_config, repeat)
+
+    print(f"{'format':<26} {'bytes':>6} {'càrrega us':>10} {'desada us':>10}")
+    print(f"{'binari (32 posicions)':<26} {SLOT_SIZE:>6} {binary_load:>10.1f} {binary_save:>10.1f}")
+    print(f"{'JSON mateixos camps':<26} {json_size:>6} {json_load:>10.1f} {json_save:>10.1f}")
+    print(f"{'JSON tecla_config.json':<26} {real_size:>6} {real_load:>10.1f} {'':>10}")
+
+
+def check_coalescing():
+    store = SettingsStore(cfg, new_nvm(), save_delay=5.0)
+    store.load()
+    set_values(duty1=50)
+    now = 0.0
+    while now < 12.0:
+        if 1.0 <= now < 4.0:
+            cfg.duty1 = 1 + int(now * 20) % 99  # Botó mantingut: canvi cada 50 ms
+        store.step(now)
+        now += 0.05
+    return store.writes
+
+
+def check_torn_write():
+    nvm = new_nvm()
+    store = SettingsStore(cfg, nvm)
+    store.load()
+    set_values(loop_mode=3, octava=4, duty1=30)
+    store.save()
+    set_values(loop_mode=7, octava=6, duty1=70)
+    store.save()
+    # Tercera desada tallada: només la meitat del registre arriba a nvm
+    set_values(loop_mode=9, octava=1, duty1=90)
+    store.save()
+    start = store.slot * SLOT_SIZE
+    torn = bytes(nvm[start:start + SLOT_SIZE // 2])
+    nvm[start:start + SLOT_SIZE] = b"\xff" * SLOT_SIZE
+    nvm[start:start + len(torn)] = torn
+    set_values(loop_mode=0, octava=5, duty1=50)
+    fresh = SettingsStore(cfg, nvm)
+    fresh.load()
+    return current()
+
+
+def check_wraparound():
+    nvm = new_nvm()
+    store = SettingsStore(cfg, nvm)
+    store.load()
+    store.seq = 0xFFFF - 5
+    for i in range(12):
+        cfg.duty2 = 40 + i
+        store.save()
+    cfg.duty2 = 1
+    fresh = SettingsStore(cfg, nvm)
+    fresh.load()
+    return fresh.seq, cfg.duty2
+
+
+def check_calibration():
+    """Calibrar CV1, sortir de calibració i arrencar de nou: (escriptures, rang, re-desades)"""
+    nvm = new_nvm()
+    cfg.cv1_range_config = 1  # Preset 0-2.5 V
+    cfg.cv1_calibrated = cfg.cv2_calibrated = False
+    store = SettingsStore(cfg, nvm, save_delay=5.0)
+    store.load()
+    cfg.cv1_min, cfg.cv1_max = 0.12, 2.87
+    cfg.cv1_calibrated = True
+    store.request_save(0.0)
+    now = 0.0
+    while now < 8.0:
+        store.step(now)
+        now += 0.5
+    writes = store.writes
+    # Sortir de calibració sense canviar res: no s'escriu
+    store.request_save(now)
+    while now < 16.0:
+        store.step(now)
+        now += 0.5
+    rewrites = store.writes - writes
+    cfg.cv1_min, cfg.cv1_max = 0.0, 3.3
+    cfg.cv1_calibrated = False
+    SettingsStore(cfg, nvm).load()
+    return writes, (cfg.cv1_min, cfg.cv1_max), cfg.cv1_calibrated, rewrites
+
+
+def check_old_version():
+    """Registre v1 de 18 bytes amb CRC correcte: ha de carregar-se el preset"""
+    from binascii import crc32
+    nvm = new_nvm()
+    body = struct.pack(HEADER, MAGIC, 1, 7) + bytes((9, 6, 40, 40, 40, 0, 0, 0, 2, 2))
+    record = body + struct.pack("<I", crc32(body))
+    nvm[:len(record)] = record
+    set_values(loop_mode=0, cv1_range_config=0)
+    found = SettingsStore(cfg, nvm).load()
+    return found, cfg.loop_mode
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    bench_load_save(repeat)
+    print()
+    writes = check_coalescing()
+    print(f"agrupació: 60 canvis en 3 s -> {writes} escriptura(es)")
+    values = check_torn_write()
+    torn_ok = values["loop_mode"] == 7 and values["octava"] == 6 and values["duty1"] == 70
+    print(f"escriptura tallada: carregat mode {values['loop_mode']} octava {values['octava']} "
+          f"duty1 {values['duty1']} ({'OK' if torn_ok else 'ERROR'})")
+    seq, duty2 = check_wraparound()
+    wrap_ok = seq == 6 and duty2 == 51
+    print(f"seq que dona la volta: seq {seq} duty2 {duty2} ({'OK' if wrap_ok else 'ERROR'})")
+    calib_writes, (cv_min, cv_max), calibrated, rewrites = check_calibration()
+    calib_ok = (calib_writes == 1 and calibrated and rewrites == 0
+                and abs(cv_min - 0.12) < 0.001 and abs(cv_max - 2.87) < 0.001)
+    print(f"calibració CV1: {calib_writes} escriptura(es), carregat {cv_min:.3f}-{cv_max:.3f} V "
+          f"(preset 0-2.5 V), sense canvis {rewrites} ({'OK' if calib_ok else 'ERROR'})")
+    found, loop_mode = check_old_version()
+    old_ok = not found and loop_mode == 0
+    print(f"registre v1: {'carregat' if found else 'descartat'}, mode {loop_mode} ({'OK' if old_ok else 'ERROR'})")
+    if writes != 1 or not torn_ok or not wrap_ok or not calib_ok or not old_ok:
+        sys.exit("ERROR: comportament del registre incorrecte")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# =============================================================================
+# AUDITORIA D'ASSIGNACIONS PER TICK - TECLA
+# =============================================================================
+# Cada byte que un tick deixa al heap acosta la pròxima recol·lecció del GC,
+# i una recol·lecció al mig del bucle és una pausa de diversos ms. Aquest
+# mòdul mesura gc.mem_free() abans i després del tick de cada mode i en
+# guarda, per mode, els ticks mesurats, els bytes totals i el pic per tick.
+#
+# A CircuitPython els enters petits i els floats són immediats (no van al
+# heap): un tick en estat estacionari hauria de donar 0 bytes. Si el GC
+# s'executa durant el tick, la mostra surt negativa i es descarta (columna
+# "gc" de l'informe).
+#
+# Activar-la amb cfg.alloc_audit = True; informe: enviar "a" per la consola
+# sèrie (amb "r" es reinicia juntament amb el profiler).
+# =============================================================================
+import gc
+from array import array
+
+try:
+    _mem_free = gc.mem_free
+except AttributeError:  # Host / emulador: CPython no té gc.mem_free()
+    _mem_free = None
+
+
+class AllocTracker:
+    """Bytes assignats per tick i per mode amb memòria preassignada.
+
+    Arguments:
+        names: Nom de cada mode, indexat pel número de mode
+        enabled: Si és False (o no hi ha gc.mem_free), begin()/end() no fan res
+        mem_free: Funció que retorna els bytes lliures (per defecte gc.mem_free)
+    """
+
+    __slots__ = ("names", "enabled", "mem_free", "ticks", "total", "peak", "collected", "_before")
+
+    def __init__(self, names, enabled=True, mem_free=None):
+        self.names = names
+        modes = len(names)
+        self.mem_free = mem_free if mem_free is not None else _mem_free
+        self.enabled = enabled and self.mem_free is not None
+        self.ticks = array("L", [0] * modes)
+        self.total = array("L", [0] * modes)
+        self.peak = array("L", [0] * modes)
+        self.collected = array("L", [0] * modes)  # Mostres descartades pel GC
+        self._before = 0
+
+    def begin(self):
+        """Mostra abans del tick"""
+        if self.enabled:
+            self._before = self.mem_free()
+
+    def end(self, mode_num):
+        """Mostra després del tick del mode `mode_num`"""
+        if not self.enabled:
+            return
+        used = self._before - self.mem_free()
+        if used < 0:
+            self.collected[mode_num] += 1
+            return
+        self.ticks[mode_num] += 1
+        self.total[mode_num] += used
+        if used > self.peak[mode_num]:
+            self.peak[mode_num] = used
+
+    def reset(self):
+        for mode_num in range(len(self.ticks)):
+            self.ticks[mode_num] = 0
+            self.total[mode_num] = 0
+            self.peak[mode_num] = 0
+            self.collected[mode_num] = 0
+
+    def report(self):
+        """Informe per mode: ticks, bytes/tick (mitjana), pic i mostres descartades"""
+        lines = ["%-4s %-11s %7s %8s %6s %4s" % ("mode", "nom", "ticks", "B/tick", "pic", "gc")]
+        for mode_num in range(len(self.ticks)):
+            ticks = self.ticks[mode_num]
+            if ticks == 0 and self.collected[mode_num] == 0:
+                continue
+            lines.append("%-4d %-11s %7d %8.1f %6d %4d" % (
+                mode_num,
+                self.names[mode_num],
+                ticks,
+                self.total[mode_num] / ticks if ticks else 0.0,
+                self.peak[mode_num],
+                self.collected[mode_num],
+            ))
+        return "\n".join(lines)
@@ -0,0 +1,147 @@
+# =============================================================================
+# ESDEVENIMENTS DE BOTONS - TECLA
+# =============================================================================
+# Converteix el bitmask dels botons (bit i = botó i premut) en esdeveniments:
+#
+#   PRESS      - el botó s'ha premut
+#   RELEASE    - el botó s'ha deixat anar
+#   LONG_PRESS - el botó porta premut long_press_ms (un cop per polsació)
+#   REPEAT     - el botó continua premut (cada repeat_ms, després de
+#                repeat_delay_ms)
+#
+# Només els bits que canvien (o un temporitzador de LONG_PRESS/REPEAT que
+# venç) generen feina: si el bitmask és el mateix i no hi ha cap temps
+# pendent, scan() retorna 0 de seguida. El debounce és un bloqueig per botó:
+# el primer flanc s'accepta a l'instant i els canvis durant debounce_ms
+# s'ignoren (es revisa l'estat quan el bloqueig acaba).
+#
+# Els esdeveniments van a una cua circular (bytearray) sense assignacions:
+# cada entrada és (tipus << 4) | botó.
+# =============================================================================
+from array import array
+
+PRESS = 1
+RELEASE = 2
+LONG_PRESS = 3
+REPEAT = 4
+
+BUTTON_MASK = 0x0F  # Botó dins d'una entrada de la cua
+EVENT_SHIFT = 4     # Tipus dins d'una entrada de la cua
+
+QUEUE_SIZE = 16
+
+
+class ButtonEvents:
+    """Detector de flancs i cua d'esdeveniments de botons.
+
+    Arguments:
+        count: Nombre de botons (com a molt 16)
+        debounce_ms: Bloqueig després de cada flanc acceptat
+        long_press_ms: Temps de LONG_PRESS per botó (0 = cap)
+        repeat_delay_ms: Primer REPEAT després del PRESS per botó (0 = cap)
+        repeat_ms: Interval entre REPEAT per botó
+    """
+
+    def __init__(self, count, debounce_ms, long_press_ms, repeat_delay_ms, repeat_ms):
+        self.count = count
+        self.debounce_ms = debounce_ms
+        self.long_press_ms = array("l", long_press_ms)
+        self.repeat_delay_ms = array("l", repeat_delay_ms)
+        self.repeat_ms = array("l", repeat_ms)
+
+        self.stable = 0     # Bitmask amb debounce (estat publicat)
+        self._edge_ms = array("l", [-debounce_ms] * count)  # Últim flanc acceptat
+        self._due_ms = array("l", [0] * count)  # Pròxim LONG_PRESS/REPEAT (0 = cap)
+        self._long_done = 0  # Bits amb LONG_PRESS ja enviat en aquesta polsació
+        self.next_due = -1   # Pròxim temps en què scan() té feina sense canvis
+
+        self._queue = bytearray(QUEUE_SIZE)
+        self._head = 0
+        self._tail = 0
+        self.pending = 0     # Esdeveniments a la cua
+        self.dropped = 0     # Esdeveniments perduts per cua plena
+
+    def scan(self, mask, now_ms):
+        """Compara el bitmask amb l'estat publicat i genera esdeveniments
+
+        Arguments:
+            mask: Bitmask actual dels botons
+            now_ms: Temps actual en mil·lisegons (enter)
+
+        Returns:
+            Nombre d'esdeveniments a la cua
+        """
+        if mask == self.stable and (self.next_due < 0 or now_ms < self.next_due):
+            return self.pending
+
+        debounce_ms = self.debounce_ms
+        edge_ms = self._edge_ms
+        due_ms = self._due_ms
+        changed = mask ^ self.stable
+        next_due = -1
+
+        for i in range(self.count):
+            bit = 1 << i
+            if changed & bit:
+                if now_ms - edge_ms[i] >= debounce_ms:
+                    edge_ms[i] = now_ms
+                    if mask & bit:
+                        self.stable |= bit
+                        self._long_done &= ~bit
+                        self._push(PRESS, i)
+                        due_ms[i] = self._first_due(i, now_ms)
+                    else:
+                        self.stable &= ~bit
+                        due_ms[i] = 0
+                        self._push(RELEASE, i)
+                else:
+                    # Canvi dins del bloqueig: tornar-hi quan s'acabi
+                    unlock = edge_ms[i] + debounce_ms
+                    if next_due < 0 or unlock < next_due:
+                        next_due = unlock
+
+            due = due_ms[i]
+            if due and now_ms >= due:
+                if self.long_press_ms[i] and not self._long_done & bit:
+                    self._long_done |= bit
+                    self._push(LONG_PRESS, i)
+                    due = now_ms + self.repeat_ms[i] if self.repeat_ms[i] else 0
+                else:
+                    self._push(REPEAT, i)
+                    due += self.repeat_ms[i]
+                    if due <= now_ms:
+                        due = now_ms + self.repeat_ms[i]  # Bucle lent: no acumular
+                due_ms[i] = due
+            if due and (next_due < 0 or due < next_due):
+                next_due = due
+
+        self.next_due = next_due
+        return self.pending
+
+    def _first_due(self, i, now_ms):
+        if self.long_press_ms[i]:
+            return now_ms + self.long_press_ms[i]
+        if self.repeat_delay_ms[i]:
+            return now_ms + self.repeat_delay_ms[i]
+        return 0
+
+    def _push(self, kind, button):
+        if self.pending >= QUEUE_SIZE:
+            self.dropped += 1
+            return
+        self._queue[self._tail] = (kind << EVENT_SHIFT) | button
+        self._tail = (self._tail + 1) % QUEUE_SIZE
+        self.pending += 1
+
+    def pop(self):
+        """Treu el primer esdeveniment: (tipus << 4) | botó, o 0 si no n'hi ha"""
+        if not self.pending:
+            return 0
+        event = self._queue[self._head]
+        self._head = (self._head + 1) % QUEUE_SIZE
+        self.pending -= 1
+        return event
+
+    def is_pressed(self, button):
+        """Estat amb debounce d'un botó"""
+        return bool(self.stable & (1 << button))
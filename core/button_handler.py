@@ -1,238 +1,235 @@
 # =============================================================================
 # BUTTON HANDLER - TECLA
 # =============================================================================
-import time
+# Els botons arriben com a esdeveniments (core/button_events.py): PRESS,
+# RELEASE, LONG_PRESS i REPEAT. Si cap botó no canvia i no hi ha cap
+# temporitzador de polsació llarga/repetició pendent, process_buttons()
+# no fa res més que comparar el bitmask.
+# =============================================================================
 import random
 
+from core.button_events import (
+    ButtonEvents,
+    PRESS,
+    RELEASE,
+    LONG_PRESS,
+    REPEAT,
+    BUTTON_MASK,
+    EVENT_SHIFT,
+)
+
 # Constants de temps per polsacions llargues - Temps Humà Natural
 LONG_PRESS_SUMMARY = 1.5  # 1.5s - Mostrar resum complet (Extra1) - més deliberat
 LONG_PRESS_PAUSE = 1.5    # 1.5s - Pausa total/stop (Extra2) - evita stops accidentals
 
 CONFIG_OPTION_COUNT = 7  # Mode, 3 duty i 3 harmònics
 
-# Debounce times globals
-_debounce = {}
-for i in range(6):
-    _debounce[i] = 0.0
+# Índexs dels botons (ordre de hw.buttons i bits de hw.read_buttons())
+CRUETA_1 = 0
+CRUETA_2 = 1
+CRUETA_3 = 2
+CRUETA_4 = 3
+EXTRA_1 = 4
+EXTRA_2 = 5
+
+DEBOUNCE_MS = 20          # Bloqueig després de cada flanc (rebots mecànics)
+OCTAVE_REPEAT_MS = 80     # Octava: repetició mentre es manté premut
+VALUE_REPEAT_MS = 5       # Valors: un pas cada 5 ms (com l'escaneig anterior)
+MODE_CHANGE_INTERVAL = 0.15  # 150ms mínim entre canvis de mode
+CALIBRATION_TOGGLE = 0.5  # 500ms debounce per calibració
+
+_events = ButtonEvents(
+    6,
+    DEBOUNCE_MS,
+    long_press_ms=(0, 0, 0, 0, int(LONG_PRESS_SUMMARY * 1000), int(LONG_PRESS_PAUSE * 1000)),
+    repeat_delay_ms=(OCTAVE_REPEAT_MS, OCTAVE_REPEAT_MS, VALUE_REPEAT_MS, VALUE_REPEAT_MS, 0, 0),
+    repeat_ms=(OCTAVE_REPEAT_MS, OCTAVE_REPEAT_MS, VALUE_REPEAT_MS, VALUE_REPEAT_MS, 0, 0),
+)
+
+# Extra 1 + Extra 2 premuts junts (calibració): ignorar les seves accions
+# fins que tots dos es deixin anar
+_combo = False
+_calibration_toggle_time = -1.0
 
-def boton_presionado(boton, idx, tiempo_espera=0.08):  # 80ms debounce més natural
-    """Verifica botó amb debounce NO BLOQUEJANT"""
-    ct = time.monotonic()
-    if boton.value and ct - _debounce[idx] > tiempo_espera:
-        _debounce[idx] = ct
-        return True
-    return False
 
 def process_buttons(hw, cfg, rtos, current_time):
-    """Processa tots els botons amb prioritats RTOS"""
-    
+    """Processa els esdeveniments de botons pendents
+
+    Args:
+        hw: TeclaHardware (read_buttons())
+        cfg: Mòdul de configuració global
+        rtos: RTOSManager (stop_all_notes())
+        current_time: Temps actual (time.monotonic())
+    """
+    if not _events.scan(hw.read_buttons(), int(current_time * 1000)):
+        return
+
+    while _events.pending:
+        event = _events.pop()
+        button = event & BUTTON_MASK
+        kind = event >> EVENT_SHIFT
+        if button == CRUETA_1 or button == CRUETA_2:
+            if kind == PRESS or kind == REPEAT:
+                _change_octave(cfg, 1 if button == CRUETA_1 else -1)
+        elif button == CRUETA_3 or button == CRUETA_4:
+            _value_button(cfg, rtos, button, kind, current_time)
+        else:
+            _extra_button(hw, cfg, rtos, button, kind, current_time)
+
+
+def _change_octave(cfg, step):
+    """Botons cruceta 1/2: ↑/↓ octava; als extrems activa/desactiva el caos"""
+    # NO actualitzar last_interaction_time (no canvia pantalla)
+    octava = cfg.octava + step
+    if 0 <= octava <= 8:
+        cfg.octava = octava
+        cfg.caos = 0
+    else:
+        # Al activar/desactivar el modo caos, guardar/restaurar la octava
+        if cfg.caos == 0:
+            # Guardar la octava actual y activar modo caos
+            cfg.octava_anterior = cfg.octava
+            cfg.octava = random.randint(0, 8)  # Octava aleatoria inicial
+            cfg.caos = 1
+        else:
+            # Restaurar la octava anterior y desactivar modo caos
+            cfg.octava = cfg.octava_anterior
+            cfg.caos = 0
+
+
+def _value_button(cfg, rtos, button, kind, current_time):
+    """Botons cruceta 3/4: decrementar/incrementar valor amb acceleració"""
+    if kind == RELEASE:
+        cfg.button_debounce_time[button] = 0
+        cfg.config_acceleration = 1
+        return
+    if cfg.calibration_mode:
+        return
+    if kind == PRESS:
+        cfg.button_debounce_time[button] = current_time
+        cfg.config_hold_time = 0.0
+    elif kind != REPEAT or cfg.button_debounce_time[button] == 0:
+        return
+
+    # Calcular acceleració exponencial - Progressió més natural
+    cfg.config_hold_time = current_time - cfg.button_debounce_time[button]
+    if cfg.config_hold_time > 2.0:      # Acceleració màxima més tard
+        cfg.config_acceleration = 8
+    elif cfg.config_hold_time > 1.5:    # Progressió més gradual
+        cfg.config_acceleration = 4
+    elif cfg.config_hold_time > 0.8:    # Temps més natural abans d'accelerar
+        cfg.config_acceleration = 2
+    else:
+        cfg.config_acceleration = 1
+
+    cfg.last_interaction_time = current_time
+    step = cfg.config_acceleration if button == CRUETA_4 else -cfg.config_acceleration
+
+    if cfg.configout == 0:
+        # MODE CANVI: Sempre canviar només 1 mode (NO acceleració)
+        # Usar debounce per evitar múltiples canvis
+        if current_time - cfg.button_debounce_time[button] > MODE_CHANGE_INTERVAL:
+            if button == CRUETA_4:
+                cfg.loop_mode = (cfg.loop_mode + 1) if cfg.loop_mode < cfg.mode_count else 1
+            else:
+                cfg.loop_mode = (cfg.loop_mode - 1) if cfg.loop_mode > 1 else cfg.mode_count
+            cfg.configout = 0  # Mantenir en mode selecció de modes
+            rtos.stop_all_notes()
+            cfg.button_debounce_time[button] = current_time  # Reset debounce
+    elif cfg.configout == 1:
+        cfg.duty1 = max(1, min(99, cfg.duty1 + step))
+        rtos.stop_all_notes()  # Apagar gate al canviar duty
+    elif cfg.configout == 2:
+        cfg.duty2 = max(1, min(99, cfg.duty2 + step))
+        rtos.stop_all_notes()  # Apagar gate al canviar duty
+    elif cfg.configout == 3:
+        cfg.duty3 = max(1, min(99, cfg.duty3 + step))
+        rtos.stop_all_notes()  # Apagar gate al canviar duty
+    else:
+        # Harmònics: sempre d'un en un (sense acceleració)
+        harmonic = 1 if button == CRUETA_4 else -1
+        if cfg.configout == 4:
+            cfg.freqharm_base = (cfg.freqharm_base + harmonic) % 13
+        elif cfg.configout == 5:
+            cfg.freqharm1 = (cfg.freqharm1 + harmonic) % 13
+        elif cfg.configout == 6:
+            cfg.freqharm2 = (cfg.freqharm2 + harmonic) % 13
+        rtos.stop_all_notes()  # Apagar gate al canviar harmònic
+
+    cfg.show_config_mode = True
+    cfg.config_display_timer = 0
+
+
+def _extra_button(hw, cfg, rtos, button, kind, current_time):
+    """Botons extra: curta = ciclar configuració, llarga = resum / pausa"""
+    global _combo, _calibration_toggle_time
+
+    other = EXTRA_2 if button == EXTRA_1 else EXTRA_1
+
     # MODE CALIBRACIÓ: Botons extra 1 + 2 premuts junts
-    if hw.boton_extra_1.value and hw.boton_extra_2.value:
-        # Debounce per evitar canvis múltiples
-        if current_time - _debounce.get(10, 0) > 0.5:  # 500ms debounce per calibració
+    if kind == PRESS and _events.is_pressed(other):
+        if not _combo and current_time - _calibration_toggle_time > CALIBRATION_TOGGLE:
             cfg.calibration_mode = not cfg.calibration_mode
             cfg.last_interaction_time = current_time
-            _debounce[10] = current_time
+            _calibration_toggle_time = current_time
+            if cfg.calibration_mode:
+                # Carregar-la ara (gest de l'usuari) i no al primer frame de
+                # pantalla, dins d'una porció de cfg.display_slice_us
+                import core.calibration  # noqa: F401
+            elif cfg.settings_store is not None:
+                # Fi de la calibració: desar els rangs (si han canviat)
+                cfg.settings_store.request_save(current_time)
+        _combo = True
+    if _combo:
+        if kind == RELEASE:
+            cfg.button_hold_times[button] = 0
+            cfg.button_long_press_triggered[button] = False
+            if not _events.is_pressed(other):
+                _combo = False
         return
-    
-    # Botó extra 1: Ciclar configuració
-    if hw.boton_extra_1.value and not cfg.calibration_mode:
-        if cfg.button_hold_times[4] == 0:
-            cfg.button_hold_times[4] = current_time
-        
-        hold_duration = current_time - cfg.button_hold_times[4]
-        
-        # Polsació llarga: mostrar resum complet
-        if hold_duration > LONG_PRESS_SUMMARY and not cfg.button_long_press_triggered[4]:
+
+    if kind == PRESS:
+        if not cfg.calibration_mode:
+            cfg.button_hold_times[button] = current_time
+        return
+
+    if kind == LONG_PRESS:
+        if cfg.button_hold_times[button] == 0:
+            return  # Premut en mode calibració
+        cfg.button_long_press_triggered[button] = True
+        if button == EXTRA_1:
+            # Polsació llarga: mostrar resum complet
             cfg.show_full_summary = True
-            cfg.button_long_press_triggered[4] = True
-    elif cfg.button_hold_times[4] > 0:
-        # Deixa anar: Mode normal
-        if not cfg.button_long_press_triggered[4]:
-            # Ciclar configout (si estem en mode 0, mantenir configout=0)
-            if cfg.loop_mode == 0:
-                cfg.configout = 0  # Mode 0: només canviar modes
-            else:
-                cfg.configout = (cfg.configout + 1) % CONFIG_OPTION_COUNT
-            cfg.show_config_mode = True
-            cfg.config_display_timer = 0
         else:
-            cfg.show_full_summary = False
-        cfg.button_hold_times[4] = 0
-        cfg.button_long_press_triggered[4] = False
-        cfg.last_interaction_time = current_time
-    
-    # Botó extra 2: Curta=enrere config, Llarga(>1s)=pausa/stop
-    if hw.boton_extra_2.value and not cfg.calibration_mode:
-        if cfg.button_hold_times[5] == 0:
-            cfg.button_hold_times[5] = current_time
-        
-        hold_duration = current_time - cfg.button_hold_times[5]
-        
-        # Polsació llarga: pausa total
-        if hold_duration > LONG_PRESS_PAUSE and not cfg.button_long_press_triggered[5]:
+            # Polsació llarga: pausa total
             cfg.loop_mode = 0
             cfg.configout = 0  # Forçar mode de selecció de modes
             rtos.stop_all_notes()
             cfg.iteration = 0
             cfg.caos = 0
             hw.all_leds_off()
-            cfg.button_long_press_triggered[5] = True
-    elif cfg.button_hold_times[5] > 0:
-        # Deixa anar: si no era llarga
-        if not cfg.button_long_press_triggered[5]:
-            # Rotar enrere configout (SEMPRE mantenir configout=0 si estem en mode 0)
-            if cfg.loop_mode == 0:
-                cfg.configout = 0  # Mode 0: només canviar modes
-            else:
-                cfg.configout = (cfg.configout - 1) % CONFIG_OPTION_COUNT
-            cfg.show_config_mode = True
-            cfg.config_display_timer = 0
-        else:
-            # Si acabem de fer pausa llarga, assegurar configout=0
-            cfg.configout = 0
-        cfg.button_hold_times[5] = 0
-        cfg.button_long_press_triggered[5] = False
-        cfg.last_interaction_time = current_time
-    
-# Botó cruceta 1: ↑ Pujar octava
-    if boton_presionado(hw.boton_crueta_1, 0):
-        # NO actualitzar last_interaction_time (no canvia pantalla)
-        # Pujar octava
-        if cfg.octava < 8:
-            cfg.octava += 1
-            cfg.caos = 0
-        else:
-            # Al activar/desactivar el modo caos, guardar/restaurar la octava
-            if cfg.caos == 0:
-                # Guardar la octava actual y activar modo caos
-                cfg.octava_anterior = cfg.octava
-                cfg.octava = random.randint(0, 8)  # Octava aleatoria inicial
-                cfg.caos = 1
-            else:
-                # Restaurar la octava anterior y desactivar modo caos
-                cfg.octava = cfg.octava_anterior
-                cfg.caos = 0
-    
-    # Botó cruceta 2: ↓ Baixar octava
-    if boton_presionado(hw.boton_crueta_2, 1):
-        # NO actualitzar last_interaction_time (no canvia pantalla)
-        # Baixar octava
-        if cfg.octava > 0:
-            cfg.octava -= 1
-            cfg.caos = 0
-        else:
-            # Al activar/desactivar el modo caos, guardar/restaurar la octava
-            if cfg.caos == 0:
-                # Guardar la octava actual y activar modo caos
-                cfg.octava_anterior = cfg.octava
-                cfg.octava = random.randint(0, 8)  # Octava aleatoria inicial
-                cfg.caos = 1
-            else:
-                # Restaurar la octava anterior y desactivar modo caos
-                cfg.octava = cfg.octava_anterior
-                cfg.caos = 0
-    
-    # Botó cruceta 3: Decrementar valor amb acceleració
-    if hw.boton_crueta_3.value and not cfg.calibration_mode:
-        if cfg.button_debounce_time[2] == 0:
-            cfg.button_debounce_time[2] = current_time
-            cfg.config_hold_time = 0.0
-        
-        # Calcular acceleració exponencial - Progressió més natural
-        cfg.config_hold_time = current_time - cfg.button_debounce_time[2]
-        if cfg.config_hold_time > 2.0:      # Acceleració màxima més tard
-            cfg.config_acceleration = 8
-        elif cfg.config_hold_time > 1.5:    # Progressió més gradual
-            cfg.config_acceleration = 4
-        elif cfg.config_hold_time > 0.8:    # Temps més natural abans d'accelerar
-            cfg.config_acceleration = 2
-        else:
-            cfg.config_acceleration = 1
-        
-        cfg.last_interaction_time = current_time
-
-        if cfg.configout == 0:
-            # MODE CANVI: Sempre canviar només 1 mode (NO acceleració)
-            # Usar debounce per evitar múltiples canvis
-            if current_time - cfg.button_debounce_time[2] > 0.15:  # 150ms mínim
-                cfg.loop_mode = (cfg.loop_mode - 1) if cfg.loop_mode > 1 else 14
-                cfg.configout = 0  # Mantenir en mode selecció de modes
-                rtos.stop_all_notes()
-                cfg.button_debounce_time[2] = current_time  # Reset debounce
-        elif cfg.configout == 1:
-            cfg.duty1 = max(1, cfg.duty1 - cfg.config_acceleration)
-            rtos.stop_all_notes()  # Apagar gate al canviar duty
-        elif cfg.configout == 2:
-            cfg.duty2 = max(1, cfg.duty2 - cfg.config_acceleration)
-            rtos.stop_all_notes()  # Apagar gate al canviar duty
-        elif cfg.configout == 3:
-            cfg.duty3 = max(1, cfg.duty3 - cfg.config_acceleration)
-            rtos.stop_all_notes()  # Apagar gate al canviar duty
-        elif cfg.configout == 4:
-            cfg.freqharm_base = (cfg.freqharm_base - 1) % 13
-            rtos.stop_all_notes()  # Apagar gate al canviar harmònic
-        elif cfg.configout == 5:
-            cfg.freqharm1 = (cfg.freqharm1 - 1) % 13
-            rtos.stop_all_notes()  # Apagar gate al canviar harmònic
-        elif cfg.configout == 6:
-            cfg.freqharm2 = (cfg.freqharm2 - 1) % 13
-            rtos.stop_all_notes()  # Apagar gate al canviar harmònic
-        
-        cfg.show_config_mode = True
-        cfg.config_display_timer = 0
-    else:
-        cfg.button_debounce_time[2] = 0
-        cfg.config_acceleration = 1
-    
-    # Botó cruceta 4: Incrementar valor amb acceleració
-    if hw.boton_crueta_4.value and not cfg.calibration_mode:
-        if cfg.button_debounce_time[3] == 0:
-            cfg.button_debounce_time[3] = current_time
-            cfg.config_hold_time = 0.0
-        
-        # Calcular acceleració exponencial - Progressió més natural
-        cfg.config_hold_time = current_time - cfg.button_debounce_time[3]
-        if cfg.config_hold_time > 2.0:      # Acceleració màxima més tard
-            cfg.config_acceleration = 8
-        elif cfg.config_hold_time > 1.5:    # Progressió més gradual
-            cfg.config_acceleration = 4
-        elif cfg.config_hold_time > 0.8:    # Temps més natural abans d'accelerar
-            cfg.config_acceleration = 2
+        return
+
+    if kind != RELEASE or cfg.button_hold_times[button] == 0:
+        return
+
+    # Deixa anar
+    if not cfg.button_long_press_triggered[button]:
+        # Curta: ciclar configout endavant (Extra1) o enrere (Extra2)
+        # (SEMPRE mantenir configout=0 si estem en mode 0)
+        if cfg.loop_mode == 0:
+            cfg.configout = 0  # Mode 0: només canviar modes
+        elif button == EXTRA_1:
+            cfg.configout = (cfg.configout + 1) % CONFIG_OPTION_COUNT
         else:
-            cfg.config_acceleration = 1
-        
-        cfg.last_interaction_time = current_time
-        
-        if cfg.configout == 0:
-            # MODE CANVI: Sempre canviar només 1 mode (NO acceleració)
-            # Usar debounce per evitar múltiples canvis
-            if current_time - cfg.button_debounce_time[3] > 0.15:  # 150ms mínim
-                cfg.loop_mode = (cfg.loop_mode + 1) if cfg.loop_mode < 14 else 1
-                cfg.configout = 0  # Mantenir en mode selecció de modes
-                rtos.stop_all_notes()
-                cfg.button_debounce_time[3] = current_time  # Reset debounce
-        elif cfg.configout == 1:
-            cfg.duty1 = min(99, cfg.duty1 + cfg.config_acceleration)
-            rtos.stop_all_notes()  # Apagar gate al canviar duty
-        elif cfg.configout == 2:
-            cfg.duty2 = min(99, cfg.duty2 + cfg.config_acceleration)
-            rtos.stop_all_notes()  # Apagar gate al canviar duty
-        elif cfg.configout == 3:
-            cfg.duty3 = min(99, cfg.duty3 + cfg.config_acceleration)
-            rtos.stop_all_notes()  # Apagar gate al canviar duty
-        elif cfg.configout == 4:
-            cfg.freqharm_base = (cfg.freqharm_base + 1) % 13
-            rtos.stop_all_notes()  # Apagar gate al canviar harmònic
-        elif cfg.configout == 5:
-            cfg.freqharm1 = (cfg.freqharm1 + 1) % 13
-            rtos.stop_all_notes()  # Apagar gate al canviar harmònic
-        elif cfg.configout == 6:
-            cfg.freqharm2 = (cfg.freqharm2 + 1) % 13
-            rtos.stop_all_notes()  # Apagar gate al canviar harmònic
-        
+            cfg.configout = (cfg.configout - 1) % CONFIG_OPTION_COUNT
         cfg.show_config_mode = True
         cfg.config_display_timer = 0
+    elif button == EXTRA_1:
+        cfg.show_full_summary = False
     else:
-        cfg.button_debounce_time[3] = 0
-        cfg.config_acceleration = 1
+        # Si acabem de fer pausa llarga, assegurar configout=0
+        cfg.configout = 0
+    cfg.button_hold_times[button] = 0
+    cfg.button_long_press_triggered[button] = False
+    cfg.last_interaction_time = current_time
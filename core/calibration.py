@@ -1,6 +1,11 @@
 # =============================================================================
 # CALIBRACIÓ CV - TECLA
 # =============================================================================
+# Processat dels botons i pantalla del mode calibració. main.py l'importa
+# sota demanda (core/lazy.py): només es carrega si s'entra en calibració.
+# En sortir del mode, core/button_handler.py demana desar els rangs
+# calibrats (SettingsStore.request_save()).
+# =============================================================================
 import time
 
 # Debounce per botons de calibració - Temps humà natural
@@ -14,19 +19,46 @@ def procesar_calibracion(hw, cfg):
     # Botó 1: Establir CV1 mínim
     if hw.boton_crueta_1.value and current_time - _calibration_debounce[0] > CALIBRATION_DEBOUNCE_TIME:
         cfg.cv1_min = hw.get_voltage(hw.cv1_pote)  # GP26
+        cfg.cv1_calibrated = True
         _calibration_debounce[0] = current_time
     
     # Botó 2: Establir CV1 màxim
     if hw.boton_crueta_2.value and current_time - _calibration_debounce[1] > CALIBRATION_DEBOUNCE_TIME:
         cfg.cv1_max = hw.get_voltage(hw.cv1_pote)  # GP26
+        cfg.cv1_calibrated = True
         _calibration_debounce[1] = current_time
     
     # Botó 3: Establir CV2 mínim
     if hw.boton_crueta_3.value and current_time - _calibration_debounce[2] > CALIBRATION_DEBOUNCE_TIME:
         cfg.cv2_min = hw.get_voltage(hw.cv2_ldr)  # GP27
+        cfg.cv2_calibrated = True
         _calibration_debounce[2] = current_time
     
     # Botó 4: Establir CV2 màxim
     if hw.boton_crueta_4.value and current_time - _calibration_debounce[3] > CALIBRATION_DEBOUNCE_TIME:
         cfg.cv2_max = hw.get_voltage(hw.cv2_ldr)  # GP27
+        cfg.cv2_calibrated = True
         _calibration_debounce[3] = current_time
+
+
+def mostrar_calibracion_cv(hw, cfg):
+    """Pantalla calibració CV"""
+    hw.display.fill(0)
+    
+    cv1_actual = hw.get_voltage(hw.cv1_pote)  # GP26
+    cv2_actual = hw.get_voltage(hw.cv2_ldr)   # GP27
+    
+    hw.display.text("CALIBRACIO CV", 10, 0, 1)
+    hw.display.hline(0, 10, 128, 1)
+    hw.display.text("CV1 (Pote):", 0, 15, 1)
+    hw.display.text(f"{cv1_actual:.2f}V", 80, 15, 1)
+    hw.display.text(f"Min:{cfg.cv1_min:.2f}", 0, 25, 1)
+    hw.display.text(f"Max:{cfg.cv1_max:.2f}", 70, 25, 1)
+    
+    hw.display.text("CV2 (LDR):", 0, 38, 1)
+    hw.display.text(f"{cv2_actual:.2f}V", 80, 38, 1)
+    hw.display.text(f"Min:{cfg.cv2_min:.2f}", 0, 48, 1)
+    hw.display.text(f"Max:{cfg.cv2_max:.2f}", 70, 48, 1)
+    
+    hw.display.text("BTN: 1/2=CV1 3/4=CV2", 0, 58, 1)
+    hw.display.show()
@@ -4,21 +4,43 @@ from music.converters import bpm_to_sleep_time, smooth_value
 
 
 class MasterClock:
-    """Clock centralitzat que sincronitza totes les tasques segons BPM."""
+    """Clock centralitzat que sincronitza totes les tasques segons BPM.
 
-    def __init__(self, config, max_catchup_ticks=5):  # Abans 3, ara 5 per millor recuperació
+    Si es passa `sync` (MidiClockFollower) i cfg.midi_clock_follow és True,
+    mentre arribin TimingClock el tempo i la fase dels ticks vénen del
+    rellotge MIDI extern en lloc del slider.
+    """
+
+    def __init__(self, config, max_catchup_ticks=5, sync=None):  # Abans 3, ara 5 per millor recuperació
         self.cfg = config
         self.max_catchup_ticks = max_catchup_ticks
+        self.sync = sync
+        self.external = False  # True = seguint el rellotge MIDI
         initial_bpm = config.filtered_bpm if config.filtered_bpm else config.bpm
         self.filtered_bpm = max(1.0, float(initial_bpm))
         self.period = bpm_to_sleep_time(self.filtered_bpm)
         now = time.monotonic()
         self.last_tick = now
         self.next_tick = now + self.period
+        self._ticks = []  # Llista reutilitzada per consume_ticks() (sense assignar per iteració)
 
     def update(self, raw_bpm, current_time):
         """Actualitza el període segons el BPM mesurat amb suavitzat."""
-        filtered = smooth_value(self.filtered_bpm, raw_bpm, self.cfg.bpm_smoothing)
+        sync = self.sync
+        external = (
+            sync is not None and sync.active and sync.period > 0
+            and self.cfg.midi_clock_follow
+        )
+        if external != self.external:
+            # Canvi de font: el pròxim tick es recalcula des d'ara
+            self.external = external
+            self.next_tick = current_time + self.period
+        if external:
+            # El PLL ja suavitza: sense filtre addicional
+            raw_bpm = sync.bpm
+            filtered = raw_bpm
+        else:
+            filtered = smooth_value(self.filtered_bpm, raw_bpm, self.cfg.bpm_smoothing)
         if filtered is None:
             filtered = raw_bpm
         filtered = max(1.0, float(filtered))
@@ -33,20 +55,29 @@ class MasterClock:
         # filtered_sleep_time eliminat (redundant)
         self.cfg.bpm = int(round(filtered))
 
+        if external:
+            self.next_tick = sync.next_tick_time()
         # Evitar que un canvi brusc deixi la següent nota massa llunyana
-        if self.next_tick - current_time > self.period * 2:
+        elif self.next_tick - current_time > self.period * 2:
             self.next_tick = current_time + self.period
 
         return self.period
 
     def consume_ticks(self, current_time, active=True):
-        """Retorna una llista de ticks que s'han de disparar fins al temps actual."""
+        """Retorna una llista de ticks que s'han de disparar fins al temps actual.
+
+        La llista es reutilitza: només és vàlida fins a la pròxima crida.
+        """
+        ticks = self._ticks
+        ticks.clear()
         if not active:
             self.last_tick = current_time
             self.next_tick = current_time + self.period
-            return []
+            return ticks
+
+        if self.external:
+            return self._consume_external_ticks(current_time)
 
-        ticks = []
         while current_time >= self.next_tick and len(ticks) < self.max_catchup_ticks:
             tick_time = self.next_tick
             ticks.append(tick_time)
@@ -60,9 +91,34 @@ class MasterClock:
 
         return ticks
 
+    def _consume_external_ticks(self, current_time):
+        """Ticks a l'hora estimada pel PLL del rellotge MIDI."""
+        sync = self.sync
+        ticks = self._ticks
+        if not sync.running:
+            self.next_tick = current_time + self.period
+            return ticks
+        tick_time = sync.next_tick_time()
+        while current_time >= tick_time and len(ticks) < self.max_catchup_ticks:
+            ticks.append(tick_time)
+            self.last_tick = tick_time
+            sync.advance_tick()
+            tick_time = sync.next_tick_time()
+        # Massa enrere (p. ex. bucle bloquejat): saltar els ticks perduts
+        while current_time >= tick_time:
+            sync.advance_tick()
+            tick_time = sync.next_tick_time()
+        self.next_tick = tick_time
+        return ticks
+
     def idle_sleep(self, current_time):
         """Sleep adaptatiu més agressiu per màxima responsivitat (optimitzat)."""
-        remaining = self.next_tick - current_time
+        # Despertar també per al pròxim deadline del RTOS (polsos de rellotge)
+        next_deadline = self.next_tick
+        timers = self.cfg.timer_queue
+        if timers is not None and timers.next_deadline < next_deadline:
+            next_deadline = timers.next_deadline
+        remaining = next_deadline - current_time
         if remaining > 0.002:  # Només sleep si queda >2ms (abans 1ms)
             # Sleep més agressiu: max 1ms, però proporcional al temps restant
             time.sleep(min(0.001, remaining * 0.3))  # Abans: 0.05
@@ -7,10 +7,21 @@ octava = 5
 octava_anterior = 0  # Guarda la octava anterior al activar el modo caos
 caos = 0
 caos_note = 0
-rio_base = 64
+mandelbrot_bilinear = False  # Graella fractal: False=cel·la més propera, True=bilineal
+mandelbrot_fill_cells = 4  # Cel·les de la graella fractal per porció de la tasca "fractal"
 
 # Estats del sistema
 loop_mode = 0
+mode_count = 14  # Número de mode més alt del registre (ModeLoader l'actualitza)
+modes_max_loaded = 0  # Modes importats alhora com a màxim (0 = sense límit, només memòria)
+modes_min_free = 24576  # Bytes lliures mínims: per sota es descarreguen els modes menys usats
+skip_intro = False  # True = arrencar sense animació d'inici
+profiler_enabled = True  # Histogrames de temps del bucle (informe: 'p' per sèrie)
+alloc_audit = False  # Bytes assignats per tick i mode amb gc.mem_free() (informe: 'a' per sèrie)
+midi_running_status = False  # True = ometre bytes d'estat repetits dins de cada write MIDI
+midi_clock_follow = True  # Seguir el rellotge MIDI extern (24 ppqn) quan n'arribi
+midi_clock_active = False  # Estat: True mentre arriben TimingClock
+midi_clock_out = True  # Enviar TimingClock (24 ppqn) + Start/Stop amb els modes
 configout = 0  # 0=mode, 1=duty1, 2=duty2, 3=duty3, 4=harm_base, 5=harm1, 6=harm2
 last_interaction_time = 0.0
 
@@ -18,6 +29,16 @@ last_interaction_time = 0.0
 button_hold_times = [0.0] * 6  # Temps inici polsació per cada botó
 button_long_press_triggered = [False] * 6  # Si polsació llarga activada
 show_full_summary = False  # Mostrar resum complet (Extra1 mantingut)
+pio_buttons = False  # Llegir els botons amb PIO (core/pio_buttons.py) en comptes de DigitalInOut
+scheduler_guard_us = 300  # Marge abans del pròxim tick/temporitzador per a LEDs i pantalla
+scheduler_max_defer = 0.5  # Segons màxims que la pantalla pot quedar ajornada (0 = mai)
+display_slice_us = 2000  # Temps màxim de dibuix de pantalla per porció del planificador
+gc_managed = True  # GC automàtic desactivat: gc.collect() al marge abans del pròxim tick (core/gc_manager.py)
+gc_soft_bytes = 32768  # Escombraries mínimes per recol·lectar en un marge
+gc_max_heap = 0.75  # Fracció del heap ocupat a partir de la qual es recol·lecta sense marge
+settings_persist = True  # Desar mode/octava/duty/harmònics/rangs i calibració CV a nvm (core/settings_store.py)
+settings_save_delay = 5.0  # Segons sense canvis abans d'escriure la configuració
+settings_max_wait = 60.0  # Segons màxims esperant marge per escriure (després s'escriu igualment)
 
 # Control d'harmonies i cicles de treball
 duty1 = 50  # Cicle de treball PWM1 (1-99%)
@@ -43,9 +64,8 @@ led_last_state = {
 led_mode_step = 0
 last_loop_led_time = 0.0
 
-def duty_percent_to_cycle(percent):
-    """Converteix duty cycle de percentatge (1-99) a valor PWM (655-64880)"""
-    return int((percent / 100.0) * 65535)
+# Conversió duty% -> PWM via taula precalculada (mantingut aquí per compatibilitat)
+from music.converters import duty_percent_to_cycle
 
 # Variables de temps i seqüència
 iteration = 0
@@ -58,6 +78,11 @@ next_note_time = 0.0
 last_button_check = 0.0
 last_display_update = 0.0
 last_input_sample = 0.0  # Nueva variable para muestreo desacoplado
+input_sample_rate = 200  # Mostres ADC per segon (InputSampler)
+input_oversample = 5  # Lectures per mostra i canal (filtre de mediana)
+input_filter = "median"  # "median" o "trimmed" (mitjana sense mínim ni màxim)
+input_change_threshold = 0.01  # Volts: canvis menors es consideren soroll
+input_version = 0  # S'incrementa quan CV1/CV2/slider canvien (InputSampler)
 next_calibration_frame = 0.0  # Temps objectiu per refresc de pantalla en mode calibratge
 current_sleep_time = 0.3  # Període actual entre notes segons BPM (actualitzat cada iteració)
 x, y, z = 0.0, 0.0, 0.0  # Variables globales para inputs
@@ -92,6 +117,8 @@ calibration_mode = False
 # CV input ranges (calibrables per CV1 i CV2 independents)
 cv1_min, cv1_max = 0.0, 3.3
 cv2_min, cv2_max = 0.0, 3.3
+cv1_calibrated = False  # True: cv1_min/max venen de la calibració (es desen a nvm)
+cv2_calibrated = False  # True: cv2_min/max venen de la calibració (es desen a nvm)
 
 # Presets de rangs CV segons cv1/cv2_range_config
 CV_RANGE_PRESETS = {
@@ -120,49 +147,6 @@ def apply_cv2_range_preset():
 show_config_mode = False
 config_display_timer = 0
 
-# Estats per algorismes específics
-state_harmony = {
-    'previous_note': 60,
-    'last_profile': 0,
-    'last_tension': 0,
-    'initialized': False
-}
-
-# Estat específic per al mode Euclidia simplificat
-state_euclid = {
-    'initialized': False,
-    'pattern': [],
-    'accent_map': [],
-    'pulses': -1,
-    'position': 0,
-    'degree': 0,
-    'direction': 1,
-    'previous_note': None,
-    'accent_level': -1,
-}
-
-# Estat específic per al mode Espiral
-state_espiral = {
-    'initialized': False,
-    'transposicio': 0,
-    'cicle_counter': 0,
-}
-
-# Estat específic per al mode Contrapunt
-state_contrapunt = {
-    'initialized': False,
-    'beat_counter': 0,
-    'degree': 0,
-}
-
-# Estat específic per al mode Narval
-state_narval = {
-    'initialized': False,
-    'grau_escala': 0,         # Posició actual a l'escala pentatònica
-    'nota_base': 60,          # Nota MIDI base (Do central)
-}
-
-
 # Rangs i escales per conversió de voltatge
 pot_min, pot_max = 0.0, 3.3
 step = (pot_max - pot_min) / 127.0
@@ -177,6 +161,13 @@ gate_active = False
 gate_off_time = 0.0
 gate_duration = 0.020  # Duració variable segons mode
 note_off_schedule = {}  # Mapa nota->temps_off per NoteOff programats
+timer_queue = None  # TimerQueue de deadlines (gate + NoteOff + rellotge MIDI), creada per RTOSManager
+profiler = None  # LoopProfiler del bucle principal, creat a main.py
+control_frame = None  # ControlFrame dels modes (CVs normalitzats per tick), creat per ModeLoader
+scheduler = None  # Scheduler del bucle principal (core/scheduler.py), creat a main.py
+render_job = None  # RenderJob del frame de pantalla en curs (display/render_job.py), creat a main.py
+gc_manager = None  # GCManager (core/gc_manager.py), creat a main.py
+settings_store = None  # SettingsStore (core/settings_store.py), creat a main.py
 
 # Duracions segures per a NoteOff (clamp per mantenir consistència)
 NOTE_OFF_MIN_DURATION = 0.02
@@ -0,0 +1,105 @@
+# =============================================================================
+# CONTROL FRAME - Paràmetres dels CVs calculats un cop per tick
+# =============================================================================
+# Els modes convertien x/y amb converters.normalize() 2-4 vegades per tick i
+# en treien enters (densitat, pulsos, tonalitat...). El ControlFrame fa la
+# normalització una sola vegada quan canvien els CVs o la calibració, i
+# memoritza cada paràmetre quantitzat fins que torna a canviar l'entrada.
+#
+#   nx, ny      - CV1 / CV2 normalitzats (0-1)
+#   qx(levels)  - CV1 quantitzat a `levels` nivells (0 .. levels-1)
+#   qy(levels)  - igual per CV2
+#   changed     - algun CV ha canviat des del tick anterior
+#   x_changed(levels) / y_changed(levels)
+#               - el valor quantitzat ha canviat en aquest tick
+#
+# La quantització és int(n * (levels - 0.001)), la mateixa que feien els
+# modes amb `* 9.999`, `* 31.999`, etc.
+# =============================================================================
+from music.converters import normalize
+
+# Posicions de cada entrada de memòria [versió, valor, versió del canvi]
+_VERSION = 0
+_VALUE = 1
+_CHANGED = 2
+
+
+class ControlFrame:
+    """Valors normalitzats i quantitzats de CV1/CV2 per al tick actual.
+
+    Arguments:
+        config: Mòdul de configuració global (rangs cv1/cv2 calibrats)
+    """
+
+    __slots__ = (
+        "cfg", "x", "y", "nx", "ny", "version", "changed",
+        "_cal", "_qx", "_qy",
+    )
+
+    def __init__(self, config):
+        self.cfg = config
+        self.x = None
+        self.y = None
+        self.nx = 0.5
+        self.ny = 0.5
+        self.version = 0   # S'incrementa a cada canvi de CV o calibració
+        self.changed = False
+        self._cal = (None, None, None, None)
+        self._qx = {}      # levels -> [versió, valor, versió del canvi]
+        self._qy = {}
+
+    def update(self, x, y):
+        """Nou tick: recalcula nx/ny només si x, y o la calibració han canviat
+
+        Arguments:
+            x: CV1 (GP26) calibrat
+            y: CV2 (GP27) calibrat
+
+        Returns:
+            True si algun valor ha canviat des del tick anterior
+        """
+        cfg = self.cfg
+        cal = self._cal
+        if (x == self.x and y == self.y
+                and cal[0] == cfg.cv1_min and cal[1] == cfg.cv1_max
+                and cal[2] == cfg.cv2_min and cal[3] == cfg.cv2_max):
+            self.changed = False
+            return False
+
+        self._cal = (cfg.cv1_min, cfg.cv1_max, cfg.cv2_min, cfg.cv2_max)
+        self.x = x
+        self.y = y
+        self.nx = normalize(x, cfg.cv1_min, cfg.cv1_max)
+        self.ny = normalize(y, cfg.cv2_min, cfg.cv2_max)
+        self.version += 1
+        self.changed = True
+        return True
+
+    def _quantize(self, memo, value, levels):
+        entry = memo.get(levels)
+        if entry is None:
+            entry = [-1, -1, -1]
+            memo[levels] = entry
+        if entry[_VERSION] != self.version:
+            entry[_VERSION] = self.version
+            q = int(value * (levels - 0.001))
+            if q != entry[_VALUE]:
+                entry[_VALUE] = q
+                entry[_CHANGED] = self.version
+        return entry
+
+    def qx(self, levels):
+        """CV1 quantitzat a `levels` nivells (0 .. levels-1)"""
+        return self._quantize(self._qx, self.nx, levels)[_VALUE]
+
+    def qy(self, levels):
+        """CV2 quantitzat a `levels` nivells (0 .. levels-1)"""
+        return self._quantize(self._qy, self.ny, levels)[_VALUE]
+
+    def x_changed(self, levels):
+        """True si qx(levels) ha canviat en aquest tick"""
+        return self.changed and self._quantize(self._qx, self.nx, levels)[_CHANGED] == self.version
+
+    def y_changed(self, levels):
+        """True si qy(levels) ha canviat en aquest tick"""
+        return self.changed and self._quantize(self._qy, self.ny, levels)[_CHANGED] == self.version
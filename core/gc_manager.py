@@ -0,0 +1,132 @@
+# =============================================================================
+# GESTOR DEL GC - Recol·leccions fora del compàs - TECLA
+# =============================================================================
+# A CircuitPython el GC automàtic s'executa quan el heap s'omple, sigui on
+# sigui: al mig d'un tick o just abans d'un pols de rellotge MIDI, amb una
+# pausa de diversos ms. Aquest mòdul desactiva la recol·lecció automàtica
+# (gc.disable()) i crida gc.collect() des del bucle principal, just abans
+# del sleep, només quan:
+#
+#   - s'han acumulat com a mínim soft_bytes d'escombraries des de l'última
+#     recol·lecció, i
+#   - el marge fins al pròxim deadline (MasterClock.next_tick o temporitzador
+#     del RTOS, Scheduler.slack_us()) hi cap la pausa estimada + un marge.
+#     La pausa estimada és el pic de les últimes (decau 1/8 per recol·lecció)
+#
+# Sostre de seguretat: si el heap ocupat passa de max_heap (fracció), es
+# recol·lecta igualment sense esperar marge (recol·lecció forçada). I amb el
+# GC desactivat la VM encara recol·lecta si una assignació no hi cap: aquestes
+# es compten com a automàtiques (mem_alloc() baixa sense cap collect()).
+#
+# Les pauses es registren a l'etapa "gc" del profiler; informe: enviar "g"
+# per la consola sèrie.
+# =============================================================================
+import gc
+import time
+
+from core.profiler import STAGE_GC
+
+
+class GCManager:
+    """Recol·leccions explícites en el marge abans del pròxim deadline.
+
+    Arguments:
+        scheduler: Scheduler del bucle principal (slack_us)
+        profiler: LoopProfiler (etapa "gc") o None
+        soft_bytes: Escombraries mínimes per demanar una recol·lecció
+        max_heap: Fracció del heap a partir de la qual es força la recol·lecció
+        guard_us: Marge extra abans del deadline
+        enabled: Si és False (o no hi ha gc.mem_alloc), el GC queda com està
+    """
+
+    __slots__ = (
+        "scheduler", "profiler", "soft_bytes", "max_heap", "guard_us", "enabled",
+        "heap_size", "limit", "pause_us", "max_pause_us", "collections", "forced",
+        "automatic", "_live", "_used",
+    )
+
+    def __init__(self, scheduler, profiler=None, soft_bytes=32768, max_heap=0.75,
+                 guard_us=300, enabled=True):
+        self.scheduler = scheduler
+        self.profiler = profiler
+        self.soft_bytes = soft_bytes
+        self.max_heap = max_heap
+        self.guard_us = guard_us
+        self.enabled = enabled and hasattr(gc, "mem_alloc")
+        self.heap_size = 0
+        self.limit = 0
+        self.pause_us = 0        # Pausa estimada (pic amb decaïment)
+        self.max_pause_us = 0
+        self.collections = 0     # Recol·leccions explícites (incloses les forçades)
+        self.forced = 0          # Per sobre de max_heap sense marge
+        self.automatic = 0       # Fetes per la VM (heap ple)
+        self._live = 0           # Heap ocupat després de l'última recol·lecció
+        self._used = 0           # Heap ocupat a l'últim step()
+
+    def start(self):
+        """Recol·lecta, mesura el heap i desactiva el GC automàtic"""
+        if not self.enabled:
+            return
+        self._collect()
+        self.collections = 0
+        self.heap_size = gc.mem_alloc() + gc.mem_free()
+        self.limit = int(self.heap_size * self.max_heap)
+        gc.disable()
+
+    def stop(self):
+        """Torna al GC automàtic"""
+        if self.enabled:
+            gc.enable()
+
+    def step(self):
+        """Recol·lecta si cal i hi ha marge (cridar just abans del sleep)
+
+        Returns:
+            True si ha recol·lectat (el marge ja està gastat)
+        """
+        if not self.enabled:
+            return False
+        used = gc.mem_alloc()
+        if used < self._used:
+            # La VM ha recol·lectat pel seu compte (assignació sense lloc)
+            self.automatic += 1
+            self._live = used
+        self._used = used
+        if used >= self.limit:
+            self.forced += 1
+        elif (used - self._live < self.soft_bytes
+              or self.scheduler.slack_us() < self.pause_us + self.guard_us):
+            return False
+        self._collect()
+        return True
+
+    def _collect(self):
+        start = time.monotonic_ns()
+        gc.collect()
+        pause_ns = time.monotonic_ns() - start
+        self._live = self._used = gc.mem_alloc()
+        self.collections += 1
+        pause_us = pause_ns // 1000
+        estimate = self.pause_us
+        self.pause_us = pause_us if pause_us > estimate else estimate - ((estimate - pause_us) >> 3)
+        if pause_us > self.max_pause_us:
+            self.max_pause_us = pause_us
+        if self.profiler is not None:
+            self.profiler.record_pause(STAGE_GC, pause_ns)
+
+    def reset(self):
+        self.max_pause_us = 0
+        self.collections = 0
+        self.forced = 0
+        self.automatic = 0
+
+    def report(self):
+        """Informe: recol·leccions, pauses i ocupació del heap"""
+        if not self.enabled:
+            return "GC automàtic (gestor desactivat)"
+        return (
+            f"GC: {self.collections} collect ({self.forced} forçats) "
+            f"{self.automatic} automàtics | pausa est {self.pause_us} us "
+            f"max {self.max_pause_us} us | heap {gc.mem_alloc()}/{self.heap_size} B "
+            f"(viu {self._live} B, sostre {self.limit} B)"
+        )
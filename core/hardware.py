@@ -7,15 +7,24 @@ import digitalio
 import analogio
 import pwmio
 import usb_midi
-from adafruit_midi import MIDI
+from core.midi_out import FastMIDI
 from adafruit_ssd1306 import SSD1306_I2C
+from display.dirty_display import DirtyDisplay
 
 class TeclaHardware:
     """Gestió centralitzada de tot el hardware del TECLA"""
     
-    def __init__(self):
+    def __init__(self, pio_buttons=False):
+        """
+        Args:
+            pio_buttons: Llegir els botons amb màquines PIO (ButtonPIOManager)
+                en comptes de sis DigitalInOut
+        """
+        self.pio_buttons = pio_buttons
+        self.button_pio = None
+
         # MIDI
-        self.midi = MIDI(midi_out=usb_midi.ports[1], out_channel=0)
+        self.midi = FastMIDI(midi_in=usb_midi.ports[0], midi_out=usb_midi.ports[1], out_channel=0)
         
         # PWM outputs - PWM1 i PWM3 invertits
         self.pwm1 = pwmio.PWMOut(board.GP22, frequency=440, duty_cycle=80, variable_frequency=True)  # Era GP0
@@ -40,18 +49,37 @@ class TeclaHardware:
         self._setup_display()
     
     def _setup_buttons(self):
-        """Configurar botons de control"""
-        self.boton_crueta_1 = self._create_button(board.GP13)
-        self.boton_crueta_2 = self._create_button(board.GP14)
-        self.boton_crueta_3 = self._create_button(board.GP15)
-        self.boton_crueta_4 = self._create_button(board.GP3)
-        self.boton_extra_1 = self._create_button(board.GP5)
-        self.boton_extra_2 = self._create_button(board.GP4)
+        """Configurar botons de control
         
-        self.buttons = [
-            self.boton_crueta_1, self.boton_crueta_2, self.boton_crueta_3,
-            self.boton_crueta_4, self.boton_extra_1, self.boton_extra_2
-        ]
+        Ordre (índex = bit del bitmask de read_buttons()):
+            0 crueta_1, 1 crueta_2, 2 crueta_3, 3 crueta_4, 4 extra_1, 5 extra_2
+        """
+        pins = (board.GP13, board.GP14, board.GP15, board.GP3, board.GP5, board.GP4)
+        
+        if self.pio_buttons:
+            # PIO: el FIFO només rep mostres quan algun pin canvia;
+            # els proxies mantenen .value per al codi existent (calibració)
+            from core.pio_buttons import ButtonPIOManager
+            self.button_pio = ButtonPIOManager(pins, pull_down=True)
+            self.buttons = list(self.button_pio.proxies)
+        else:
+            self.buttons = [self._create_button(pin) for pin in pins]
+        
+        (self.boton_crueta_1, self.boton_crueta_2, self.boton_crueta_3,
+         self.boton_crueta_4, self.boton_extra_1, self.boton_extra_2) = self.buttons
+    
+    def read_buttons(self):
+        """Bitmask dels botons premuts (bit i = self.buttons[i])"""
+        if self.button_pio is not None:
+            self.button_pio.update()
+            return self.button_pio.mask
+        mask = 0
+        bit = 1
+        for button in self.buttons:
+            if button.value:
+                mask |= bit
+            bit <<= 1
+        return mask
     
     def _create_button(self, pin):
         """Crear botó amb pull-down"""
@@ -92,7 +120,8 @@ class TeclaHardware:
     def _setup_display(self):
         """Configurar pantalla OLED"""
         i2c = busio.I2C(scl=board.GP21, sda=board.GP20)
-        self.display = SSD1306_I2C(128, 64, i2c, addr=0x3C)
+        # DirtyDisplay: show() només envia les pàgines que han canviat
+        self.display = DirtyDisplay(SSD1306_I2C(128, 64, i2c, addr=0x3C))
         self.display.fill(0)
         self.display.show()
     
@@ -244,8 +273,8 @@ class TeclaHardware:
     def display_configuration_mode(self, cfg):
         """Mostra el valor del paràmetre configurat en LEDs 6, 3, 7"""
         if cfg.configout == 0:
-            # Loop mode (0-14)
-            self._display_value(cfg.loop_mode, 14)
+            # Loop mode (0-mode_count)
+            self._display_value(cfg.loop_mode, cfg.mode_count)
         elif cfg.configout == 1:
             # Duty1 (1-99)
             self._display_value(cfg.duty1, 99)
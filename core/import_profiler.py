@@ -0,0 +1,163 @@
+# =============================================================================
+# PERFIL D'IMPORTACIONS A L'ARRENCADA - TECLA
+# =============================================================================
+# main.py importa tots els subsistemes abans del bucle principal (hardware,
+# RTOS, MIDI, pantalles, modes...) i cada import compila o carrega el mòdul,
+# executa el seu codi i deixa objectes al heap. ImportProfiler substitueix
+# builtins.__import__ durant l'arrencada i, per cada mòdul que es carrega de
+# nou (els que ja són a sys.modules no es mesuren), registra:
+#
+#   total  - temps inclusiu (amb els mòduls que importa)
+#   propi  - temps sense els imports niuats
+#   bytes  - heap retingut (gc.mem_alloc() abans/després), inclusiu i propi
+#
+# `from paquet import a, b` amb submòduls encara no carregats es mesura
+# com un registre per submòdul (paquet.a, paquet.b). Els imports relatius
+# (level > 0) no es mesuren.
+#
+# main.py l'activa a l'inici i l'atura abans del bucle principal; informe:
+# enviar "i" per la consola sèrie.
+#
+# Nota: cal un firmware que permeti substituir builtins (els builds complets
+# de CircuitPython, RP2040 inclòs); si no, start() retorna False.
+# =============================================================================
+import gc
+import sys
+import time
+
+try:
+    import builtins
+except ImportError:
+    builtins = None
+
+# Camps de cada registre
+NAME = 0
+DEPTH = 1
+TOTAL_US = 2
+SELF_US = 3
+BYTES = 4
+SELF_BYTES = 5
+
+
+class ImportProfiler:
+    """Temps i heap de cada mòdul importat entre start() i stop().
+
+    Arguments:
+        clock: Funció de temps en ns (per defecte time.monotonic_ns)
+        mem_alloc: Funció de bytes ocupats al heap (per defecte gc.mem_alloc)
+    """
+
+    def __init__(self, clock=None, mem_alloc=None):
+        self.clock = clock
+        self.mem_alloc = mem_alloc if mem_alloc is not None else getattr(gc, "mem_alloc", None)
+        self.records = []     # [nom, profunditat, us, us propis, bytes, bytes propis]
+        self.enabled = False
+        self.total_us = 0     # De start() a stop()
+        self._original = None
+        self._start = 0
+        self._depth = 0
+        self._child_ns = 0    # Temps dels imports niuats del nivell actual
+        self._child_bytes = 0
+
+    def _now(self):
+        return self.clock() if self.clock is not None else time.monotonic_ns()
+
+    def start(self):
+        """Substitueix builtins.__import__
+
+        Returns:
+            True si el perfil queda actiu
+        """
+        if self.enabled or builtins is None:
+            return self.enabled
+        original = builtins.__import__
+        try:
+            builtins.__import__ = self._import
+        except (AttributeError, TypeError):
+            return False
+        self._original = original
+        self.enabled = True
+        self._start = self._now()
+        return True
+
+    def stop(self):
+        """Restaura builtins.__import__ (els registres es conserven)"""
+        if not self.enabled:
+            return
+        builtins.__import__ = self._original
+        self._original = None
+        self.enabled = False
+        self.total_us = (self._now() - self._start) // 1000
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original
+        if level or original is None:
+            return original(name, globals, locals, fromlist, level)
+        if name not in sys.modules:
+            self._measure(name)
+        if fromlist:
+            module = sys.modules.get(name)
+            for item in fromlist:
+                if item == "*" or module is None or hasattr(module, item):
+                    continue
+                if name + "." + item not in sys.modules:
+                    try:
+                        self._measure(name + "." + item)
+                    except ImportError:
+                        pass  # No és un submòdul: l'import original donarà l'error
+        return original(name, globals, locals, fromlist, level)
+
+    def _measure(self, name):
+        """Importa `name` (ja resolt) i en registra temps i heap"""
+        mem_alloc = self.mem_alloc
+        record = [name, self._depth, 0, 0, 0, 0]
+        self.records.append(record)
+        child_ns = self._child_ns
+        child_bytes = self._child_bytes
+        self._child_ns = 0
+        self._child_bytes = 0
+        self._depth += 1
+        heap = mem_alloc() if mem_alloc is not None else 0
+        start = self._now()
+        try:
+            self._original(name, None, None, (), 0)
+        finally:
+            elapsed = self._now() - start
+            used = mem_alloc() - heap if mem_alloc is not None else 0
+            record[TOTAL_US] = elapsed // 1000
+            record[SELF_US] = (elapsed - self._child_ns) // 1000
+            record[BYTES] = used
+            record[SELF_BYTES] = used - self._child_bytes
+            self._depth -= 1
+            self._child_ns = child_ns + elapsed
+            self._child_bytes = child_bytes + used
+
+    def totals(self):
+        """(mòduls, us, bytes) dels imports de primer nivell"""
+        us = 0
+        used = 0
+        for record in self.records:
+            if record[DEPTH] == 0:
+                us += record[TOTAL_US]
+                used += record[BYTES]
+        return len(self.records), us, used
+
+    def summary(self):
+        """Una línia: mòduls, temps i heap de tots els imports"""
+        count, us, used = self.totals()
+        return f"Importacions: {count} mòduls, {us / 1000:.0f} ms, {used / 1024:.1f} KB"
+
+    def report(self, limit=12):
+        """Informe: resum i els `limit` mòduls amb més temps propi"""
+        lines = [self.summary()]
+        if self.total_us:
+            lines[0] += f" (de {self.total_us / 1000:.0f} ms d'arrencada perfilada)"
+        lines.append(f"{'propi ms':>8} {'total ms':>8} {'propi KB':>8} {'total KB':>8}  mòdul")
+        ranked = sorted(self.records, key=lambda r: r[SELF_US], reverse=True)
+        for record in ranked[:limit]:
+            lines.append(
+                f"{record[SELF_US] / 1000:>8.1f} {record[TOTAL_US] / 1000:>8.1f} "
+                f"{record[SELF_BYTES] / 1024:>8.1f} {record[BYTES] / 1024:>8.1f}  "
+                + "  " * record[DEPTH] + record[NAME]
+            )
+        return "\n".join(lines)
@@ -2,88 +2,178 @@
 # INPUT SAMPLER - Mostreig asíncron d'inputs amb buffer
 # =============================================================================
 import time
+from array import array
+
+# Conversió ADC (16 bits) -> volts, només quan un valor canvia
+ADC_SCALE = 65536
+ADC_VOLTS = 3.3
+
+# Ordre dels canals als arrays interns
+CH_SLIDER = 0  # z - GP28 (BPM)
+CH_CV1 = 1     # x - GP26
+CH_CV2 = 2     # y - GP27
 
 
 class InputSampler:
     """
     Mostreig asíncron d'inputs analògics amb buffer.
-    
-    Redueix lectures ADC de ~1500/s a 100/s per millorar estabilitat del clock.
-    Els valors es guarden en un buffer i es retornen instantàniament sense ADC.
+
+    Redueix lectures ADC de ~1500/s a `input_sample_rate` mostres/s per
+    millorar estabilitat del clock. Cada mostra fa `input_oversample` lectures
+    seguides de cada ADC i en treu la mediana (o la mitjana retallada),
+    tot en enters dins d'un array preassignat.
+
+    Els valors només s'actualitzen quan la mostra filtrada s'allunya més de
+    `input_change_threshold` volts de l'últim valor publicat: `changed` indica
+    si l'última mostra ha canviat res i `version` s'incrementa a cada canvi
+    (els modes poden guardar la versió i no recalcular res si no varia).
     """
-    
-    def __init__(self, hardware, config):
+
+    def __init__(self, hardware, config, sample_rate=None, oversample=None,
+                 filter_mode=None, threshold=None):
         """
         Inicialitza el sampler amb referències al hardware i configuració.
-        
+
         Args:
             hardware: Instància de TeclaHardware
             config: Mòdul de configuració global
+            sample_rate: Mostres per segon (per defecte cfg.input_sample_rate)
+            oversample: Lectures per mostra (per defecte cfg.input_oversample)
+            filter_mode: "median" o "trimmed" (per defecte cfg.input_filter)
+            threshold: Canvi mínim en volts (per defecte cfg.input_change_threshold)
         """
         self.hw = hardware
         self.cfg = config
-        
+
         # Buffer d'inputs (valors calibrats i llestos per usar)
         self.x_buffered = 0.0  # CV1 (pote) - calibrat
         self.y_buffered = 0.0  # CV2 (LDR) - calibrat
         self.z_buffered = 0.0  # Slider (BPM) - NO calibrat (sempre 0-3.3V)
-        
+
         # Control temporal
+        rate = sample_rate if sample_rate else config.input_sample_rate
         self.last_sample_time = 0.0
-        self.sample_interval = 0.010  # 10ms = 100Hz (vs ~500-1000Hz abans)
-        
+        self.sample_interval = 1.0 / rate  # 200 Hz per defecte (vs ~500-1000 Hz abans)
+
+        # Filtre: lectures enteres d'una mostra (ordenades en inserir-les)
+        count = oversample if oversample else config.input_oversample
+        self.oversample = max(1, count)
+        mode = filter_mode if filter_mode else config.input_filter
+        self.use_median = mode != "trimmed"
+        self._reads = array("H", [0] * self.oversample)
+        volts = config.input_change_threshold if threshold is None else threshold
+        self.threshold = int(volts * ADC_SCALE / ADC_VOLTS)
+
+        # Valor publicat de cada canal en comptes ADC (-1 = cap encara)
+        self._pins = (hardware.slider, hardware.cv1_pote, hardware.cv2_ldr)
+        self.raw = array("l", [-1, -1, -1])
+        # Rang de calibració aplicat a l'últim clamp
+        self._cv1_min = self._cv1_max = self._cv2_min = self._cv2_max = None
+
+        # Estat de canvis
+        self.changed = False
+        self.version = 0
+        self.samples = 0
+
         # Fer primera lectura immediata per evitar valors 0
         self._read_adc_values()
-    
+
+    def _filtered_read(self, pin):
+        """Llegeix el pin `oversample` vegades i retorna el valor filtrat (enter)"""
+        reads = self._reads
+        n = self.oversample
+        # Inserció ordenada mentre es llegeix (n petit: 3-9 lectures)
+        for i in range(n):
+            value = pin.value
+            j = i
+            while j > 0 and reads[j - 1] > value:
+                reads[j] = reads[j - 1]
+                j -= 1
+            reads[j] = value
+        if self.use_median or n < 3:
+            return reads[n >> 1]
+        # Mitjana retallada: sense el mínim ni el màxim
+        total = 0
+        for i in range(1, n - 1):
+            total += reads[i]
+        return total // (n - 2)
+
     def _read_adc_values(self):
         """
         Llegeix valors dels ADCs i actualitza el buffer.
         PRIVAT: Només cridat internament per update().
-        
+
         IMPORTANT: Els valors CV1 i CV2 es CLAMPEN (limiten) al rang calibrat.
         Cada mode després farà la seva pròpia normalització amb normalize().
+
+        Returns:
+            True si algun valor publicat ha canviat
         """
-        # Lectura raw dels 3 ADCs
-        z_raw = self.hw.get_voltage(self.hw.slider)      # Slider GP28 - BPM
-        x_raw = self.hw.get_voltage(self.hw.cv1_pote)    # CV1 GP26
-        y_raw = self.hw.get_voltage(self.hw.cv2_ldr)     # CV2 GP27
-        
-        # CLAMPAR CV1 i CV2 al rang calibrat (no normalitzar!)
-        # Els modes després faran normalize(x, cv1_min, cv1_max) ells mateixos
-        x_clamped = max(self.cfg.cv1_min, min(self.cfg.cv1_max, x_raw))
-        y_clamped = max(self.cfg.cv2_min, min(self.cfg.cv2_max, y_raw))
-        
-        # Guardar al buffer (ATÒMIC: assignació simple)
-        self.x_buffered = x_clamped
-        self.y_buffered = y_clamped
-        self.z_buffered = z_raw  # Slider no es calibra
-    
+        self.samples += 1
+        raw = self.raw
+        threshold = self.threshold
+        changed = False
+        for channel in range(3):
+            value = self._filtered_read(self._pins[channel])
+            previous = raw[channel]
+            if previous < 0 or value - previous > threshold or previous - value > threshold:
+                raw[channel] = value
+                changed = True
+
+        # Un canvi de calibració també canvia els valors clampats
+        cfg = self.cfg
+        if (cfg.cv1_min != self._cv1_min or cfg.cv1_max != self._cv1_max
+                or cfg.cv2_min != self._cv2_min or cfg.cv2_max != self._cv2_max):
+            self._cv1_min, self._cv1_max = cfg.cv1_min, cfg.cv1_max
+            self._cv2_min, self._cv2_max = cfg.cv2_min, cfg.cv2_max
+            changed = True
+
+        if changed:
+            # Conversió a volts només dels valors publicats
+            z_raw = raw[CH_SLIDER] * ADC_VOLTS / ADC_SCALE  # Slider GP28 - BPM
+            x_raw = raw[CH_CV1] * ADC_VOLTS / ADC_SCALE     # CV1 GP26
+            y_raw = raw[CH_CV2] * ADC_VOLTS / ADC_SCALE     # CV2 GP27
+
+            # CLAMPAR CV1 i CV2 al rang calibrat (no normalitzar!)
+            # Els modes després faran normalize(x, cv1_min, cv1_max) ells mateixos
+            x_clamped = max(cfg.cv1_min, min(cfg.cv1_max, x_raw))
+            y_clamped = max(cfg.cv2_min, min(cfg.cv2_max, y_raw))
+
+            # Guardar al buffer (ATÒMIC: assignació simple)
+            self.x_buffered = x_clamped
+            self.y_buffered = y_clamped
+            self.z_buffered = z_raw  # Slider no es calibra
+            self.version += 1
+
+        self.changed = changed
+        return changed
+
     def update(self, current_time):
         """
         Actualitza el buffer si ha passat l'interval de mostreig.
-        
+
         Args:
             current_time: Temps actual (time.monotonic())
-        
+
         Returns:
-            True si s'ha fet lectura ADC, False altrament
+            True si s'ha fet lectura ADC i algun valor ha canviat, False altrament
         """
         if current_time - self.last_sample_time >= self.sample_interval:
-            self._read_adc_values()
             self.last_sample_time = current_time
-            return True
-        
+            return self._read_adc_values()
+
+        self.changed = False
         return False
-    
+
     def get_inputs(self):
         """
         Retorna els valors buffered (INSTANT, sense ADC).
-        
+
         Returns:
             Tuple (x, y, z) amb valors calibrats (x, y) i raw (z)
         """
         return self.x_buffered, self.y_buffered, self.z_buffered
-    
+
     def force_update(self):
         """
         Força una lectura ADC immediata (per inicialització o casos especials).
@@ -0,0 +1,44 @@
+# =============================================================================
+# IMPORTS DIFERITS - TECLA
+# =============================================================================
+# Intermediari per a les peces que no calen a l'arrencada (calibració CV): el
+# mòdul s'importa el primer cop que se'n llegeix un atribut. Fins aleshores
+# no costa temps d'arrencada ni heap.
+#
+#   calibration = LazyModule("core.calibration")
+#   calibration.procesar_calibracion(hw, cfg)   # <- aquí s'importa
+#
+# Importar un mòdul són desenes de ms: el primer accés no pot caure dins
+# d'una porció pressupostada (pantalla, ticks). Cal carregar-lo abans en un
+# punt conegut (p. ex. el gest de l'usuari que activa la funció) o, si la
+# peça es fa servir en funcionament normal, importar-la a l'arrencada.
+# =============================================================================
+
+
+def _load_module(name):
+    # Amb fromlist no buit, __import__ retorna el submòdul i no el paquet
+    return __import__(name, None, None, ("__name__",))
+
+
+class LazyModule:
+    """Mòdul que s'importa el primer cop que se'n llegeix un atribut.
+
+    Arguments:
+        name: Nom complet del mòdul (p. ex. "core.calibration")
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    @property
+    def loaded(self):
+        return self._module is not None
+
+    def __getattr__(self, attr):
+        module = self._module
+        if module is None:
+            module = _load_module(self._name)
+            self._module = module
+        return getattr(module, attr)
+
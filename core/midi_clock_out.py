@@ -0,0 +1,123 @@
+# =============================================================================
+# SORTIDA DE RELLOTGE MIDI - TECLA
+# =============================================================================
+# Envia TimingClock a 24 ppqn i Start/Stop perquè altres aparells (DAW,
+# caixes de ritmes) segueixin el tempo del TECLA.
+#
+# Un tick del MasterClock és una corxera = 12 polsos. El pols 0 surt amb el
+# tick (mateix instant que la nota); els polsos 1-11 són deadlines dins de la
+# TimerQueue del RTOS (clau CLOCK_TIMER), igual que els NoteOff i el gate, i
+# no depenen del refresc del bucle principal. Si el tempo s'accelera i un
+# tick arriba abans d'enviar els 12 polsos de l'anterior, els que falten
+# s'afegeixen al tick nou (12 + els que falten, repartits pel període) per
+# no perdre el compte (el receptor compta polsos) sense enviar-los de cop.
+# Com a màxim se n'arrosseguen MAX_CARRY; la resta es descarten (dropped).
+#
+# RTOSManager.stop_all_notes() buida la TimerQueue: després crida
+# reschedule() perquè el pols pendent torni a la cua.
+# =============================================================================
+import time
+
+from core.rtos import CLOCK_TIMER
+
+TIMING_CLOCK = 0xF8
+START = 0xFA
+STOP = 0xFC
+PULSES_PER_TICK = 12  # 24 ppqn, tick = corxera
+MAX_CARRY = PULSES_PER_TICK  # Polsos endarrerits màxims afegits al tick següent
+
+
+class MidiClockOutput:
+    """Generador de TimingClock / Start / Stop sincronitzat amb els ticks.
+
+    Arguments:
+        hardware: TeclaHardware (hw.midi = FastMIDI)
+        timers: TimerQueue del RTOSManager
+        profiler: LoopProfiler per a l'histograma d'intervals (opcional)
+    """
+
+    def __init__(self, hardware, timers, profiler=None):
+        self.hw = hardware
+        self.timers = timers
+        self.profiler = profiler
+        self.running = False
+        self.pending_deadline = None  # Deadline del pròxim pols a la cua
+        self.pulses = 0               # Polsos enviats des de l'últim Start
+        self.dropped = 0              # Polsos endarrerits descartats (> MAX_CARRY)
+        self._tick_time = 0.0
+        self._pulse_period = 0.0
+        self._pulses_in_tick = PULSES_PER_TICK  # 12 + polsos arrossegats
+        self._sent_in_tick = PULSES_PER_TICK
+        self._last_pulse_ns = 0
+        self._nominal_us = 0
+
+    def start(self):
+        """Start: el pròxim tick serà el primer temps per als receptors"""
+        if self.running:
+            return
+        self.running = True
+        self.pulses = 0
+        self._pulses_in_tick = PULSES_PER_TICK
+        self._sent_in_tick = PULSES_PER_TICK  # Cap pols pendent
+        self._last_pulse_ns = 0
+        self.hw.midi.send_realtime(START)
+
+    def stop(self):
+        """Stop: deixa d'enviar polsos"""
+        if not self.running:
+            return
+        self.running = False
+        self.pending_deadline = None  # Les entrades a la cua queden obsoletes
+        self.hw.midi.send_realtime(STOP)
+
+    def on_tick(self, tick_time, tick_period):
+        """Tick del MasterClock: pols 0 ara i polsos 1-11 programats"""
+        if not self.running:
+            return
+        # Polsos que falten del tick anterior (tempo accelerat): es reparteixen
+        # dins d'aquest tick en lloc d'enviar-los de cop
+        carry = self._pulses_in_tick - self._sent_in_tick
+        if carry > MAX_CARRY:
+            self.dropped += carry - MAX_CARRY
+            carry = MAX_CARRY
+        self._pulses_in_tick = PULSES_PER_TICK + carry
+        self._tick_time = tick_time
+        self._pulse_period = tick_period / self._pulses_in_tick
+        self._nominal_us = int(self._pulse_period * 1000000)
+        self._sent_in_tick = 0
+        self._send_pulse()
+        self._schedule_next()
+
+    def on_timer(self, deadline):
+        """Deadline CLOCK_TIMER extret de la TimerQueue pel RTOS"""
+        if not self.running or deadline != self.pending_deadline:
+            return  # Entrada obsoleta
+        self.pending_deadline = None
+        if self._sent_in_tick >= self._pulses_in_tick:
+            return
+        self._send_pulse()
+        self._schedule_next()
+
+    def reschedule(self):
+        """Torna a posar el pols pendent a la cua (després de TimerQueue.clear())"""
+        if self.running and self.pending_deadline is not None:
+            self.timers.push(self.pending_deadline, CLOCK_TIMER)
+
+    def _schedule_next(self):
+        if self._sent_in_tick >= self._pulses_in_tick:
+            return
+        deadline = self._tick_time + self._sent_in_tick * self._pulse_period
+        self.pending_deadline = deadline
+        self.timers.push(deadline, CLOCK_TIMER)
+
+    def _send_pulse(self):
+        self.hw.midi.send_realtime(TIMING_CLOCK)
+        self._sent_in_tick += 1
+        self.pulses += 1
+        profiler = self.profiler
+        if profiler is not None and profiler.enabled:
+            now = time.monotonic_ns()
+            if self._last_pulse_ns:
+                interval = (now - self._last_pulse_ns) // 1000
+                profiler.record_clock_interval(interval, self._nominal_us)
+            self._last_pulse_ns = now
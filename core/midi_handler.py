@@ -2,13 +2,14 @@
 # MIDI & PWM HANDLER - TECLA
 # =============================================================================
 import time
-from adafruit_midi.note_on import NoteOn
-from adafruit_midi.note_off import NoteOff
-from adafruit_midi.control_change import ControlChange
-from music.converters import midi_to_frequency, apply_harmonic_interval
+from music.converters import (
+    midi_to_frequency,
+    apply_harmonic_interval,
+    duty_percent_to_cycle,
+)
+from core.rtos import GATE_TIMER
 from core.config import (
     get_gate_duration_for_mode,
-    duty_percent_to_cycle,
     NOTE_OFF_MIN_DURATION,
     NOTE_OFF_MAX_DURATION,
     NOTE_OFF_DEFAULT_RATIO,
@@ -64,11 +65,11 @@ class MidiHandler:
         self.hw.led_2.value = True
         self.cfg.gate_active = True
         self.cfg.gate_duration = gate_duration
-        self.cfg.gate_off_time = current_time + gate_duration
+        self._schedule_gate_off(current_time + gate_duration)
         
         # --- Nota MIDI amb duració programada ---
         try:
-            self.hw.midi.send(NoteOn(note, 100))
+            self.hw.midi.send_note_on(note, 100)
         except Exception as exc:  # pragma: no cover - runtime safeguard
             self._handle_midi_error(exc)
             self._stop_note_immediate(note, suppress_midi=True)
@@ -78,7 +79,7 @@ class MidiHandler:
 
         note_duration = gate_duration * NOTE_OFF_DEFAULT_RATIO
         note_duration = max(NOTE_OFF_MIN_DURATION, min(NOTE_OFF_MAX_DURATION, note_duration))
-        self.cfg.note_off_schedule[note] = current_time + note_duration
+        self._schedule_note_off(note, current_time + note_duration)
         
         # --- Armònics i PWM ---
         freq0 = getattr(self.cfg, "freqharm_base", 0)
@@ -135,9 +136,9 @@ class MidiHandler:
         self.hw.led_2.value = True
         self.cfg.gate_active = True
         self.cfg.gate_duration = gate_duration
-        self.cfg.gate_off_time = current_time + gate_duration
+        self._schedule_gate_off(current_time + gate_duration)
         try:
-            self.hw.midi.send(NoteOn(nota_pwm1 if nota_pwm1 > 0 else 60, 100))
+            self.hw.midi.send_note_on(nota_pwm1 if nota_pwm1 > 0 else 60, 100)
         except Exception as exc:
             self._handle_midi_error(exc)
             self._stop_note_immediate(nota_pwm1 if nota_pwm1 > 0 else 60, suppress_midi=True)
@@ -145,7 +146,7 @@ class MidiHandler:
         self.cfg.playing_notes.add(nota_pwm1 if nota_pwm1 > 0 else 60)
         note_duration = gate_duration * NOTE_OFF_DEFAULT_RATIO
         note_duration = max(NOTE_OFF_MIN_DURATION, min(NOTE_OFF_MAX_DURATION, note_duration))
-        self.cfg.note_off_schedule[nota_pwm1 if nota_pwm1 > 0 else 60] = current_time + note_duration
+        self._schedule_note_off(nota_pwm1 if nota_pwm1 > 0 else 60, current_time + note_duration)
         
         # PWM1: Aplicar harmònics o apagar si nota=0
         if nota_pwm1 > 0:
@@ -196,7 +197,14 @@ class MidiHandler:
             self._stop_note_immediate(active_note)
 
         try:
-            self.hw.midi.send(ControlChange(ALL_NOTES_OFF_CC, 0))
+            self.hw.midi.send_control_change(ALL_NOTES_OFF_CC, 0)
+        except Exception as exc:  # pragma: no cover - runtime safeguard
+            self._handle_midi_error(exc)
+
+    def flush(self, current_time=None):
+        """Envia els missatges MIDI acumulats a la iteració (un sol write)."""
+        try:
+            self.hw.midi.flush(current_time)
         except Exception as exc:  # pragma: no cover - runtime safeguard
             self._handle_midi_error(exc)
 
@@ -209,7 +217,7 @@ class MidiHandler:
 
         if not suppress_midi and note not in (None, 0):
             try:
-                self.hw.midi.send(NoteOff(note, 0))
+                self.hw.midi.send_note_off(note, 0)
             except Exception as exc:  # pragma: no cover - runtime safeguard
                 self._handle_midi_error(exc)
 
@@ -218,6 +226,18 @@ class MidiHandler:
         self.cfg.gate_active = False
         self.cfg.nota_tocada_ara = False
 
+    def _schedule_gate_off(self, off_time):
+        """Programa l'apagada del gate a la cua de temporitzadors del RTOS."""
+        self.cfg.gate_off_time = off_time
+        if self.cfg.timer_queue is not None:
+            self.cfg.timer_queue.push(off_time, GATE_TIMER)
+
+    def _schedule_note_off(self, note, off_time):
+        """Programa el NoteOff d'una nota (substitueix el deadline anterior)."""
+        self.cfg.note_off_schedule[note] = off_time
+        if self.cfg.timer_queue is not None:
+            self.cfg.timer_queue.push(off_time, note)
+
     def _handle_midi_error(self, error):
         """Registra errors MIDI i estableix període de pausa."""
         self.cfg.last_midi_error = repr(error)
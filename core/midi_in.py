@@ -0,0 +1,209 @@
+# =============================================================================
+# ENTRADA MIDI AMB BUFFER CIRCULAR - TECLA
+# =============================================================================
+# adafruit_midi.MIDI.receive() fa `self._in_buf = self._in_buf[endplusone:]`
+# després de cada missatge (copia la resta del buffer) i from_message_bytes()
+# recorre la llista de parelles (estat, màscara) per cada byte d'estat.
+#
+# MidiInputParser:
+#   - Buffer circular de mida fixa (potència de 2) amb índexs de lectura i
+#     escriptura: llegir del port i consumir bytes no copia res
+#   - Taula de 256 entrades byte d'estat -> classe de missatge
+#   - Parser incremental byte a byte: running status d'entrada, missatges
+#     de temps real (0xF8-0xFF) enmig d'un altre missatge, SysEx
+#   - Missatges sense dades (TimingClock, Start, Stop...) són una instància
+#     compartida per classe: 24 ppqn de rellotge no creen objectes
+# =============================================================================
+from adafruit_midi.midi_message import MIDIMessage, MIDIUnknownEvent, MIDIBadEvent
+# Importar les classes les registra a MIDIMessage (i per tant a la taula)
+from adafruit_midi.note_off import NoteOff  # noqa: F401
+from adafruit_midi.note_on import NoteOn  # noqa: F401
+from adafruit_midi.polyphonic_key_pressure import PolyphonicKeyPressure  # noqa: F401
+from adafruit_midi.control_change import ControlChange  # noqa: F401
+from adafruit_midi.program_change import ProgramChange  # noqa: F401
+from adafruit_midi.channel_pressure import ChannelPressure  # noqa: F401
+from adafruit_midi.pitch_bend import PitchBend  # noqa: F401
+from adafruit_midi.system_exclusive import SystemExclusive  # noqa: F401
+from adafruit_midi.mtc_quarter_frame import MtcQuarterFrame  # noqa: F401
+from adafruit_midi.timing_clock import TimingClock  # noqa: F401
+from adafruit_midi.start import Start  # noqa: F401
+from adafruit_midi.midi_continue import Continue  # noqa: F401
+from adafruit_midi.stop import Stop  # noqa: F401
+from adafruit_midi.active_sensing import ActiveSensing  # noqa: F401
+
+RING_SIZE = 64        # Bytes pendents de parsejar (potència de 2)
+READ_CHUNK = 32       # Bytes màxims per lectura del port
+SYSEX_MAX = 64        # SysEx més llargs es descarten
+DRAIN_MAX_READS = 8   # Lectures màximes del port per receive_all()
+ALL_CHANNELS = 0xFFFF  # Màscara de canals (bit n = canal n)
+SYSEX_END = 0xF7
+
+
+def build_status_table():
+    """Taula de 256 entrades: byte d'estat -> classe registrada (o None)"""
+    table = [None] * 256
+    # La llista està ordenada amb les màscares més específiques primer
+    for (status, mask), msgclass in reversed(MIDIMessage._statusandmask_to_class):
+        for byte in range(0x80, 0x100):
+            if byte & mask == status:
+                table[byte] = msgclass
+    return tuple(table)
+
+
+def channel_mask(channel_spec):
+    """in_channel d'adafruit_midi (int o tupla) -> màscara de 16 bits"""
+    if isinstance(channel_spec, int):
+        return 1 << channel_spec
+    mask = 0
+    for channel in channel_spec:
+        mask |= 1 << channel
+    return mask
+
+
+STATUS_TABLE = build_status_table()
+
+
+class MidiInputParser:
+    """Parser incremental de MIDI d'entrada sobre un buffer circular.
+
+    Arguments:
+        midi_in: Port amb readinto(buf, n) o read(n) (usb_midi.ports[0], UART)
+        ring_size: Mida del buffer circular (potència de 2)
+    """
+
+    def __init__(self, midi_in, ring_size=RING_SIZE):
+        self.midi_in = midi_in
+        self._ring = bytearray(ring_size)
+        self._mask = ring_size - 1
+        self._read = 0   # Següent byte a parsejar
+        self._write = 0  # Següent posició lliure
+        self._chunk = bytearray(READ_CHUNK)
+        self._readinto = getattr(midi_in, "readinto", None)
+
+        # Estat del parser
+        self._msg = bytearray(3)   # Estat + dades del missatge en curs
+        self._need = 0             # Bytes de dades del missatge en curs
+        self._count = 0
+        self._sysex = bytearray(SYSEX_MAX)
+        self._sysex_len = -1       # -1 = fora de SysEx
+        self._shared = {}          # Instàncies dels missatges sense dades
+
+        # Estadístiques
+        self.skipped_bytes = 0
+        self.overflows = 0
+
+    def pending(self):
+        """Bytes rebuts pendents de parsejar"""
+        return (self._write - self._read) & self._mask
+
+    def fill(self):
+        """Llegeix del port tot el que hi càpiga al buffer circular"""
+        free = self._mask - self.pending()  # Una posició sempre buida
+        if free <= 0:
+            self.overflows += 1
+            return 0
+        chunk = self._chunk
+        wanted = free if free < len(chunk) else len(chunk)
+        if self._readinto is not None:
+            count = self._readinto(chunk, wanted)
+        else:
+            data = self.midi_in.read(wanted)
+            count = len(data) if data else 0
+            if count:
+                chunk[:count] = data
+        if not count:
+            return 0
+        ring = self._ring
+        mask = self._mask
+        write = self._write
+        for index in range(count):
+            ring[write] = chunk[index]
+            write = (write + 1) & mask
+        self._write = write
+        return count
+
+    def next_message(self, in_mask=ALL_CHANNELS):
+        """Parseja bytes del buffer fins a completar un missatge (o None)"""
+        ring = self._ring
+        mask = self._mask
+        while self._read != self._write:
+            byte = ring[self._read]
+            self._read = (self._read + 1) & mask
+            msg = self._parse_byte(byte)
+            if msg is None:
+                continue
+            channel = msg.channel
+            if channel is not None and not in_mask & (1 << channel):
+                continue
+            return msg
+        return None
+
+    def _parse_byte(self, byte):
+        if byte >= 0xF8:
+            # Temps real: pot arribar enmig de qualsevol missatge
+            return self._complete_status(byte)
+
+        if byte & 0x80:
+            if self._sysex_len >= 0:
+                sysex_len = self._sysex_len
+                self._sysex_len = -1
+                if byte == SYSEX_END and sysex_len < SYSEX_MAX:
+                    self._sysex[sysex_len] = byte
+                    return self._build(self._sysex[:sysex_len + 1])
+                # SysEx interromput o massa llarg: es descarta
+                if byte == SYSEX_END:
+                    return None
+
+            msgclass = STATUS_TABLE[byte]
+            if msgclass is None:
+                self._need = 0
+                return MIDIUnknownEvent(byte)
+            if msgclass.LENGTH < 0:
+                self._sysex[0] = byte
+                self._sysex_len = 1
+                self._need = 0
+                return None
+            if msgclass.LENGTH == 1:
+                self._need = 0  # Estat de sistema sense dades
+                return self._complete_status(byte)
+            self._msg[0] = byte
+            self._need = msgclass.LENGTH - 1
+            self._count = 0
+            return None
+
+        # Byte de dades
+        if self._sysex_len >= 0:
+            if self._sysex_len < SYSEX_MAX:
+                self._sysex[self._sysex_len] = byte
+            self._sysex_len += 1
+            return None
+        if self._need == 0:
+            self.skipped_bytes += 1
+            return None
+        self._count += 1
+        self._msg[self._count] = byte
+        if self._count < self._need:
+            return None
+        self._count = 0
+        status = self._msg[0]
+        if status >= 0xF0:
+            self._need = 0  # Els missatges de sistema no admeten running status
+        return self._build(self._msg)
+
+    def _complete_status(self, status):
+        """Missatge d'un sol byte: instància compartida per classe"""
+        msg = self._shared.get(status)
+        if msg is None:
+            msgclass = STATUS_TABLE[status]
+            if msgclass is None:
+                return MIDIUnknownEvent(status)
+            msg = msgclass()
+            self._shared[status] = msg
+        return msg
+
+    def _build(self, data):
+        msgclass = STATUS_TABLE[data[0]]
+        try:
+            return msgclass.from_bytes(data)
+        except (ValueError, TypeError) as ex:
+            return MIDIBadEvent(data, ex)
@@ -0,0 +1,217 @@
+# =============================================================================
+# SORTIDA MIDI SENSE ASSIGNACIONS - TECLA
+# =============================================================================
+# MIDI.send(NoteOn(...)) crea un objecte missatge per nota i després
+# msg.__bytes__() crea un bytes nou: diverses assignacions al heap per cada
+# nota i cada NoteOff, que acaben en pauses del GC enmig de la música.
+#
+# FastMIDI afegeix mètodes directes que escriuen estat + dades al bytearray
+# _outbuf que MIDI ja té preassignat i l'envien tal qual. Els bytes d'estat
+# surten de taules precalculades per canal. La sortida és idèntica byte a
+# byte a la de NoteOn / NoteOff / ControlChange.
+#
+# Cua per iteració: entre begin_batch() i flush() els missatges s'acumulen en
+# un buffer preassignat i surten amb un sol write() (un arpegi de Tempesta o
+# les notes dobles del mode caos ja no són N escriptures USB). Opcionalment
+# s'aplica running status dins del lot (el byte d'estat repetit s'omet).
+#
+# L'entrada (receive / receive_all) passa pel buffer circular de
+# core/midi_in.py en lloc del bytearray que adafruit_midi retalla.
+# =============================================================================
+from adafruit_midi import MIDI
+from core.midi_in import MidiInputParser, channel_mask, DRAIN_MAX_READS
+
+# Byte d'estat per canal (0-15)
+NOTE_OFF_STATUS = bytes(0x80 | channel for channel in range(16))
+NOTE_ON_STATUS = bytes(0x90 | channel for channel in range(16))
+CONTROL_CHANGE_STATUS = bytes(0xB0 | channel for channel in range(16))
+
+BATCH_BUFFER_SIZE = 96  # 32 missatges de 3 bytes per iteració
+
+
+class FastMIDI(MIDI):
+    """MIDI d'adafruit_midi amb enviament directe i cua per iteració.
+
+    Mateixos arguments que adafruit_midi.MIDI, més:
+        running_status: Ometre el byte d'estat repetit dins d'un lot
+        batch_size: Mida del buffer de la cua (bytes)
+
+    send() continua disponible per a la resta de missatges.
+    """
+
+    def __init__(self, *args, running_status=False, batch_size=BATCH_BUFFER_SIZE, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._parser = MidiInputParser(self._midi_in) if self._midi_in is not None else None
+        self.running_status = running_status
+        self._batch = bytearray(batch_size)
+        self._batch_len = 0
+        self._batching = False
+        self._last_status = -1
+
+        # Estadístiques (totals i per segon, actualitzades a flush())
+        self.messages = 0
+        self.bytes_sent = 0
+        self.writes = 0
+        self.bytes_per_second = 0
+        self.writes_per_second = 0
+        self._rate_start = None
+        self._rate_bytes = 0
+        self._rate_writes = 0
+
+    @property
+    def in_channel(self):
+        """Canal(s) d'entrada, com a adafruit_midi.MIDI"""
+        return self._in_channel
+
+    @in_channel.setter
+    def in_channel(self, channel):
+        # Mateixa validació que MIDI.in_channel (sense super() per a propietats)
+        if channel is None or channel == "ALL":
+            self._in_channel = tuple(range(16))
+        elif isinstance(channel, int) and 0 <= channel <= 15:
+            self._in_channel = channel
+        elif isinstance(channel, tuple) and all(0 <= c <= 15 for c in channel):
+            self._in_channel = channel
+        else:
+            raise RuntimeError("Invalid input channel")
+        self._in_mask = channel_mask(self._in_channel)
+
+    def receive(self):
+        """Retorna el següent missatge rebut (o None) sense copiar buffers"""
+        parser = self._parser
+        msg = parser.next_message(self._in_mask)
+        if msg is None and parser.fill():
+            msg = parser.next_message(self._in_mask)
+        self._skipped_bytes = parser.skipped_bytes
+        return msg
+
+    def receive_all(self, callback=None):
+        """Buida el port i processa tots els missatges complets.
+
+        Arguments:
+            callback: Funció cridada amb cada missatge. Si és None, es
+                retorna una llista amb els missatges.
+
+        Retorna el nombre de missatges (o la llista si no hi ha callback).
+        """
+        parser = self._parser
+        in_mask = self._in_mask
+        messages = None if callback is not None else []
+        count = 0
+        reads = 0
+        while True:
+            msg = parser.next_message(in_mask)
+            if msg is None:
+                # Límit de lectures: un flux continu no pot bloquejar el bucle
+                if reads >= DRAIN_MAX_READS or not parser.fill():
+                    break
+                reads += 1
+                continue
+            count += 1
+            if callback is not None:
+                callback(msg)
+            else:
+                messages.append(msg)
+        self._skipped_bytes = parser.skipped_bytes
+        return count if callback is not None else messages
+
+    def _write(self, buf, num):
+        self._midi_out.write(buf, num)
+        self.bytes_sent += num
+        self.writes += 1
+
+    def _send(self, packet, num):
+        # Camí de send(): respectar l'ordre amb el que ja hi ha a la cua
+        if self._batch_len:
+            self._flush_batch()
+        if self._debug:
+            print("Sending: ", [hex(i) for i in packet[:num]])
+        self._write(packet, num)
+
+    def _flush_batch(self):
+        num = self._batch_len
+        self._batch_len = 0  # Si el write falla, el lot es descarta
+        self._last_status = -1  # Cada write comença amb byte d'estat
+        self._write(self._batch, num)
+
+    def _send_channel_message(self, status_table, data1, data2, channel):
+        if not 0 <= data1 <= 127 or not 0 <= data2 <= 127:
+            raise ValueError("Value out of range")
+        if channel is None:
+            channel = self._out_channel
+        status = status_table[channel & 0x0F]
+        self.messages += 1
+
+        if not self._batching:
+            outbuf = self._outbuf
+            outbuf[0] = status
+            outbuf[1] = data1
+            outbuf[2] = data2
+            self._write(outbuf, 3)
+            return
+
+        batch = self._batch
+        if self._batch_len + 3 > len(batch):
+            self._flush_batch()
+        index = self._batch_len
+        if not self.running_status or status != self._last_status:
+            batch[index] = status
+            index += 1
+            self._last_status = status
+        batch[index] = data1
+        batch[index + 1] = data2
+        self._batch_len = index + 2
+
+    def send_note_on(self, note, velocity=127, channel=None):
+        """Equivalent a send(NoteOn(note, velocity), channel)"""
+        self._send_channel_message(NOTE_ON_STATUS, note, velocity, channel)
+
+    def send_note_off(self, note, velocity=0, channel=None):
+        """Equivalent a send(NoteOff(note, velocity), channel)"""
+        self._send_channel_message(NOTE_OFF_STATUS, note, velocity, channel)
+
+    def send_control_change(self, control, value, channel=None):
+        """Equivalent a send(ControlChange(control, value), channel)"""
+        self._send_channel_message(CONTROL_CHANGE_STATUS, control, value, channel)
+
+    def send_realtime(self, status):
+        """Missatge de temps real d'un byte (TimingClock 0xF8, Start 0xFA...).
+
+        No afecta el running status dels missatges de canal.
+        """
+        self.messages += 1
+        if not self._batching:
+            outbuf = self._outbuf
+            outbuf[0] = status
+            self._write(outbuf, 1)
+            return
+        if self._batch_len + 1 > len(self._batch):
+            self._flush_batch()
+        self._batch[self._batch_len] = status
+        self._batch_len += 1
+
+    def begin_batch(self):
+        """A partir d'ara els missatges de canal s'acumulen fins a flush()"""
+        self._batching = True
+
+    def flush(self, current_time=None):
+        """Envia la cua amb un sol write() i torna a l'enviament directe.
+
+        Arguments:
+            current_time: Si s'indica, actualitza bytes/writes per segon
+        """
+        self._batching = False
+        if self._batch_len:
+            self._flush_batch()
+        if current_time is None:
+            return
+        if self._rate_start is None:
+            self._rate_start = current_time
+            return
+        elapsed = current_time - self._rate_start
+        if elapsed >= 1.0:
+            self.bytes_per_second = int((self.bytes_sent - self._rate_bytes) / elapsed)
+            self.writes_per_second = int((self.writes - self._rate_writes) / elapsed)
+            self._rate_start = current_time
+            self._rate_bytes = self.bytes_sent
+            self._rate_writes = self.writes
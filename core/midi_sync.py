@@ -0,0 +1,162 @@
+# =============================================================================
+# SINCRONIA AMB RELLOTGE MIDI EXTERN - TECLA
+# =============================================================================
+# Segueix el rellotge MIDI d'un DAW (TimingClock a 24 ppqn + Start / Stop /
+# Continue) i dona al MasterClock el període i la fase dels ticks.
+#
+# Els TimingClock arriben per USB amb jitter (paquets agrupats, latència del
+# host i del bucle principal). Disparar un tick a l'arribada de cada 12è pols
+# trasllada aquest jitter a la música. En lloc d'això, un PLL de segon ordre
+# (filtre alfa-beta) estima la fase i el període del rellotge:
+#
+#   error  = arribada - predicció
+#   fase  += període + ALFA * error
+#   període += BETA * error
+#
+# i els ticks es disparen a l'hora estimada, no a l'hora d'arribada.
+# =============================================================================
+from adafruit_midi.timing_clock import TimingClock
+from adafruit_midi.start import Start
+from adafruit_midi.stop import Stop
+from adafruit_midi.midi_continue import Continue
+
+CLOCKS_PER_BEAT = 24      # MIDI: 24 pulsos per negra
+PULSES_PER_TICK = 12      # Un tick del MasterClock = corxera (30 / BPM)
+PLL_ALPHA = 0.12          # Correcció de fase per pols
+PLL_BETA = 0.008          # Correcció de període per pols
+RESYNC_ERROR = 4.0        # Error (en períodes) a partir del qual es resincronitza
+LOCK_CLOCKS = 6           # Polsos coherents abans de considerar-se enganxat
+CLOCK_TIMEOUT = 0.5       # Sense polsos durant aquest temps = rellotge perdut
+MIN_CLOCK_PERIOD = 60.0 / (300 * CLOCKS_PER_BEAT)  # 300 BPM
+MAX_CLOCK_PERIOD = 60.0 / (20 * CLOCKS_PER_BEAT)   # 20 BPM
+
+
+class MidiClockFollower:
+    """Estimador de fase i tempo del rellotge MIDI d'entrada.
+
+    Arguments:
+        config: Mòdul de configuració (cfg)
+        pulses_per_tick: Polsos de rellotge per tick del MasterClock
+    """
+
+    def __init__(self, config, pulses_per_tick=PULSES_PER_TICK):
+        self.cfg = config
+        self.pulses_per_tick = pulses_per_tick
+        self.active = False       # Arriben polsos: el MasterClock els segueix
+        self.locked = False       # El PLL ha convergit
+        self.running = True       # Transport (Stop el posa a False)
+        self.period = 0.0         # Període estimat d'un pols (s)
+        self.last_error = 0.0     # Últim error de fase (s)
+        self._now = 0.0
+        self._last_arrival = None
+        self._ref_time = 0.0      # Fase estimada de l'últim pols
+        self._ref_count = -1      # Índex de l'últim pols (0 = primer després de Start)
+        self._good_clocks = 0
+        self._next_tick_count = 0  # Índex del pols del pròxim tick
+        self._on_message = self.on_message  # Mètode lligat una sola vegada
+
+    @property
+    def tick_period(self):
+        """Període d'un tick del MasterClock (s)"""
+        return self.period * self.pulses_per_tick
+
+    @property
+    def bpm(self):
+        return 60.0 / (self.period * CLOCKS_PER_BEAT) if self.period else 0.0
+
+    def poll(self, midi, current_time):
+        """Processa tots els missatges MIDI pendents i comprova el timeout"""
+        self._now = current_time
+        midi.receive_all(self._on_message)
+        if self.active and current_time - self._last_arrival > CLOCK_TIMEOUT:
+            self._deactivate()
+        self.cfg.midi_clock_active = self.active
+
+    def on_message(self, msg, arrival=None):
+        """Tracta un missatge d'entrada (arrival = temps de recepció)"""
+        if arrival is None:
+            arrival = self._now
+        if isinstance(msg, TimingClock):
+            self.on_clock(arrival)
+        elif isinstance(msg, Start):
+            # El següent pols és el primer del compàs
+            self.running = True
+            self._ref_count = -1
+            self._next_tick_count = 0
+        elif isinstance(msg, Continue):
+            self.running = True
+        elif isinstance(msg, Stop):
+            self.running = False
+
+    def on_clock(self, arrival):
+        """Actualitza el PLL amb l'arribada d'un TimingClock"""
+        last = self._last_arrival
+        self._last_arrival = arrival
+        self._ref_count += 1
+
+        if last is None:
+            # Primer pols: el pròxim tick és el primer alineat a partir d'aquí
+            self.active = True
+            self._skip_past_ticks()
+        if last is None or not self.period:
+            # Llavor de fase, període per mesurar
+            if last is not None:
+                interval = arrival - last
+                if MIN_CLOCK_PERIOD <= interval <= MAX_CLOCK_PERIOD:
+                    self.period = interval
+            self._ref_time = arrival
+            self.last_error = 0.0
+            return
+
+        predicted = self._ref_time + self.period
+        error = arrival - predicted
+        if error > self.period * RESYNC_ERROR or error < -self.period * RESYNC_ERROR:
+            # Salt de tempo o pausa llarga: reiniciar la fase sense perdre el compte
+            interval = arrival - last
+            if MIN_CLOCK_PERIOD <= interval <= MAX_CLOCK_PERIOD:
+                self.period = interval
+            self._ref_time = arrival
+            self._good_clocks = 0
+            self.last_error = error
+            return
+
+        self._ref_time = predicted + PLL_ALPHA * error
+        period = self.period + PLL_BETA * error
+        if period < MIN_CLOCK_PERIOD:
+            period = MIN_CLOCK_PERIOD
+        elif period > MAX_CLOCK_PERIOD:
+            period = MAX_CLOCK_PERIOD
+        self.period = period
+        self.last_error = error
+
+        if not self.locked:
+            self._good_clocks += 1
+            if self._good_clocks >= LOCK_CLOCKS:
+                self.locked = True
+
+    def next_tick_time(self):
+        """Hora estimada del pròxim tick"""
+        if self.period:
+            return self._ref_time + (self._next_tick_count - self._ref_count) * self.period
+        # Període encara desconegut: el tick surt amb l'arribada del seu pols
+        if self._next_tick_count <= self._ref_count:
+            return self._ref_time
+        return self._ref_time + CLOCK_TIMEOUT
+
+    def advance_tick(self):
+        self._next_tick_count += self.pulses_per_tick
+
+    def _skip_past_ticks(self):
+        # Primer tick alineat (múltiple de pulses_per_tick) no anterior a l'últim pols
+        step = self.pulses_per_tick
+        count = self._next_tick_count
+        if count < self._ref_count:
+            count += ((self._ref_count - count + step - 1) // step) * step
+        self._next_tick_count = count
+
+    def _deactivate(self):
+        self.active = False
+        self.locked = False
+        self.period = 0.0
+        self._last_arrival = None
+        self._good_clocks = 0
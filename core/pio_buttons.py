@@ -1,58 +1,99 @@
 import array
 
-try:
-    import adafruit_pioasm  # type: ignore
-except ImportError:  # CircuitPython build sense (library not bundled)
-    adafruit_pioasm = None  # pragma: no cover
-
 import rp2pio
 
+# Freqüència del PIO: el bucle sense canvis són 5 instruccions, així que a
+# 10 kHz els pins es mostregen a 2 kHz (0.5 ms de latència)
+DEFAULT_FREQUENCY = 10_000
+
+# Programa: només fa push quan els pins canvien respecte a l'últim valor
+# enviat (y). Sense canvis, la CPU no rep res i el FIFO queda buit.
+#
+#   .program button_watch
+#       set y, 0
+#   .wrap_target
+#   loop:
+#       mov isr, null
+#       in pins, {pin_span}
+#       mov x, isr
+#       jmp x!=y, changed
+#       jmp loop
+#   changed:
+#       mov y, x
+#       push block
+#   .wrap
+
 
-_BUTTON_PIO_TEMPLATE = """
-.program button_watch
-.wrap_target
-loop:
-    in pins, {pin_span}
-    push block
-    jmp loop
-.wrap
-"""
+def _encode_set_y(value):
+    # opcode=SET (0b111), dest=Y (0b010), data in lower 5 bits
+    return (0b111 << 13) | (0b010 << 5) | (value & 0x1F)
+
+
+def _encode_mov(dest, source):
+    # opcode=MOV (0b101), dest bits 7-5, op=none (00), source bits 2-0
+    return (0b101 << 13) | (dest << 5) | source
 
 
 def _encode_in_pins(count):
-    # opcode=IN (0b010), source=PINS (0), count in lower 5 bits
+    # opcode=IN (0b010), source=PINS (0), count in lower 5 bits (32 = 0)
     return (0b010 << 13) | (0 << 5) | (count & 0x1F)
 
 
 def _encode_push_block():
-    # opcode=PUSH (0b100), block=1 (bit7), if_full=0
-    return (0b100 << 13) | (1 << 7)
+    # opcode=PUSH/PULL (0b100), bit7=0 (PUSH), if_full=0 (bit6), block=1 (bit5)
+    return (0b100 << 13) | (1 << 5)
+
 
+def _encode_jmp(target, condition=0):
+    # opcode=JMP (0b000), condition bits 7-5 (0 = always, 5 = x!=y)
+    return (0b000 << 13) | (condition << 5) | (target & 0x1F)
 
-def _encode_jmp(target):
-    # opcode=JMP (0b000), condition=always (0)
-    return (0b000 << 13) | (target & 0x1F)
+
+# Operands de MOV i condicions de JMP
+_MOV_X = 0b001
+_MOV_Y = 0b010
+_MOV_NULL = 0b011
+_MOV_ISR = 0b110
+_JMP_X_NOT_Y = 0b101
+
+_LOOP = 1      # Adreça de loop (wrap_target)
+_CHANGED = 6   # Adreça de changed
 
 
 def _assemble_button_program(pin_span):
-    if adafruit_pioasm is not None:
-        program = adafruit_pioasm.assemble(
-            _BUTTON_PIO_TEMPLATE.format(pin_span=pin_span)
-        )
-        instruction_count = len(program) // 2
-        return program, 0, instruction_count - 1
+    """Programa PIO acoblat a mà (vegeu el llistat de dalt)
 
-    # Fallback: hand-assembled program equivalent to template above
+    Returns:
+        (program, wrap_target, wrap)
+    """
     instructions = (
-        _encode_in_pins(pin_span),
-        _encode_push_block(),
-        _encode_jmp(0),
+        _encode_set_y(0),                       # 0: set y, 0
+        _encode_mov(_MOV_ISR, _MOV_NULL),       # 1: mov isr, null
+        _encode_in_pins(pin_span),              # 2: in pins, span
+        _encode_mov(_MOV_X, _MOV_ISR),          # 3: mov x, isr
+        _encode_jmp(_CHANGED, _JMP_X_NOT_Y),    # 4: jmp x!=y, changed
+        _encode_jmp(_LOOP),                     # 5: jmp loop
+        _encode_mov(_MOV_Y, _MOV_X),            # 6: mov y, x
+        _encode_push_block(),                   # 7: push block
     )
     program = bytearray()
     for instr in instructions:
         program.append(instr & 0xFF)
         program.append((instr >> 8) & 0xFF)
-    return bytes(program), 0, len(instructions) - 1
+    return bytes(program), _LOOP, len(instructions) - 1
+
+
+def pin_number(pin):
+    """Número GPIO d'un pin de board (GP13 -> 13), o None si no se sap"""
+    pin_id = getattr(pin, "id", None)
+    if pin_id is not None:
+        return pin_id
+    name = repr(pin)
+    index = name.rfind("GP")
+    if index < 0:
+        return None
+    digits = name[index + 2:]
+    return int(digits) if digits.isdigit() else None
 
 
 class _ButtonGroup:
@@ -98,13 +139,14 @@ class ButtonPIOManager:
     Es creen tantes màquines d'estat com grups contigus de pins. En detectar un
     canvi, el PIO envia el nou mostreig al FIFO i el gestor actualitza un cache
     en memòria, evitant canvis en el codi existent que consulta ``.value``.
+    ``mask`` té el mateix estat com a bitmask (bit i = pin i de ``pins``).
     """
 
     def __init__(
         self,
         pins,
         *,
-        frequency=1_000_000,
+        frequency=DEFAULT_FREQUENCY,
         pull_down=True,
     ):
         self._pins = list(pins)
@@ -112,6 +154,7 @@ class ButtonPIOManager:
             raise ValueError("ButtonPIOManager requires at least one pin")
 
         self._state = [False] * len(self._pins)
+        self.mask = 0
         self._groups = []
         self._buffer = array.array("I", [0])
 
@@ -119,7 +162,7 @@ class ButtonPIOManager:
         pins_with_id = []
         single_pin_groups = []
         for idx, pin in enumerate(self._pins):
-            pin_id = getattr(pin, "id", None)
+            pin_id = pin_number(pin)
             if pin_id is None:
                 single_pin_groups.append([(idx, idx, pin)])
             else:
@@ -169,6 +212,7 @@ class ButtonPIOManager:
             first_in_pin=base_pin,
             in_pin_count=span,
             pull_in_pin_down=pull_down,
+            in_shift_right=False,  # Bit 0 del mostreig = pin base
             auto_push=False,
             push_threshold=32,
             wrap_target=wrap_target,
@@ -202,7 +246,12 @@ class ButtonPIOManager:
                 for bit_index, global_index in zip(
                     group.bit_indices, group.global_indices
                 ):
-                    self._state[global_index] = bool((group.sample >> bit_index) & 1)
+                    pressed = bool((group.sample >> bit_index) & 1)
+                    self._state[global_index] = pressed
+                    if pressed:
+                        self.mask |= 1 << global_index
+                    else:
+                        self.mask &= ~(1 << global_index)
 
         return any_update
 
@@ -0,0 +1,195 @@
+# =============================================================================
+# PROFILER DEL BUCLE PRINCIPAL - TECLA
+# =============================================================================
+# Histogrames de durada per etapa del bucle (RTOS, entrades, botons, modes,
+# LEDs, display, sleep) i de retard dels ticks del MasterClock respecte al
+# seu deadline. Pensat per deixar-lo activat en producció:
+#
+#   - Cada etapa és un lap(): una lectura de time.monotonic_ns() i un
+#     increment dins d'un array('L') preassignat (sense llistes ni dicts)
+#   - Buckets logarítmics: 16 lineals (0-15 us) i després 8 per octava
+#     (error <= 12.5%), fins a ~16 s
+#
+# Per veure l'informe: enviar "p" per la consola sèrie (i "r" per reiniciar).
+# Altres mòduls hi poden afegir informes amb add_command() ("a" = assignacions
+# per tick, "g" = recol·leccions del GC, "s" = configuració desada, "m" = modes
+# carregats).
+# =============================================================================
+import time
+from array import array
+
+try:
+    import supervisor
+except ImportError:  # Host / emulador
+    supervisor = None
+
+# Etapes del bucle principal
+STAGE_RTOS = 0
+STAGE_INPUTS = 1
+STAGE_BUTTONS = 2
+STAGE_MODES = 3
+STAGE_LEDS = 4
+STAGE_DISPLAY = 5
+STAGE_IDLE = 6
+STAGE_LOOP = 7        # Iteració sencera
+STAGE_TICK_LATE = 8   # Retard d'execució dels ticks (no és una etapa)
+STAGE_CLOCK_INTERVAL = 9   # Interval entre TimingClock enviats
+STAGE_CLOCK_JITTER = 10    # |interval - nominal| dels TimingClock
+STAGE_GC = 11              # Pauses de gc.collect() (no és una etapa)
+
+STAGE_NAMES = (
+    "rtos", "inputs", "buttons", "modes", "leds",
+    "display", "idle", "loop", "tick_late",
+    "clk_int", "clk_jit", "gc",
+)
+
+BUCKETS = 176  # 16 + 8 * 20 octaves
+
+
+def bucket_index(us):
+    """Microsegons -> índex de bucket logarítmic"""
+    if us < 16:
+        return us if us > 0 else 0
+    exp = 0
+    while us >= 16:
+        us >>= 1
+        exp += 1
+    index = 8 * exp + us
+    return index if index < BUCKETS else BUCKETS - 1
+
+
+def bucket_upper_us(index):
+    """Límit superior (exclusiu) del bucket en microsegons"""
+    if index < 16:
+        return index + 1
+    exp = (index - 8) // 8
+    mantissa = index - 8 * exp
+    return (mantissa + 1) << exp
+
+
+class LoopProfiler:
+    """Histogrames per etapa amb memòria preassignada.
+
+    Arguments:
+        enabled: Si és False, mark()/lap()/record() no fan res
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        stages = len(STAGE_NAMES)
+        self.hist = [array("L", [0] * BUCKETS) for _ in range(stages)]
+        self.counts = array("L", [0] * stages)
+        self.max_us = array("L", [0] * stages)
+        self._loop_start = 0
+        self._last = 0
+        self._commands = {}  # Lletra -> (informe, reinici) per la consola sèrie
+
+    def mark(self):
+        """Inici d'iteració del bucle"""
+        if self.enabled:
+            now = time.monotonic_ns()
+            self._loop_start = now
+            self._last = now
+
+    def lap(self, stage):
+        """Tanca l'etapa `stage` (temps des del mark/lap anterior)"""
+        if not self.enabled:
+            return
+        now = time.monotonic_ns()
+        self.record(stage, (now - self._last) // 1000)
+        self._last = now
+
+    def end_loop(self):
+        """Tanca l'iteració sencera"""
+        if self.enabled:
+            self.record(STAGE_LOOP, (time.monotonic_ns() - self._loop_start) // 1000)
+
+    def record_tick(self, tick_time, current_time):
+        """Retard d'un tick del MasterClock respecte al seu deadline (s)"""
+        if self.enabled:
+            late = int((current_time - tick_time) * 1000000)
+            self.record(STAGE_TICK_LATE, late if late > 0 else 0)
+
+    def record_clock_interval(self, interval_us, nominal_us):
+        """Interval entre dos TimingClock enviats i desviació del nominal"""
+        if self.enabled:
+            self.record(STAGE_CLOCK_INTERVAL, interval_us)
+            jitter = interval_us - nominal_us
+            self.record(STAGE_CLOCK_JITTER, jitter if jitter >= 0 else -jitter)
+
+    def record_pause(self, stage, pause_ns):
+        """Pausa dins l'etapa en curs (p.ex. GC): es registra a `stage` i no
+        compta al lap() següent"""
+        if self.enabled:
+            self.record(stage, pause_ns // 1000)
+            self._last += pause_ns
+
+    def record(self, stage, us):
+        """Afegeix una mostra (microsegons) a l'histograma d'una etapa"""
+        self.hist[stage][bucket_index(us)] += 1
+        self.counts[stage] += 1
+        if us > self.max_us[stage]:
+            self.max_us[stage] = us
+
+    def percentile(self, stage, fraction):
+        """Percentil aproximat (límit superior del bucket) en microsegons"""
+        total = self.counts[stage]
+        if total == 0:
+            return 0
+        target = total * fraction
+        hist = self.hist[stage]
+        seen = 0
+        for index in range(BUCKETS):
+            seen += hist[index]
+            if seen >= target:
+                return min(bucket_upper_us(index), self.max_us[stage])
+        return self.max_us[stage]
+
+    def reset(self):
+        for hist in self.hist:
+            for index in range(BUCKETS):
+                hist[index] = 0
+        for stage in range(len(STAGE_NAMES)):
+            self.counts[stage] = 0
+            self.max_us[stage] = 0
+
+    def report(self):
+        """Retorna l'informe p50/p99/max (us) de cada etapa com a text"""
+        lines = ["%-10s %8s %8s %8s %8s" % ("etapa", "n", "p50", "p99", "max")]
+        for stage, name in enumerate(STAGE_NAMES):
+            lines.append("%-10s %8d %8d %8d %8d" % (
+                name,
+                self.counts[stage],
+                self.percentile(stage, 0.50),
+                self.percentile(stage, 0.99),
+                self.max_us[stage],
+            ))
+        return "\n".join(lines)
+
+    def add_command(self, command, report, reset=None):
+        """Afegeix un informe a la consola sèrie
+
+        Args:
+            command: Lletra de la comanda (no 'p' ni 'r')
+            report: Funció que retorna el text de l'informe
+            reset: Funció cridada amb 'r' (opcional)
+        """
+        self._commands[command] = (report, reset)
+
+    def poll_serial(self):
+        """Comandes per la consola sèrie: 'p' = informe, 'r' = reiniciar,
+        i les afegides amb add_command()"""
+        if supervisor is None or not supervisor.runtime.serial_bytes_available:
+            return
+        import sys
+        command = sys.stdin.read(1)
+        if command == "p":
+            print(self.report())
+        elif command == "r":
+            self.reset()
+            for _, reset in self._commands.values():
+                if reset is not None:
+                    reset()
+            print("⏱️  Profiler reiniciat")
+        elif command in self._commands:
+            print(self._commands[command][0]())
@@ -2,52 +2,89 @@
 # SISTEMA RTOS - Real-Time Operating System per TECLA
 # =============================================================================
 import time
-from adafruit_midi.note_off import NoteOff
+from core.timer_queue import TimerQueue
+
+# Claus reservades dins la cua (les notes són 0-127)
+GATE_TIMER = -1
+CLOCK_TIMER = -2  # Pols de rellotge MIDI (core/midi_clock_out.py)
+
+# 128 notes MIDI + gate, amb marge per entrades obsoletes abans de compactar
+TIMER_QUEUE_CAPACITY = 160
+
 
 class RTOSManager:
     """Gestió temporal en temps real amb prioritats"""
-    
+
     def __init__(self, hardware, config):
         self.hw = hardware
         self.cfg = config
-    
+        self.timers = TimerQueue(TIMER_QUEUE_CAPACITY, self._timer_is_live)
+        self.cfg.timer_queue = self.timers
+        self.clock_output = None  # MidiClockOutput (opcional)
+
+    def _timer_is_live(self, key, deadline):
+        """Una entrada és vàlida si coincideix amb l'estat autoritatiu de cfg"""
+        if key == GATE_TIMER:
+            return self.cfg.gate_active and self.cfg.gate_off_time == deadline
+        if key == CLOCK_TIMER:
+            return self.clock_output is not None and self.clock_output.pending_deadline == deadline
+        return self.cfg.note_off_schedule.get(key) == deadline
+
     def update(self, current_time):
         """
         Sistema RTOS amb PRIORIDADES - Gestiona timings crítics en temps real
-        
+
         PRIORIDAD 1 (CRÍTICA): Gate/Trigger temporal
-        PRIORIDAD 2 (ALTA): NoteOff programats
-        
+        PRIORIDAD 2 (ALTA): NoteOff programats i polsos de rellotge MIDI
+
+        Els deadlines viuen en una cua ordenada (TimerQueue): si el més proper
+        encara no ha arribat, es surt immediatament sense recórrer res.
+
         Args:
             current_time: Temps actual (time.monotonic()) passat des del bucle principal
         """
         # No cridar time.monotonic() aquí (optimització: evita crida redundant)
-        
-        # ===== PRIORIDAD 1: Gestió del Gate temporal (CRÍTICO) =====
-        if self.cfg.gate_active and current_time >= self.cfg.gate_off_time:
-            self.hw.out_jack.value = False
-            self.hw.led_2.value = False
-            self.cfg.gate_active = False
-        
-        # ===== PRIORIDAD 2: Gestió de NoteOff programats (ALTA) =====
-        if self.cfg.note_off_schedule:
-            notes_to_remove = []
-            for note, off_time in self.cfg.note_off_schedule.items():
-                if current_time >= off_time:
-                    self.hw.midi.send(NoteOff(note, 0))
-                    if note in self.cfg.playing_notes:
-                        self.cfg.playing_notes.remove(note)
-                    notes_to_remove.append(note)
-            
-            for note in notes_to_remove:
-                del self.cfg.note_off_schedule[note]
-    
+        timers = self.timers
+        if current_time < timers.next_deadline:
+            return
+
+        cfg = self.cfg
+        schedule = cfg.note_off_schedule
+        while current_time >= timers.next_deadline:
+            key = timers.pop()
+            deadline = timers.last_deadline
+
+            # ===== PRIORIDAD 1: Gestió del Gate temporal (CRÍTICO) =====
+            if key == GATE_TIMER:
+                if cfg.gate_active and cfg.gate_off_time == deadline:
+                    self.hw.out_jack.value = False
+                    self.hw.led_2.value = False
+                    cfg.gate_active = False
+                continue
+
+            # ===== PRIORIDAD 2: Polsos de rellotge MIDI (ALTA) =====
+            if key == CLOCK_TIMER:
+                if self.clock_output is not None:
+                    self.clock_output.on_timer(deadline)
+                continue
+
+            # ===== PRIORIDAD 2: Gestió de NoteOff programats (ALTA) =====
+            # Entrada obsoleta: la nota s'ha reprogramat o ja s'ha aturat
+            if schedule.get(key) != deadline:
+                continue
+            self.hw.midi.send_note_off(key, 0)
+            cfg.playing_notes.discard(key)
+            del schedule[key]
+
     def stop_all_notes(self):
         """Detiene todas las notas activas"""
         for note in self.cfg.playing_notes:
-            self.hw.midi.send(NoteOff(note, 0))
+            self.hw.midi.send_note_off(note, 0)
         self.cfg.playing_notes.clear()
         self.cfg.note_off_schedule.clear()
+        self.timers.clear()
+        if self.clock_output is not None:
+            self.clock_output.reschedule()  # El pols de rellotge pendent no és una nota
         self.cfg.gate_active = False
         self.hw.out_jack.value = False
         self.hw.led_2.value = False
@@ -0,0 +1,147 @@
+# =============================================================================
+# PLANIFICADOR COOPERATIU AMB DEADLINES - TECLA
+# =============================================================================
+# Substitueix la cadena fixa d'etapes del bucle principal per tasques amb
+# prioritat. Cada tasca és una funció step(now) que fa una porció de feina i
+# retorna True si en queda més (es torna a cridar a la iteració següent) o
+# False si ha acabat fins al pròxim període. Les tasques s'executen en
+# l'ordre en què s'afegeixen (entrades abans dels modes, etc.); la prioritat
+# decideix si una porció es pot ajornar:
+#
+#   CRITICAL - s'executa sempre (RTOS, ticks dels modes)
+#   HIGH     - s'executa sempre que toca (entrades, botons): porcions curtes
+#   LOW      - només si abans del pròxim deadline hi cap el cost estimat de
+#              la porció + un marge (LEDs, intro, pantalla)
+#
+# El pròxim deadline és el mínim entre MasterClock.next_tick (si hi ha un
+# mode sonant) i el primer temporitzador del RTOS (gate, NoteOff, polsos de
+# rellotge MIDI). El cost d'una tasca LOW és el pic de les últimes porcions
+# (decau 1/8 a cada execució): un render de 8 ms no comença a 2 ms d'un tick.
+# Una tasca ajornada més de max_defer s'executa igualment, perquè la
+# pantalla no es quedi congelada si el tempo és massa ràpid per a la porció.
+# =============================================================================
+import time
+
+CRITICAL = 0
+HIGH = 1
+LOW = 2
+
+
+class Task:
+    """Tasca del planificador.
+
+    Arguments:
+        name: Nom per a l'informe
+        step: Funció step(now) -> True si queda feina pendent
+        priority: CRITICAL, HIGH o LOW
+        period: Segons entre execucions (0 = cada iteració)
+        cost_us: Cost inicial estimat d'una porció (només LOW)
+        stage: Etapa del profiler (lap després de la tasca) o -1
+    """
+
+    __slots__ = (
+        "name", "step", "priority", "period", "stage", "next_run",
+        "cost_us", "deferred_since", "runs", "deferrals", "forced",
+    )
+
+    def __init__(self, name, step, priority, period=0.0, cost_us=0, stage=-1):
+        self.name = name
+        self.step = step
+        self.priority = priority
+        self.period = period
+        self.stage = stage
+        self.next_run = 0.0
+        self.cost_us = cost_us
+        self.deferred_since = -1.0  # Primer ajornament seguit (-1 = cap)
+        self.runs = 0
+        self.deferrals = 0
+        self.forced = 0  # Execucions forçades per max_defer
+
+
+class Scheduler:
+    """Planificador cooperatiu del bucle principal.
+
+    Arguments:
+        clock: MasterClock (next_tick)
+        timers: TimerQueue del RTOS (next_deadline)
+        profiler: LoopProfiler (lap per etapa) o None
+        guard_us: Marge extra abans del deadline per a les tasques LOW
+        max_defer: Segons màxims que una tasca LOW pot quedar ajornada
+            (0 = no ajornar mai: cadena fixa com el bucle antic)
+    """
+
+    def __init__(self, clock, timers, profiler=None, guard_us=300, max_defer=0.5):
+        self.clock = clock
+        self.timers = timers
+        self.profiler = profiler
+        self.guard_us = guard_us
+        self.max_defer = max_defer
+        self.tasks = []
+        self.ticking = False  # El MasterClock genera ticks (mode > 0)
+
+    def add(self, name, step, priority, period=0.0, cost_us=0, stage=-1):
+        """Afegeix una tasca al final de la iteració"""
+        task = Task(name, step, priority, period, cost_us, stage)
+        self.tasks.append(task)
+        return task
+
+    def slack_us(self, now=None):
+        """Microsegons fins al pròxim deadline (tick o temporitzador)"""
+        deadline = self.timers.next_deadline
+        if self.ticking and self.clock.next_tick < deadline:
+            deadline = self.clock.next_tick
+        if now is None:
+            now = time.monotonic()
+        return (deadline - now) * 1_000_000
+
+    def run(self, now):
+        """Executa una porció de cada tasca que toca
+
+        Args:
+            now: Temps de l'inici de la iteració (time.monotonic())
+        """
+        profiler = self.profiler
+        for task in self.tasks:
+            if now >= task.next_run:
+                if task.priority == LOW and not self._admit(task, now):
+                    if task.stage >= 0 and profiler is not None:
+                        profiler.lap(task.stage)
+                    continue
+
+                task.runs += 1
+                if task.priority == LOW:
+                    start = time.monotonic_ns()
+                    more = task.step(now)
+                    elapsed = (time.monotonic_ns() - start) // 1000
+                    # Pic amb decaïment: puja de cop, baixa 1/8 per execució
+                    cost = task.cost_us
+                    task.cost_us = elapsed if elapsed > cost else cost - ((cost - elapsed) >> 3)
+                else:
+                    more = task.step(now)
+                if not more:
+                    task.next_run = now + task.period
+            if task.stage >= 0 and profiler is not None:
+                profiler.lap(task.stage)
+
+    def _admit(self, task, now):
+        if self.max_defer <= 0 or self.slack_us() >= task.cost_us + self.guard_us:
+            task.deferred_since = -1.0
+            return True
+        task.deferrals += 1
+        if task.deferred_since < 0:
+            task.deferred_since = now
+        elif now - task.deferred_since > self.max_defer:
+            task.deferred_since = -1.0
+            task.forced += 1
+            return True
+        return False
+
+    def report(self):
+        """Informe per tasca: execucions, ajornaments i cost estimat"""
+        lines = ["tasca        prio   runs  ajorn  forç  cost_us"]
+        for task in self.tasks:
+            lines.append(
+                f"{task.name:<12} {task.priority:>4} {task.runs:>6} "
+                f"{task.deferrals:>6} {task.forced:>5} {task.cost_us:>8}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,317 @@
+# =============================================================================
+# CONFIGURACIÓ PERSISTENT EN BINARI - TECLA
+# =============================================================================
+# Els paràmetres que l'usuari canvia amb els botons (mode, octava, duty,
+# harmònics, presets de rang de CV) i la calibració dels CV (cv1/cv2
+# min/max, core/calibration.py) es guarden a la memòria no volàtil
+# (microcontroller.nvm) en un registre binari de mida fixa:
+#
+#   magic  versió  seq    10 camps (1 byte)   calibració (mV)   CRC32
+#   B      B       H      10B                 4H                I   = 26 bytes
+#
+# La calibració es desa en mil·livolts (0-3300); CALIB_NONE en un canal vol
+# dir que no s'ha calibrat i en carregar s'aplica el preset de rang.
+#
+# Els registres s'escriuen en un registre circular de SLOTS posicions: cada
+# desada va a la posició següent amb seq + 1, i en arrencar es carrega el de
+# seq més alta amb magic, versió, CRC i rangs vàlids. Els registres d'una
+# versió anterior (18 bytes, sense calibració) es descarten.
+#
+# Les escriptures s'agrupen: step() (tasca LOW del planificador) compara
+# els valors actuals amb els desats sense assignar memòria i només escriu
+# quan fa save_delay segons que no canvien. Mantenir un botó premut 3 s són
+# desenes de canvis i una sola escriptura. La calibració no es consulta a
+# cada step(): en sortir del mode calibració es crida request_save(). Abans
+# d'escriure es compara el registre sencer amb el desat: si és igual no
+# s'escriu.
+#
+# Nota RP2040: nvm és un sector de flaix de 4 KB que CircuitPython esborra i
+# reescriu sencer a cada escriptura (desenes de ms amb el processador
+# aturat). Per això l'escriptura espera que el marge fins al pròxim deadline
+# (Scheduler.slack_us()) hi càpiga (en pausa, o amb tempos lents sense
+# rellotge MIDI de sortida), i només s'escriu igualment després de max_wait.
+#
+# Límits coneguts: com que el sector s'esborra sencer, la rotació de
+# posicions no reparteix el desgast (cada desada és un cicle d'esborrat del
+# mateix sector); el desgast només el redueixen l'agrupació i no escriure
+# registres iguals. La rotació i el CRC només protegeixen d'una escriptura
+# tallada a memòries que no s'esborren per sectors. Si el tall arriba durant
+# l'esborrat del sector es perden totes les posicions i s'arrenca amb els
+# valors per defecte.
+# =============================================================================
+import struct
+import time
+from binascii import crc32
+
+MAGIC = 0x54  # "T"
+VERSION = 2  # 2: calibració dels CV en mV
+
+# Camps del registre (noms de core/config) i rang vàlid de cada un
+FIELDS = (
+    "loop_mode", "octava", "duty1", "duty2", "duty3",
+    "freqharm_base", "freqharm1", "freqharm2",
+    "cv1_range_config", "cv2_range_config",
+)
+LIMITS = (
+    (0, 63), (0, 8), (1, 99), (1, 99), (1, 99),  # loop_mode: registre de modes ampliable
+    (0, 12), (0, 12), (0, 12),
+    (0, 4), (0, 4),
+)
+
+# Calibració: cv1_min, cv1_max, cv2_min, cv2_max en mV
+CALIBRATION = "<4H"
+CALIB_NONE = 0xFFFF  # Canal sense calibrar: s'aplica el preset
+CALIB_MAX_MV = 3300
+
+HEADER = "<BBH"
+HEADER_SIZE = struct.calcsize(HEADER)
+CALIB_OFFSET = len(FIELDS)  # Dins de les dades (després de la capçalera)
+DATA_SIZE = CALIB_OFFSET + struct.calcsize(CALIBRATION)
+BODY_SIZE = HEADER_SIZE + DATA_SIZE
+SLOT_SIZE = BODY_SIZE + 4  # + CRC32
+SLOTS = 32
+WRITE_US = 50000  # Estimació inicial d'una escriptura a nvm (esborrat de sector)
+
+
+def _newer(seq, other):
+    """seq és posterior a other (comptador de 16 bits que dona la volta)"""
+    return 0 < ((seq - other) & 0xFFFF) < 0x8000
+
+
+def _millivolts(volts):
+    mv = int(volts * 1000 + 0.5)
+    return 0 if mv < 0 else CALIB_MAX_MV if mv > CALIB_MAX_MV else mv
+
+
+class SettingsStore:
+    """Registre circular de configuracions a la memòria no volàtil.
+
+    Arguments:
+        cfg: Mòdul de configuració global
+        storage: microcontroller.nvm (o qualsevol bytearray) o None
+        save_delay: Segons sense canvis abans d'escriure
+        max_wait: Segons màxims esperant marge després de save_delay
+        scheduler: Scheduler (slack_us) o None per escriure sense esperar
+        guard_us: Marge extra abans del deadline
+        offset: Primer byte del registre dins de storage
+    """
+
+    def __init__(self, cfg, storage, save_delay=5.0, max_wait=60.0, scheduler=None,
+                 guard_us=300, offset=0):
+        self.cfg = cfg
+        self.storage = storage
+        self.save_delay = save_delay
+        self.max_wait = max_wait
+        self.scheduler = scheduler
+        self.guard_us = guard_us
+        self.offset = offset
+        self.slots = 0 if storage is None else min(SLOTS, (len(storage) - offset) // SLOT_SIZE)
+        self.enabled = self.slots > 0
+        self.slot = -1      # Última posició escrita/carregada
+        self.seq = 0
+        self.writes = 0
+        self.forced = 0     # Escriptures sense marge (després de max_wait)
+        self.load_us = 0
+        self.write_us = WRITE_US  # Pic amb decaïment de les escriptures
+        self._record = bytearray(SLOT_SIZE)
+        self._values = bytearray(len(FIELDS))   # Valors actuals (step)
+        self._seen = bytearray(len(FIELDS))     # Valors de l'step anterior
+        self._saved = bytearray(len(FIELDS))    # Valors desats
+        self._data = bytearray(DATA_SIZE)       # Dades del registre a escriure
+        self._saved_data = bytearray(DATA_SIZE)  # Dades de l'últim registre
+        self._requested = False                 # request_save() pendent
+        self._changed_at = -1.0                 # Últim canvi pendent (-1 = cap)
+
+    # ------------------------------------------------------------------
+    # Càrrega
+    # ------------------------------------------------------------------
+    def load(self):
+        """Aplica a cfg el registre vàlid més recent
+
+        Primer es llegeixen les capçaleres (4 bytes per posició) i només es
+        valida (CRC i rangs) la més recent; si falla, la següent.
+
+        Returns:
+            True si s'ha trobat un registre vàlid
+        """
+        if not self.enabled:
+            return False
+        start = time.monotonic_ns()
+        seqs = [-1] * self.slots
+        for slot in range(self.slots):
+            at = self.offset + slot * SLOT_SIZE
+            magic, version, seq = struct.unpack(HEADER, self.storage[at:at + HEADER_SIZE])
+            if magic == MAGIC and version == VERSION:
+                seqs[slot] = seq
+        found = False
+        while not found:
+            best = -1
+            for slot in range(self.slots):
+                if seqs[slot] >= 0 and (best < 0 or _newer(seqs[slot], seqs[best])):
+                    best = slot
+            if best < 0:
+                break
+            found = self._read_slot(best)
+            if found:
+                self.slot = best
+                self.seq = seqs[best]
+                self._apply(self._record)
+            seqs[best] = -1
+        if not found:
+            self.slot = self.slots - 1  # Primera desada a la posició 0
+            self.seq = 0
+        self._snapshot(self._saved)
+        self._snapshot(self._seen)
+        self._pack(self._saved_data)
+        self.load_us = (time.monotonic_ns() - start) // 1000
+        return found
+
+    def _read_slot(self, slot):
+        """Copia la posició a _record; True si el CRC i els rangs són vàlids"""
+        at = self.offset + slot * SLOT_SIZE
+        record = self._record
+        record[:] = self.storage[at:at + SLOT_SIZE]
+        if struct.unpack_from("<I", record, BODY_SIZE)[0] != crc32(record[:BODY_SIZE]):
+            return False
+        for i in range(len(FIELDS)):
+            low, high = LIMITS[i]
+            if not low <= record[HEADER_SIZE + i] <= high:
+                return False
+        calibration = struct.unpack_from(CALIBRATION, record, HEADER_SIZE + CALIB_OFFSET)
+        for channel in (0, 2):
+            low, high = calibration[channel], calibration[channel + 1]
+            if low == CALIB_NONE and high == CALIB_NONE:
+                continue
+            if low > CALIB_MAX_MV or high > CALIB_MAX_MV:
+                return False
+        return True
+
+    def _apply(self, record):
+        cfg = self.cfg
+        for i in range(len(FIELDS)):
+            setattr(cfg, FIELDS[i], record[HEADER_SIZE + i])
+        cv1_min, cv1_max, cv2_min, cv2_max = struct.unpack_from(
+            CALIBRATION, record, HEADER_SIZE + CALIB_OFFSET)
+        # Calibració desada: té prioritat sobre el preset del canal
+        if cv1_min == CALIB_NONE:
+            cfg.cv1_calibrated = False
+            cfg.apply_cv1_range_preset()
+        else:
+            cfg.cv1_calibrated = True
+            cfg.cv1_min = cv1_min / 1000
+            cfg.cv1_max = cv1_max / 1000
+        if cv2_min == CALIB_NONE:
+            cfg.cv2_calibrated = False
+            cfg.apply_cv2_range_preset()
+        else:
+            cfg.cv2_calibrated = True
+            cfg.cv2_min = cv2_min / 1000
+            cfg.cv2_max = cv2_max / 1000
+
+    # ------------------------------------------------------------------
+    # Desada diferida
+    # ------------------------------------------------------------------
+    def _snapshot(self, values):
+        """Valors actuals de cfg a `values` (sense assignar memòria)"""
+        cfg = self.cfg
+        for i in range(len(FIELDS)):
+            values[i] = getattr(cfg, FIELDS[i])
+        if cfg.caos:
+            # En mode caos l'octava és aleatòria: desar la d'abans del caos
+            values[1] = cfg.octava_anterior
+
+    def _pack(self, data):
+        """Dades del registre (camps + calibració en mV) a `data`"""
+        self._snapshot(data)
+        cfg = self.cfg
+        if cfg.cv1_calibrated:
+            cv1_min, cv1_max = _millivolts(cfg.cv1_min), _millivolts(cfg.cv1_max)
+        else:
+            cv1_min = cv1_max = CALIB_NONE
+        if cfg.cv2_calibrated:
+            cv2_min, cv2_max = _millivolts(cfg.cv2_min), _millivolts(cfg.cv2_max)
+        else:
+            cv2_min = cv2_max = CALIB_NONE
+        struct.pack_into(CALIBRATION, data, CALIB_OFFSET, cv1_min, cv1_max, cv2_min, cv2_max)
+
+    def request_save(self, now):
+        """Demana una desada (p. ex. en acabar la calibració dels CV)
+
+        Segueix el mateix camí que un canvi de botons: save_delay i marge
+        del planificador. Si el registre no ha canviat no s'escriu.
+
+        Args:
+            now: Temps actual (time.monotonic())
+        """
+        if self.enabled:
+            self._requested = True
+            self._changed_at = now
+
+    def step(self, now):
+        """Tasca del planificador: desa si fa save_delay que no hi ha canvis
+
+        Args:
+            now: Temps actual (time.monotonic())
+        """
+        if not self.enabled:
+            return False
+        values = self._values
+        self._snapshot(values)
+        if values != self._seen:
+            for i in range(len(values)):
+                self._seen[i] = values[i]
+            self._changed_at = now
+        elif self._changed_at >= 0 and now - self._changed_at >= self.save_delay:
+            if values == self._saved and not self._requested:
+                self._changed_at = -1.0
+            elif not self._dirty():
+                self._changed_at = -1.0
+                self._requested = False
+            elif self.scheduler is None or self.scheduler.slack_us() >= self.write_us + self.guard_us:
+                self._changed_at = -1.0
+                self.save()
+            elif now - self._changed_at >= self.save_delay + self.max_wait:
+                self._changed_at = -1.0
+                self.forced += 1
+                self.save()
+        return False
+
+    def _dirty(self):
+        """El registre actual és diferent de l'últim desat"""
+        self._pack(self._data)
+        return self._data != self._saved_data
+
+    def save(self):
+        """Escriu els valors actuals a la posició següent del registre"""
+        if not self.enabled:
+            return
+        data = self._data
+        self._pack(data)
+        self.seq = (self.seq + 1) & 0xFFFF
+        self.slot = (self.slot + 1) % self.slots
+        record = self._record
+        struct.pack_into(HEADER, record, 0, MAGIC, VERSION, self.seq)
+        record[HEADER_SIZE:BODY_SIZE] = data
+        struct.pack_into("<I", record, BODY_SIZE, crc32(record[:BODY_SIZE]))
+        at = self.offset + self.slot * SLOT_SIZE
+        start = time.monotonic_ns()
+        self.storage[at:at + SLOT_SIZE] = record
+        elapsed = (time.monotonic_ns() - start) // 1000
+        estimate = self.write_us
+        self.write_us = elapsed if elapsed > estimate else estimate - ((estimate - elapsed) >> 3)
+        for i in range(len(FIELDS)):
+            self._saved[i] = data[i]
+        self._saved_data[:] = data
+        self._requested = False
+        self.writes += 1
+
+    def report(self):
+        """Informe: posició i seq actuals, escriptures i temps de càrrega"""
+        if not self.enabled:
+            return "Configuració persistent desactivada"
+        return (
+            f"Configuració: slot {self.slot}/{self.slots} seq {self.seq} | "
+            f"{self.writes} escriptures ({self.forced} forçades, est {self.write_us} us) | "
+            f"càrrega {self.load_us} us | "
+            f"pendent {'sí' if self._changed_at >= 0 else 'no'}"
+        )
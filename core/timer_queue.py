@@ -0,0 +1,142 @@
+# =============================================================================
+# TIMER QUEUE - Cua de temporitzadors per deadline (min-heap) - TECLA
+# =============================================================================
+# Cua de prioritat amb memòria preassignada per als deadlines del RTOS
+# (gate-off i NoteOff). El deadline més proper sempre és a l'arrel, de manera
+# que RTOSManager.update() pot sortir amb una sola comparació quan no hi ha
+# res pendent.
+#
+# Les entrades NO s'esborren quan una nota es reprograma o s'atura: es marquen
+# com a obsoletes implícitament (el deadline ja no coincideix amb l'estat
+# autoritatiu de cfg) i es descarten quan arriben a l'arrel.
+# =============================================================================
+
+INFINITY = float("inf")
+
+
+class TimerQueue:
+    """Min-heap de (deadline, clau) sobre llistes preassignades.
+
+    Arguments:
+        capacity: Nombre màxim d'entrades simultànies
+        is_live: Funció (clau, deadline) -> bool que indica si una entrada
+            encara és vàlida. S'usa per compactar la cua quan s'omple.
+    """
+
+    def __init__(self, capacity=160, is_live=None):
+        self.capacity = capacity
+        self._deadlines = [0.0] * capacity
+        self._keys = [0] * capacity
+        self._size = 0
+        self._is_live = is_live
+        self.next_deadline = INFINITY  # Peek O(1) del deadline més proper
+        self.last_deadline = 0.0       # Deadline de l'última entrada extreta
+
+    def __len__(self):
+        return self._size
+
+    def push(self, deadline, key):
+        """Afegeix un deadline per a la clau indicada."""
+        if self._size >= self.capacity:
+            self.compact()
+            if self._size >= self.capacity:
+                raise RuntimeError("TimerQueue plena")
+
+        deadlines = self._deadlines
+        keys = self._keys
+
+        # Sift-up
+        pos = self._size
+        self._size += 1
+        while pos > 0:
+            parent = (pos - 1) >> 1
+            if deadlines[parent] <= deadline:
+                break
+            deadlines[pos] = deadlines[parent]
+            keys[pos] = keys[parent]
+            pos = parent
+        deadlines[pos] = deadline
+        keys[pos] = key
+
+        self.next_deadline = deadlines[0]
+
+    def pop(self):
+        """Extreu la clau amb el deadline més proper.
+
+        El deadline extret queda a ``last_deadline`` (evita crear tuples).
+        """
+        deadlines = self._deadlines
+        keys = self._keys
+
+        key = keys[0]
+        self.last_deadline = deadlines[0]
+
+        self._size -= 1
+        size = self._size
+        if size == 0:
+            self.next_deadline = INFINITY
+            return key
+
+        # Moure l'última entrada a l'arrel i fer sift-down
+        deadline = deadlines[size]
+        moved_key = keys[size]
+        pos = 0
+        while True:
+            child = 2 * pos + 1
+            if child >= size:
+                break
+            right = child + 1
+            if right < size and deadlines[right] < deadlines[child]:
+                child = right
+            if deadline <= deadlines[child]:
+                break
+            deadlines[pos] = deadlines[child]
+            keys[pos] = keys[child]
+            pos = child
+        deadlines[pos] = deadline
+        keys[pos] = moved_key
+
+        self.next_deadline = deadlines[0]
+        return key
+
+    def compact(self):
+        """Descarta les entrades obsoletes i reconstrueix el heap in situ."""
+        if self._is_live is None:
+            return
+
+        deadlines = self._deadlines
+        keys = self._keys
+        kept = 0
+        for i in range(self._size):
+            if self._is_live(keys[i], deadlines[i]):
+                deadlines[kept] = deadlines[i]
+                keys[kept] = keys[i]
+                kept += 1
+        self._size = kept
+
+        # Heapify (Floyd) sobre les entrades conservades
+        for start in range((kept >> 1) - 1, -1, -1):
+            deadline = deadlines[start]
+            key = keys[start]
+            pos = start
+            while True:
+                child = 2 * pos + 1
+                if child >= kept:
+                    break
+                right = child + 1
+                if right < kept and deadlines[right] < deadlines[child]:
+                    child = right
+                if deadline <= deadlines[child]:
+                    break
+                deadlines[pos] = deadlines[child]
+                keys[pos] = keys[child]
+                pos = child
+            deadlines[pos] = deadline
+            keys[pos] = key
+
+        self.next_deadline = deadlines[0] if kept else INFINITY
+
+    def clear(self):
+        """Buida la cua (no allibera memòria)."""
+        self._size = 0
+        self.next_deadline = INFINITY
@@ -22,6 +22,7 @@ import time
 import random
 import math
 from music.converters import midi_to_note_name  # Note: No longer used in idle animation
+from display.render_job import run
 
 class Animations:
     """Animacions per pantalla OLED"""
@@ -32,6 +33,15 @@ class Animations:
     
     def animacion_ojo(self):
         """Animación de ojo en modo inactivo con 24 frames - Muestra parámetros modificados"""
+        run(self.ojo_job())
+    
+    def ojo_job(self):
+        """Frame de l'ull com a treball de dibuix per porcions (display/render_job.py)
+        
+        Fa `yield` després de cada pupil·la o columna de píxels. El ritme de
+        frames el marca el bucle principal (abans hi havia un sleep de 100 ms
+        que bloquejava botons i MIDI).
+        """
         self.hw.display.fill(0)  # Limpiar pantalla
         
         # Valores por defecto
@@ -68,14 +78,15 @@ class Animations:
         
         # Contorno del ojo GEGANT
         self.hw.display.circle(cx, cy, r, 1)
+        yield
         
-        # Funció helper per omplir cercle manualment
+        # Funció helper per omplir cercle: una hline per fila (els mateixos
+        # píxels que dx*dx + dy*dy <= radi*radi, hline retalla als marges)
         def dibuixar_pupila(px, py, radi):
+            rr = radi * radi
             for dy in range(-radi, radi + 1):
-                for dx in range(-radi, radi + 1):
-                    if dx*dx + dy*dy <= radi*radi:
-                        if 0 <= px + dx < 128 and 0 <= py + dy < 64:
-                            self.hw.display.pixel(px + dx, py + dy, 1)
+                w = int((rr - dy * dy) ** 0.5)
+                self.hw.display.hline(px - w, py + dy, 2 * w + 1, 1)
         
         # Funció helper per afegir iris (anells al voltant de la pupil·la)
         def dibuixar_iris(px, py):
@@ -155,12 +166,14 @@ class Animations:
                 # TRES PUPIL·LES
                 dibuixar_pupila(cx, cy - 12, 4)
                 dibuixar_pupila(cx, cy, 6)
+                yield
                 dibuixar_pupila(cx, cy + 12, 4)
             
             elif frame_glitch == 4:
                 # QUATRE PUPIL·LES
                 dibuixar_pupila(cx - 10, cy - 10, 5)
                 dibuixar_pupila(cx + 10, cy - 10, 5)
+                yield
                 dibuixar_pupila(cx - 10, cy + 10, 5)
                 dibuixar_pupila(cx + 10, cy + 10, 5)
             
@@ -173,10 +186,12 @@ class Animations:
                     px = int(cx + 12 * math.cos(rad))
                     py = int(cy + 12 * math.sin(rad))
                     dibuixar_pupila(px, py, 4)
+                    yield
             
             elif frame_glitch == 6:
                 # Cercles caòtics
                 dibuixar_pupila(cx, cy, 10)
+                yield
                 self.hw.display.circle(cx, cy, 6, 1)
                 self.hw.display.circle(cx, cy, 14, 1)
                 self.hw.display.circle(cx, cy, 18, 1)
@@ -192,6 +207,8 @@ class Animations:
                     py = int(cy + r_spiral * math.sin(rad))
                     if 0 <= px < 128 and 0 <= py < 64:
                         dibuixar_pupila(px, py, 2)
+                    if i % 120 == 100:
+                        yield
             
             elif frame_glitch == 8:
                 # Inversió 25%
@@ -199,6 +216,7 @@ class Animations:
                 for x in range(0, 128, 4):
                     for y in range(0, 64, 4):
                         self.hw.display.pixel(x, y, 0)
+                    yield
             
             elif frame_glitch == 9:
                 # Inversió 50%
@@ -207,12 +225,14 @@ class Animations:
                     for y in range(0, 64, 2):
                         if (x + y) % 4 == 0:
                             self.hw.display.pixel(x, y, 0)
+                    yield
             
             elif frame_glitch == 10:
                 # Inversió 75%
                 for x in range(0, 128, 2):
                     for y in range(0, 64, 2):
                         self.hw.display.pixel(x, y, 0)
+                    yield
                 dibuixar_pupila(cx - 12, cy, 5)
                 dibuixar_pupila(cx + 12, cy, 5)
             
@@ -220,6 +240,7 @@ class Animations:
                 # INVERSIÓ COMPLETA (5 frames)
                 self.hw.display.fill(1)  # Tot blanc
                 self.hw.display.circle(cx, cy, r, 0)  # Ull negre
+                yield
                 # Pupil·la blanca (píxels negres = 0)
                 for dy in range(-6, 7):
                     for dx in range(-6, 7):
@@ -231,12 +252,14 @@ class Animations:
                 # Tornada amb glitch
                 dibuixar_pupila(cx, cy, 8)
                 # Línies verticals glitch
+                yield
                 for i in range(0, 128, 6):
                     self.hw.display.vline(i, 0, 64, 1)
             
             elif frame_glitch == 17:
                 # Glitch horitzontal
                 dibuixar_pupila(cx, cy, 7)
+                yield
                 for i in range(0, 64, 4):
                     self.hw.display.hline(0, i, 128, 1)
             
@@ -254,6 +277,7 @@ class Animations:
                     px = int(cx + 10 * math.cos(rad))
                     py = int(cy + 10 * math.sin(rad))
                     dibuixar_pupila(px, py, 3)
+                    yield
             
             elif frame_glitch >= 20 and frame_glitch <= 24:
                 # Reset gradual (5 frames)
@@ -276,7 +300,6 @@ class Animations:
                 self.hw.display.text(config_text, (128 - text_width) // 2, 56, 1)
         
         self.hw.display.show()
-        time.sleep(0.1)  # Manté 100ms per frame (sortida ràpida possible)
     
     def dibujar_rayo_simple(self):
         """Raig espectacular a PANTALLA COMPLETA - només quan nota toca"""
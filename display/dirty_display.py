@@ -0,0 +1,211 @@
+# =============================================================================
+# DIRTY DISPLAY - Enviament parcial del framebuffer SSD1306 - TECLA
+# =============================================================================
+# Totes les pantalles fan fill(0) + redibuixar + show(), i show() envia el
+# framebuffer sencer (1 KB) per I2C encara que només hagi canviat la línia
+# "Oct:5 C4". Aquest embolcall compara el frame nou amb l'últim enviat i, per
+# cada pàgina de 8 files que ha canviat, envia només el rang de columnes
+# modificat (SET_COL_ADDR / SET_PAGE_ADDR + dades).
+#
+# L'I2C es fa dins del bucle principal (un sol fil): menys bytes per frame
+# vol dir menys jitter als ticks musicals. Amb deferred=True, show() només
+# marca el frame com a pendent i cada flush_step() n'envia un tros (com a
+# molt chunk_columns columnes d'una pàgina), perquè el planificador
+# (core/scheduler.py) pugui repartir l'enviament entre ticks.
+# =============================================================================
+
+# Comandes SSD1306 d'adreçament horitzontal
+SET_COL_ADDR = 0x21
+SET_PAGE_ADDR = 0x22
+DATA_CONTROL = 0x40  # Co=0, D/C=1: els bytes següents són dades
+
+# Mètodes de dibuix que es deleguen directament (sense __getattr__ per crida)
+_DRAW_METHODS = (
+    "fill", "pixel", "hline", "vline", "line", "rect", "fill_rect",
+    "circle", "text", "scroll", "blit",
+)
+
+
+class DirtyDisplay:
+    """Embolcall de SSD1306_I2C amb flush només de les pàgines modificades.
+
+    Arguments:
+        display: Instància de SSD1306_I2C (adafruit_ssd1306)
+    """
+
+    def __init__(self, display):
+        self.display = display
+        self.width = display.width
+        self.height = display.height
+        self.buffer = display.buffer
+        for name in _DRAW_METHODS:
+            method = getattr(display, name, None)
+            if method is not None:
+                setattr(self, name, method)
+
+        self.pages = self.height // 8
+        pixels = self.width * self.pages
+        self._offset = len(self.buffer) - pixels  # 1 a SSD1306_I2C (byte de control)
+        self._prev = bytearray(pixels)
+        self._cmd = bytearray((0x00, SET_COL_ADDR, 0, 0, SET_PAGE_ADDR, 0, 0))
+
+        # Només sabem enviar finestres parcials amb adreçament horitzontal,
+        # bus I2C i amplada 128 (sense offset de columna)
+        self._partial = (
+            self._offset >= 1
+            and self.width == 128
+            and not getattr(display, "page_addressing", False)
+            and hasattr(display, "i2c_device")
+        )
+        self._full_pending = True  # El primer frame sempre s'envia sencer
+
+        # Enviament per porcions (planificador)
+        self.deferred = False  # True: show() només marca el frame pendent
+        self.pending = False   # Hi ha un frame per enviar amb flush_step()
+        self.chunk_columns = 32  # Columnes màximes per porció de flush_step()
+        self._next_page = 0
+        self._next_col = 0
+
+        # Estadístiques
+        self.flushes = 0
+        self.pages_sent = 0
+        self.bytes_sent = 0
+
+    def __getattr__(self, name):
+        # Resta de l'API (poweron, contrast, invert...) directament al driver
+        return getattr(self.display, name)
+
+    def invalidate(self):
+        """Força que el pròxim show() enviï el framebuffer sencer."""
+        self._full_pending = True
+
+    def _send_window(self, page, col0, col1):
+        """Envia les columnes col0..col1 (incloses) de la pàgina indicada."""
+        # Les sis comandes d'adreçament en una sola transacció (Co=0, D/C=0:
+        # tots els bytes següents són comandes)
+        cmd = self._cmd
+        cmd[2] = col0
+        cmd[3] = col1
+        cmd[5] = page
+        cmd[6] = page
+        self.display.i2c_device.write(cmd)
+
+        # Posar temporalment el byte de control just abans de les dades per
+        # enviar-ho tot en una sola transacció sense copiar el buffer
+        buffer = self.buffer
+        start = self._offset + page * self.width + col0
+        end = self._offset + page * self.width + col1 + 1
+        saved = buffer[start - 1]
+        buffer[start - 1] = DATA_CONTROL
+        try:
+            self.display.i2c_device.write(buffer, start=start - 1, end=end)
+        finally:
+            buffer[start - 1] = saved
+        self.bytes_sent += end - start + 1 + len(cmd)
+
+    def show(self):
+        """Envia al display només les pàgines que han canviat."""
+        self.flushes += 1
+        if self.deferred:
+            # Un frame nou reinicia el recorregut de pàgines
+            self.pending = True
+            self._next_page = 0
+            self._next_col = 0
+            return
+        self.pending = False
+        if self._full_pending or not self._partial:
+            self._send_full()
+            return
+
+        for page in range(self.pages):
+            self._flush_page(page)
+
+    def _send_full(self):
+        prev = self._prev
+        self.display.show()
+        prev[:] = memoryview(self.buffer)[self._offset:]
+        self._full_pending = False
+        self.pages_sent += self.pages
+        self.bytes_sent += len(prev) + 1
+
+    def flush_step(self):
+        """Envia la pròxima finestra modificada del frame pendent.
+
+        Cada crida envia com a molt chunk_columns columnes d'una pàgina
+        (a 100 kHz, una pàgina sencera són ~12 ms de bus).
+
+        Returns:
+            True si encara queda part del frame per revisar
+        """
+        if not self.pending:
+            return False
+        if not self._partial:
+            # Sense finestres parcials: tot el frame en una porció
+            self.pending = False
+            self._send_full()
+            return False
+
+        buffer = self.buffer
+        prev = self._prev
+        offset = self._offset
+        width = self.width
+        full = self._full_pending
+        page = self._next_page
+        col0 = self._next_col
+        while page < self.pages:
+            base = page * width
+            if not full:
+                while col0 < width and buffer[offset + base + col0] == prev[base + col0]:
+                    col0 += 1
+            if col0 < width:
+                col1 = width - 1
+                if not full:
+                    while buffer[offset + base + col1] == prev[base + col1]:
+                        col1 -= 1
+                end = col0 + self.chunk_columns - 1
+                last = col1 <= end
+                if not last:
+                    col1 = end
+                self._send_window(page, col0, col1)
+                for col in range(col0, col1 + 1):
+                    prev[base + col] = buffer[offset + base + col]
+                if last:
+                    self.pages_sent += 1
+                    page += 1
+                    col0 = 0
+                else:
+                    col0 = col1 + 1
+                break
+            page += 1
+            col0 = 0
+
+        self._next_page = page
+        self._next_col = col0
+        if page < self.pages:
+            return True
+        self.pending = False
+        self._full_pending = False
+        return False
+
+    def _flush_page(self, page):
+        """Envia el rang modificat d'una pàgina."""
+        buffer = self.buffer
+        prev = self._prev
+        offset = self._offset
+        width = self.width
+        base = page * width
+        # Primera columna modificada
+        col0 = 0
+        while col0 < width and buffer[offset + base + col0] == prev[base + col0]:
+            col0 += 1
+        if col0 == width:
+            return
+        # Última columna modificada
+        col1 = width - 1
+        while buffer[offset + base + col1] == prev[base + col1]:
+            col1 -= 1
+
+        self._send_window(page, col0, col1)
+        for col in range(col0, col1 + 1):
+            prev[base + col] = buffer[offset + base + col]
+        self.pages_sent += 1
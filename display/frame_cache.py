@@ -0,0 +1,99 @@
+# =============================================================================
+# FRAME CACHE - Imatges de pantalla completa pre-renderitzades - TECLA
+# =============================================================================
+# Les imatges grans de _dibuixar_imatge_gran es dibuixen píxel a píxel (i
+# algunes, com el fractal del Mode 1, fan centenars d'iteracions). Com que són
+# estàtiques, es renderitzen una sola vegada, es copia el framebuffer
+# resultant (1 KB, format MVLSB de l'SSD1306) i les següents vegades es copia
+# directament al buffer del display amb una sola assignació de slice.
+#
+# Cache LRU petita: com a màxim `capacity` imatges (1 KB cadascuna). Els
+# bytearrays de les entrades expulsades es reutilitzen (sense noves
+# assignacions de memòria un cop plena).
+# =============================================================================
+
+
+def framebuffer_view(display):
+    """Retorna el memoryview dels píxels del display (o None si no n'hi ha)
+
+    SSD1306_I2C reserva el primer byte de `buffer` per al byte de control
+    I2C (0x40); els píxels comencen a l'offset 1.
+    """
+    buffer = getattr(display, "buffer", None)
+    if buffer is None:
+        return None
+    pixels = (display.width * display.height) // 8
+    offset = len(buffer) - pixels
+    if offset < 0:
+        return None
+    return memoryview(buffer)[offset:]
+
+
+class FrameCache:
+    """Cache LRU de framebuffers complets indexada per clau (p.ex. el mode).
+
+    Arguments:
+        capacity: Nombre màxim d'imatges en memòria
+    """
+
+    __slots__ = ("capacity", "_frames", "_order")
+
+    def __init__(self, capacity=4):
+        self.capacity = capacity
+        self._frames = {}   # clau -> bytearray
+        self._order = []    # claus, la menys recent primer
+
+    def __len__(self):
+        return len(self._frames)
+
+    def __contains__(self, key):
+        return key in self._frames
+
+    def blit(self, key, display):
+        """Copia la imatge `key` al buffer del display.
+
+        Retorna False si la imatge no és a la cache (cal renderitzar-la).
+        """
+        frame = self._frames.get(key)
+        if frame is None:
+            return False
+        view = framebuffer_view(display)
+        if view is None:
+            return False
+        view[:] = frame
+        order = self._order
+        if order[-1] != key:
+            order.remove(key)
+            order.append(key)
+        return True
+
+    def store(self, key, display):
+        """Guarda el contingut actual del buffer del display com a `key`."""
+        view = framebuffer_view(display)
+        if view is None:
+            return
+        self.load(key, view)
+
+    def load(self, key, data):
+        """Guarda una imatge ja empaquetada (1-bpp MVLSB, 1 KB per 128x64)."""
+        if self.capacity <= 0:
+            return
+        frames = self._frames
+        order = self._order
+        frame = frames.get(key)
+        if frame is not None:
+            order.remove(key)
+        elif len(order) >= self.capacity:
+            # Reutilitzar el buffer de l'entrada menys recent
+            frame = frames.pop(order.pop(0))
+            if len(frame) != len(data):
+                frame = None
+        if frame is None:
+            frame = bytearray(len(data))
+        frame[:] = data
+        frames[key] = frame
+        order.append(key)
+
+    def clear(self):
+        self._frames.clear()
+        del self._order[:]
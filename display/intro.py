@@ -0,0 +1,195 @@
+# =============================================================================
+# INTRO - Animació d'inici cooperativa - TECLA
+# =============================================================================
+# La seqüència d'inici (prova de LEDs + animació de LEDs + 4 fases a la
+# pantalla) abans bloquejava el bucle principal uns 6 segons amb time.sleep().
+# Ara és un generador: cada `yield` retorna el temps que s'hauria dormit, i
+# el bucle principal avança un sol pas quan ha vençut el temps programat.
+# Mentre dura la intro ja es llegeixen botons i es pot començar un mode.
+# =============================================================================
+import math
+import random
+
+
+class IntroAnimation:
+    """Animació d'inici avançada frame a frame des del bucle principal.
+
+    Arguments:
+        hardware: TeclaHardware (display + LEDs)
+    """
+
+    def __init__(self, hardware):
+        self.hw = hardware
+        self.active = False
+        self.start_time = 0.0
+        self._next_time = 0.0
+        self._steps = None
+
+    def start(self, current_time):
+        """Inicia la seqüència (el primer pas s'executa al primer update)"""
+        self.active = True
+        self.start_time = current_time
+        self._next_time = current_time
+        self._steps = self._sequence()
+
+    def stop(self):
+        """Atura la intro immediatament i deixa LEDs i pantalla nets"""
+        if not self.active:
+            return
+        self.active = False
+        self._steps = None
+        self.hw.all_leds_off()
+        self.hw.display.fill(0)
+        self.hw.display.show()
+
+    def update(self, current_time):
+        """Executa el pas següent si ja li toca. Retorna True mentre duri."""
+        if not self.active:
+            return False
+        if current_time < self._next_time:
+            return True
+        try:
+            delay = next(self._steps)
+        except StopIteration:
+            self.active = False
+            self._steps = None
+            return False
+        self._next_time = current_time + delay
+        return True
+
+    def _sequence(self):
+        """Seqüència d'inici: cada yield és la pausa fins al pas següent"""
+        hw = self.hw
+        display = hw.display
+        leds = hw.leds
+
+        # ====================================================================
+        # PROVA INICIAL DE LEDS - Verificar funcionament
+        # ====================================================================
+        hw.all_leds_on()
+        yield 1.0  # 1 segon amb tots encesos
+        hw.all_leds_off()
+        yield 0.3
+
+        # ====================================================================
+        # ANIMACIÓ DE LEDS (abans hw.led_startup_animation)
+        # ====================================================================
+        # Seqüència 1: Tots els LEDs en cascada (endavant)
+        for led in leds:
+            led.value = True
+            yield 0.08
+        yield 0.15
+
+        # Seqüència 2: Apagar en cascada (enrere)
+        for led in reversed(leds):
+            led.value = False
+            yield 0.08
+        yield 0.1
+
+        # Seqüència 3: Flash tots 2 vegades
+        for _ in range(2):
+            hw.all_leds_on()
+            yield 0.1
+            hw.all_leds_off()
+            yield 0.1
+
+        # ====================================================================
+        # ANIMACIÓ ÈPICA D'INICI - 3 SEGONS
+        # ====================================================================
+        # FASE 1: EXPLOSIÓ DE PARTÍCULES (1s)
+        for frame in range(12):
+            display.fill(0)
+            progress = frame / 12.0
+
+            # Partícules que surten del centre
+            for _ in range(int(progress * 40)):
+                angle = random.uniform(0, 6.28)  # 2π
+                distance = progress * 60
+                px = int(64 + distance * math.cos(angle))
+                py = int(32 + distance * math.sin(angle))
+                if 0 <= px < 128 and 0 <= py < 64:
+                    display.pixel(px, py, 1)
+                    # Esteles de moviment
+                    px2 = int(64 + distance * 0.7 * math.cos(angle))
+                    py2 = int(32 + distance * 0.7 * math.sin(angle))
+                    if 0 <= px2 < 128 and 0 <= py2 < 64:
+                        display.pixel(px2, py2, 1)
+
+            # Text "TECLA" apareix gradualment
+            if progress > 0.5:
+                alpha = (progress - 0.5) / 0.5
+                if alpha > 0.2:
+                    display.text("TECLA", 49, 28, 1)
+
+            display.show()
+            yield 0.08  # 12×0.08 = 0.96s
+
+        # FASE 2: RAIG ELÈCTRIC (0.6s)
+        for frame in range(6):
+            display.fill(0)
+
+            # Raigs que creuen tota la pantalla
+            for r in range(3):
+                x, y = 64, random.randint(5, 25)
+                for i in range(8):
+                    dx = random.randint(-8, 8)
+                    dy = random.randint(4, 8)
+                    display.line(x, y, x + dx, y + dy, 1)
+                    x, y = x + dx, y + dy
+                    if y > 60:
+                        break
+
+            # Flash en frames parells
+            if frame % 2 == 0:
+                display.text("TECLA", 49, 28, 1)
+                # Cercle d'impacte
+                display.circle(64, 32, 15 + frame * 3, 1)
+
+            display.show()
+            yield 0.1  # 6×0.1 = 0.6s
+
+        # FASE 3: ONES EXPANSIVES + "CHIPTUNE" (1s)
+        for frame in range(15):
+            display.fill(0)
+            progress = frame / 15.0
+
+            # Ones concèntriques que s'expandeixen
+            for ring in range(5):
+                radius = int((progress + ring * 0.2) * 40)
+                if radius < 50 and radius > 0:
+                    # Cercle amb punts
+                    for angle in range(0, 360, 10):
+                        rad = math.radians(angle)
+                        px = int(64 + radius * math.cos(rad))
+                        py = int(32 + radius * math.sin(rad))
+                        if 0 <= px < 128 and 0 <= py < 64:
+                            display.pixel(px, py, 1)
+
+            # Text "CHIPTUNE" amb efecte d'escaneig
+            if progress > 0.3:
+                display.text("CHIPTUNE", 40, 28, 1)
+                # Línia d'escaneig
+                scan_y = int(20 + progress * 30)
+                display.hline(0, scan_y, 128, 1)
+
+            display.show()
+            yield 0.067  # 15×0.067 = 1.0s
+
+        # FASE 4: FADE OUT AMB ESTRELLES (0.4s)
+        for frame in range(5):
+            display.fill(0)
+
+            # Estrelles aleatòries
+            for _ in range(20):
+                sx = random.randint(0, 127)
+                sy = random.randint(0, 63)
+                display.pixel(sx, sy, 1)
+
+            # Text final
+            if frame < 3:
+                display.text("CHIPTUNE", 40, 28, 1)
+
+            display.show()
+            yield 0.08  # 5×0.08 = 0.4s
+
+        yield 0.04  # Pausa final
@@ -0,0 +1,68 @@
+# =============================================================================
+# RENDER JOB - Dibuix de pantalla per porcions - TECLA
+# =============================================================================
+# Les pantalles grans (imatges dels modes, ull del mode 0) fan centenars de
+# pixel()/line() seguits. Escrites com a generadors, fan una quantitat
+# acotada de primitives i fan `yield`: el bucle principal les reprèn amb
+# step() només quan el planificador (core/scheduler.py) veu marge abans del
+# pròxim tick. Amb càrrega, la pantalla baixa de frames per segon i els
+# ticks musicals no es mouen.
+#
+# Convenció: un treball és un generador que dibuixa al framebuffer i acaba
+# amb display.show() (amb DirtyDisplay.deferred, show() només deixa el frame
+# pendent d'enviar pàgina a pàgina).
+# =============================================================================
+import time
+
+
+def run(job):
+    """Executa un treball de dibuix sencer (ús síncron, fora del bucle)"""
+    for _ in job:
+        pass
+
+
+class RenderJob:
+    """Treball de dibuix en curs, avançat per porcions amb pressupost de temps."""
+
+    __slots__ = ("job", "steps", "frames", "dropped")
+
+    def __init__(self):
+        self.job = None
+        self.steps = 0     # Passos (yields) executats
+        self.frames = 0    # Treballs acabats
+        self.dropped = 0   # Treballs abandonats per un de nou
+
+    @property
+    def active(self):
+        return self.job is not None
+
+    def start(self, job):
+        """Comença un treball nou (abandona l'anterior si n'hi havia)"""
+        if self.job is not None:
+            self.dropped += 1
+        self.job = job
+
+    def step(self, budget_us):
+        """Avança el treball fins a esgotar el pressupost
+
+        Args:
+            budget_us: Microsegons màxims de dibuix (com a mínim un pas)
+
+        Returns:
+            True si el treball encara no ha acabat
+        """
+        job = self.job
+        if job is None:
+            return False
+        start = time.monotonic_ns()
+        limit = budget_us * 1000
+        try:
+            while True:
+                next(job)
+                self.steps += 1
+                if time.monotonic_ns() - start >= limit:
+                    return True
+        except StopIteration:
+            self.job = None
+            self.frames += 1
+            return False
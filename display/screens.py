@@ -3,11 +3,16 @@
 # =============================================================================
 import time
 from music.converters import midi_to_note_name
+from display.frame_cache import FrameCache
+from display.render_job import run
 
 # Constants de timing per display - Adaptades a resposta humana
 IDLE_SUMMARY_START = 6.0  # Iniciar resum complet després de 6s (més relaxat)
 IDLE_SUMMARY_END = 9.0    # Finalitzar resum complet després de 9s
 
+# Imatges grans pre-renderitzades en memòria (1 KB cadascuna)
+IMAGE_CACHE_SIZE = 4
+
 class ScreenManager:
     """Gestió de pantalles amb renderització diferencial"""
     
@@ -50,18 +55,26 @@ class ScreenManager:
     # Noms dels paràmetres de configuració
     CONFIG_NAMES = ["Mode", "Cicle1", "Cicle2", "Cicle3", "H0", "H1", "H2"]
     
+    # Modes amb imatge gran que canvia amb el temps (no es guarden a la cache)
+    DYNAMIC_IMAGE_MODES = (0,)
+    
     def __init__(self, hardware, config):
         self.hw = hardware
         self.cfg = config
+        self.image_cache = FrameCache(IMAGE_CACHE_SIZE)
     
     def mostrar_info_loop_mode(self):
         """Pantalla principal - OPTIMITZAT amb menys informació"""
+        run(self.info_loop_mode_job())
+    
+    def info_loop_mode_job(self):
+        """Pantalla principal com a treball de dibuix per porcions"""
         current_time = time.monotonic()
         inactive_time = current_time - self.cfg.last_interaction_time
         
         # Després de 5s d'inactivitat: mostrar resum complet breument
         if IDLE_SUMMARY_START < inactive_time < IDLE_SUMMARY_END:
-            self._mostrar_resum_complet()
+            yield from self.resum_complet_job()
         # Abans de 5s: mostrar només paràmetre configurat
         elif inactive_time <= IDLE_SUMMARY_START:
             self._mostrar_param_actual()
@@ -110,16 +123,50 @@ class ScreenManager:
     
     def _mostrar_resum_complet(self):
         """Mostra imatge gran dibuixada + nom mode"""
+        run(self.resum_complet_job())
+    
+    def resum_complet_job(self):
+        """Resum complet com a treball de dibuix per porcions"""
         self.hw.display.fill(0)
         
         # Dibuixar imatge gran per al mode
-        self._dibuixar_imatge_gran(self.cfg.loop_mode)
-    
+        yield from self._imatge_gran_job(self.cfg.loop_mode)
         
         self.hw.display.show()
     
     def _dibuixar_imatge_gran(self, mode):
-        """Dibuixa imatge gran procedural per cada mode"""
+        """Dibuixa la imatge gran del mode (síncron)"""
+        run(self._imatge_gran_job(mode))
+    
+    def _imatge_gran_job(self, mode):
+        """Dibuixa la imatge gran del mode
+        
+        Les imatges estàtiques es renderitzen un sol cop i després es copien
+        des de la cache de framebuffers. Cal que el buffer estigui buidat
+        (fill(0)): la còpia substitueix la pantalla sencera.
+        """
+        if mode in self.DYNAMIC_IMAGE_MODES:
+            yield from self._renderitzar_imatge_gran(mode)
+            return
+        
+        display = self.hw.display
+        if not self.image_cache.blit(mode, display):
+            yield from self._renderitzar_imatge_gran(mode)
+            self.image_cache.store(mode, display)
+        
+        if mode == 8:  # Cosmos - Estrelles aleatòries sobre la nebulosa
+            import random
+            for _ in range(30):
+                sx = random.randint(10, 118)
+                sy = random.randint(5, 59)
+                display.pixel(sx, sy, 1)
+    
+    def _renderitzar_imatge_gran(self, mode):
+        """Dibuixa imatge gran procedural per cada mode
+        
+        Generador: fa `yield` després de cada bloc acotat de primitives
+        (una columna, un núvol, un arbre...).
+        """
         
         if mode == 0:  # Pausa - Píxels aleatoris (dau)
             # Cada 0.5s tira una dau per cada LED
@@ -134,6 +181,7 @@ class ScreenManager:
                 for y in range(0, 64, 2):
                     if random.random() < 0.5:  # 50% probabilitat (dau amb 2 cares)
                         self.hw.display.pixel(x, y, 1)
+                yield
         
         elif mode == 1:  # Fractal - Conjunt de Mandelbrot
             # Distribució de píxels del conjunt de Mandelbrot
@@ -162,6 +210,7 @@ class ScreenManager:
                             # Afegir densitat
                             if px + 1 < 128 and iteracio >= max_iter:
                                 self.hw.display.pixel(px + 1, py, 1)
+                yield
         
         elif mode == 2:  # Riu - Ones fluides grans
             # Múltiples ones verticals simulant aigua
@@ -171,6 +220,7 @@ class ScreenManager:
                     offset = int(8 * math.sin((x + y) * 0.15))
                     self.hw.display.pixel(x + offset, y, 1)
                     self.hw.display.pixel(x + offset + 1, y, 1)
+                yield
         
         elif mode == 3:  # Tempesta - Núvols variats i pluja dispersa
             # Núvol 1: Esquerra-dalt (petit i alt)
@@ -181,6 +231,8 @@ class ScreenManager:
                         if 0 <= x < 128 and 0 <= y < 64:
                             self.hw.display.pixel(x, y, 1)
             
+            yield
+            
             # Núvol 2: Centre (gran i irregular)
             for x in range(35, 95, 2):
                 for y in range(8, 22):
@@ -190,6 +242,8 @@ class ScreenManager:
                         if 0 <= x < 128 and 0 <= y < 64:
                             self.hw.display.pixel(x, y, 1)
             
+            yield
+            
             # Núvol 3: Dreta (ample i pla, més amunt)
             for x in range(75, 125, 2):
                 for y in range(8, 19):
@@ -198,6 +252,8 @@ class ScreenManager:
                         if 0 <= x < 128 and 0 <= y < 64:
                             self.hw.display.pixel(x, y, 1)
             
+            yield
+            
             # Núvol 4: Esquerra-mig (petit complement)
             for x in range(8, 28, 2):
                 for y in range(18, 28):
@@ -205,6 +261,8 @@ class ScreenManager:
                         if 0 <= x < 128 and 0 <= y < 64:
                             self.hw.display.pixel(x, y, 1)
             
+            yield
+            
             # Pluja: gotes curtes (1-2 píxels) molt disperses per tota la pantalla
             import random
             random.seed(42)  # Seed fix per consistència
@@ -219,6 +277,8 @@ class ScreenManager:
                     if 0 <= x < 128 and 0 <= y < 64:
                         self.hw.display.pixel(x, y, 1)
             
+            yield
+            
             # Rajos (3 rajos en zigzag amb línies)
             # Raig 1: Del núvol esquerra
             raig1_punts = [(15, 12), (18, 20), (14, 28), (16, 36), (12, 44)]
@@ -253,18 +313,24 @@ class ScreenManager:
                     if x + 1 < 128:
                         self.hw.display.pixel(x + 1, y, 1)
             
+            yield
+            
             # Ona 2: Tercera harmònica
             for x in range(0, 128, 2):
                 y = int(32 + 18 * math.sin(x * 0.3))
                 if 0 <= y < 64:
                     self.hw.display.pixel(x, y, 1)
             
+            yield
+            
             # Ona 3: Quinta harmònica
             for x in range(0, 128, 2):
                 y = int(32 + 12 * math.sin(x * 0.5))
                 if 0 <= y < 64:
                     self.hw.display.pixel(x, y, 1)
             
+            yield
+            
             # Afegir píxels de densitat per omplir més verticalment
             for x in range(0, 128, 3):
                 for offset in [-20, -10, 0, 10, 20]:
@@ -297,6 +363,7 @@ class ScreenManager:
                     for dx in range(-w, w + 1):
                         if 0 <= x + dx < 128 and 0 <= y < 64:
                             self.hw.display.pixel(x + dx, y, 1)
+                yield
             
             # Afegir "fullaraca" - píxels esparsos al terra
             for x in range(0, 128, 3):
@@ -313,6 +380,8 @@ class ScreenManager:
                 self.hw.display.pixel(ox, oy - 1, 1)
                 self.hw.display.pixel(ox + 1, oy, 1)
             
+            yield
+            
             # Lluna menguant (mitja lluna al centre-dalt)
             import math
             lx, ly = 64, 20  # Posició de la lluna
@@ -328,6 +397,8 @@ class ScreenManager:
                         if 0 <= x < 128 and 0 <= y < 64:
                             self.hw.display.pixel(x, y, 1)
             
+            yield
+            
             # 2. Buidar semicercle interior (crear la forma de C)
             for y in range(ly - 6, ly + 7):
                 for x in range(lx + 1, lx + 8):
@@ -365,6 +436,7 @@ class ScreenManager:
                         py = y_start + dy
                         if 0 <= px < 128 and 0 <= py < 64 and dx % 6 < 2:
                             self.hw.display.pixel(px, py, 1)
+                yield
         
         elif mode == 7:  # Euclidia - Drum and Bass visual
             # Patró de píxels inspirat en ritme Drum and Bass
@@ -381,6 +453,8 @@ class ScreenManager:
                             if x_pos + 1 < 128:
                                 self.hw.display.pixel(x_pos + 1, y, 1)
             
+            yield
+            
             # Snare (píxels al mig - mitjos)
             snare_pattern = [0, 0, 1, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 1, 0]
             for i, hit in enumerate(snare_pattern):
@@ -390,6 +464,8 @@ class ScreenManager:
                         if 0 <= x_pos < 128 and (y - 28) % 3 == 0:
                             self.hw.display.pixel(x_pos, y, 1)
             
+            yield
+            
             # Hi-hats densos (píxels a dalt - aguts)
             for x in range(0, 128, 4):
                 if x % 8 < 3:
@@ -397,6 +473,8 @@ class ScreenManager:
                         if (x + y) % 5 < 2:
                             self.hw.display.pixel(x, y, 1)
             
+            yield
+            
             # Afegir "breaks" - píxels de transició
             for x in range(0, 128, 16):
                 for dy in range(0, 55, 8):
@@ -405,8 +483,7 @@ class ScreenManager:
         
         elif mode == 8:  # Cosmos - Nebulosa
             import math
-            import random
-            # Espiral galàctica amb estrelles
+            # Espiral galàctica (les estrelles es dibuixen a sobre cada frame)
             for i in range(0, 360, 8):
                 rad = math.radians(i)
                 r = 3 + i / 20.0
@@ -414,12 +491,6 @@ class ScreenManager:
                 py = int(32 + r * math.sin(rad))
                 self.hw.display.pixel(px, py, 1)
                 self.hw.display.pixel(px + 1, py, 1)
-            
-            # Estrelles aleatòries
-            for _ in range(30):
-                sx = random.randint(10, 118)
-                sy = random.randint(5, 59)
-                self.hw.display.pixel(sx, sy, 1)
         
         elif mode == 9:  # Campanetes - Campana VERTICAL
             cx, cy = 64, 20
@@ -463,6 +534,8 @@ class ScreenManager:
                     if x + 1 < 128:
                         self.hw.display.pixel(x + 1, y1, 1)
             
+            yield
+            
             # Ona inferior (desplaçada - interval de segona)
             for x in range(0, 128, 2):
                 y2 = int(42 + 8 * math.sin(x * 0.12))
@@ -476,6 +549,8 @@ class ScreenManager:
             cx, cy = 64, 32
             # 5 voltes amb més punts per omplir més
             for i in range(0, 1800, 2):  # 5 voltes (1800°) amb pas de 2°
+                if i % 120 == 0:
+                    yield  # Cada 60 punts
                 rad = math.radians(i)
                 r = i / 50.0  # Creixement del radi
                 px = int(cx + r * math.cos(rad))
@@ -493,6 +568,8 @@ class ScreenManager:
             
             # Espiral 1: Sentit horari (densa)
             for i in range(0, 900, 3):  # 2.5 voltes
+                if i % 180 == 0:
+                    yield  # Cada 60 punts
                 rad = math.radians(i)
                 r = i / 30.0
                 px = int(cx + r * math.cos(rad))
@@ -506,6 +583,8 @@ class ScreenManager:
             
             # Espiral 2: Sentit antihorari (contrarotant)
             for i in range(0, 900, 3):
+                if i % 180 == 0:
+                    yield  # Cada 60 punts
                 rad = -math.radians(i)  # Negatiu = antihorari
                 r = i / 30.0
                 px = int(cx + r * math.cos(rad))
@@ -513,6 +592,8 @@ class ScreenManager:
                 if 0 <= px < 128 and 0 <= py < 64:
                     self.hw.display.pixel(px, py, 1)
             
+            yield
+            
             # Afegir punts de focus al centre (hipnòtic)
             for ring in range(1, 4):
                 radius = ring * 3
@@ -556,7 +637,9 @@ class ScreenManager:
                 (36, 60, 5), (68, 60, 5), (100, 58, 5), (18, 48, 4), (54, 44, 4), (88, 42, 4)
             ]
             
-            for bx, by, size in bombolletes:
+            for index, (bx, by, size) in enumerate(bombolletes):
+                if index % 16 == 15:
+                    yield  # Cada 16 bombolletes
                 # Dibuixar bombolleta com a cercle de píxels
                 if size == 2:
                     # Bombolleta petita (4 píxels)
@@ -742,25 +825,3 @@ class ScreenManager:
         
         self.hw.display.text(mode_name, 10, 50, 1)
         self.hw.display.show()
-    
-    def mostrar_calibracion_cv(self):
-        """Pantalla calibració CV"""
-        self.hw.display.fill(0)
-        
-        cv1_actual = self.hw.get_voltage(self.hw.cv1_pote)  # GP26
-        cv2_actual = self.hw.get_voltage(self.hw.cv2_ldr)   # GP27
-        
-        self.hw.display.text("CALIBRACIO CV", 10, 0, 1)
-        self.hw.display.hline(0, 10, 128, 1)
-        self.hw.display.text("CV1 (Pote):", 0, 15, 1)
-        self.hw.display.text(f"{cv1_actual:.2f}V", 80, 15, 1)
-        self.hw.display.text(f"Min:{self.cfg.cv1_min:.2f}", 0, 25, 1)
-        self.hw.display.text(f"Max:{self.cfg.cv1_max:.2f}", 70, 25, 1)
-        
-        self.hw.display.text("CV2 (LDR):", 0, 38, 1)
-        self.hw.display.text(f"{cv2_actual:.2f}V", 80, 38, 1)
-        self.hw.display.text(f"Min:{self.cfg.cv2_min:.2f}", 0, 48, 1)
-        self.hw.display.text(f"Max:{self.cfg.cv2_max:.2f}", 70, 48, 1)
-        
-        self.hw.display.text("BTN: 1/2=CV1 3/4=CV2", 0, 58, 1)
-        self.hw.display.show()
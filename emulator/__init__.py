@@ -0,0 +1,59 @@
+# =============================================================================
+# EMULADOR DE HARDWARE (host) - TECLA
+# =============================================================================
+# Permet executar main.py, ModeLoader i ScreenManager sense canvis a CPython:
+#
+#   - emulator/circuitpython/: mòduls falsos amb els noms de CircuitPython
+#     (board, busio, digitalio, analogio, pwmio, usb_midi, adafruit_ssd1306,
+#     rp2pio, microcontroller)
+#   - VirtualClock: substitueix time.monotonic/sleep per un rellotge virtual
+#   - VirtualHeap (opcional): mòdul gc fals amb heap i pauses de recol·lecció
+#   - Scenario: corbes de CV, botons i MIDI d'entrada en funció del temps
+#   - runtime: registres de PWM, MIDI, GPIO i I2C amb marca de temps
+#
+# Ús típic (des de l'arrel del repositori):
+#   python -m emulator.run --seconds 10 --mode 3 --skip-intro
+#
+# O des d'un benchmark:
+#   from emulator import install
+#   emu = install(Scenario(cv1=sine(1.65, 1.5, 0.2)), limit=5.0)
+# =============================================================================
+import os
+import sys
+
+from emulator import runtime
+from emulator.clock import VirtualClock
+from emulator.scenario import Scenario
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SHIM_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "circuitpython")
+
+
+def install(scenario=None, clock=None, heap=None, **clock_options):
+    """Instal·la l'emulador: rellotge virtual, escenari i mòduls falsos.
+
+    Arguments:
+        scenario: Scenario amb les entrades (per defecte, tot a 0 V)
+        clock: VirtualClock ja creat (si no, se'n crea un amb clock_options)
+        heap: VirtualHeap que substitueix el mòdul gc (per defecte, gc real)
+
+    Retorna el mòdul runtime (amb clock, scenario i els registres).
+    """
+    for path in (os.path.join(ROOT, "lib"), ROOT, SHIM_DIR):
+        if path in sys.path:
+            sys.path.remove(path)
+        sys.path.insert(0, path)
+
+    runtime.reset(scenario or Scenario(), clock or VirtualClock(**clock_options), heap)
+    runtime.clock.install()
+    if heap is not None:
+        heap.install(runtime.clock)
+    return runtime
+
+
+def uninstall():
+    """Restaura els mòduls time i gc originals."""
+    if runtime.clock is not None:
+        runtime.clock.uninstall()
+    if runtime.heap is not None:
+        runtime.heap.uninstall()
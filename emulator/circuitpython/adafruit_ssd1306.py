@@ -0,0 +1,203 @@
+# =============================================================================
+# adafruit_ssd1306 (fals) - Display SSD1306 en memòria per a l'emulador TECLA
+# =============================================================================
+# Framebuffer MVLSB amb la mateixa disposició que el driver real (byte de
+# control 0x40 a buffer[0]) i l'API de dibuix d'adafruit_framebuf que fa
+# servir el firmware. Els bytes enviats per I2C s'apliquen a una GDDRAM
+# simulada (per verificar enviaments parcials) i fan avançar el rellotge
+# virtual el temps que trigarien al bus.
+#
+# El text es dibuixa amb glifs sintètics de 5x8 (deterministes per caràcter):
+# no és la font real, però toca els mateixos rectangles de píxels.
+# =============================================================================
+from emulator import runtime
+
+SET_COL_ADDR = 0x21
+SET_PAGE_ADDR = 0x22
+
+
+class _PanelI2CDevice:
+    """Dispositiu I2C de l'SSD1306: interpreta comandes i dades"""
+
+    def __init__(self, i2c, width, height):
+        self.i2c = i2c
+        self.width = width
+        self.pages = height // 8
+        self.ram = bytearray(width * self.pages)  # GDDRAM del panell
+        self.bytes = 0
+        self.writes = 0
+        self._cmds = []
+        self._col = (0, width - 1)
+        self._page = (0, self.pages - 1)
+
+    def write(self, buf, *, start=0, end=None):
+        data = bytes(buf[start:end])
+        self.bytes += len(data)
+        self.writes += 1
+        runtime.i2c_bytes += len(data)
+        runtime.i2c_writes += 1
+        # Temps al bus: adreça + dades, 9 bits per byte
+        frequency = getattr(self.i2c, "frequency", 100000)
+        if runtime.clock is not None:
+            runtime.clock.advance((len(data) + 1) * 9 / frequency)
+
+        if not data:
+            return
+        if data[0] == 0x80 or data[0] == 0x00:
+            self._command(data[1:])
+            return
+
+        col, page = self._col[0], self._page[0]
+        for value in data[1:]:
+            if page < self.pages:
+                self.ram[page * self.width + col] = value
+            col += 1
+            if col > self._col[1]:
+                col = self._col[0]
+                page += 1
+                if page > self._page[1]:
+                    page = self._page[0]
+
+    def _command(self, data):
+        for byte in data:
+            self._cmds.append(byte)
+            cmd = self._cmds[0]
+            if cmd in (SET_COL_ADDR, SET_PAGE_ADDR):
+                if len(self._cmds) < 3:
+                    continue
+                if cmd == SET_COL_ADDR:
+                    self._col = (self._cmds[1], self._cmds[2])
+                else:
+                    self._page = (self._cmds[1], self._cmds[2])
+            self._cmds = []
+
+
+class SSD1306_I2C:
+    """SSD1306 per I2C amb framebuffer en memòria"""
+
+    def __init__(self, width, height, i2c, *, addr=0x3C, external_vcc=False,
+                 reset=None, page_addressing=False):
+        self.width = width
+        self.height = height
+        self.pages = height // 8
+        self.addr = addr
+        self.page_addressing = page_addressing
+        self.buffer = bytearray(width * self.pages + 1)
+        self.buffer[0] = 0x40  # Co=0, D/C=1
+        self.buf = memoryview(self.buffer)[1:]
+        self.i2c_device = _PanelI2CDevice(i2c, width, height)
+        self.shows = 0
+        self.power = True
+
+    # ----- Control del panell ---------------------------------------------
+    def write_cmd(self, cmd):
+        self.i2c_device.write(bytes((0x80, cmd)))
+
+    def show(self):
+        self.shows += 1
+        for cmd in (SET_COL_ADDR, 0, self.width - 1, SET_PAGE_ADDR, 0, self.pages - 1):
+            self.write_cmd(cmd)
+        self.i2c_device.write(self.buffer)
+
+    def poweron(self):
+        self.power = True
+
+    def poweroff(self):
+        self.power = False
+
+    def contrast(self, contrast):
+        pass
+
+    def invert(self, invert):
+        pass
+
+    def rotate(self, rotate):
+        pass
+
+    # ----- Dibuix (API d'adafruit_framebuf, format MVLSB) -----------------
+    def fill(self, color):
+        value = 0xFF if color else 0
+        buf = self.buffer
+        for i in range(1, len(buf)):
+            buf[i] = value
+
+    def pixel(self, x, y, color=None):
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        idx = 1 + (y >> 3) * self.width + x
+        bit = 1 << (y & 7)
+        if color is None:
+            return 1 if self.buffer[idx] & bit else 0
+        if color:
+            self.buffer[idx] |= bit
+        else:
+            self.buffer[idx] &= ~bit & 0xFF
+        return None
+
+    def hline(self, x, y, width, color):
+        for i in range(width):
+            self.pixel(x + i, y, color)
+
+    def vline(self, x, y, height, color):
+        for i in range(height):
+            self.pixel(x, y + i, color)
+
+    def rect(self, x, y, width, height, color, *, fill=False):
+        if fill:
+            self.fill_rect(x, y, width, height, color)
+            return
+        self.hline(x, y, width, color)
+        self.hline(x, y + height - 1, width, color)
+        self.vline(x, y, height, color)
+        self.vline(x + width - 1, y, height, color)
+
+    def fill_rect(self, x, y, width, height, color):
+        for i in range(height):
+            self.hline(x, y + i, width, color)
+
+    def line(self, x_0, y_0, x_1, y_1, color):
+        dx, dy = abs(x_1 - x_0), -abs(y_1 - y_0)
+        sx = 1 if x_0 < x_1 else -1
+        sy = 1 if y_0 < y_1 else -1
+        err = dx + dy
+        while True:
+            self.pixel(x_0, y_0, color)
+            if x_0 == x_1 and y_0 == y_1:
+                return
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x_0 += sx
+            if e2 <= dx:
+                err += dx
+                y_0 += sy
+
+    def circle(self, center_x, center_y, radius, color):
+        x, y, err = radius, 0, 1 - radius
+        while x >= y:
+            for px, py in ((x, y), (y, x), (-y, x), (-x, y),
+                           (-x, -y), (-y, -x), (y, -x), (x, -y)):
+                self.pixel(center_x + px, center_y + py, color)
+            y += 1
+            if err < 0:
+                err += 2 * y + 1
+            else:
+                x -= 1
+                err += 2 * (y - x) + 1
+
+    def text(self, string, x, y, color, *, font_name="font5x8.bin", size=1):
+        for n, char in enumerate(string):
+            code = ord(char)
+            if char == " ":
+                continue
+            for col in range(5 * size):
+                bits = ((code >> (col // size % 5)) | 0x81) & 0xFF
+                for row in range(8 * size):
+                    if bits & (1 << (row // size)):
+                        self.pixel(x + n * 6 * size + col, y + row, color)
+
+    def scroll(self, delta_x, delta_y):
+        pass
+
+    def blit(self, *args, **kwargs):
+        pass
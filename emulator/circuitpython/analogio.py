@@ -0,0 +1,21 @@
+# =============================================================================
+# analogio (fals) - ADC de 16 bits per a l'emulador TECLA
+# =============================================================================
+from emulator import runtime
+
+
+class AnalogIn:
+    """Llegeix el voltatge de l'escenari actiu (0-3.3 V -> 0-65535)"""
+
+    reference_voltage = 3.3
+
+    def __init__(self, pin):
+        self.pin = pin
+
+    @property
+    def value(self):
+        volts = runtime.scenario.voltage(self.pin.name, runtime.now())
+        return min(65535, int(volts / 3.3 * 65536))
+
+    def deinit(self):
+        pass
@@ -0,0 +1,29 @@
+# =============================================================================
+# board (fals) - Pins de la Raspberry Pi Pico per a l'emulador TECLA
+# =============================================================================
+
+
+class Pin:
+    """Identificador de pin (només el nom)"""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return "board." + self.name
+
+
+for _n in range(30):
+    globals()["GP%d" % _n] = Pin("GP%d" % _n)
+
+LED = Pin("LED")
+A0, A1, A2 = GP26, GP27, GP28  # noqa: F821
+
+
+def __getattr__(name):
+    # Qualsevol altre pin (SCL, SDA, ...) es crea sota demanda
+    pin = Pin(name)
+    globals()[name] = pin
+    return pin
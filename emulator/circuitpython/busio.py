@@ -0,0 +1,24 @@
+# =============================================================================
+# busio (fals) - Bus I2C per a l'emulador TECLA
+# =============================================================================
+
+
+class I2C:
+    """Bus I2C: només guarda la freqüència (els bytes els compta el display)"""
+
+    def __init__(self, scl, sda, *, frequency=100000, timeout=255):
+        self.scl = scl
+        self.sda = sda
+        self.frequency = frequency
+
+    def try_lock(self):
+        return True
+
+    def unlock(self):
+        pass
+
+    def scan(self):
+        return [0x3C]
+
+    def deinit(self):
+        pass
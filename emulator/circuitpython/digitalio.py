@@ -0,0 +1,54 @@
+# =============================================================================
+# digitalio (fals) - Entrades/sortides digitals per a l'emulador TECLA
+# =============================================================================
+# Les entrades (botons) llegeixen l'escenari actiu; els canvis de les
+# sortides (gate, LEDs) queden a runtime.gpio_log amb el temps virtual.
+# =============================================================================
+from emulator import runtime
+
+
+class Direction:
+    INPUT = "INPUT"
+    OUTPUT = "OUTPUT"
+
+
+class Pull:
+    UP = "UP"
+    DOWN = "DOWN"
+
+
+class DriveMode:
+    PUSH_PULL = "PUSH_PULL"
+    OPEN_DRAIN = "OPEN_DRAIN"
+
+
+class DigitalInOut:
+    def __init__(self, pin):
+        self.pin = pin
+        self.direction = Direction.INPUT
+        self.pull = None
+        self._value = False
+
+    def switch_to_output(self, value=False, drive_mode=DriveMode.PUSH_PULL):
+        self.direction = Direction.OUTPUT
+        self.value = value
+
+    def switch_to_input(self, pull=None):
+        self.direction = Direction.INPUT
+        self.pull = pull
+
+    @property
+    def value(self):
+        if self.direction == Direction.INPUT:
+            return runtime.scenario.button(self.pin.name, runtime.now())
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        value = bool(value)
+        if value != self._value:
+            runtime.gpio_log.append((runtime.now(), self.pin.name, value))
+        self._value = value
+
+    def deinit(self):
+        pass
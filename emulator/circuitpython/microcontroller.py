@@ -0,0 +1,35 @@
+# =============================================================================
+# microcontroller (fals) - Memòria no volàtil per a l'emulador TECLA
+# =============================================================================
+# nvm es comporta com el de l'RP2040: 4 KB (0xFF en esborrat) i cada
+# escriptura esborra i reprograma el sector sencer, cosa que fa avançar el
+# rellotge virtual WRITE_TIME segons. Es crea de nou a cada runtime.reset().
+# =============================================================================
+from emulator import runtime
+
+NVM_SIZE = 4096
+WRITE_TIME = 0.050  # Esborrat del sector (~45 ms) + programació
+
+
+class NVM:
+    def __init__(self, size=NVM_SIZE):
+        self.data = bytearray(b"\xff" * size)
+        self.writes = 0
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index):
+        return bytes(self.data[index]) if isinstance(index, slice) else self.data[index]
+
+    def __setitem__(self, index, value):
+        self.data[index] = value
+        self.writes += 1
+        if runtime.clock is not None:
+            runtime.clock.advance(WRITE_TIME)
+
+
+def __getattr__(name):
+    if name == "nvm":
+        return runtime.nvm
+    raise AttributeError(name)
@@ -0,0 +1,48 @@
+# =============================================================================
+# pwmio (fals) - Sortides PWM per a l'emulador TECLA
+# =============================================================================
+# Cada canvi de freqüència o duty cycle es registra a runtime.pwm_log com a
+# (temps, pin, freqüència, duty_cycle).
+# =============================================================================
+from emulator import runtime
+
+
+class PWMOut:
+    def __init__(self, pin, *, duty_cycle=0, frequency=500, variable_frequency=False):
+        self.pin = pin
+        self.variable_frequency = variable_frequency
+        self._frequency = frequency
+        self._duty_cycle = duty_cycle
+        self._log()
+
+    def _log(self):
+        runtime.pwm_log.append((runtime.now(), self.pin.name, self._frequency, self._duty_cycle))
+
+    @property
+    def frequency(self):
+        return self._frequency
+
+    @frequency.setter
+    def frequency(self, value):
+        if not self.variable_frequency:
+            raise ValueError("PWM frequency not writable")
+        value = int(value)
+        if value != self._frequency:
+            self._frequency = value
+            self._log()
+
+    @property
+    def duty_cycle(self):
+        return self._duty_cycle
+
+    @duty_cycle.setter
+    def duty_cycle(self, value):
+        value = int(value)
+        if not 0 <= value <= 65535:
+            raise ValueError("duty_cycle out of range")
+        if value != self._duty_cycle:
+            self._duty_cycle = value
+            self._log()
+
+    def deinit(self):
+        pass
@@ -0,0 +1,201 @@
+# =============================================================================
+# rp2pio (fals) - Màquines d'estat PIO per a l'emulador TECLA
+# =============================================================================
+# Interpreta el programa PIO (codificació real de 16 bits) amb el rellotge
+# virtual: a cada consulta (in_waiting/readinto) executa els cicles que
+# toquen des de l'última vegada a `frequency`. Els pins d'entrada llegeixen
+# els botons de l'escenari. Implementa JMP, IN, PUSH/PULL, MOV i SET (el que
+# fan servir els programes del TECLA) i els retards de cada instrucció.
+# =============================================================================
+from emulator import runtime
+
+RX_FIFO_DEPTH = 4
+_MASK32 = 0xFFFFFFFF
+
+
+def _pin_number(pin):
+    name = getattr(pin, "name", str(pin))
+    return int(name[2:]) if name.startswith("GP") else None
+
+
+class StateMachine:
+    def __init__(self, program, frequency, *, first_in_pin=None, in_pin_count=1,
+                 pull_in_pin_down=0, pull_in_pin_up=0, auto_push=False,
+                 push_threshold=32, in_shift_right=True, wrap_target=0, wrap=-1,
+                 init=None, **_options):
+        self.program = [program[i] | (program[i + 1] << 8) for i in range(0, len(program), 2)]
+        self.frequency = frequency
+        self.in_base = _pin_number(first_in_pin) if first_in_pin is not None else None
+        self.in_count = in_pin_count
+        self.in_shift_right = in_shift_right
+        self.wrap_target = wrap_target
+        self.wrap = wrap if wrap >= 0 else len(self.program) - 1
+
+        self.pc = 0
+        self.x = 0
+        self.y = 0
+        self.isr = 0
+        self.isr_count = 0
+        self.osr = 0
+        self.rx_fifo = []
+        self.cycles = 0
+        self._period = 1.0 / frequency
+        self._next_cycle = runtime.now()
+        self._delay = 0
+        self._running = True
+
+    # ----- Interfície de rp2pio -----
+    @property
+    def in_waiting(self):
+        self._run_until(runtime.now())
+        return len(self.rx_fifo)
+
+    def readinto(self, buffer, *, start=0, end=None):
+        self._run_until(runtime.now())
+        end = len(buffer) if end is None else end
+        for i in range(start, end):
+            while not self.rx_fifo:
+                # Bloqueja com el real: avançar fins que hi hagi dades
+                self._run_cycles(1)
+            buffer[i] = self.rx_fifo.pop(0)
+
+    def clear_rxfifo(self):
+        del self.rx_fifo[:]
+
+    def deinit(self):
+        self._running = False
+
+    # ----- Intèrpret -----
+    def _run_until(self, now):
+        if not self._running:
+            return
+        while self._next_cycle <= now:
+            if not self._step() and len(self.rx_fifo) >= RX_FIFO_DEPTH:
+                # Bloquejat en un push amb el FIFO ple: no canvia res fins
+                # que la CPU llegeixi
+                self._next_cycle = now + self._period
+                break
+            self._next_cycle += self._period
+
+    def _run_cycles(self, count):
+        for _ in range(count):
+            self._step()
+            self._next_cycle += self._period
+
+    def _read_pins(self):
+        value = 0
+        t = runtime.now()
+        for i in range(self.in_count):
+            if runtime.scenario.button("GP%d" % (self.in_base + i), t):
+                value |= 1 << i
+        return value
+
+    def _source(self, source):
+        if source == 0:
+            return self._read_pins()
+        if source == 1:
+            return self.x
+        if source == 2:
+            return self.y
+        if source == 3:
+            return 0
+        if source == 6:
+            return self.isr
+        if source == 7:
+            return self.osr
+        raise NotImplementedError("MOV/IN source %d" % source)
+
+    def _jump_condition(self, condition):
+        if condition == 0:
+            return True
+        if condition == 1:
+            return self.x == 0
+        if condition == 2:
+            taken = self.x != 0
+            self.x = (self.x - 1) & _MASK32
+            return taken
+        if condition == 3:
+            return self.y == 0
+        if condition == 4:
+            taken = self.y != 0
+            self.y = (self.y - 1) & _MASK32
+            return taken
+        if condition == 5:
+            return self.x != self.y
+        raise NotImplementedError("JMP condition %d" % condition)
+
+    def _advance(self):
+        self.pc = self.wrap_target if self.pc == self.wrap else self.pc + 1
+
+    def _step(self):
+        """Executa un cicle. Retorna False si la màquina està bloquejada."""
+        self.cycles += 1
+        if self._delay:
+            self._delay -= 1
+            return True
+        instr = self.program[self.pc]
+        opcode = instr >> 13
+        delay = (instr >> 8) & 0x1F
+
+        if opcode == 0b000:  # JMP
+            if self._jump_condition((instr >> 5) & 0x7):
+                self.pc = instr & 0x1F
+            else:
+                self._advance()
+        elif opcode == 0b010:  # IN
+            count = instr & 0x1F or 32
+            data = self._source((instr >> 5) & 0x7) & ((1 << count) - 1)
+            if self.in_shift_right:
+                self.isr = ((self.isr >> count) | (data << (32 - count))) & _MASK32
+            else:
+                self.isr = ((self.isr << count) | data) & _MASK32
+            self.isr_count = min(32, self.isr_count + count)
+            self._advance()
+        elif opcode == 0b100:  # PUSH / PULL
+            if instr & 0x80:
+                raise NotImplementedError("PULL")
+            if_full = instr & 0x40
+            block = instr & 0x20
+            if not if_full or self.isr_count >= 32:
+                if len(self.rx_fifo) >= RX_FIFO_DEPTH:
+                    if block:
+                        return False  # Stall: tornar a provar el pròxim cicle
+                else:
+                    self.rx_fifo.append(self.isr)
+                self.isr = 0
+                self.isr_count = 0
+            self._advance()
+        elif opcode == 0b101:  # MOV
+            dest = (instr >> 5) & 0x7
+            op = (instr >> 3) & 0x3
+            value = self._source(instr & 0x7)
+            if op == 1:
+                value = ~value & _MASK32
+            elif op == 2:
+                value = int("{:032b}".format(value)[::-1], 2)
+            if dest == 1:
+                self.x = value
+            elif dest == 2:
+                self.y = value
+            elif dest == 6:
+                self.isr = value
+                self.isr_count = 0
+            elif dest == 7:
+                self.osr = value
+            else:
+                raise NotImplementedError("MOV dest %d" % dest)
+            self._advance()
+        elif opcode == 0b111:  # SET
+            dest = (instr >> 5) & 0x7
+            data = instr & 0x1F
+            if dest == 1:
+                self.x = data
+            elif dest == 2:
+                self.y = data
+            else:
+                raise NotImplementedError("SET dest %d" % dest)
+            self._advance()
+        else:
+            raise NotImplementedError("opcode %d" % opcode)
+        self._delay = delay
+        return True
@@ -0,0 +1,31 @@
+# =============================================================================
+# usb_midi (fals) - Ports USB MIDI per a l'emulador TECLA
+# =============================================================================
+# ports[0] = entrada (bytes de l'escenari), ports[1] = sortida (registrada a
+# runtime.midi_out amb el temps virtual).
+# =============================================================================
+from emulator import runtime
+
+
+class PortIn:
+    def read(self, nbytes=1):
+        data = runtime.scenario.read_midi(runtime.now(), nbytes)
+        return data if data else None
+
+    def readinto(self, buf, nbytes=None):
+        data = self.read(len(buf) if nbytes is None else nbytes)
+        if not data:
+            return None
+        buf[:len(data)] = data
+        return len(data)
+
+
+class PortOut:
+    def write(self, buf, nbytes=None):
+        if nbytes is None:
+            nbytes = len(buf)
+        runtime.midi_out.append((runtime.now(), bytes(buf[:nbytes])))
+        return nbytes
+
+
+ports = (PortIn(), PortOut())
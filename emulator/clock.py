@@ -0,0 +1,107 @@
+# =============================================================================
+# RELLOTGE VIRTUAL - TECLA (host)
+# =============================================================================
+# Substitueix time.monotonic, monotonic_ns, sleep i time. El temps només
+# avança amb sleep(), amb advance() (p.ex. transferències I2C) i amb un cost
+# fix per cada lectura del rellotge, de manera que les execucions són
+# reproduïbles. Opcionalment, cpu_scale afegeix el temps real de CPU del host
+# escalat (per aproximar la velocitat de l'RP2040).
+# =============================================================================
+import time
+
+_REAL_MONOTONIC = time.monotonic
+_REAL_MONOTONIC_NS = time.monotonic_ns
+_REAL_SLEEP = time.sleep
+_REAL_TIME = time.time
+_REAL_PERF_COUNTER = time.perf_counter
+
+EPOCH = 1700000000.0  # time.time() virtual = EPOCH + temps virtual
+
+
+class VirtualClock:
+    """Rellotge virtual per executar el firmware al host.
+
+    Arguments:
+        start: Temps virtual inicial (s)
+        call_cost: Segons que avança cada lectura del rellotge
+        cpu_scale: Factor aplicat al temps de CPU real entre lectures (0 = no)
+        limit: Temps virtual màxim; en superar-lo es llança KeyboardInterrupt
+            una sola vegada (main.py surt net del bucle)
+    """
+
+    def __init__(self, start=0.0, call_cost=0.00005, cpu_scale=0.0, limit=None):
+        self.now = start
+        self.call_cost = call_cost
+        self.cpu_scale = cpu_scale
+        self.limit = limit
+        self.reads = 0
+        self.slept = 0.0
+        self._stopped = False
+        self._listeners = []
+        self._read_listeners = []
+        self._last_host = _REAL_PERF_COUNTER()
+        self._installed = False
+
+    def add_listener(self, callback):
+        """callback(temps) es crida cada vegada que el temps avança."""
+        self._listeners.append(callback)
+
+    def add_read_listener(self, callback):
+        """callback() es crida a cada lectura del rellotge (abans d'avançar)."""
+        self._read_listeners.append(callback)
+
+    def advance(self, seconds):
+        """Fa avançar el temps virtual sense llegir-lo."""
+        if seconds > 0:
+            self.now += seconds
+            for callback in self._listeners:
+                callback(self.now)
+
+    def monotonic(self):
+        self.reads += 1
+        for callback in self._read_listeners:
+            callback()
+        step = self.call_cost
+        if self.cpu_scale:
+            host = _REAL_PERF_COUNTER()
+            step += (host - self._last_host) * self.cpu_scale
+            self._last_host = host
+        self.advance(step)
+        if self.limit is not None and self.now >= self.limit and not self._stopped:
+            self._stopped = True
+            raise KeyboardInterrupt("límit de temps virtual")
+        return self.now
+
+    def monotonic_ns(self):
+        return int(self.monotonic() * 1000000000)
+
+    def sleep(self, seconds):
+        if seconds > 0:
+            self.slept += seconds
+            self.advance(seconds)
+        if self.cpu_scale:
+            self._last_host = _REAL_PERF_COUNTER()
+
+    def time(self):
+        return EPOCH + self.now
+
+    @property
+    def stopped(self):
+        return self._stopped
+
+    def install(self):
+        """Substitueix les funcions del mòdul time pel rellotge virtual."""
+        time.monotonic = self.monotonic
+        time.monotonic_ns = self.monotonic_ns
+        time.sleep = self.sleep
+        time.time = self.time
+        self._installed = True
+
+    def uninstall(self):
+        if not self._installed:
+            return
+        time.monotonic = _REAL_MONOTONIC
+        time.monotonic_ns = _REAL_MONOTONIC_NS
+        time.sleep = _REAL_SLEEP
+        time.time = _REAL_TIME
+        self._installed = False
@@ -0,0 +1,113 @@
+# =============================================================================
+# HEAP VIRTUAL - TECLA (host)
+# =============================================================================
+# Mòdul gc fals amb el comportament del GC de CircuitPython: mem_alloc(),
+# mem_free(), collect(), enable()/disable(), isenabled() i threshold(). El
+# heap s'omple amb una quantitat fixa de bytes per lectura del rellotge
+# virtual (aproximació de les assignacions del bucle) i una recol·lecció fa
+# avançar el rellotge la durada de la pausa:
+#
+#   pausa = base_us + mark_us_per_kb * KB vius + sweep_us_per_kb * KB de heap
+#
+# Recol·lecció automàtica com la VM: sempre que una assignació no hi cap
+# (heap ple, encara que el GC estigui desactivat) i, amb el GC actiu, quan
+# les assignacions des de l'última passen del threshold (si n'hi ha).
+#
+# install() el posa a sys.modules["gc"] (els mòduls del firmware importats
+# després el veuen); la resta d'atributs es deleguen al gc real.
+# =============================================================================
+import gc as _real_gc
+import sys
+
+
+class VirtualHeap:
+    """Heap i GC virtuals lligats a un VirtualClock.
+
+    Arguments:
+        size: Bytes de heap
+        live: Bytes vius (no es recuperen mai)
+        bytes_per_read: Bytes assignats per cada lectura del rellotge
+        base_us, mark_us_per_kb, sweep_us_per_kb: Model de durada de la pausa
+    """
+
+    def __init__(self, size=192 * 1024, live=64 * 1024, bytes_per_read=16,
+                 base_us=500, mark_us_per_kb=30, sweep_us_per_kb=6):
+        self.size = size
+        self.live = live
+        self.bytes_per_read = bytes_per_read
+        self.base_us = base_us
+        self.mark_us_per_kb = mark_us_per_kb
+        self.sweep_us_per_kb = sweep_us_per_kb
+        self.used = live
+        self.allocated = 0       # Bytes des de l'última recol·lecció
+        self.enabled = True
+        self.limit = -1          # gc.threshold(): -1 = només amb el heap ple
+        self.collections = []    # (temps, pausa_s, automàtica)
+        self.clock = None
+        self._saved = None
+
+    # -- API del mòdul gc --------------------------------------------------
+    def mem_alloc(self):
+        return self.used
+
+    def mem_free(self):
+        return self.size - self.used
+
+    def collect(self):
+        self._collect(False)
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def isenabled(self):
+        return self.enabled
+
+    def threshold(self, amount=None):
+        if amount is None:
+            return self.limit
+        self.limit = amount
+
+    def __getattr__(self, name):
+        return getattr(_real_gc, name)
+
+    # -- Simulació ---------------------------------------------------------
+    def pause(self):
+        """Durada (s) d'una recol·lecció amb l'ocupació actual"""
+        us = (self.base_us + self.mark_us_per_kb * self.live / 1024
+              + self.sweep_us_per_kb * self.size / 1024)
+        return us / 1000000
+
+    def alloc(self, nbytes):
+        """Assigna `nbytes`; recol·lecta si la VM ho faria"""
+        if self.used + nbytes > self.size:
+            self._collect(True)
+        elif self.enabled and 0 <= self.limit <= self.allocated + nbytes:
+            self._collect(True)
+        self.used += nbytes
+        self.allocated += nbytes
+
+    def _on_read(self):
+        self.alloc(self.bytes_per_read)
+
+    def _collect(self, automatic):
+        pause = self.pause()
+        self.used = self.live
+        self.allocated = 0
+        if self.clock is not None:
+            self.collections.append((self.clock.now, pause, automatic))
+            self.clock.advance(pause)
+
+    def install(self, clock):
+        """Substitueix sys.modules["gc"] i comença a assignar amb `clock`"""
+        self.clock = clock
+        clock.add_read_listener(self._on_read)
+        self._saved = sys.modules.get("gc")
+        sys.modules["gc"] = self
+
+    def uninstall(self):
+        if self._saved is not None:
+            sys.modules["gc"] = self._saved
+            self._saved = None
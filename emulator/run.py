@@ -0,0 +1,113 @@
+# =============================================================================
+# EXECUTAR EL FIRMWARE AL HOST - TECLA
+# =============================================================================
+# Executa main.py sense canvis amb l'emulador de hardware i el rellotge
+# virtual, i mostra un resum del que ha sortit per MIDI, PWM i I2C.
+#
+# Ús (des de l'arrel del repositori):
+#   python -m emulator.run --seconds 10 --mode 3 --skip-intro
+#   python -m emulator.run --seconds 5 --mode 8 --cv1 sine:1.65:1.5:0.2
+# =============================================================================
+import argparse
+import os
+import random
+import runpy
+import sys
+
+from emulator import ROOT, install, runtime, uninstall
+from emulator.scenario import Scenario, constant, sine
+
+
+def parse_curve(spec):
+    """'1.2' -> constant, 'sine:centre:amplitud:hz' -> sinusoide"""
+    if spec is None:
+        return None
+    if spec.startswith("sine:"):
+        center, amplitude, freq = (float(v) for v in spec[5:].split(":"))
+        return sine(center, amplitude, freq)
+    return constant(float(spec))
+
+
+# Paquets del firmware: es tornen a importar a cada execució (com un reset)
+FIRMWARE_PACKAGES = ("core", "modes", "music", "display")
+
+
+def run_firmware(scenario=None, seconds=10.0, mode=None, skip_intro=False,
+                 seed=1234, quiet=True, config=None, heap=None, **clock_options):
+    """Executa main.py fins a `seconds` de temps virtual.
+
+    Cada execució parteix de mòduls nous (l'estat de core.config i dels
+    mòduls amb estat global no passa d'una execució a la següent).
+
+    Arguments:
+        config: Diccionari de valors de core.config a canviar abans d'arrencar
+        heap: VirtualHeap (emulator/heap.py) com a mòdul gc, o None
+
+    Retorna el mòdul runtime amb els registres de l'execució.
+    """
+    for name in list(sys.modules):
+        if name.split(".")[0] in FIRMWARE_PACKAGES:
+            del sys.modules[name]
+
+    emu = install(scenario, heap=heap, limit=seconds, **clock_options)
+    random.seed(seed)
+
+    from core import config as cfg
+    cfg.skip_intro = skip_intro
+    if mode is not None:
+        cfg.loop_mode = mode
+    for key, value in (config or {}).items():
+        setattr(cfg, key, value)
+
+    stdout = sys.stdout
+    if quiet:
+        sys.stdout = open(os.devnull, "w")
+    try:
+        runpy.run_path(os.path.join(ROOT, "main.py"), run_name="__main__")
+    finally:
+        if quiet:
+            sys.stdout.close()
+            sys.stdout = stdout
+        uninstall()
+    return emu
+
+
+def summary(emu):
+    seconds = emu.clock.now
+    notes = emu.note_ons()
+    midi = emu.midi_bytes()
+    print(f"temps virtual:     {seconds:8.2f} s")
+    print(f"lectures rellotge: {emu.clock.reads:8d}")
+    print(f"NoteOn enviats:    {len(notes):8d}  ({len(notes) / seconds:.1f}/s)")
+    print(f"bytes MIDI:        {len(midi):8d}")
+    print(f"canvis PWM:        {len(emu.pwm_log):8d}")
+    print(f"canvis GPIO:       {len(emu.gpio_log):8d}")
+    print(f"bytes I2C:         {emu.i2c_bytes:8d}  ({emu.i2c_writes} transaccions)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Executa main.py amb l'emulador")
+    parser.add_argument("--seconds", type=float, default=10.0, help="temps virtual")
+    parser.add_argument("--mode", type=int, default=None, help="loop_mode inicial (1-14)")
+    parser.add_argument("--skip-intro", action="store_true", help="sense animació d'inici")
+    parser.add_argument("--cv1", default=None, help="volts o sine:c:a:hz")
+    parser.add_argument("--cv2", default=None, help="volts o sine:c:a:hz")
+    parser.add_argument("--slider", default=None, help="volts o sine:c:a:hz (BPM)")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--cpu-scale", type=float, default=0.0,
+                        help="afegir temps de CPU del host x factor")
+    parser.add_argument("--verbose", action="store_true", help="mostrar la sortida de main.py")
+    args = parser.parse_args(argv)
+
+    scenario = Scenario(
+        cv1=parse_curve(args.cv1),
+        cv2=parse_curve(args.cv2),
+        slider=parse_curve(args.slider),
+    )
+    emu = run_firmware(scenario, args.seconds, args.mode, args.skip_intro,
+                       args.seed, quiet=not args.verbose, cpu_scale=args.cpu_scale)
+    summary(emu)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# =============================================================================
+# ESTAT COMPARTIT DE L'EMULADOR - TECLA (host)
+# =============================================================================
+# Els mòduls falsos de emulator/circuitpython consulten aquí el rellotge i
+# l'escenari actius i hi deixen els registres amb marca de temps virtual.
+# =============================================================================
+
+clock = None      # VirtualClock actiu
+scenario = None   # Scenario actiu
+heap = None       # VirtualHeap actiu (mòdul gc fals) o None
+nvm = None        # microcontroller.nvm fals (emulator/circuitpython/microcontroller.py)
+
+pwm_log = []      # (temps, pin, freqüència, duty_cycle) a cada canvi
+gpio_log = []     # (temps, pin, valor) a cada canvi d'una sortida digital
+midi_out = []     # (temps, bytes) per cada write() al port USB MIDI
+i2c_bytes = 0     # Bytes totals enviats pel bus I2C
+i2c_writes = 0    # Transaccions I2C
+
+
+def reset(new_scenario, new_clock, new_heap=None):
+    """Reinicia l'estat per a una execució nova."""
+    global clock, scenario, heap, nvm, i2c_bytes, i2c_writes
+    from microcontroller import NVM
+    clock = new_clock
+    scenario = new_scenario
+    heap = new_heap
+    nvm = NVM()
+    del pwm_log[:]
+    del gpio_log[:]
+    del midi_out[:]
+    i2c_bytes = 0
+    i2c_writes = 0
+    clock.add_listener(scenario.on_time)
+
+
+def now():
+    """Temps virtual actual sense fer avançar el rellotge."""
+    return clock.now if clock is not None else 0.0
+
+
+def midi_bytes():
+    """Tots els bytes MIDI enviats, concatenats."""
+    return b"".join(data for _, data in midi_out)
+
+
+def note_ons():
+    """Llista de (temps, nota, velocitat) dels NoteOn enviats.
+
+    Cada write comença amb byte d'estat; dins d'un write s'accepta running
+    status (bytes de dades sense estat repetit).
+    """
+    notes = []
+    for t, data in midi_out:
+        status = 0
+        i = 0
+        while i < len(data):
+            if data[i] >= 0xF8:
+                i += 1  # Temps real: no canvia el running status
+                continue
+            if data[i] & 0x80:
+                status = data[i]
+                i += 1
+            if status & 0xF0 in (0x80, 0x90, 0xA0, 0xB0, 0xE0):
+                if i + 1 >= len(data):
+                    break
+                if status & 0xF0 == 0x90 and data[i + 1] > 0:
+                    notes.append((t, data[i], data[i + 1]))
+                i += 2
+            elif status & 0xF0 in (0xC0, 0xD0):
+                i += 1
+            elif i < len(data) and not data[i] & 0x80:
+                i += 1  # Dades de sistema: ignorar
+    return notes
+
+
+def realtime(status=0xF8):
+    """Hores d'enviament dels bytes de temps real `status` (0xF8 = TimingClock)."""
+    return [t for t, data in midi_out for byte in data if byte == status]
@@ -0,0 +1,101 @@
+# =============================================================================
+# ESCENARIS D'ENTRADA - TECLA (host)
+# =============================================================================
+# Un escenari descriu les entrades físiques en funció del temps virtual:
+# voltatges dels CV i del slider, botons premuts i MIDI d'entrada.
+# Les corbes són funcions t -> volts; aquí n'hi ha unes quantes d'habituals.
+# =============================================================================
+import math
+
+# Pins de l'entrada analògica (core/hardware.py)
+PIN_SLIDER = "GP28"
+PIN_CV1 = "GP26"
+PIN_CV2 = "GP27"
+
+# Pins dels botons (core/hardware.py)
+BUTTON_PINS = {
+    "crueta_1": "GP13",
+    "crueta_2": "GP14",
+    "crueta_3": "GP15",
+    "crueta_4": "GP3",
+    "extra_1": "GP5",
+    "extra_2": "GP4",
+}
+
+
+def constant(volts):
+    """Voltatge fix"""
+    return lambda t: volts
+
+
+def ramp(v0, v1, duration):
+    """Rampa lineal de v0 a v1 en `duration` segons (després es manté)"""
+    def curve(t):
+        if t >= duration:
+            return v1
+        return v0 + (v1 - v0) * t / duration
+    return curve
+
+
+def sine(center, amplitude, freq_hz):
+    """Sinusoide al voltant de `center`"""
+    return lambda t: center + amplitude * math.sin(2 * math.pi * freq_hz * t)
+
+
+def steps(values, interval):
+    """Seqüència de voltatges fixos, canviant cada `interval` segons"""
+    return lambda t: values[int(t / interval) % len(values)]
+
+
+class Scenario:
+    """Entrades del TECLA en funció del temps virtual.
+
+    Arguments:
+        cv1, cv2, slider: Corbes t -> volts (0-3.3 V)
+        buttons: Llista de (nom o pin, t_premut, t_deixat)
+        midi_in: Llista de (t, bytes) que arriben pel port USB MIDI
+        events: Llista de (t, funció) que s'executen quan el temps hi arriba
+    """
+
+    def __init__(self, cv1=None, cv2=None, slider=None, buttons=(), midi_in=(), events=()):
+        self.curves = {
+            PIN_CV1: cv1 or constant(1.65),
+            PIN_CV2: cv2 or constant(1.65),
+            PIN_SLIDER: slider or constant(1.65),
+        }
+        self.buttons = [(BUTTON_PINS.get(name, name), t0, t1) for name, t0, t1 in buttons]
+        self.midi_in = sorted(midi_in, key=lambda item: item[0])
+        self._midi_pos = 0
+        self.events = sorted(events, key=lambda item: item[0])
+        self._event_pos = 0
+
+    def voltage(self, pin, t):
+        curve = self.curves.get(pin)
+        if curve is None:
+            return 0.0
+        return max(0.0, min(3.3, curve(t)))
+
+    def button(self, pin, t):
+        for button_pin, t0, t1 in self.buttons:
+            if button_pin == pin and t0 <= t < t1:
+                return True
+        return False
+
+    def read_midi(self, t, max_bytes):
+        """Bytes MIDI d'entrada ja arribats (com a molt max_bytes)"""
+        out = bytearray()
+        while self._midi_pos < len(self.midi_in) and len(out) < max_bytes:
+            when, data = self.midi_in[self._midi_pos]
+            if when > t:
+                break
+            out.extend(data)
+            self._midi_pos += 1
+        return bytes(out)
+
+    def on_time(self, t):
+        """Executa els esdeveniments programats fins al temps t"""
+        events = self.events
+        while self._event_pos < len(events) and events[self._event_pos][0] <= t:
+            callback = events[self._event_pos][1]
+            self._event_pos += 1
+            callback()
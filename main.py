@@ -5,23 +5,45 @@
 print("🚀 TECLA Professional - Iniciant...")
 
 import time
+
+boot_time = time.monotonic()  # Per mesurar el temps fins a la primera nota
+
+# Temps i heap de cada import fins al bucle principal ('i' per la consola sèrie)
+from core.import_profiler import ImportProfiler
+imports = ImportProfiler()
+imports.start()
+
 import random
+import microcontroller
 from core.hardware import TeclaHardware
 from core import config as cfg
 from core.rtos import RTOSManager
 from core.midi_handler import MidiHandler
-from core import button_handler, calibration
+from core import button_handler
 from core.clock import MasterClock
+from core.input_sampler import InputSampler
+from core.midi_sync import MidiClockFollower
+from core.midi_clock_out import MidiClockOutput
+from core import profiler as prof
+from core.scheduler import Scheduler, CRITICAL, HIGH, LOW
+from core.gc_manager import GCManager
+from core.settings_store import SettingsStore
 from display.screens import ScreenManager
 from display.animations import Animations
+from display.intro import IntroAnimation
+from display.render_job import RenderJob
 from music.converters import (
     voltage_to_bpm,
     map_value,
     midi_to_note_name,
-    get_voltage_calibrated,
     smooth_value,
 )
 from modes.loader import ModeLoader
+from music import algorithms
+from core.lazy import LazyModule
+
+# Calibració: s'importa en activar-la (core/button_handler.py), no a l'arrencada
+calibration = LazyModule("core.calibration")
 
 print("✅ Mòduls importats")
 
@@ -29,15 +51,35 @@ print("✅ Mòduls importats")
 # INICIALITZACIÓ
 # =============================================================================
 try:
-    hw = TeclaHardware()
+    hw = TeclaHardware(pio_buttons=cfg.pio_buttons)
     print("✅ Hardware inicialitzat")
     
+    # Configuració desada (mode, octava, duty, harmònics, rangs CV)
+    settings = SettingsStore(
+        cfg, microcontroller.nvm if cfg.settings_persist else None,
+        save_delay=cfg.settings_save_delay,
+        max_wait=cfg.settings_max_wait,
+        guard_us=cfg.scheduler_guard_us,
+    )
+    if settings.load():
+        print(f"✅ Configuració restaurada (slot {settings.slot}, {settings.load_us} us)")
+    
     rtos = RTOSManager(hw, cfg)
     midi_handler = MidiHandler(hw, cfg)
     screen = ScreenManager(hw, cfg)
-    anim = Animations(hw, cfg)
+    anim = Animations(hw, cfg)  # Pantalla en pausa i frame de caos: s'importa a l'arrencada
     mode_loader = ModeLoader(hw, cfg, midi_handler)
-    clock = MasterClock(cfg)
+    sampler = InputSampler(hw, cfg)
+    clock_sync = MidiClockFollower(cfg)
+    clock = MasterClock(cfg, sync=clock_sync)
+    profiler = prof.LoopProfiler(cfg.profiler_enabled)
+    hw.midi.running_status = cfg.midi_running_status
+    cfg.profiler = profiler
+    if mode_loader.tracker is not None:
+        profiler.add_command("a", mode_loader.tracker.report, mode_loader.tracker.reset)
+    profiler.add_command("m", mode_loader.report)
+    clock_out = MidiClockOutput(hw, rtos.timers, profiler)
+    rtos.clock_output = clock_out
     print("✅ Gestors creats")
     
     # Temps inicials
@@ -50,122 +92,12 @@ try:
     cfg.next_calibration_frame = cfg.last_note_time
     
     # ========================================================================
-    # PROVA INICIAL DE LEDS - Verificar funcionament
-    # ========================================================================
-    print("🔦 Prova LEDs: Encenent tots els LEDs...")
-    hw.all_leds_on()
-    time.sleep(1.0)  # 1 segon amb tots encesos
-    hw.all_leds_off()
-    time.sleep(0.3)
-    print("✅ Prova LEDs completada")
-    
-    # ========================================================================
-    # ANIMACIÓ ÈPICA D'INICI - 3 SEGONS
+    # ANIMACIÓ D'INICI - Cooperativa (el bucle principal l'avança frame a frame)
     # ========================================================================
-    hw.led_startup_animation()
-    
-    # FASE 1: EXPLOSIÓ DE PARTÍCULES (1s)
-    for frame in range(12):
-        hw.display.fill(0)
-        progress = frame / 12.0
-        
-        # Partícules que surten del centre
-        import random
-        for _ in range(int(progress * 40)):
-            angle = random.uniform(0, 6.28)  # 2π
-            import math
-            distance = progress * 60
-            px = int(64 + distance * math.cos(angle))
-            py = int(32 + distance * math.sin(angle))
-            if 0 <= px < 128 and 0 <= py < 64:
-                hw.display.pixel(px, py, 1)
-                # Esteles de moviment
-                px2 = int(64 + distance * 0.7 * math.cos(angle))
-                py2 = int(32 + distance * 0.7 * math.sin(angle))
-                if 0 <= px2 < 128 and 0 <= py2 < 64:
-                    hw.display.pixel(px2, py2, 1)
-        
-        # Text "TECLA" apareix gradualment
-        if progress > 0.5:
-            alpha = (progress - 0.5) / 0.5
-            if alpha > 0.2:
-                hw.display.text("TECLA", 49, 28, 1)
-        
-        hw.display.show()
-        time.sleep(0.08)  # 12×0.08 = 0.96s
-    
-    # FASE 2: RAIG ELÈCTRIC (0.6s)
-    for frame in range(6):
-        hw.display.fill(0)
-        
-        # Raigs que creuen tota la pantalla
-        import random
-        for r in range(3):
-            x, y = 64, random.randint(5, 25)
-            for i in range(8):
-                dx = random.randint(-8, 8)
-                dy = random.randint(4, 8)
-                hw.display.line(x, y, x + dx, y + dy, 1)
-                x, y = x + dx, y + dy
-                if y > 60:
-                    break
-        
-        # Flash en frames parells
-        if frame % 2 == 0:
-            hw.display.text("TECLA", 49, 28, 1)
-            # Cercle d'impacte
-            hw.display.circle(64, 32, 15 + frame * 3, 1)
-        
-        hw.display.show()
-        time.sleep(0.1)  # 6×0.1 = 0.6s
-    
-    # FASE 3: ONES EXPANSIVES + "CHIPTUNE" (1s)
-    for frame in range(15):
-        hw.display.fill(0)
-        progress = frame / 15.0
-        
-        # Ones concèntriques que s'expandeixen
-        import math
-        for ring in range(5):
-            radius = int((progress + ring * 0.2) * 40)
-            if radius < 50 and radius > 0:
-                # Cercle amb punts
-                for angle in range(0, 360, 10):
-                    rad = math.radians(angle)
-                    px = int(64 + radius * math.cos(rad))
-                    py = int(32 + radius * math.sin(rad))
-                    if 0 <= px < 128 and 0 <= py < 64:
-                        hw.display.pixel(px, py, 1)
-        
-        # Text "CHIPTUNE" amb efecte d'escaneig
-        if progress > 0.3:
-            hw.display.text("CHIPTUNE", 40, 28, 1)
-            # Línia d'escaneig
-            scan_y = int(20 + progress * 30)
-            hw.display.hline(0, scan_y, 128, 1)
-        
-        hw.display.show()
-        time.sleep(0.067)  # 15×0.067 = 1.0s
-    
-    # FASE 4: FADE OUT AMB ESTRELLES (0.4s)
-    for frame in range(5):
-        hw.display.fill(0)
-        
-        # Estrelles aleatòries
-        import random
-        for _ in range(20):
-            sx = random.randint(0, 127)
-            sy = random.randint(0, 63)
-            hw.display.pixel(sx, sy, 1)
-        
-        # Text final
-        if frame < 3:
-            hw.display.text("CHIPTUNE", 40, 28, 1)
-        
-        hw.display.show()
-        time.sleep(0.08)  # 5×0.08 = 0.4s
-    
-    time.sleep(0.04)  # Pausa final
+    intro = IntroAnimation(hw)
+    render = RenderJob()  # Frame de pantalla en curs (generador per porcions)
+    if not cfg.skip_intro:
+        intro.start(time.monotonic())
     
     print("✅ Sistema preparat - Arquitectura Modular Activa")
     print("")
@@ -178,34 +110,51 @@ except Exception as e:
         time.sleep(1)
 
 # =============================================================================
-# BUCLE PRINCIPAL - ARQUITECTURA RTOS AMB PRIORITATS
+# TASQUES DEL BUCLE PRINCIPAL (core/scheduler.py)
 # =============================================================================
-print("🔄 Bucle principal actiu")
-iteration_count = 0
+# Cada tasca fa una porció de feina per iteració. RTOS i modes no s'ajornen
+# mai; entrades i botons són porcions curtes; LEDs i pantalla (LOW) només
+# s'executen si abans del pròxim tick o temporitzador hi cap el seu cost.
+x = y = z = 0.0
+cx = cy = 0.0
+raw_bpm = cfg.bpm
+sleep_time = clock.period
+first_note_pending = True
+bpm_settled = False
 
-while True:
-    try:
-        current_time = time.monotonic()
-        
-        # ===== PRIORITAT MÀXIMA: RTOS (Gate temporal + NoteOff) =====
-        rtos.update(current_time)  # Passar current_time (optimització: evita crida redundant)
-        
-        # ===== PRIORITAT ALTA: Lectura inputs usuari =====
-        # Pins:
-        #   Slider (GP28): z - Velocitat/BPM (NO calibrat, sempre 0-3.3V)
-        #   CV1/Pote (GP26): x - Paràmetre 1 (calibrat amb cv1_min/max)
-        #   CV2/LDR (GP27): y - Paràmetre 2 (calibrat amb cv2_min/max)
-        
-        z_raw = hw.get_voltage(hw.slider)      # Slider (GP28) - BPM
-        x_raw = hw.get_voltage(hw.cv1_pote)    # CV1 (GP26) - Param 1
-        y_raw = hw.get_voltage(hw.cv2_ldr)     # CV2 (GP27) - Param 2
-        
-        # Aplicar calibració NOMÉS als CV1 i CV2
-        x = get_voltage_calibrated(x_raw, cfg.cv1_min, cfg.cv1_max)
-        y = get_voltage_calibrated(y_raw, cfg.cv2_min, cfg.cv2_max)
-        z = z_raw  # Slider NO calibrat
-        
-        # BPM calculations amb z (slider, sempre 0-3.3V)
+
+def task_rtos(current_time):
+    # ===== PRIORITAT MÀXIMA: RTOS (Gate temporal + NoteOff) =====
+    rtos.update(current_time)  # Passar current_time (optimització: evita crida redundant)
+    return False
+
+
+def task_inputs(current_time):
+    global x, y, z, cx, cy, raw_bpm, sleep_time, bpm_settled
+    # ===== PRIORITAT ALTA: Lectura inputs usuari =====
+    # Pins:
+    #   Slider (GP28): z - Velocitat/BPM (NO calibrat, sempre 0-3.3V)
+    #   CV1/Pote (GP26): x - Paràmetre 1 (calibrat amb cv1_min/max)
+    #   CV2/LDR (GP27): y - Paràmetre 2 (calibrat amb cv2_min/max)
+
+    # Mostreig a cfg.input_sample_rate amb oversampling + mediana; x i y
+    # ja surten clampats al rang calibrat, z (slider) sense calibrar
+    if sampler.update(current_time) or sampler.version != cfg.input_version:
+        x, y, z = sampler.get_inputs()
+        cfg.input_version = sampler.version
+        bpm_settled = False
+
+        # Guardar voltatges per als modes
+        cfg.x, cfg.y, cfg.z = x, y, z
+
+        # Coordenades fractals: x i y estan clampats, els modes fan normalize()
+        cx = map_value(x, cfg.cv1_min, cfg.cv1_max, -1.5, 1.5)
+        cy = map_value(y, cfg.cv2_min, cfg.cv2_max, -1.5, 1.5)
+        cfg.cx, cfg.cy = cx, cy
+
+    # BPM calculations amb z (slider, sempre 0-3.3V): només fins que el
+    # filtre s'assenta després d'un canvi
+    if not bpm_settled:
         cfg.bpm_voltage_raw = z
         thr_filter = smooth_value(cfg.bpm_voltage_filtered, z, cfg.bpm_voltage_smoothing)
         cfg.bpm_voltage_filtered = thr_filter
@@ -217,77 +166,220 @@ while True:
             bpm_max=cfg.bpm_max,
             curve=cfg.bpm_curve,
         )
-        sleep_time = clock.update(raw_bpm, current_time)
-        
-        # Guardar voltatges per als modes
-        cfg.x, cfg.y, cfg.z = x, y, z
-        
-        # Coordenades fractals: x i y estan clampats, els modes fan normalize()
-        cx = map_value(x, cfg.cv1_min, cfg.cv1_max, -1.5, 1.5)
-        cy = map_value(y, cfg.cv2_min, cfg.cv2_max, -1.5, 1.5)
-        cfg.cx, cfg.cy = cx, cy
-        
-        # Variables aleatòries per caos
-        cfg.caos_note = random.randint(0, 1)
-        
-        # ===== PRIORITAT ALTA: Detecció botons (cada 5ms) =====
-        if current_time - cfg.last_button_check > 0.005:
-            cfg.last_button_check = current_time
-            button_handler.process_buttons(hw, cfg, rtos, current_time)
-        
-        error_block_active = current_time < cfg.error_pause_until
-
-        # ===== PRIORITAT ALTA: Execució modes musicals =====
-        if cfg.loop_mode == 0 or error_block_active:
-            # Mode parada o pausa per error
-            if cfg.playing_notes:
-                midi_handler.all_notes_off()
-            hw.pwm1.duty_cycle = 0
-            hw.pwm2.duty_cycle = 0
-            hw.pwm3.duty_cycle = 0
-        elif cfg.loop_mode > 0:
-            ticks = clock.consume_ticks(current_time)
-            for tick_time in ticks:
-                cfg.next_note_time = tick_time + sleep_time
-                mode_loader.execute_mode(cfg.loop_mode, x, y, sleep_time, cx, cy)
-                if cfg.loop_mode not in [6, 8]:
-                    cfg.iteration = (cfg.iteration + 1) % 60000
-        
-        # Actualitzar LEDs de configuració (sense animacions dinàmiques)
+        bpm_settled = abs(z - thr_filter) < 0.0005
+    # Rellotge MIDI extern (TimingClock/Start/Stop/Continue) abans del tempo
+    clock_sync.poll(hw.midi, current_time)
+    sleep_time = clock.update(raw_bpm, current_time)
+
+    # Variables aleatòries per caos
+    cfg.caos_note = random.randint(0, 1)
+    return False
+
+
+def task_buttons(current_time):
+    # ===== PRIORITAT ALTA: Detecció botons (esdeveniments) =====
+    # Amb PIO el FIFO només té dades quan un botó canvia: es revisa cada
+    # iteració; amb DigitalInOut es llegeixen els 6 pins cada 5 ms (període
+    # de la tasca)
+    cfg.last_button_check = current_time
+    button_handler.process_buttons(hw, cfg, rtos, current_time)
+    return False
+
+
+def task_modes(current_time):
+    global first_note_pending
+    error_block_active = current_time < cfg.error_pause_until
+
+    # ===== PRIORITAT ALTA: Execució modes musicals =====
+    # Transport MIDI: Start en sortir del mode 0, Stop en tornar-hi
+    if cfg.midi_clock_out and cfg.loop_mode > 0:
+        clock_out.start()
+    else:
+        clock_out.stop()
+
+    if cfg.loop_mode == 0 or error_block_active:
+        # Mode parada o pausa per error
+        scheduler.ticking = False
+        if cfg.playing_notes:
+            midi_handler.all_notes_off()
+        hw.pwm1.duty_cycle = 0
+        hw.pwm2.duty_cycle = 0
+        hw.pwm3.duty_cycle = 0
+    elif cfg.loop_mode > 0:
+        scheduler.ticking = True
+        ticks = clock.consume_ticks(current_time)
+        for tick_time in ticks:
+            profiler.record_tick(tick_time, current_time)
+            clock_out.on_tick(tick_time, sleep_time)
+            cfg.next_note_time = tick_time + sleep_time
+            mode_loader.execute_mode(cfg.loop_mode, x, y, sleep_time, cx, cy)
+            if cfg.loop_mode not in (6, 8):
+                cfg.iteration = (cfg.iteration + 1) % 60000
+            if first_note_pending:
+                first_note_pending = False
+                print(f"🎵 Primera nota: {(time.monotonic() - boot_time) * 1000:.0f} ms des de l'arrencada")
+
+    midi_handler.flush(current_time)
+    return False
+
+
+fractal_cell_us = 1000  # Pitjor cel·la de la graella fractal mesurada (us)
+
+
+def task_fractal(current_time):
+    global fractal_cell_us
+    # Graella del fractal (assignada en carregar el mode 1 o 8): cel·les una
+    # a una mentre abans del pròxim deadline hi càpiga la pitjor cel·la (una
+    # cel·la de l'interior del conjunt són 200 iteracions)
+    for _ in range(cfg.mandelbrot_fill_cells):
+        if scheduler.slack_us() < fractal_cell_us + cfg.scheduler_guard_us:
+            return True
+        start = time.monotonic_ns()
+        done = algorithms.mandelbrot_grid_fill(1)
+        elapsed = (time.monotonic_ns() - start) // 1000
+        if elapsed > fractal_cell_us:
+            fractal_cell_us = elapsed
+        if done:
+            return False
+    return True
+
+
+def task_leds(current_time):
+    # Actualitzar LEDs de configuració (sense animacions dinàmiques)
+    if not intro.active:
         hw.update_config_led_indicators(cfg)
-        
-        # ===== PRIORITAT BAIXA: Actualització display =====
-        if cfg.calibration_mode:
-            calibration.procesar_calibracion(hw, cfg)
-            if current_time >= cfg.next_calibration_frame:
-                cfg.next_calibration_frame = current_time + cfg.calibration_frame_interval
-                screen.mostrar_calibracion_cv()
-            
-        elif current_time - cfg.last_display_update > 0.15:  # Optimitzat: 150ms (abans 100ms)
-            inactive_time = current_time - cfg.last_interaction_time
-            
-            if cfg.show_full_summary:
-                screen._mostrar_resum_complet()
-            elif cfg.caos == 1 and cfg.nota_tocada_ara:
-                screen.mostrar_info_loop_mode()
-                anim.dibujar_rayo_simple()
-                hw.display.show()
-                cfg.nota_tocada_ara = False
-            elif cfg.loop_mode == 0:
-                anim.animacion_ojo()
-            elif cfg.loop_mode > 0 and inactive_time > 999999:  # DESACTIVAT (abans 5.0s)
-                # Animacions idle desactivades per performance
-                screen.mostrar_info_loop_mode()  # Mostrar info normal
-            else:
-                screen.mostrar_info_loop_mode()
-            
-            cfg.last_display_update = current_time
-        
-        # Sleep mínim CPU (0.5ms per màxima responsivitat)
-        clock.idle_sleep(current_time)
-        
+    return False
+
+
+def task_display(current_time):
+    # ===== PRIORITAT BAIXA: Actualització display =====
+    # Porcions: dibuixar el frame (un generador que avança fins a
+    # cfg.display_slice_us per porció; show() només el marca pendent) i
+    # després enviar-lo per trossos de pàgina, un per iteració
+    display = hw.display
+    if display.pending:
+        return display.flush_step()
+
+    display.deferred = True
+    try:
+        if not render.active:
+            _start_display_frame(current_time)
+        render.step(cfg.display_slice_us)
+    finally:
+        display.deferred = False
+    return render.active or display.pending
+
+
+def _start_display_frame(current_time):
+    # Animació d'inici (un pas per iteració): qualsevol botó o l'inici d'un
+    # mode l'aturen i retornen la pantalla
+    if intro.active:
+        if cfg.loop_mode > 0 or cfg.last_interaction_time > intro.start_time:
+            intro.stop()
+        else:
+            intro.update(current_time)
+            return  # La intro és propietària de la pantalla
+
+    if cfg.calibration_mode:
+        calibration.procesar_calibracion(hw, cfg)
+        if current_time >= cfg.next_calibration_frame:
+            cfg.next_calibration_frame = current_time + cfg.calibration_frame_interval
+            calibration.mostrar_calibracion_cv(hw, cfg)
+
+    elif current_time - cfg.last_display_update > 0.15:  # Optimitzat: 150ms (abans 100ms)
+        inactive_time = current_time - cfg.last_interaction_time
+
+        if cfg.show_full_summary:
+            render.start(screen.resum_complet_job())
+        elif cfg.caos == 1 and cfg.nota_tocada_ara:
+            render.start(_caos_frame_job())
+            cfg.nota_tocada_ara = False
+        elif cfg.loop_mode == 0:
+            render.start(anim.ojo_job())
+        elif cfg.loop_mode > 0 and inactive_time > 999999:  # DESACTIVAT (abans 5.0s)
+            # Animacions idle desactivades per performance
+            render.start(screen.info_loop_mode_job())  # Mostrar info normal
+        else:
+            render.start(screen.info_loop_mode_job())
+
+        cfg.last_display_update = current_time
+
+
+def _caos_frame_job():
+    yield from screen.info_loop_mode_job()
+    anim.dibujar_rayo_simple()
+    hw.display.show()
+
+
+scheduler = Scheduler(
+    clock, rtos.timers, profiler,
+    guard_us=cfg.scheduler_guard_us,
+    max_defer=cfg.scheduler_max_defer,
+)
+scheduler.add("rtos", task_rtos, CRITICAL, stage=prof.STAGE_RTOS)
+scheduler.add("inputs", task_inputs, HIGH, stage=prof.STAGE_INPUTS)
+scheduler.add(
+    "buttons", task_buttons, HIGH,
+    period=0.0 if hw.button_pio is not None else 0.005,
+    stage=prof.STAGE_BUTTONS,
+)
+scheduler.add("modes", task_modes, CRITICAL, stage=prof.STAGE_MODES)
+scheduler.add("settings", settings.step, LOW, period=0.5, cost_us=200)
+scheduler.add("fractal", task_fractal, LOW, period=0.25, cost_us=2000)
+settings.scheduler = scheduler  # L'escriptura a nvm espera marge abans del pròxim deadline
+cfg.settings_store = settings
+scheduler.add("leds", task_leds, LOW, cost_us=200, stage=prof.STAGE_LEDS)
+scheduler.add("display", task_display, LOW, cost_us=4000, stage=prof.STAGE_DISPLAY)
+cfg.scheduler = scheduler
+cfg.render_job = render
+
+gc_manager = GCManager(
+    scheduler, profiler,
+    soft_bytes=cfg.gc_soft_bytes,
+    max_heap=cfg.gc_max_heap,
+    guard_us=cfg.scheduler_guard_us,
+    enabled=cfg.gc_managed,
+)
+gc_manager.start()
+profiler.add_command("g", gc_manager.report, gc_manager.reset)
+profiler.add_command("s", settings.report)
+cfg.gc_manager = gc_manager
+
+imports.stop()
+profiler.add_command("i", imports.report)
+print(f"📦 {imports.summary()}")
+
+# =============================================================================
+# BUCLE PRINCIPAL - PLANIFICADOR COOPERATIU AMB DEADLINES
+# =============================================================================
+print(f"🔄 Bucle principal actiu ({(time.monotonic() - boot_time) * 1000:.0f} ms des de l'arrencada)")
+iteration_count = 0
+cfg.input_version = -1  # Força publicar la primera mostra del sampler
+
+while True:
+    try:
+        current_time = time.monotonic()
+        profiler.mark()
+        hw.midi.begin_batch()  # Tots els missatges MIDI de la iteració en un sol write
+
+        scheduler.run(current_time)
+
+        # Segon punt de servei dels deadlines (polsos de rellotge, NoteOff):
+        # una porció de pantalla pot trigar uns quants ms
+        rtos.update(time.monotonic())
+
+        # Recol·lecció del GC al marge abans del pròxim deadline (si cal);
+        # si n'hi ha hagut, el marge ja està gastat i no es dorm
+        if not gc_manager.step():
+            # Sleep mínim CPU (0.5ms per màxima responsivitat)
+            clock.idle_sleep(current_time)
+        profiler.lap(prof.STAGE_IDLE)
+        profiler.end_loop()
+
         # Debug cada 2000 iteracions (~4 segons)
         iteration_count += 1
+        if iteration_count % 64 == 0:
+            profiler.poll_serial()  # 'p' = informe de temps per etapa
         if iteration_count % 2000 == 0:
             try:
                 note_name = midi_to_note_name(cfg.nota_actual)
@@ -295,11 +387,13 @@ while True:
                 note_name = "---"
             print(
                 f"✅ {iteration_count} it | Mode:{cfg.loop_mode} Oct:{cfg.octava} "
-                f"BPM:{cfg.bpm} Gate:{cfg.gate_duration*1000:.1f}ms Nota:{note_name}"
+                f"BPM:{cfg.bpm} Gate:{cfg.gate_duration*1000:.1f}ms Nota:{note_name} "
+                f"MIDI:{hw.midi.bytes_per_second}B/s {hw.midi.writes_per_second}w/s"
             )
         
     except KeyboardInterrupt:
         print("\n⚠️  Interrupció manual - Netejant...")
+        midi_handler.flush()
         rtos.stop_all_notes()
         midi_handler.all_notes_off()
         hw.all_leds_off()
@@ -322,6 +416,7 @@ while True:
         hw.display.show()
         
         # Neteja i espera
+        midi_handler.flush()
         rtos.stop_all_notes()
         midi_handler.all_notes_off()
         cfg.error_pause_until = max(cfg.error_pause_until, time.monotonic() + 5.0)
@@ -0,0 +1,54 @@
+# =============================================================================
+# CLASSE BASE DELS MODES MUSICALS - TECLA
+# =============================================================================
+# Cada mode és una classe amb estat propi (__slots__) en el seu mòdul
+# (modes/fractal.py, modes/riu.py...) i tres ganxos:
+#   enter() - en entrar al mode (abans del primer tick)
+#   exit()  - en sortir del mode (abans d'entrar al següent)
+#   tick()  - un pas musical (cridat per cada tick del MasterClock)
+#
+# self.frame és el ControlFrame compartit (core/control_frame.py): CVs
+# normalitzats un sol cop per tick i paràmetres quantitzats amb qx()/qy().
+# Un tick en estat estacionari no ha d'assignar memòria: taules com a tuples
+# de classe, res de llistes literals, slices ni sum([...]) dins de tick().
+# =============================================================================
+
+
+class Mode:
+    """Classe base d'un mode musical
+
+    Arguments:
+        hardware: Accés als components físics (PWM, display, etc.)
+        config: Configuració actual (octava, modo, etc.)
+        midi_handler: Gestor de notes MIDI
+    """
+
+    __slots__ = ("hw", "cfg", "midi", "frame")
+
+    NUMBER = 0  # Número de mode (índex a la taula de dispatch)
+    NAME = ""
+
+    def __init__(self, hardware, config, midi_handler):
+        self.hw = hardware
+        self.cfg = config
+        self.midi = midi_handler
+        self.frame = config.control_frame  # CVs normalitzats un cop per tick
+
+    def enter(self):
+        """Ganxo d'entrada al mode (per defecte no fa res)"""
+        pass
+
+    def exit(self):
+        """Ganxo de sortida del mode (per defecte no fa res)"""
+        pass
+
+    def tick(self, x, y, sleep_time, cx, cy):
+        """Executa un pas musical
+
+        Arguments:
+            x: CV1 (GP26) calibrat
+            y: CV2 (GP27) calibrat
+            sleep_time: Temps entre notes
+            cx, cy: Coordenades Fractal
+        """
+        raise NotImplementedError
@@ -0,0 +1,65 @@
+# =============================================================================
+# MODE 5: BOSC - TECLA
+# =============================================================================
+# Simula els sons orgànics d'un bosc: notes aleatòries que apareixen
+# a diferents profunditats (octaves). La densitat controla quantes notes
+# "canten els ocells", i la profunditat determina si són greus o aguts.
+#
+# Controls:
+#   CV1 (x): Densitat - Nombre de notes per cicle (1-10)
+#   CV2 (y): Profunditat - Octaves de rang (0-7)
+# =============================================================================
+import random
+from modes.base import Mode
+
+
+class ModeBosc(Mode):
+    """Mode 5: Bosc - Sons orgànics
+
+    Controls:
+        x (CV1/GP26): Densitat (1-10)
+        y (CV2/GP27): Profunditat (0-7)
+    """
+
+    __slots__ = ()
+
+    NUMBER = 5
+    NAME = "Bosc"
+
+    SALTS = (-2, -1, 0, 1, 2, 4, 7)  # Intervals dels "salts" d'ocell
+    GATE = (0, 1, 1)  # 66% probabilitat de sonar
+
+    def tick(self, x, y, sleep_time, cx, cy):
+        frame = self.frame
+        # Distribució uniforme
+        densidad = frame.qx(10) + 1  # 1-10
+        profundidad = frame.qy(8)   # 0-7
+
+        # Distribuir profunditat al voltant de l'octava base (tant avall com es pugui)
+        octaves_down = min(profundidad, self.cfg.octava)
+        octaves_up = min(profundidad, 10 - self.cfg.octava)
+        base_octave = max(self.cfg.octava - octaves_down, 0)
+        top_octave = min(self.cfg.octava + octaves_up, 10)
+
+        nota_min = 12 * base_octave
+        nota_max = 12 * top_octave + 11
+
+        # Cada X iteracions, fer un "salt" (com un ocell que canvia de branca)
+        if self.cfg.iteration % densidad == 0:
+            salto = random.choice(self.SALTS)  # Interval musical
+            nota_bosque = random.randint(nota_min, nota_max) + salto
+        else:
+            # Notes normals: aleatòries dins l'octava
+            nota_bosque = random.randint(nota_min, nota_max)
+
+        nota_bosque = max(0, min(127, nota_bosque))  # Assegurar rang MIDI
+        gate_on = random.choice(self.GATE)  # 66% probabilitat de sonar
+
+        if self.cfg.caos == 1:
+            octava_new = random.randint(0, 8)
+            if self.cfg.caos_note != 0 and gate_on:
+                self.midi.play_note_full(nota_bosque, 1, octava_new, sleep_time * 500,
+                                          0, self.cfg.freqharm1, self.cfg.freqharm2)
+        elif gate_on:
+            self.midi.play_note_full(nota_bosque, 1, self.cfg.octava, sleep_time * 500,
+                                      0, self.cfg.freqharm1, self.cfg.freqharm2)
@@ -0,0 +1,60 @@
+# =============================================================================
+# MODE 9: CAMPANETES - TECLA
+# =============================================================================
+import random
+from modes.base import Mode
+
+
+class ModeCampanetes(Mode):
+    """Mode 9: Campanetes - Campanes musicals amb progressió harmònica
+
+    Controls:
+        x (CV1/GP26): Densitat (% de notes que sonen vs silencis)
+        y (CV2/GP27): Brillantor (durada del gate, més llarg = més brillant)
+    """
+
+    __slots__ = ()
+
+    NUMBER = 9
+    NAME = "Campanetes"
+
+    # Intervals de campana (acord major: Do-Mi-Sol)
+    INTERVALS_CAMPANA = (0, 4, 7)
+
+    def tick(self, x, y, sleep_time, cx, cy):
+        frame = self.frame
+        # CV1: Densitat (probabilitat de tocar)
+        densitat = frame.nx * 100  # 0-100%
+
+        # CV2: Brillantor via durada del gate (10% a 100% del beat)
+        brillantor_pct = frame.ny
+        gate_ms = sleep_time * 1000 * (0.1 + brillantor_pct * 0.9)
+
+        intervals_campana = self.INTERVALS_CAMPANA
+
+        # Progressió harmònica: cada 3 notes, pujar una tercera menor (3 semitons)
+        cicle_complet = self.cfg.iteration // len(intervals_campana)  # Cada 3 notes
+        nota_base_offset = (cicle_complet * 3) % 12  # Pujar per terceres dins l'octava
+
+        # Nota base amb progressió
+        nota_base = 12 * self.cfg.octava + nota_base_offset
+        indice = self.cfg.iteration % len(intervals_campana)
+        nota = max(0, min(127, nota_base + intervals_campana[indice]))
+
+        # Decidir si toca o silenci segons densitat
+        probabilitat = random.randint(0, 100)
+        toca = probabilitat < densitat
+
+        # Silencis reals: quan no toca, apagar tots els PWMs
+        if not toca:
+            nota_pwm1 = nota_pwm2 = nota_pwm3 = 0
+        else:
+            nota_pwm1 = nota_pwm2 = nota_pwm3 = nota
+
+        # Mode CAOS: campanes en octaves aleatòries
+        if self.cfg.caos == 1 and self.cfg.caos_note != 0 and toca:
+            octava_new = random.randint(0, 8)
+            self.midi.play_note_full_multi(nota_pwm1, nota_pwm2, nota_pwm3, 1, octava_new, gate_ms, 0, 0, 0)
+
+        # Campana principal o silenci
+        self.midi.play_note_full_multi(nota_pwm1, nota_pwm2, nota_pwm3, 1, self.cfg.octava, gate_ms, 0, 0, 0)
@@ -0,0 +1,65 @@
+# =============================================================================
+# MODE 14: CICLADOR - TECLA
+# =============================================================================
+import random
+from modes.base import Mode
+
+
+class ModeCiclador(Mode):
+    """Mode 14: Ciclador - Control independent dels duty cycles de cada PWM
+
+    Controls:
+        x (CV1/GP26): Duty cycle PWM1 (0-99%)
+        y (CV2/GP27): Duty cycle PWM2 (0-99%)
+        Slider (GP28): Duty cycle PWM3 (0-99%)
+
+    Notes:
+        - Cada PWM té control independent del duty cycle
+        - Nota fixa a C4 (Do central, MIDI 60)
+        - Octava controlada amb creueta (botons)
+        - Permet exploració tímbrica amb 3 PWMs independents
+        - En sortir del mode es restauren els duty cycles per defecte
+    """
+
+    __slots__ = ()
+
+    NUMBER = 14
+    NAME = "Ciclador"
+
+    def exit(self):
+        # Restaurar duty cycles per defecte en sortir del Mode Ciclador
+        self.cfg.duty1 = 50
+        self.cfg.duty2 = 50
+        self.cfg.duty3 = 50
+
+    def tick(self, x, y, sleep_time, cx, cy):
+        frame = self.frame
+        # x, y estan clampats al rang calibrat
+        # z (slider) no es calibra, sempre 0-3.3V
+
+        # CV1: Duty cycle per PWM1 (0-99%) - normalitzar al rang calibrat
+        duty1_pct = frame.nx * 99
+
+        # CV2: Duty cycle per PWM2 (0-99%) - normalitzar al rang calibrat
+        duty2_pct = frame.ny * 99
+
+        # Slider: Duty cycle per PWM3 (0-99%) - NO calibrat, sempre 0-3.3V
+        slider_voltage = self.cfg.z
+        duty3_pct = (slider_voltage / 3.3) * 99
+
+        # Aplicar els duty cycles independents (clamping a 1-99)
+        self.cfg.duty1 = max(1, min(99, int(duty1_pct)))
+        self.cfg.duty2 = max(1, min(99, int(duty2_pct)))
+        self.cfg.duty3 = max(1, min(99, int(duty3_pct)))
+
+        # Nota fixa C4 (MIDI 60) amb octava controlable per creueta
+        nota_base = 60 + (12 * (self.cfg.octava - 5))  # C4 = octava 5
+        nota_base = max(0, min(127, nota_base))
+
+        # Mode CAOS
+        if self.cfg.caos == 1 and self.cfg.caos_note != 0:
+            octava_caos = random.randint(0, 8)
+            self.midi.play_note_full(nota_base, 1, octava_caos, sleep_time * 500, 0, self.cfg.freqharm1, self.cfg.freqharm2)
+
+        # Tocar nota amb els duty cycles independents
+        self.midi.play_note_full(nota_base, 1, self.cfg.octava, sleep_time * 500, 0, self.cfg.freqharm1, self.cfg.freqharm2)
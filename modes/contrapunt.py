@@ -0,0 +1,70 @@
+# =============================================================================
+# MODE 12: CONTRAPUNT - TECLA
+# =============================================================================
+import random
+from modes.base import Mode
+
+
+class ModeContrapunt(Mode):
+    """Mode 12: Contrapunt - Veu principal + dues veus complementàries independents"""
+
+    __slots__ = ("beat_counter", "degree")
+
+    NUMBER = 12
+    NAME = "Contrapunt"
+
+    ESCALA_MAJOR = (0, 2, 4, 5, 7, 9, 11)
+
+    def __init__(self, hardware, config, midi_handler):
+        super().__init__(hardware, config, midi_handler)
+        self.beat_counter = 0
+        self.degree = 0
+
+    def tick(self, x, y, sleep_time, cx, cy):
+        frame = self.frame
+        escala_major = self.ESCALA_MAJOR
+
+        # CV1: Densitat PWM2 (tercera major - consonant) - INVERTIT
+        # CV1 baix = poc freqüent (cada 8), CV1 alt = molt freqüent (cada 1)
+        densitat_pwm2 = 8 - frame.qx(8)  # 8-1
+
+        # CV2: Densitat PWM3 (trítono - dissonant) - INVERTIT
+        # CV2 baix = poc freqüent (cada 8), CV2 alt = molt freqüent (cada 1)
+        densitat_pwm3 = 8 - frame.qy(8)  # 8-1
+
+        # Veu principal
+        grau_principal = self.degree % len(escala_major)
+        nota_base = 12 * self.cfg.octava
+        nota_principal = nota_base + escala_major[grau_principal]
+        nota_principal = max(0, min(127, nota_principal))
+        self.degree = (grau_principal + 1) % len(escala_major)
+        self.beat_counter += 1
+
+        # Determinar si toquen les veus complementàries
+        toca_pwm2 = (self.beat_counter % densitat_pwm2) == 0
+        toca_pwm3 = (self.beat_counter % densitat_pwm3) == 0
+
+        # PWM1: Sempre toca la veu principal
+        nota_pwm1 = nota_principal
+
+        # PWM2: Tercera major (consonant) o silenci
+        if toca_pwm2:
+            nota_pwm2 = nota_principal + 4  # Tercera major
+            nota_pwm2 = max(0, min(127, nota_pwm2))
+        else:
+            nota_pwm2 = 0  # SILENCI
+
+        # PWM3: Trítono (dissonant) o silenci
+        if toca_pwm3:
+            nota_pwm3 = nota_principal + 6  # Trítono (interval més dissonant)
+            nota_pwm3 = max(0, min(127, nota_pwm3))
+        else:
+            nota_pwm3 = 0  # SILENCI
+
+        # Mode CAOS
+        if self.cfg.caos == 1 and self.cfg.caos_note != 0:
+            octava_new = random.randint(0, 8)
+            self.midi.play_note_full_multi(nota_pwm1, nota_pwm2, nota_pwm3, 1, octava_new, sleep_time * 500, 0, 0, 0)
+
+        # Tocar les 3 veus (amb silencis on correspongui)
+        self.midi.play_note_full_multi(nota_pwm1, nota_pwm2, nota_pwm3, 1, self.cfg.octava, sleep_time * 500, 0, 0, 0)
@@ -0,0 +1,90 @@
+# =============================================================================
+# MODE 8: COSMOS - TECLA
+# =============================================================================
+# El mode més complex: combina TOTS els algorismes anteriors en una
+# síntesi híbrida. Barreja Fractal + Sinusoidal + Harmonia + Euclidia
+# per crear textures musicals úniques i impossibles d'aconseguir d'altra manera.
+#
+# Controls:
+#   CV1 (x): Freqüència/Perfil + Pulsos
+#   CV2 (y): Amplitud/Tensió + Steps
+# =============================================================================
+import random
+from music import algorithms
+from modes.base import Mode
+
+
+class ModeCosmos(Mode):
+    """Mode 8: Cosmos - Síntesi fractal
+
+    Controls:
+        x (CV1/GP26): Freq/Perfil
+        y (CV2/GP27): Amplitude/Tensió
+    """
+
+    __slots__ = ("pulsos", "steps_ritme", "ritmo")
+
+    NUMBER = 8
+    NAME = "Cosmos"
+
+    def __init__(self, hardware, config, midi_handler):
+        super().__init__(hardware, config, midi_handler)
+        self.pulsos = -1
+        self.steps_ritme = -1
+        self.ritmo = None
+        algorithms.mandelbrot_grid_alloc()  # En carregar el mode, no al primer tick
+
+    def tick(self, x, y, sleep_time, cx, cy):
+        frame = self.frame
+        # Component 1: Nota del fractal Mandelbrot
+        fractal_note = algorithms.mandelbrot_grid_note(cx, cy, self.cfg.mandelbrot_bilinear)
+
+        # Component 2: Sinusoidal (distribució uniforme)
+        freq_ona = frame.nx * 127
+        amplitude_ona = frame.ny * 2
+
+        sinusoidal_note = int(algorithms.sinusoidal_value_2(
+            self.cfg.iteration,
+            freq_ona,
+            amplitude_ona / 100
+        ))
+
+        # Component 3: Harmònica (distribució uniforme)
+        perfil = frame.qx(11)
+        tensio = frame.qy(11)
+
+        armonica = algorithms.harmonic_next_note(perfil, tensio, fractal_note)
+
+        # Combinar
+        base_note = (fractal_note + sinusoidal_note + armonica) // 3
+        base_note = max(0, min(127, base_note))
+
+        if self.cfg.caos > 0:
+            caos_offset = random.randint(-self.cfg.caos, self.cfg.caos)
+            base_note = max(0, min(127, base_note + caos_offset))
+            if self.cfg.caos_note == 0:
+                base_note = 0
+
+        # Component 4: Ritme euclidià (distribució uniforme)
+        pulsos = frame.qx(36) + 1
+        steps_ritme = frame.qy(36) + 2
+
+        # El patró només es recalcula quan canvien els paràmetres quantitzats
+        if pulsos != self.pulsos or steps_ritme != self.steps_ritme:
+            self.ritmo = algorithms.euclid_pattern(pulsos, steps_ritme)
+            self.pulsos = pulsos
+            self.steps_ritme = steps_ritme
+        ritmo = self.ritmo
+        pattern_value = ritmo[self.cfg.iteration % len(ritmo)]  # Ritme actual
+
+        # Invertir el gate: per defecte encès, s'apaga quan el patró és 0
+        play = 1
+        if pattern_value == 0:
+            play = 0 if (self.cfg.iteration % 2 == 0) else 1
+
+        # Tocar la nota còsmica!
+        self.midi.play_note_full(base_note, play, self.cfg.octava, sleep_time * 500,
+                                  0, self.cfg.freqharm1, self.cfg.freqharm2)
+
+        # Incrementar iteració (amb reinici a 60000)
+        self.cfg.iteration = (self.cfg.iteration + 1) % 60000
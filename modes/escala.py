@@ -0,0 +1,58 @@
+# =============================================================================
+# MODE 6: ESCALA CV - TECLA
+# =============================================================================
+# Quantitzador d'escales modals. Toca seqüències seguint les 7 escales
+# gregorianes (modes musicals antics). Perfecte per crear melodies que
+# sempre "sonen bé" dins d'una tonalitat específica.
+#
+# Controls:
+#   CV1 (x): Tonalitat - Escala modal (0-6)
+#   CV2 (y): Salt melòdic - Velocitat d'avançament (1-32)
+#
+# Escales:
+#   0=Jònic (Major), 1=Dòric, 2=Frigi, 3=Lidi, 4=Mixolidi, 5=Eòlic (Menor), 6=Locri
+# =============================================================================
+from modes.base import Mode
+
+
+class ModeEscala(Mode):
+    """Mode 6: Escala CV - Quantitzador d'escales
+
+    Controls:
+        x (CV1/GP26): Tonalitat/escala (0-6)
+        y (CV2/GP27): Velocitat (1-32)
+    """
+
+    __slots__ = ()
+
+    NUMBER = 6
+    NAME = "Escala CV"
+
+    ESCALAS = (
+        (0, 2, 4, 5, 7, 9, 11),  # Jònic (Major)
+        (2, 4, 6, 7, 9, 11, 1),  # Dòric
+        (4, 6, 8, 9, 11, 1, 3),  # Frigi
+        (5, 7, 9, 10, 0, 2, 4),  # Lidi
+        (7, 9, 11, 0, 2, 4, 6),  # Mixolidi
+        (9, 11, 1, 2, 4, 6, 8),  # Eòlic (Menor)
+        (11, 1, 3, 4, 6, 8, 10), # Locri
+    )
+
+    def tick(self, x, y, sleep_time, cx, cy):
+        frame = self.frame
+        # Distribució uniforme
+        tonalidad = frame.qx(7)  # 0-6
+        escala = self.ESCALAS[tonalidad]
+        salto = frame.qy(32) + 1  # 1-32
+
+        # Calcular nota base de l'octava
+        nota_base = 12 * self.cfg.octava
+
+        # Calcular què nota de l'escala tocar (avança segons "salto")
+        indice = (self.cfg.iteration * salto) % len(escala)
+        nota = nota_base + escala[indice]  # Nota base + interval de l'escala
+        nota = max(0, min(127, nota))      # Assegurar rang MIDI vàlid
+
+        # Tocar la nota de l'escala
+        self.midi.play_note_full(nota, 1, self.cfg.octava, sleep_time * 500,
+                                  0, self.cfg.freqharm1, self.cfg.freqharm2)
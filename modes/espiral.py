@@ -0,0 +1,43 @@
+# =============================================================================
+# MODE 11: ESPIRAL - TECLA
+# =============================================================================
+import random
+from modes.base import Mode
+
+
+class ModeEspiral(Mode):
+    """Mode 11: Espiral - Recorregut circular amb transposició gradual"""
+
+    __slots__ = ("transposicio", "cicle_counter")
+
+    NUMBER = 11
+    NAME = "Espiral"
+
+    ESCALA_MAJOR = (0, 2, 4, 5, 7, 9, 11, 12)
+
+    def __init__(self, hardware, config, midi_handler):
+        super().__init__(hardware, config, midi_handler)
+        self.transposicio = 0
+        self.cicle_counter = 0
+
+    def tick(self, x, y, sleep_time, cx, cy):
+        frame = self.frame
+        escala_major = self.ESCALA_MAJOR
+        avanç = frame.qx(7) + 1
+        cicle_transposicio = frame.qy(32) + 1
+        grau_index = (self.cfg.iteration * avanç) % len(escala_major)
+        interval_escala = escala_major[grau_index]
+        self.cicle_counter += 1
+        if self.cicle_counter >= cicle_transposicio:
+            self.transposicio += 1
+            self.cicle_counter = 0
+            if self.transposicio >= 12:
+                self.transposicio = 0
+        nota_base = 12 * self.cfg.octava
+        nota = nota_base + interval_escala + self.transposicio
+        nota = max(0, min(127, nota))
+        if self.cfg.caos == 1:
+            octava_new = random.randint(0, 8)
+            if self.cfg.caos_note != 0:
+                self.midi.play_note_full(nota, 1, octava_new, sleep_time * 500, 0, self.cfg.freqharm1, self.cfg.freqharm2)
+        self.midi.play_note_full(nota, 1, self.cfg.octava, sleep_time * 500, 0, self.cfg.freqharm1, self.cfg.freqharm2)
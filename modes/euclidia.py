@@ -0,0 +1,140 @@
+# =============================================================================
+# MODE 7: EUCLIDIA - TECLA
+# =============================================================================
+# Genera ritmes matemàticament perfectes. L'algorisme euclidià distribueix
+# X pulsos en Y steps de la manera més uniforme possible. Es fa servir
+# en música tradicional de tot el món (rumba, bossa nova, etc.).
+#
+# Controls:
+#   CV1 (x): Pulsos - Notes actives (1-32)
+#   CV2 (y): Accents - Pulsos accentuats (1-32)
+#
+# Exemple: 3 pulsos en 8 steps = [X..X..X.] (tresillo afro-cubano)
+# =============================================================================
+import random
+from music import algorithms
+from modes.base import Mode
+
+
+class ModeEuclidia(Mode):
+    """Mode 7: Euclidia - Ritmes euclidians
+
+    Controls:
+        x (CV1/GP26): Pulsos (1-32)
+        y (CV2/GP27): Accents (1-32)
+    """
+
+    __slots__ = (
+        "pattern",
+        "accent_map",
+        "pulses",
+        "accent_level",
+        "position",
+        "degree",
+        "direction",
+        "previous_note",
+    )
+
+    NUMBER = 7
+    NAME = "Euclidia"
+
+    STEPS = 32
+    MAJOR_SCALE = (0, 2, 4, 5, 7, 9, 11)
+
+    def __init__(self, hardware, config, midi_handler):
+        super().__init__(hardware, config, midi_handler)
+        # Estat persistent
+        self.pattern = bytearray(self.STEPS)
+        self.accent_map = [0] * self.STEPS
+        self.pulses = -1
+        self.accent_level = -1
+        self.position = 0
+        self.degree = 0
+        self.direction = 1
+        self.previous_note = None
+
+    def tick(self, x, y, sleep_time, cx, cy):
+        frame = self.frame
+        steps = self.STEPS
+        major_scale = self.MAJOR_SCALE
+
+        # Distribució uniforme
+        pulses = frame.qx(32) + 1  # 1-32
+        accent_level = frame.qy(32) + 1  # 1-32
+
+        base_note = max(0, min(12 * self.cfg.octava, 120))
+
+        if self.previous_note is None:
+            self.previous_note = base_note + major_scale[0]
+
+        # Recalcular patró o accents si ha canviat algun paràmetre
+        if pulses != self.pulses or accent_level != self.accent_level:
+            if pulses > 0:
+                pattern = algorithms.euclid_pattern(pulses, steps)
+            else:
+                pattern = bytearray(steps)
+
+            accent_map = [0] * steps
+            if pulses > 0 and accent_level > 0:
+                ones_idx = [idx for idx, value in enumerate(pattern) if value == 1]
+                accent_count = min(len(ones_idx), accent_level)
+                if accent_count > 0:
+                    spacing = len(ones_idx) / accent_count
+                    for i in range(accent_count):
+                        target = ones_idx[min(len(ones_idx) - 1, int(i * spacing))]
+                        accent_map[target] = 1
+
+            self.pattern = pattern
+            self.accent_map = accent_map
+            self.pulses = pulses
+            self.accent_level = accent_level
+            self.position = 0
+            self.degree = 0
+            self.direction = 1
+            self.previous_note = base_note + major_scale[0]
+
+        step_index = self.position % steps
+        gate = self.pattern[step_index] if self.pattern else 0
+        accent = self.accent_map[step_index] if self.accent_map else 0
+
+        current_note = self.previous_note or (base_note + major_scale[0])
+        play = 0
+
+        if gate == 1:
+            step_size = 2 if accent else 1
+            degree = self.degree
+            direction = self.direction
+            new_degree = degree + (direction * step_size)
+
+            if new_degree >= len(major_scale):
+                new_degree = len(major_scale) - 1
+                direction = -1
+            elif new_degree < 0:
+                new_degree = 0
+                direction = 1
+
+            current_note = base_note + major_scale[new_degree]
+
+            self.degree = new_degree
+            self.direction = direction
+            self.previous_note = current_note
+            play = 1
+
+        current_note = max(0, min(127, current_note))
+
+        # Silencis rítmics: quan play=0, apagar tots els PWMs
+        if play == 0:
+            nota_pwm1 = nota_pwm2 = nota_pwm3 = 0
+        else:
+            nota_pwm1 = nota_pwm2 = nota_pwm3 = current_note
+
+        # Mode CAOS
+        if self.cfg.caos == 1 and play == 1 and self.cfg.caos_note != 0:
+            octava_new = random.randint(0, 8)
+            self.midi.play_note_full_multi(nota_pwm1, nota_pwm2, nota_pwm3, 1, octava_new, sleep_time * 500, 0, 0, 0)
+
+        # Tocar nota o silenci segons patró euclidià
+        self.midi.play_note_full_multi(nota_pwm1, nota_pwm2, nota_pwm3, 1, self.cfg.octava, sleep_time * 500, 0, 0, 0)
+
+        self.position = (step_index + 1) % steps
+        self.cfg.position = self.position
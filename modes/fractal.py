@@ -0,0 +1,48 @@
+# =============================================================================
+# MODE 1: FRACTAL MANDELBROT - TECLA
+# =============================================================================
+# Explora el famós fractal de Mandelbrot, convertint coordenades
+# matemàtiques en notes musicals. És com "navegar" per un paisatge
+# infinit de matemàtiques i escoltar el que "sonen" els diferents punts.
+#
+# Controls:
+#   CV1 (x): BPM - Velocitat de navegació
+#   CV2 (y): Coordenada X del fractal (-1.5 a 1.5)
+#   Slider (z): Coordenada Y del fractal (-1.5 a 1.5)
+# =============================================================================
+import random
+from music import algorithms
+from modes.base import Mode
+
+
+class ModeFractal(Mode):
+    """Mode 1: Fractal - Matemàtica visual convertida a música"""
+
+    __slots__ = ()
+
+    NUMBER = 1
+    NAME = "Fractal"
+
+    def __init__(self, hardware, config, midi_handler):
+        super().__init__(hardware, config, midi_handler)
+        algorithms.mandelbrot_grid_alloc()  # En carregar el mode, no al primer tick
+
+    def tick(self, x, y, sleep_time, cx, cy):
+        # Converteix les coordenades del fractal en una nota MIDI (0-127)
+        # (graella quantitzada: consulta de temps constant)
+        note = algorithms.mandelbrot_grid_note(cx, cy, self.cfg.mandelbrot_bilinear)
+
+        # Si el mode CAOS està activat, afegeix imprevisibilitat
+        if self.cfg.caos == 1:
+            octava_new = random.randint(0, 8)  # Octava aleatòria
+
+            if self.cfg.caos_note == 0:
+                note = 0  # Silenci aleatori
+            else:
+                # Toca una nota extra en una octava aleatòria (eco caòtic)
+                self.midi.play_note_full(note, 1, octava_new, sleep_time * 500,
+                                          0, self.cfg.freqharm1, self.cfg.freqharm2)
+
+        # Toca la nota principal en l'octava configurada
+        self.midi.play_note_full(note, 1, self.cfg.octava, sleep_time * 500,
+                                  0, self.cfg.freqharm1, self.cfg.freqharm2)
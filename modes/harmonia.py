@@ -0,0 +1,88 @@
+# =============================================================================
+# MODE 4: HARMONIA - TECLA
+# =============================================================================
+# Genera progressions harmòniques intel·ligents. La nota següent depèn
+# de la nota anterior, creant seqüències musicals coherents i agradables.
+# Com un pianista que escull la millor nota següent en una improvisació.
+#
+# Controls:
+#   CV1 (x): Arrel - Grau de l'escala major (0-6)
+#   CV2 (y): Tensió - Tipus d'acord (0-3)
+# =============================================================================
+import random
+from modes.base import Mode
+
+
+class ModeHarmonia(Mode):
+    """Mode 4: Harmonia - Progressions d'acords
+
+    Controls:
+        x (CV1/GP26): Arrel (0-6)
+        y (CV2/GP27): Tensió (0-3)
+    """
+
+    __slots__ = ("initialized", "previous_note", "chord_step", "last_root", "last_tension")
+
+    NUMBER = 4
+    NAME = "Harmonia"
+
+    # Escala base (major)
+    MAJOR_SCALE = (0, 2, 4, 5, 7, 9, 11)
+
+    CHORD_SHAPES = (
+        (0, 4, 7),      # Triada major
+        (0, 3, 7),      # Triada menor
+        (0, 4, 7, 11),  # Major 7
+        (0, 3, 7, 10),  # Menor 7
+    )
+
+    def __init__(self, hardware, config, midi_handler):
+        super().__init__(hardware, config, midi_handler)
+        self.initialized = False
+        self.previous_note = 60
+        self.chord_step = 0
+        self.last_root = 0
+        self.last_tension = 0
+
+    def enter(self):
+        # Inicialitzar estat la primera vegada
+        if not self.initialized:
+            self.previous_note = 12 * self.cfg.octava
+            self.chord_step = 0
+            self.initialized = True
+
+    def tick(self, x, y, sleep_time, cx, cy):
+        frame = self.frame
+        # Paràmetres quantitzats del ControlFrame (distribució uniforme)
+        root_index = frame.qx(7)
+        tension_level = frame.qy(4)
+
+        chord = self.CHORD_SHAPES[tension_level]
+        base_note = self.cfg.octava * 12
+        root_interval = self.MAJOR_SCALE[root_index]
+
+        step_index = self.chord_step % len(chord)
+        interval = chord[step_index]
+        new_note = base_note + root_interval + interval
+
+        # Mantenir la nota dins l'octava base
+        while new_note > base_note + 11:
+            new_note -= 12
+        while new_note < base_note:
+            new_note += 12
+
+        # Mode CAOS: afegir notes en octaves aleatòries
+        if self.cfg.caos == 1 and self.cfg.caos_note != 0:
+            octava_new = random.randint(0, 8)
+            self.midi.play_note_full(new_note, 1, octava_new, sleep_time * 500,
+                                      0, self.cfg.freqharm1, self.cfg.freqharm2)
+
+        # Guardar estat per la següent iteració
+        self.previous_note = new_note
+        self.chord_step = (step_index + 1) % len(chord)
+        self.last_root = root_index
+        self.last_tension = tension_level
+
+        # Tocar la nota actual
+        self.midi.play_note_full(new_note, 1, self.cfg.octava, sleep_time * 500,
+                                  0, self.cfg.freqharm1, self.cfg.freqharm2)
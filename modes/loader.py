@@ -1,9 +1,23 @@
 # =============================================================================
 # CARREGADOR DE MODES MUSICALS - TECLA Professional
 # =============================================================================
-# Aquest fitxer conté tots els modes musicals que pot tocar el TECLA.
-# Cada mode és una "personalitat" musical diferent que genera notes
-# de forma automàtica segons els valors dels potenciòmetres (CVs).
+# Cada mode és una "personalitat" musical diferent que genera notes de forma
+# automàtica segons els valors dels potenciòmetres (CVs). Cada un viu en el
+# seu mòdul (modes/fractal.py, modes/riu.py...) com una subclasse de Mode
+# (modes/base.py) amb els ganxos enter(), exit() i tick().
+#
+# MODE_REGISTRY només conté número, nom, mòdul i classe: arrencar no importa
+# cap mode. ModeLoader importa un mode el primer cop que se selecciona i
+# guarda la instància en una taula indexada pel número de mode (cada tick
+# és una sola indexació). Si la memòria lliure baixa de cfg.modes_min_free
+# (o hi ha més de cfg.modes_max_loaded modes carregats), es descarreguen els
+# modes usats fa més temps: la instància i el mòdul surten de sys.modules i
+# el GC en recupera la memòria.
+#
+# Abans de cada tick actualitza el ControlFrame (self.frame a cada mode):
+# CVs normalitzats un sol cop i paràmetres quantitzats amb qx()/qy(). Amb
+# cfg.alloc_audit = True, AllocTracker (core/alloc_tracker.py) mesura els
+# bytes que deixa cada tick al heap, per mode.
 #
 # Modes disponibles:
 #   1. Fractal    - Explora el conjunt de Mandelbrot (matemàtica visual)
@@ -14,31 +28,197 @@
 #   6. Escala CV  - Seqüències d'escales modals
 #   7. Euclidia   - Ritmes matemàtics perfectament distribuïts
 #   8. Cosmos     - Combinació de tots els algorismes (MODE FINAL)
+#   9. Campanetes - Campanes amb progressió per terceres
+#  10. Segones    - Dues veus amb separació harmònica
+#  11. Espiral    - Recorregut circular amb transposició
+#  12. Contrapunt - Veu principal + dues veus complementàries
+#  13. Narval     - Tres narvals que es comuniquen
+#  14. Ciclador   - Control directe dels duty cycles
+# =============================================================================
+import gc
+import sys
+
+from core.control_frame import ControlFrame  # CVs normalitzats un cop per tick
+from core.alloc_tracker import AllocTracker  # Bytes assignats per tick i mode
+
+try:
+    _mem_free = gc.mem_free
+except AttributeError:  # Host / emulador: CPython no té gc.mem_free()
+    _mem_free = None
+
+
+# =============================================================================
+# REGISTRE DE MODES
 # =============================================================================
+# Per afegir un mode nou: crear el mòdul amb la subclasse de Mode (amb NUMBER
+# únic) i afegir-ne aquí una entrada (número, nom, mòdul, classe).
+MODE_REGISTRY = (
+    (1, "Fractal", "modes.fractal", "ModeFractal"),
+    (2, "Riu", "modes.riu", "ModeRiu"),
+    (3, "Tempesta", "modes.tempesta", "ModeTempesta"),
+    (4, "Harmonia", "modes.harmonia", "ModeHarmonia"),
+    (5, "Bosc", "modes.bosc", "ModeBosc"),
+    (6, "Escala CV", "modes.escala", "ModeEscala"),
+    (7, "Euclidia", "modes.euclidia", "ModeEuclidia"),
+    (8, "Cosmos", "modes.cosmos", "ModeCosmos"),
+    (9, "Campanetes", "modes.campanetes", "ModeCampanetes"),
+    (10, "Segones", "modes.segones", "ModeSegones"),
+    (11, "Espiral", "modes.espiral", "ModeEspiral"),
+    (12, "Contrapunt", "modes.contrapunt", "ModeContrapunt"),
+    (13, "Narval", "modes.narval", "ModeNarval"),
+    (14, "Ciclador", "modes.ciclador", "ModeCiclador"),
+)
 
-import random  # Per generar números aleatoris
-import time    # Per mesurar el temps
-import math    # Per funcions matemàtiques (sin, cos)
-from music import algorithms, converters  # Eines musicals personalitzades
 
 class ModeLoader:
     """Carrega i executa modes musicals amb qualitat professional"""
-    
-    def __init__(self, hardware, config, midi_handler):
+
+    def __init__(self, hardware, config, midi_handler, registry=MODE_REGISTRY):
         """Inicialitza el carregador de modes
-        
+
         Arguments:
             hardware: Accés als components físics (PWM, display, etc.)
             config: Configuració actual (octava, modo, etc.)
             midi_handler: Gestor de notes MIDI
+            registry: Entrades (número, nom, mòdul, classe) dels modes
         """
         self.hw = hardware      # Hardware del TECLA
         self.cfg = config       # Configuració actual
         self.midi = midi_handler  # Per tocar notes
-    
+
+        # CVs normalitzats i paràmetres quantitzats compartits per tots els modes
+        self.frame = ControlFrame(config)
+        config.control_frame = self.frame
+
+        # Taules indexades pel número de mode (índex 0 = Pausa)
+        max_mode = max(entry[0] for entry in registry)
+        self.registry = [None] * (max_mode + 1)
+        for entry in registry:
+            self.registry[entry[0]] = entry
+        self.modes = [None] * (max_mode + 1)     # Instàncies carregades
+        self.last_used = [0] * (max_mode + 1)    # Ordre d'ús (LRU)
+        config.mode_count = max_mode
+
+        self.max_loaded = config.modes_max_loaded
+        self.min_free = config.modes_min_free
+        self.loaded = 0
+        self.loads = 0
+        self.unloads = 0
+        self._uses = 0
+
+        self.active_num = 0
+        self.active = None
+
+        # Auditoria d'assignacions per tick (None si està desactivada)
+        self.tracker = None
+        if config.alloc_audit:
+            names = tuple(self.mode_name(num) for num in range(max_mode + 1))
+            tracker = AllocTracker(names)
+            if tracker.enabled:
+                self.tracker = tracker
+
+    def mode_name(self, mode_num):
+        """Nom del mode (sense importar-lo)"""
+        if mode_num == 0:
+            return "Pausa"
+        if 0 < mode_num < len(self.registry) and self.registry[mode_num] is not None:
+            return self.registry[mode_num][1]
+        return ""
+
+    def get_mode(self, mode_num):
+        """Retorna l'objecte del mode indicat, important-lo si cal (o None)"""
+        if 0 <= mode_num < len(self.modes):
+            mode = self.modes[mode_num]
+            if mode is None and self.registry[mode_num] is not None:
+                mode = self._load(mode_num)
+            return mode
+        return None
+
+    def switch_mode(self, mode_num):
+        """Crida exit() del mode actiu i enter() del nou"""
+        if self.active is not None:
+            self.active.exit()
+        self.active_num = mode_num
+        self.active = self.get_mode(mode_num)
+        self.cfg.last_mode = mode_num
+        if self.active is not None:
+            self._uses += 1
+            self.last_used[mode_num] = self._uses
+            self.active.enter()
+
+    # ------------------------------------------------------------------
+    # Càrrega i descàrrega sota demanda
+    # ------------------------------------------------------------------
+    def _load(self, mode_num):
+        self._make_room()
+        try:
+            mode = self._instantiate(self.registry[mode_num])
+        except MemoryError:
+            # Heap ple o fragmentat: descarregar tots els altres i reintentar
+            while self._unload_lru():
+                pass
+            gc.collect()
+            mode = self._instantiate(self.registry[mode_num])
+        self.modes[mode_num] = mode
+        self.loaded += 1
+        self.loads += 1
+        return mode
+
+    def _instantiate(self, entry):
+        _, _, module_name, class_name = entry
+        module = __import__(module_name, None, None, (class_name,))
+        return getattr(module, class_name)(self.hw, self.cfg, self.midi)
+
+    def _make_room(self):
+        """Descarrega modes LRU fins a complir modes_max_loaded i modes_min_free"""
+        while 0 < self.max_loaded <= self.loaded:
+            if not self._unload_lru():
+                break
+        if _mem_free is None or _mem_free() >= self.min_free:
+            return
+        gc.collect()  # Amb el GC gestionat, mem_free() inclou escombraries
+        while _mem_free() < self.min_free and self._unload_lru():
+            gc.collect()
+
+    def _unload_lru(self):
+        """Descarrega el mode carregat usat fa més temps (mai l'actiu)"""
+        oldest = -1
+        for num in range(len(self.modes)):
+            if self.modes[num] is not None and num != self.active_num:
+                if oldest < 0 or self.last_used[num] < self.last_used[oldest]:
+                    oldest = num
+        if oldest < 0:
+            return False
+        self.unload(oldest)
+        return True
+
+    def unload(self, mode_num):
+        """Treu el mode de la taula i el seu mòdul de sys.modules"""
+        if self.modes[mode_num] is None or mode_num == self.active_num:
+            return
+        self.modes[mode_num] = None
+        self.loaded -= 1
+        self.unloads += 1
+        module_name = self.registry[mode_num][2]
+        if module_name in sys.modules:
+            del sys.modules[module_name]
+        package, _, leaf = module_name.rpartition(".")
+        parent = sys.modules.get(package)
+        if parent is not None and hasattr(parent, leaf):
+            delattr(parent, leaf)
+
+    def report(self):
+        """Informe: modes carregats, càrregues i descàrregues"""
+        names = [self.mode_name(num) for num in range(len(self.modes)) if self.modes[num] is not None]
+        return (
+            f"Modes: {self.loaded}/{len(self.registry) - 1} carregats "
+            f"({self.loads} càrregues, {self.unloads} descàrregues) | "
+            + ", ".join(names)
+        )
+
     def execute_mode(self, mode_num, x, y, sleep_time, cx, cy):
         """Executa el mode musical seleccionat
-        
+
         Arguments:
             mode_num: Mode 1-14
             x: CV1 (GP26) calibrat
@@ -46,965 +226,16 @@ class ModeLoader:
             sleep_time: Temps entre notes
             cx, cy: Coordenades Fractal
         """
-        
-        # Detectar si sortim del Mode 14 Ciclador per restaurar duty cycles
-        if not hasattr(self.cfg, 'last_mode'):
-            self.cfg.last_mode = mode_num
-        
-        if self.cfg.last_mode == 14 and mode_num != 14:
-            # Restaurar duty cycles per defecte en sortir del Mode Ciclador
-            self.cfg.duty1 = 50
-            self.cfg.duty2 = 50
-            self.cfg.duty3 = 50
-        
-        self.cfg.last_mode = mode_num
-        
-        if mode_num == 1:
-            self._mode_mandelbrot(cx, cy, sleep_time)
-        elif mode_num == 2:
-            self._mode_rio(x, y, sleep_time)
-        elif mode_num == 3:
-            self._mode_tormenta(x, y, sleep_time)
-        elif mode_num == 4:
-            self._mode_armonia(x, y, sleep_time)
-        elif mode_num == 5:
-            self._mode_bosque(x, y, sleep_time)
-        elif mode_num == 6:
-            self._mode_escala(x, y, sleep_time)
-        elif mode_num == 7:
-            self._mode_euclidiano(x, y, sleep_time)
-        elif mode_num == 8:
-            self._mode_cosmos(x, y, sleep_time, cx, cy)
-        elif mode_num == 9:
-            self._mode_campanetes(x, y, sleep_time)
-        elif mode_num == 10:
-            self._mode_segones(x, y, sleep_time)
-        elif mode_num == 11:
-            self._mode_espiral(x, y, sleep_time)
-        elif mode_num == 12:
-            self._mode_contrapunt(x, y, sleep_time)
-        elif mode_num == 13:
-            self._mode_narval(x, y, sleep_time)
-        elif mode_num == 14:
-            self._mode_ciclador(x, y, sleep_time)
-    
-    # =========================================================================
-    # MODE 1: FRACTAL MANDELBROT
-    # =========================================================================
-    # Explora el famós fractal de Mandelbrot, convertint coordenades
-    # matemàtiques en notes musicals. És com "navegar" per un paisatge
-    # infinit de matemàtiques i escoltar el que "sonen" els diferents punts.
-    # 
-    # Controls:
-    #   CV1 (x): BPM - Velocitat de navegació
-    #   CV2 (y): Coordenada X del fractal (-1.5 a 1.5)
-    #   Slider (z): Coordenada Y del fractal (-1.5 a 1.5)
-    # =========================================================================
-    def _mode_mandelbrot(self, cx, cy, sleep_time):
-        """Mode 1: Fractal - Matemàtica visual convertida a música"""
-        
-        # Converteix les coordenades del fractal en una nota MIDI (0-127)
-        note = algorithms.mandelbrot_to_midi(cx, cy)
-        
-        # Si el mode CAOS està activat, afegeix imprevisibilitat
-        if self.cfg.caos == 1:
-            octava_new = random.randint(0, 8)  # Octava aleatòria
-            
-            if self.cfg.caos_note == 0:
-                note = 0  # Silenci aleatori
-            else:
-                # Toca una nota extra en una octava aleatòria (eco caòtic)
-                self.midi.play_note_full(note, 1, octava_new, sleep_time * 500,
-                                          0, self.cfg.freqharm1, self.cfg.freqharm2)
-        
-        # Toca la nota principal en l'octava configurada
-        self.midi.play_note_full(note, 1, self.cfg.octava, sleep_time * 500,
-                                  0, self.cfg.freqharm1, self.cfg.freqharm2)
-    
-    # =========================================================================
-    # MODE 2: RIU
-    # =========================================================================
-    # Notes fluides com aigua que corre per un riu. L'algorisme simula ones
-    # sinusoïdals que creen melodies orgàniques i fluides.
-    # 
-    # Controls:
-    #   CV1 (GP26): Densitat - Nombre de notes per cicle (1-10)
-    #   CV2 (GP27): Turbulència - Força de les onades (0-127)
-    #   Slider (GP28): BPM - Velocitat del riu (automàtic)
-    # =========================================================================
-    def _mode_rio(self, x, y, sleep_time):
-        """Mode 2: Riu
-        
-        Controls:
-            x (CV1/GP26): Densitat (1-10)
-            y (CV2/GP27): Turbulència (0-127)
-        """
-        
-        # Convertir voltatges (distribució uniforme)
-        densitat = int(converters.normalize(x, self.cfg.cv1_min, self.cfg.cv1_max) * 9.999) + 1
-        turbulencia = converters.normalize(y, self.cfg.cv2_min, self.cfg.cv2_max) * 127
-        rio_time = time.time()                # Temps actual (per les ones)
-        
-        # Calcular el rang de notes segons l'octava actual
-        nota_min = 12 * self.cfg.octava  # Nota més baixa de l'octava
-        nota_max = nota_min + 11          # Nota més alta de l'octava
-        
-        # El riu "avança" sempre endavant (augmenta la nota base)
-        self.cfg.rio_base = (self.cfg.rio_base + densitat) % 12
-        nota_base = nota_min + self.cfg.rio_base
-        
-        # Afegir moviment ondulatori (com ones a l'aigua)
-        wave = math.sin(rio_time * 0.8) * (densitat * 0.5)      # Ona lenta
-        ripple = math.cos(rio_time * 2.2) * (turbulencia * 0.05) # Ona ràpida
-        random_offset = random.uniform(-2, 2)                     # Variació aleatòria
-        
-        # Combinar tots els elements per obtenir la nota final
-        nota_rio = nota_base + wave + ripple + random_offset
-        nota_rio = int(max(0, min(127, nota_rio)))  # Assegurar rang MIDI vàlid
-        
-        # Patró de gate (quan sona / quan no sona)
-        patron_gate = [1, 1, 1, 0, 0, 1, 1, 1, 1, 0]  # 1=toca, 0=silenci
-        gate_on = patron_gate[self.cfg.iteration % len(patron_gate)]
-        
-        # Mode CAOS: afegeix notes aleatòries en octaves diferents
-        if self.cfg.caos == 1:
-            octava_new = random.randint(0, 8)  # Octava aleatòria
-            
-            if self.cfg.caos_note == 0:
-                nota_rio = 0  # Silenci caòtic
-            elif gate_on:
-                # Toca eco caòtic en octava aleatòria
-                self.midi.play_note_full(nota_rio, 1, octava_new, sleep_time * 500,
-                                          0, self.cfg.freqharm1, self.cfg.freqharm2)
-        
-        # Toca la nota principal del riu
-        self.midi.play_note_full(nota_rio, gate_on, self.cfg.octava, sleep_time * 500,
-                                  0, self.cfg.freqharm1, self.cfg.freqharm2)
-    
-    # =========================================================================
-    # MODE 3: TEMPESTA
-    # =========================================================================
-    # Controls:
-    #   CV1 (GP26): Intensitat lluvia (0-127)
-    #   CV2 (GP27): Freqüència llamps (0-127)
-    #   Slider (GP28): BPM
-    # =========================================================================
-    def _mode_tormenta(self, x, y, sleep_time):
-        """Mode 3: Tempesta
-        
-        Controls:
-            x (CV1/GP26): Intensitat pluja
-            y (CV2/GP27): Freqüència llamps
-        """
-        
-        escala_tormenta = [0, 3, 5, 7, 10]
-        
-        # Convertir voltatges (distribució uniforme)
-        intensidad_lluvia = converters.normalize(x, self.cfg.cv1_min, self.cfg.cv1_max) * 127
-        frecuencia_rayos = converters.normalize(y, self.cfg.cv2_min, self.cfg.cv2_max) * 127
-        
-        # Calcular nota base dins de l'octava actual
-        nota_min = 12 * self.cfg.octava
-        nota_max = min(nota_min + 11, 127)
-        nota_base = nota_min + int(intensidad_lluvia * 0.09)
-        nota_base = max(nota_min, min(nota_max, nota_base))
-        
-        # Decidir si toca un llamp (aleatori segons freqüència)
-        if random.randint(0, 1000) < (frecuencia_rayos * 8):  # Probabilitat 0-101.6%
-            # LLAMP! Generar arpegi ascendent o descendent
-            direccion = 1 if random.random() > 0.3 else -1  # 70% amunt, 30% avall
-            
-            # Tocar totes les notes de l'arpegi ràpidament
-            for i, intervalo in enumerate(escala_tormenta[::direccion]):
-                multiplicador = max(1, min(3, (i+1)))  # Intensificar el llamp
-                nota_relampago = nota_base + (intervalo * direccion * multiplicador)
-                nota_relampago = max(nota_min, min(nota_max, nota_relampago))
-                
-                # Mode CAOS: llamps en octaves aleatòries
-                if self.cfg.caos == 1:
-                    octava_new = random.randint(0, 8)
-                    if self.cfg.caos_note != 0:
-                        self.midi.play_note_full(nota_relampago, 1, octava_new, sleep_time * 500,
-                                                  0, self.cfg.freqharm1, self.cfg.freqharm2)
-                else:
-                    # Toca nota del llamp
-                    self.midi.play_note_full(nota_relampago, 1, self.cfg.octava, sleep_time * 500,
-                                              0, self.cfg.freqharm1, self.cfg.freqharm2)
-        else:
-            # PLUJA: Notes constants amb petites variacions
-            variacion_lluvia = random.randint(-3, 3)  # Variació aleatòria ±3 semitons
-            nota_lluvia = max(nota_min, min(nota_max, nota_base + variacion_lluvia))
-            
-            # Mode CAOS: pluja en octaves aleatòries
-            if self.cfg.caos == 1:
-                octava_new = random.randint(0, 8)
-                if self.cfg.caos_note != 0:
-                    self.midi.play_note_full(nota_lluvia, 1, octava_new, sleep_time * 500,
-                                              0, self.cfg.freqharm1, self.cfg.freqharm2)
-            else:
-                # Toca nota de la pluja
-                self.midi.play_note_full(nota_lluvia, 1, self.cfg.octava, sleep_time * 500,
-                                          0, self.cfg.freqharm1, self.cfg.freqharm2)
-    
-    # =========================================================================
-    # MODE 4: HARMONIA
-    # =========================================================================
-    # Genera progressions harmòniques intel·ligents. La nota següent depèn
-    # de la nota anterior, creant seqüències musicals coherents i agradables.
-    # Com un pianista que escull la millor nota següent en una improvisació.
-    # 
-    # Controls:
-    #   CV1 (x): BPM - Velocitat de la progressió
-    #   CV2 (y): Perfil harmònic - Tipus de progressió (0-127)
-    #   Slider (z): Tensió harmònica - Dissonancia/Resolució (0-127)
-    # =========================================================================
-    def _mode_armonia(self, y, z, sleep_time):
-        """Mode 4: Harmonia - Progressions harmòniques intel·ligents"""
-    def _mode_armonia(self, x, y, sleep_time):
-        """Mode 4: Harmonia - Progressions d'acords
-        
-        Controls:
-            x (CV1/GP26): Arrel (0-6)
-            y (CV2/GP27): Tensió (0-3)
-        """
-        
-        # Inicialitzar estat la primera vegada
-        if not self.cfg.state_harmony['initialized']:
-            self.cfg.state_harmony.update({
-                'previous_note': 12 * self.cfg.octava,
-                'chord_step': 0,
-                'initialized': True
-            })
-
-        # Escala base (major) i selecció d'arrel/tensió
-        major_scale = [0, 2, 4, 5, 7, 9, 11]
-        # Utilitzar normalize per distribució uniforme amb qualsevol rang CV
-        root_index = int(converters.normalize(x, self.cfg.cv1_min, self.cfg.cv1_max) * 6.999)
-        tension_level = int(converters.normalize(y, self.cfg.cv2_min, self.cfg.cv2_max) * 3.999)
-
-        chord_shapes = [
-            [0, 4, 7],      # Triada major
-            [0, 3, 7],      # Triada menor
-            [0, 4, 7, 11],  # Major 7
-            [0, 3, 7, 10],  # Menor 7
-        ]
-
-        chord = chord_shapes[tension_level]
-        base_note = self.cfg.octava * 12
-        root_interval = major_scale[root_index]
-
-        step_index = self.cfg.state_harmony.get('chord_step', 0) % len(chord)
-        interval = chord[step_index]
-        new_note = base_note + root_interval + interval
-
-        # Mantenir la nota dins l'octava base
-        while new_note > base_note + 11:
-            new_note -= 12
-        while new_note < base_note:
-            new_note += 12
-
-        # Mode CAOS: afegir notes en octaves aleatòries
-        if self.cfg.caos == 1 and self.cfg.caos_note != 0:
-            octava_new = random.randint(0, 8)
-            self.midi.play_note_full(new_note, 1, octava_new, sleep_time * 500,
-                                      0, self.cfg.freqharm1, self.cfg.freqharm2)
-
-        # Guardar estat per la següent iteració
-        self.cfg.state_harmony.update({
-            'previous_note': new_note,
-            'chord_step': (step_index + 1) % len(chord),
-            'initialized': True,
-            'last_root': root_index,
-            'last_tension': tension_level,
-        })
-
-        # Tocar la nota actual
-        self.midi.play_note_full(new_note, 1, self.cfg.octava, sleep_time * 500,
-                                  0, self.cfg.freqharm1, self.cfg.freqharm2)
-    
-    # =========================================================================
-    # MODE 5: BOSC
-    # =========================================================================
-    # Simula els sons orgànics d'un bosc: notes aleatòries que apareixen
-    # a diferents profunditats (octaves). La densitat controla quantes notes
-    # "canten els ocells", i la profunditat determina si són greus o aguts.
-    # 
-    # Controls:
-    #   CV1 (x): BPM - Velocitat del temps al bosc
-    #   CV2 (y): Densitat - Nombre de notes per cicle (1-10)
-    #   Slider (z): Profunditat - Octaves de rang (0-7)
-    # =========================================================================
-    def _mode_bosque(self, x, y, sleep_time):
-        """Mode 5: Bosc - Sons orgànics
-        
-        Controls:
-            x (CV1/GP26): Densitat (1-10)
-            y (CV2/GP27): Profunditat (0-7)
-        """
-        
-        # Distribució uniforme
-        densidad = int(converters.normalize(x, self.cfg.cv1_min, self.cfg.cv1_max) * 9.999) + 1  # 1-10
-        profundidad = int(converters.normalize(y, self.cfg.cv2_min, self.cfg.cv2_max) * 7.999)   # 0-7
-        
-        # Distribuir profunditat al voltant de l'octava base (tant avall com es pugui)
-        octaves_down = min(profundidad, self.cfg.octava)
-        octaves_up = min(profundidad, 10 - self.cfg.octava)
-        base_octave = max(self.cfg.octava - octaves_down, 0)
-        top_octave = min(self.cfg.octava + octaves_up, 10)
-        
-        nota_min = 12 * base_octave
-        nota_max = 12 * top_octave + 11
-        
-        # Cada X iteracions, fer un "salt" (com un ocell que canvia de branca)
-        if self.cfg.iteration % densidad == 0:
-            salto = random.choice([-2, -1, 0, 1, 2, 4, 7])  # Interval musical
-            nota_bosque = random.randint(nota_min, nota_max) + salto
-        else:
-            # Notes normals: aleatòries dins l'octava
-            nota_bosque = random.randint(nota_min, nota_max)
-        
-        nota_bosque = max(0, min(127, nota_bosque))  # Assegurar rang MIDI
-        gate_on = random.choice([0, 1, 1])  # 66% probabilitat de sonar
-        
-        if self.cfg.caos == 1:
-            octava_new = random.randint(0, 8)
-            if self.cfg.caos_note != 0 and gate_on:
-                self.midi.play_note_full(nota_bosque, 1, octava_new, sleep_time * 500,
-                                          0, self.cfg.freqharm1, self.cfg.freqharm2)
-        elif gate_on:
-            self.midi.play_note_full(nota_bosque, 1, self.cfg.octava, sleep_time * 500,
-                                      0, self.cfg.freqharm1, self.cfg.freqharm2)
-    
-    # =========================================================================
-    # MODE 6: ESCALA CV
-    # =========================================================================
-    # Quantitzador d'escales modals. Toca seqüències seguint les 7 escales
-    # gregorianes (modes musicals antics). Perfecte per crear melodies que
-    # sempre "sonen bé" dins d'una tonalitat específica.
-    # 
-    # Controls:
-    #   CV1 (x): BPM - Velocitat de la seqüència
-    #   CV2 (y): Salt melòdic - Velocitat d'avançament (1-32)
-    #   Slider (z): Tonalitat - Escala modal (0-6)
-    # 
-    # Escales:
-    #   0=Jònic (Major), 1=Dòric, 2=Frigi, 3=Lidi, 4=Mixolidi, 5=Eòlic (Menor), 6=Locri
-    # =========================================================================
-    def _mode_escala(self, x, y, sleep_time):
-        """Mode 6: Escala CV - Quantitzador d'escales
-        
-        Controls:
-            x (CV1/GP26): Tonalitat/escala (0-6)
-            y (CV2/GP27): Velocitat (1-32)
-        """
-        
-        escalas = {
-            0: [0, 2, 4, 5, 7, 9, 11],  # Jònic (Major)
-            1: [2, 4, 6, 7, 9, 11, 1],  # Dòric
-            2: [4, 6, 8, 9, 11, 1, 3],  # Frigi
-            3: [5, 7, 9, 10, 0, 2, 4],  # Lidi
-            4: [7, 9, 11, 0, 2, 4, 6],  # Mixolidi
-            5: [9, 11, 1, 2, 4, 6, 8],  # Eòlic (Menor)
-            6: [11, 1, 3, 4, 6, 8, 10], # Locri
-        }
-        
-        # Distribució uniforme
-        tonalidad = int(converters.normalize(x, self.cfg.cv1_min, self.cfg.cv1_max) * 6.999)  # 0-6
-        escala = escalas[tonalidad]
-        salto = int(converters.normalize(y, self.cfg.cv2_min, self.cfg.cv2_max) * 31.999) + 1  # 1-32
-        
-        # Calcular nota base de l'octava
-        nota_base = 12 * self.cfg.octava
-        
-        # Calcular què nota de l'escala tocar (avança segons "salto")
-        indice = (self.cfg.iteration * salto) % len(escala)
-        nota = nota_base + escala[indice]  # Nota base + interval de l'escala
-        nota = max(0, min(127, nota))      # Assegurar rang MIDI vàlid
-        
-        # Tocar la nota de l'escala
-        self.midi.play_note_full(nota, 1, self.cfg.octava, sleep_time * 500,
-                                  0, self.cfg.freqharm1, self.cfg.freqharm2)
-    
-    # =========================================================================
-    # MODE 7: EUCLIDIA
-    # =========================================================================
-    # Genera ritmes matemàticament perfectes. L'algorisme euclidià distribueix
-    # X pulsos en Y steps de la manera més uniforme possible. Es fa servir
-    # en música tradicional de tot el món (rumba, bossa nova, etc.).
-    # 
-    # Controls:
-    #   CV1 (x): BPM - Velocitat del ritme
-    #   CV2 (y): Pulsos - Notes actives (1-64)
-    #   Slider (z): Steps - Llargada del patró (1-64)
-    # 
-    # Exemple: 3 pulsos en 8 steps = [X..X..X.] (tresillo afro-cubano)
-    # =========================================================================
-    def _mode_euclidiano(self, x, y, sleep_time):
-        """Mode 7: Euclidia - Ritmes euclidians
-        
-        Controls:
-            x (CV1/GP26): Pulsos (1-32)
-            y (CV2/GP27): Accents (1-32)
-        """
-        
-        # Estat persistent
-        state = self.cfg.state_euclid
-        if not state['initialized']:
-            state.update({
-                'initialized': True,
-                'pattern': [0] * 32,
-                'accent_map': [0] * 32,
-                'pulses': -1,
-                'accent_level': -1,
-                'position': 0,
-                'degree': 0,
-                'direction': 1,
-                'previous_note': None,
-            })
-
-        # Distribució uniforme
-        pulses = int(converters.normalize(x, self.cfg.cv1_min, self.cfg.cv1_max) * 31.999) + 1  # 1-32
-        accent_level = int(converters.normalize(y, self.cfg.cv2_min, self.cfg.cv2_max) * 31.999) + 1  # 1-32
-
-        major_scale = [0, 2, 4, 5, 7, 9, 11]
-        base_note = max(0, min(12 * self.cfg.octava, 120))
-
-        if state['previous_note'] is None:
-            state['previous_note'] = base_note + major_scale[0]
-
-        # Recalcular patró o accents si ha canviat algun paràmetre
-        if pulses != state['pulses'] or accent_level != state['accent_level']:
-            if pulses > 0:
-                pattern = algorithms.generar_ritmo_euclideo(pulses, 32)
-            else:
-                pattern = [0] * 32
-
-            accent_map = [0] * 32
-            if pulses > 0 and accent_level > 0:
-                ones_idx = [idx for idx, value in enumerate(pattern) if value == 1]
-                accent_count = min(len(ones_idx), accent_level)
-                if accent_count > 0:
-                    spacing = len(ones_idx) / accent_count
-                    for i in range(accent_count):
-                        target = ones_idx[min(len(ones_idx) - 1, int(i * spacing))]
-                        accent_map[target] = 1
-
-            state.update({
-                'pattern': pattern,
-                'accent_map': accent_map,
-                'pulses': pulses,
-                'accent_level': accent_level,
-                'position': 0,
-                'degree': 0,
-                'direction': 1,
-                'previous_note': base_note + major_scale[0],
-            })
-
-        step_index = state['position'] % 32
-        gate = state['pattern'][step_index] if state['pattern'] else 0
-        accent = state['accent_map'][step_index] if state['accent_map'] else 0
-
-        current_note = state['previous_note'] or (base_note + major_scale[0])
-        play = 0
-
-        if gate == 1:
-            step_size = 2 if accent else 1
-            degree = state['degree']
-            direction = state['direction']
-            new_degree = degree + (direction * step_size)
-
-            if new_degree >= len(major_scale):
-                new_degree = len(major_scale) - 1
-                direction = -1
-            elif new_degree < 0:
-                new_degree = 0
-                direction = 1
-
-            current_note = base_note + major_scale[new_degree]
-
-            # Aplicar una desviació mínima segons el slider (±1 semitò)
-            # slider_offset = int(round(((slider_steps / 127.0) - 0.5) * 2)) # No hi ha slider en aquesta signatura
-            # current_note += slider_offset
-
-            state['degree'] = new_degree
-            state['direction'] = direction
-            state['previous_note'] = current_note
-            play = 1
-
-        current_note = max(0, min(127, current_note))
-
-        # Silencis rítmics: quan play=0, apagar tots els PWMs
-        if play == 0:
-            nota_pwm1 = nota_pwm2 = nota_pwm3 = 0
-        else:
-            nota_pwm1 = nota_pwm2 = nota_pwm3 = current_note
-
-        # Mode CAOS
-        if self.cfg.caos == 1 and play == 1 and self.cfg.caos_note != 0:
-            octava_new = random.randint(0, 8)
-            self.midi.play_note_full_multi(nota_pwm1, nota_pwm2, nota_pwm3, 1, octava_new, sleep_time * 500, 0, 0, 0)
-
-        # Tocar nota o silenci segons patró euclidià
-        self.midi.play_note_full_multi(nota_pwm1, nota_pwm2, nota_pwm3, 1, self.cfg.octava, sleep_time * 500, 0, 0, 0)
-
-        state['position'] = (step_index + 1) % 32
-        self.cfg.position = state['position']
-    
-    # =========================================================================
-    # MODE 8: COSMOS
-    # =========================================================================
-    # El mode més complex: combina TOTS els algorismes anteriors en una
-    # síntesi híbrida. Barreja Fractal + Sinusoidal + Harmonia + Euclidia
-    # per crear textures musicals úniques i impossibles d'aconseguir d'altra manera.
-    # 
-    # Controls:
-    #   CV1 (x): BPM + Coordenada X Fractal
-    #   CV2 (y): Harmonia + Sinusoidal
-    #   Slider (z): Harmonia + Sinusoidal + Ritme
-    # =========================================================================
-    def _mode_cosmos(self, x, y, sleep_time, cx, cy):
-        """Mode 8: Cosmos - Síntesi fractal
-        
-        Controls:
-            x (CV1/GP26): Freq/Perfil
-            y (CV2/GP27): Amplitude/Tensió
-        """
-        # Component 1: Nota del fractal Mandelbrot
-        fractal_note = algorithms.mandelbrot_to_midi(cx, cy)
-        
-        # Component 2: Sinusoidal (distribució uniforme)
-        freq_ona = converters.normalize(x, self.cfg.cv1_min, self.cfg.cv1_max) * 127
-        amplitude_ona = converters.normalize(y, self.cfg.cv2_min, self.cfg.cv2_max) * 2
-        
-        sinusoidal_note = int(algorithms.sinusoidal_value_2(
-            self.cfg.iteration,
-            freq_ona,
-            amplitude_ona / 100
-        ))
-        
-        # Component 3: Harmònica (distribució uniforme)
-        perfil = int(converters.normalize(x, self.cfg.cv1_min, self.cfg.cv1_max) * 10.999)
-        tensio = int(converters.normalize(y, self.cfg.cv2_min, self.cfg.cv2_max) * 10.999)
-        
-        armonica = algorithms.harmonic_next_note(perfil, tensio, fractal_note)
-        
-        # Combinar
-        base_note = (fractal_note + sinusoidal_note + armonica) // 3
-        base_note = max(0, min(127, base_note))
-        
-        if self.cfg.caos > 0:
-            caos_offset = random.randint(-self.cfg.caos, self.cfg.caos)
-            base_note = max(0, min(127, base_note + caos_offset))
-            if self.cfg.caos_note == 0:
-                base_note = 0
-        
-        # Component 4: Ritme euclidià (distribució uniforme)
-        pulsos = int(converters.normalize(x, self.cfg.cv1_min, self.cfg.cv1_max) * 35.999) + 1
-        steps_ritme = int(converters.normalize(y, self.cfg.cv2_min, self.cfg.cv2_max) * 35.999) + 2
-        
-        ritmo = algorithms.generar_ritmo_euclideo(pulsos, steps_ritme)
-        pattern_value = ritmo[self.cfg.iteration % len(ritmo)]  # Ritme actual
-
-        # Invertir el gate: per defecte encès, s'apaga quan el patró és 0
-        play = 1
-        if pattern_value == 0:
-            play = 0 if (self.cfg.iteration % 2 == 0) else 1
-
-        # Tocar la nota còsmica!
-        self.midi.play_note_full(base_note, play, self.cfg.octava, sleep_time * 500,
-                                  0, self.cfg.freqharm1, self.cfg.freqharm2)
-        
-        # Incrementar iteració (amb reinici a 60000)
-        self.cfg.iteration = (self.cfg.iteration + 1) % 60000
-    
-    # =========================================================================
-    # MODE 9: CAMPANETES
-    # =========================================================================
-    def _mode_campanetes(self, x, y, sleep_time):
-        """Mode 9: Campanetes - Campanes musicals amb progressió harmònica
-        
-        Controls:
-            x (CV1/GP26): Densitat (% de notes que sonen vs silencis)
-            y (CV2/GP27): Brillantor (durada del gate, més llarg = més brillant)
-        """
-        
-        # CV1: Densitat (probabilitat de tocar)
-        densitat = converters.normalize(x, self.cfg.cv1_min, self.cfg.cv1_max) * 100  # 0-100%
-        
-        # CV2: Brillantor via durada del gate (10% a 100% del beat)
-        brillantor_pct = converters.normalize(y, self.cfg.cv2_min, self.cfg.cv2_max)
-        gate_ms = sleep_time * 1000 * (0.1 + brillantor_pct * 0.9)
-        
-        # Intervals de campana (acord major: Do-Mi-Sol)
-        intervals_campana = [0, 4, 7]
-        
-        # Progressió harmònica: cada 3 notes, pujar una tercera menor (3 semitons)
-        cicle_complet = self.cfg.iteration // len(intervals_campana)  # Cada 3 notes
-        nota_base_offset = (cicle_complet * 3) % 12  # Pujar per terceres dins l'octava
-        
-        # Nota base amb progressió
-        nota_base = 12 * self.cfg.octava + nota_base_offset
-        indice = self.cfg.iteration % len(intervals_campana)
-        nota = max(0, min(127, nota_base + intervals_campana[indice]))
-        
-        # Decidir si toca o silenci segons densitat
-        probabilitat = random.randint(0, 100)
-        toca = probabilitat < densitat
-        
-        # Silencis reals: quan no toca, apagar tots els PWMs
-        if not toca:
-            nota_pwm1 = nota_pwm2 = nota_pwm3 = 0
-        else:
-            nota_pwm1 = nota_pwm2 = nota_pwm3 = nota
-        
-        # Mode CAOS: campanes en octaves aleatòries
-        if self.cfg.caos == 1 and self.cfg.caos_note != 0 and toca:
-            octava_new = random.randint(0, 8)
-            self.midi.play_note_full_multi(nota_pwm1, nota_pwm2, nota_pwm3, 1, octava_new, gate_ms, 0, 0, 0)
-        
-        # Campana principal o silenci
-        self.midi.play_note_full_multi(nota_pwm1, nota_pwm2, nota_pwm3, 1, self.cfg.octava, gate_ms, 0, 0, 0)
-    
-    # =========================================================================
-    # MODE 10: SEGONES
-    # =========================================================================
-    def _mode_segones(self, x, y, sleep_time):
-        """Mode 10: Segones - Dues notes simultànies amb velocitat i separació progressiva
-        
-        Controls:
-            x (CV1/GP26): Velocitat i direcció (7 rangs progressius):
-                - 0.00-0.15: -6 semitons/beat (molt ràpid ↓)
-                - 0.15-0.30: -4 semitons/beat (ràpid ↓)
-                - 0.30-0.45: -2 semitons/beat (lent ↓)
-                - 0.45-0.55: MANTÉ nota (zona morta)
-                - 0.55-0.70: +2 semitons/beat (lent ↑)
-                - 0.70-0.85: +4 semitons/beat (ràpid ↑)
-                - 0.85-1.00: +6 semitons/beat (molt ràpid ↑)
-                
-            y (CV2/GP27): Separació harmònica entre PWM1 i PWM2 (7 rangs):
-                - 0.00-0.15: 1-2 semitons (segones)
-                - 0.15-0.30: 3-4 semitons (terceres)
-                - 0.30-0.45: 5-6 semitons (quartes/trítono)
-                - 0.45-0.55: 7 semitons (quinta justa)
-                - 0.55-0.70: 8-9 semitons (sextes)
-                - 0.70-0.85: 10-11 semitons (sèptimes)
-                - 0.85-1.00: 12 semitons (octava)
-        
-        Notes:
-            - PWM1 toca la nota base en evolució contínua
-            - PWM2 toca la nota base + separació harmònica
-            - Zona morta central permet mantenir notes estables
-        """
-        
-        # Inicialitzar estat si no existeix
-        if not hasattr(self.cfg, 'segones_nota_anterior'):
-            self.cfg.segones_nota_anterior = 12 * self.cfg.octava
-        
-        # CV1: Velocitat i direcció amb 7 rangs progressius
-        direccio_pct = converters.normalize(x, self.cfg.cv1_min, self.cfg.cv1_max)
-        
-        # CV2: Separació harmònica amb 7 rangs progressius
-        separacio_pct = converters.normalize(y, self.cfg.cv2_min, self.cfg.cv2_max)
-        
-        if separacio_pct < 0.15:
-            separacio = random.choice([1, 2])  # Segona menor/major
-        elif separacio_pct < 0.30:
-            separacio = random.choice([3, 4])  # Tercera menor/major
-        elif separacio_pct < 0.45:
-            separacio = random.choice([5, 6])  # Quarta/trítono
-        elif separacio_pct <= 0.55:
-            separacio = 7  # Quinta justa (zona central)
-        elif separacio_pct < 0.70:
-            separacio = random.choice([8, 9])  # Sexta menor/major
-        elif separacio_pct < 0.85:
-            separacio = random.choice([10, 11])  # Sèptima menor/major
-        else:
-            separacio = 12  # Octava
-        
-        # Calcular nova nota segons velocitat amb 7 rangs
-        if direccio_pct < 0.15:
-            nova_nota = self.cfg.segones_nota_anterior - 6  # Molt ràpid avall
-        elif direccio_pct < 0.30:
-            nova_nota = self.cfg.segones_nota_anterior - 4  # Ràpid avall
-        elif direccio_pct < 0.45:
-            nova_nota = self.cfg.segones_nota_anterior - 2  # Lent avall
-        elif direccio_pct <= 0.55:
-            nova_nota = self.cfg.segones_nota_anterior  # Zona morta: mantenir
-        elif direccio_pct < 0.70:
-            nova_nota = self.cfg.segones_nota_anterior + 2  # Lent amunt
-        elif direccio_pct < 0.85:
-            nova_nota = self.cfg.segones_nota_anterior + 4  # Ràpid amunt
-        else:
-            nova_nota = self.cfg.segones_nota_anterior + 6  # Molt ràpid amunt
-        
-        # Mantenir dins del rang MIDI
-        nova_nota = max(0, min(127, nova_nota))
-        if nova_nota <= 0:
-            nova_nota = 2
-        elif nova_nota >= 127:
-            nova_nota = 125
-        
-        self.cfg.segones_nota_anterior = nova_nota
-        
-        # Tocar nota amb dues freqüències simultànies:
-        # PWM1 = nota base (via freqharm_base global)
-        # PWM2 = nota base + separacio (via freq1 paràmetre)
-        # PWM3 = nota base (via freq2=0)
-        
-        # Caos
-        if self.cfg.caos == 1 and self.cfg.caos_note != 0:
-            octava_new = random.randint(0, 8)
-            self.midi.play_note_full(nova_nota, 1, octava_new, sleep_time * 500,
-                                      0, separacio, 0)  # freq1=separacio
-        
-        # Nota principal amb dues freqüències
-        self.midi.play_note_full(nova_nota, 1, self.cfg.octava, sleep_time * 500,
-                                  0, separacio, 0)  # freq1=separacio per PWM2
-    
-    # =========================================================================
-    # MODE 11: ESPIRAL
-    # =========================================================================
-    def _mode_espiral(self, x, y, sleep_time):
-        """Mode 11: Espiral - Recorregut circular amb transposició gradual"""
-        if not self.cfg.state_espiral['initialized']:
-            self.cfg.state_espiral.update({'transposicio': 0, 'cicle_counter': 0, 'initialized': True})
-        escala_major = [0, 2, 4, 5, 7, 9, 11, 12]
-        avanç = int(converters.normalize(x, self.cfg.cv1_min, self.cfg.cv1_max) * 6.999) + 1
-        cicle_transposicio = int(converters.normalize(y, self.cfg.cv2_min, self.cfg.cv2_max) * 31.999) + 1
-        grau_index = (self.cfg.iteration * avanç) % len(escala_major)
-        interval_escala = escala_major[grau_index]
-        self.cfg.state_espiral['cicle_counter'] += 1
-        if self.cfg.state_espiral['cicle_counter'] >= cicle_transposicio:
-            self.cfg.state_espiral['transposicio'] += 1
-            self.cfg.state_espiral['cicle_counter'] = 0
-            if self.cfg.state_espiral['transposicio'] >= 12:
-                self.cfg.state_espiral['transposicio'] = 0
-        nota_base = 12 * self.cfg.octava
-        nota = nota_base + interval_escala + self.cfg.state_espiral['transposicio']
-        nota = max(0, min(127, nota))
-        if self.cfg.caos == 1:
-            octava_new = random.randint(0, 8)
-            if self.cfg.caos_note != 0:
-                self.midi.play_note_full(nota, 1, octava_new, sleep_time * 500, 0, self.cfg.freqharm1, self.cfg.freqharm2)
-        self.midi.play_note_full(nota, 1, self.cfg.octava, sleep_time * 500, 0, self.cfg.freqharm1, self.cfg.freqharm2)
-    
-    # =========================================================================
-    # MODE 12: CONTRAPUNT
-    # =========================================================================
-    def _mode_contrapunt(self, x, y, sleep_time):
-        """Mode 12: Contrapunt - Veu principal + dues veus complementàries independents"""
-        if not self.cfg.state_contrapunt['initialized']:
-            self.cfg.state_contrapunt.update({'beat_counter': 0, 'degree': 0, 'initialized': True})
-        
-        escala_major = [0, 2, 4, 5, 7, 9, 11]
-        
-        # CV1: Densitat PWM2 (tercera major - consonant) - INVERTIT
-        # CV1 baix = poc freqüent (cada 8), CV1 alt = molt freqüent (cada 1)
-        densitat_pwm2 = 8 - int(converters.normalize(x, self.cfg.cv1_min, self.cfg.cv1_max) * 7.999)  # 8-1
-        
-        # CV2: Densitat PWM3 (trítono - dissonant) - INVERTIT
-        # CV2 baix = poc freqüent (cada 8), CV2 alt = molt freqüent (cada 1)
-        densitat_pwm3 = 8 - int(converters.normalize(y, self.cfg.cv2_min, self.cfg.cv2_max) * 7.999)  # 8-1
-        
-        # Veu principal
-        grau_principal = self.cfg.state_contrapunt['degree'] % len(escala_major)
-        nota_base = 12 * self.cfg.octava
-        nota_principal = nota_base + escala_major[grau_principal]
-        nota_principal = max(0, min(127, nota_principal))
-        self.cfg.state_contrapunt['degree'] = (grau_principal + 1) % len(escala_major)
-        self.cfg.state_contrapunt['beat_counter'] += 1
-        
-        # Determinar si toquen les veus complementàries
-        toca_pwm2 = (self.cfg.state_contrapunt['beat_counter'] % densitat_pwm2) == 0
-        toca_pwm3 = (self.cfg.state_contrapunt['beat_counter'] % densitat_pwm3) == 0
-        
-        # PWM1: Sempre toca la veu principal
-        nota_pwm1 = nota_principal
-        
-        # PWM2: Tercera major (consonant) o silenci
-        if toca_pwm2:
-            nota_pwm2 = nota_principal + 4  # Tercera major
-            nota_pwm2 = max(0, min(127, nota_pwm2))
-        else:
-            nota_pwm2 = 0  # SILENCI
-        
-        # PWM3: Trítono (dissonant) o silenci
-        if toca_pwm3:
-            nota_pwm3 = nota_principal + 6  # Trítono (interval més dissonant)
-            nota_pwm3 = max(0, min(127, nota_pwm3))
-        else:
-            nota_pwm3 = 0  # SILENCI
-        
-        # Mode CAOS
-        if self.cfg.caos == 1 and self.cfg.caos_note != 0:
-            octava_new = random.randint(0, 8)
-            self.midi.play_note_full_multi(nota_pwm1, nota_pwm2, nota_pwm3, 1, octava_new, sleep_time * 500, 0, 0, 0)
-        
-        # Tocar les 3 veus (amb silencis on correspongui)
-        self.midi.play_note_full_multi(nota_pwm1, nota_pwm2, nota_pwm3, 1, self.cfg.octava, sleep_time * 500, 0, 0, 0)
-    
-    # =========================================================================
-    # MODE 13: NARVAL
-    # =========================================================================
-    def _mode_narval(self, x, y, sleep_time):
-        """Mode 13: Narval - Tres narvals que es comuniquen musicalment amb interaccions orgàniques"""
-        if not self.cfg.state_narval['initialized']:
-            self.cfg.state_narval.update({'grau_escala': 0, 'nota_base': 60, 'initialized': True})
-        escala_pentatonica = [0, 2, 4, 7, 9]
-        prob_crida = converters.normalize(x, self.cfg.cv1_min, self.cfg.cv1_max)
-        tipus_resposta = converters.normalize(y, self.cfg.cv2_min, self.cfg.cv2_max)
-        
-        # CV2 ara controla probabilitat de resposta (més alt = més respostes)
-        prob_resposta = tipus_resposta * 0.8  # Màxim 80% probabilitat de respondre
-        
-        # Intervals harmònics segons tipus de resposta
-        if tipus_resposta < 0.33:
-            intervals = [3, 6, 10]  # Trist
-        elif tipus_resposta < 0.66:
-            intervals = [5, 7, 12]  # Neutre
-        else:
-            intervals = [4, 9, 12]  # Feliç
-        
-        # 3 daus independents per cada narval
-        dau_narval1, dau_narval2, dau_narval3 = random.random(), random.random(), random.random()
-        narval1_crida = dau_narval1 < prob_crida
-        narval2_crida = dau_narval2 < prob_crida
-        narval3_crida = dau_narval3 < prob_crida
-        narvals_parlant = sum([narval1_crida, narval2_crida, narval3_crida])
-        
-        # Nota base de l'escala
-        grau = self.cfg.state_narval['grau_escala'] % len(escala_pentatonica)
-        nota_base = 12 * self.cfg.octava + escala_pentatonica[grau]
-        self.cfg.state_narval['grau_escala'] = (grau + 1) % len(escala_pentatonica)
-        
-        # Inicialitzar notes (per defecte silenci)
-        nota_pwm1 = nota_pwm2 = nota_pwm3 = 0
-        
-        if narvals_parlant == 0:
-            # Cap narval crida: silenci total
-            pass
-            
-        elif narvals_parlant == 1:
-            # UN SOL NARVAL CRIDA: Els altres poden respondre o callar
-            if narval1_crida:
-                # Narval 1 crida (sempre toca)
-                nota_pwm1 = nota_base
-                # Narval 2 i 3 responen segons probabilitat
-                if random.random() < prob_resposta:
-                    nota_pwm2 = nota_base + intervals[0]
-                if random.random() < prob_resposta:
-                    nota_pwm3 = nota_base + intervals[1]
-                    
-            elif narval2_crida:
-                # Narval 2 crida (sempre toca)
-                nota_pwm2 = nota_base
-                # Narval 1 i 3 responen segons probabilitat
-                if random.random() < prob_resposta:
-                    nota_pwm1 = nota_base + intervals[0]
-                if random.random() < prob_resposta:
-                    nota_pwm3 = nota_base + intervals[1]
-                    
-            else:  # narval3_crida
-                # Narval 3 crida (sempre toca)
-                nota_pwm3 = nota_base
-                # Narval 1 i 2 responen segons probabilitat
-                if random.random() < prob_resposta:
-                    nota_pwm1 = nota_base + intervals[0]
-                if random.random() < prob_resposta:
-                    nota_pwm2 = nota_base + intervals[1]
-                    
-        elif narvals_parlant == 2:
-            # DOS NARVALS PARLEN: El tercer pot ballar o callar
-            if not narval1_crida:
-                # Narvals 2 i 3 parlen
-                nota_pwm2 = nota_base
-                nota_pwm3 = nota_base + intervals[0]
-                # Narval 1 balla només si prob_resposta és alta
-                if random.random() < prob_resposta * 0.5:  # 50% menys probable
-                    nota_pwm1 = nota_base + 12
-                    
-            elif not narval2_crida:
-                # Narvals 1 i 3 parlen
-                nota_pwm1 = nota_base
-                nota_pwm3 = nota_base + intervals[0]
-                # Narval 2 balla segons probabilitat
-                if random.random() < prob_resposta * 0.5:
-                    nota_pwm2 = nota_base + 12
-                    
-            else:  # not narval3_crida
-                # Narvals 1 i 2 parlen
-                nota_pwm1 = nota_base
-                nota_pwm2 = nota_base + intervals[0]
-                # Narval 3 balla segons probabilitat
-                if random.random() < prob_resposta * 0.5:
-                    nota_pwm3 = nota_base + 12
-                    
-        else:  # narvals_parlant == 3
-            # TOTS TRES PARLEN: harmonia completa (sempre toquen tots)
-            nota_pwm1 = nota_base
-            nota_pwm2 = nota_base + intervals[0]
-            nota_pwm3 = nota_base + intervals[2]
-        
-        # Assegurar rang MIDI vàlid
-        nota_pwm1 = max(0, min(127, nota_pwm1))
-        nota_pwm2 = max(0, min(127, nota_pwm2))
-        nota_pwm3 = max(0, min(127, nota_pwm3))
-        
-        # Mode CAOS
-        if self.cfg.caos == 1 and self.cfg.caos_note != 0 and (nota_pwm1 > 0 or nota_pwm2 > 0 or nota_pwm3 > 0):
-            self.midi.play_note_full_multi(nota_pwm1, nota_pwm2, nota_pwm3, 1, random.randint(0, 8), sleep_time * 500, 0, 0, 0)
-        
-        # Tocar notes (nota = 0 significa silenci per aquell PWM)
-        if nota_pwm1 > 0 or nota_pwm2 > 0 or nota_pwm3 > 0:
-            self.midi.play_note_full_multi(nota_pwm1, nota_pwm2, nota_pwm3, 1, self.cfg.octava, sleep_time * 500, 0, 0, 0)
-
-    # =========================================================================
-    # MODE 14: CICLADOR
-    # =========================================================================
-    def _mode_ciclador(self, x, y, sleep_time):
-        """Mode 14: Ciclador - Control independent dels duty cycles de cada PWM
-        
-        Controls:
-            x (CV1/GP26): Duty cycle PWM1 (0-99%)
-            y (CV2/GP27): Duty cycle PWM2 (0-99%)
-            Slider (GP28): Duty cycle PWM3 (0-99%)
-        
-        Notes:
-            - Cada PWM té control independent del duty cycle
-            - Nota fixa a C4 (Do central, MIDI 60)
-            - Octava controlada amb creueta (botons)
-            - Permet exploració tímbrica amb 3 PWMs independents
-        """
-        
-        # x, y estan clampats al rang calibrat
-        # z (slider) no es calibra, sempre 0-3.3V
-        
-        # CV1: Duty cycle per PWM1 (0-99%) - normalitzar al rang calibrat
-        duty1_pct = converters.normalize(x, self.cfg.cv1_min, self.cfg.cv1_max) * 99
-        
-        # CV2: Duty cycle per PWM2 (0-99%) - normalitzar al rang calibrat
-        duty2_pct = converters.normalize(y, self.cfg.cv2_min, self.cfg.cv2_max) * 99
-        
-        # Slider: Duty cycle per PWM3 (0-99%) - NO calibrat, sempre 0-3.3V
-        slider_voltage = self.cfg.z
-        duty3_pct = (slider_voltage / 3.3) * 99
-        
-        # Aplicar els duty cycles independents (clamping a 1-99)
-        self.cfg.duty1 = max(1, min(99, int(duty1_pct)))
-        self.cfg.duty2 = max(1, min(99, int(duty2_pct)))
-        self.cfg.duty3 = max(1, min(99, int(duty3_pct)))
-        
-        # Nota fixa C4 (MIDI 60) amb octava controlable per creueta
-        nota_base = 60 + (12 * (self.cfg.octava - 5))  # C4 = octava 5
-        nota_base = max(0, min(127, nota_base))
-        
-        # Mode CAOS
-        if self.cfg.caos == 1 and self.cfg.caos_note != 0:
-            octava_caos = random.randint(0, 8)
-            self.midi.play_note_full(nota_base, 1, octava_caos, sleep_time * 500, 0, self.cfg.freqharm1, self.cfg.freqharm2)
-        
-        # Tocar nota amb els duty cycles independents
-        self.midi.play_note_full(nota_base, 1, self.cfg.octava, sleep_time * 500, 0, self.cfg.freqharm1, self.cfg.freqharm2)
-
-
-
+        # Els ganxos enter/exit només s'executen quan canvia el mode
+        if mode_num != self.active_num:
+            self.switch_mode(mode_num)
+
+        mode = self.active
+        if mode is not None:
+            tracker = self.tracker
+            if tracker is not None:
+                tracker.begin()
+            self.frame.update(x, y)
+            mode.tick(x, y, sleep_time, cx, cy)
+            if tracker is not None:
+                tracker.end(mode_num)
@@ -0,0 +1,135 @@
+# =============================================================================
+# MODE 13: NARVAL - TECLA
+# =============================================================================
+import random
+from modes.base import Mode
+
+
+class ModeNarval(Mode):
+    """Mode 13: Narval - Tres narvals que es comuniquen musicalment amb interaccions orgàniques"""
+
+    __slots__ = ("grau_escala", "nota_base")
+
+    NUMBER = 13
+    NAME = "Narval"
+
+    ESCALA_PENTATONICA = (0, 2, 4, 7, 9)
+
+    # Intervals harmònics segons tipus de resposta
+    INTERVALS_TRIST = (3, 6, 10)
+    INTERVALS_NEUTRE = (5, 7, 12)
+    INTERVALS_FELIC = (4, 9, 12)
+
+    def __init__(self, hardware, config, midi_handler):
+        super().__init__(hardware, config, midi_handler)
+        self.grau_escala = 0   # Posició actual a l'escala pentatònica
+        self.nota_base = 60    # Nota MIDI base (Do central)
+
+    def tick(self, x, y, sleep_time, cx, cy):
+        frame = self.frame
+        escala_pentatonica = self.ESCALA_PENTATONICA
+        prob_crida = frame.nx
+        tipus_resposta = frame.ny
+
+        # CV2 ara controla probabilitat de resposta (més alt = més respostes)
+        prob_resposta = tipus_resposta * 0.8  # Màxim 80% probabilitat de respondre
+
+        if tipus_resposta < 0.33:
+            intervals = self.INTERVALS_TRIST
+        elif tipus_resposta < 0.66:
+            intervals = self.INTERVALS_NEUTRE
+        else:
+            intervals = self.INTERVALS_FELIC
+
+        # 3 daus independents per cada narval
+        dau_narval1, dau_narval2, dau_narval3 = random.random(), random.random(), random.random()
+        narval1_crida = dau_narval1 < prob_crida
+        narval2_crida = dau_narval2 < prob_crida
+        narval3_crida = dau_narval3 < prob_crida
+        narvals_parlant = narval1_crida + narval2_crida + narval3_crida
+
+        # Nota base de l'escala
+        grau = self.grau_escala % len(escala_pentatonica)
+        nota_base = 12 * self.cfg.octava + escala_pentatonica[grau]
+        self.grau_escala = (grau + 1) % len(escala_pentatonica)
+
+        # Inicialitzar notes (per defecte silenci)
+        nota_pwm1 = nota_pwm2 = nota_pwm3 = 0
+
+        if narvals_parlant == 0:
+            # Cap narval crida: silenci total
+            pass
+
+        elif narvals_parlant == 1:
+            # UN SOL NARVAL CRIDA: Els altres poden respondre o callar
+            if narval1_crida:
+                # Narval 1 crida (sempre toca)
+                nota_pwm1 = nota_base
+                # Narval 2 i 3 responen segons probabilitat
+                if random.random() < prob_resposta:
+                    nota_pwm2 = nota_base + intervals[0]
+                if random.random() < prob_resposta:
+                    nota_pwm3 = nota_base + intervals[1]
+
+            elif narval2_crida:
+                # Narval 2 crida (sempre toca)
+                nota_pwm2 = nota_base
+                # Narval 1 i 3 responen segons probabilitat
+                if random.random() < prob_resposta:
+                    nota_pwm1 = nota_base + intervals[0]
+                if random.random() < prob_resposta:
+                    nota_pwm3 = nota_base + intervals[1]
+
+            else:  # narval3_crida
+                # Narval 3 crida (sempre toca)
+                nota_pwm3 = nota_base
+                # Narval 1 i 2 responen segons probabilitat
+                if random.random() < prob_resposta:
+                    nota_pwm1 = nota_base + intervals[0]
+                if random.random() < prob_resposta:
+                    nota_pwm2 = nota_base + intervals[1]
+
+        elif narvals_parlant == 2:
+            # DOS NARVALS PARLEN: El tercer pot ballar o callar
+            if not narval1_crida:
+                # Narvals 2 i 3 parlen
+                nota_pwm2 = nota_base
+                nota_pwm3 = nota_base + intervals[0]
+                # Narval 1 balla només si prob_resposta és alta
+                if random.random() < prob_resposta * 0.5:  # 50% menys probable
+                    nota_pwm1 = nota_base + 12
+
+            elif not narval2_crida:
+                # Narvals 1 i 3 parlen
+                nota_pwm1 = nota_base
+                nota_pwm3 = nota_base + intervals[0]
+                # Narval 2 balla segons probabilitat
+                if random.random() < prob_resposta * 0.5:
+                    nota_pwm2 = nota_base + 12
+
+            else:  # not narval3_crida
+                # Narvals 1 i 2 parlen
+                nota_pwm1 = nota_base
+                nota_pwm2 = nota_base + intervals[0]
+                # Narval 3 balla segons probabilitat
+                if random.random() < prob_resposta * 0.5:
+                    nota_pwm3 = nota_base + 12
+
+        else:  # narvals_parlant == 3
+            # TOTS TRES PARLEN: harmonia completa (sempre toquen tots)
+            nota_pwm1 = nota_base
+            nota_pwm2 = nota_base + intervals[0]
+            nota_pwm3 = nota_base + intervals[2]
+
+        # Assegurar rang MIDI vàlid
+        nota_pwm1 = max(0, min(127, nota_pwm1))
+        nota_pwm2 = max(0, min(127, nota_pwm2))
+        nota_pwm3 = max(0, min(127, nota_pwm3))
+
+        # Mode CAOS
+        if self.cfg.caos == 1 and self.cfg.caos_note != 0 and (nota_pwm1 > 0 or nota_pwm2 > 0 or nota_pwm3 > 0):
+            self.midi.play_note_full_multi(nota_pwm1, nota_pwm2, nota_pwm3, 1, random.randint(0, 8), sleep_time * 500, 0, 0, 0)
+
+        # Tocar notes (nota = 0 significa silenci per aquell PWM)
+        if nota_pwm1 > 0 or nota_pwm2 > 0 or nota_pwm3 > 0:
+            self.midi.play_note_full_multi(nota_pwm1, nota_pwm2, nota_pwm3, 1, self.cfg.octava, sleep_time * 500, 0, 0, 0)
@@ -0,0 +1,77 @@
+# =============================================================================
+# MODE 2: RIU - TECLA
+# =============================================================================
+# Notes fluides com aigua que corre per un riu. L'algorisme simula ones
+# sinusoïdals que creen melodies orgàniques i fluides.
+#
+# Controls:
+#   CV1 (GP26): Densitat - Nombre de notes per cicle (1-10)
+#   CV2 (GP27): Turbulència - Força de les onades (0-127)
+#   Slider (GP28): BPM - Velocitat del riu (automàtic)
+# =============================================================================
+import random
+import time
+import math
+from modes.base import Mode
+
+
+class ModeRiu(Mode):
+    """Mode 2: Riu
+
+    Controls:
+        x (CV1/GP26): Densitat (1-10)
+        y (CV2/GP27): Turbulència (0-127)
+    """
+
+    __slots__ = ("rio_base",)
+
+    NUMBER = 2
+    NAME = "Riu"
+
+    # Patró de gate (quan sona / quan no sona)
+    PATRON_GATE = (1, 1, 1, 0, 0, 1, 1, 1, 1, 0)  # 1=toca, 0=silenci
+
+    def __init__(self, hardware, config, midi_handler):
+        super().__init__(hardware, config, midi_handler)
+        self.rio_base = 64
+
+    def tick(self, x, y, sleep_time, cx, cy):
+        frame = self.frame
+        # Convertir voltatges (distribució uniforme)
+        densitat = frame.qx(10) + 1
+        turbulencia = frame.ny * 127
+        rio_time = time.time()                # Temps actual (per les ones)
+
+        # Calcular el rang de notes segons l'octava actual
+        nota_min = 12 * self.cfg.octava  # Nota més baixa de l'octava
+
+        # El riu "avança" sempre endavant (augmenta la nota base)
+        self.rio_base = (self.rio_base + densitat) % 12
+        nota_base = nota_min + self.rio_base
+
+        # Afegir moviment ondulatori (com ones a l'aigua)
+        wave = math.sin(rio_time * 0.8) * (densitat * 0.5)      # Ona lenta
+        ripple = math.cos(rio_time * 2.2) * (turbulencia * 0.05) # Ona ràpida
+        random_offset = random.uniform(-2, 2)                     # Variació aleatòria
+
+        # Combinar tots els elements per obtenir la nota final
+        nota_rio = nota_base + wave + ripple + random_offset
+        nota_rio = int(max(0, min(127, nota_rio)))  # Assegurar rang MIDI vàlid
+
+        patron_gate = self.PATRON_GATE
+        gate_on = patron_gate[self.cfg.iteration % len(patron_gate)]
+
+        # Mode CAOS: afegeix notes aleatòries en octaves diferents
+        if self.cfg.caos == 1:
+            octava_new = random.randint(0, 8)  # Octava aleatòria
+
+            if self.cfg.caos_note == 0:
+                nota_rio = 0  # Silenci caòtic
+            elif gate_on:
+                # Toca eco caòtic en octava aleatòria
+                self.midi.play_note_full(nota_rio, 1, octava_new, sleep_time * 500,
+                                          0, self.cfg.freqharm1, self.cfg.freqharm2)
+
+        # Toca la nota principal del riu
+        self.midi.play_note_full(nota_rio, gate_on, self.cfg.octava, sleep_time * 500,
+                                  0, self.cfg.freqharm1, self.cfg.freqharm2)
@@ -0,0 +1,118 @@
+# =============================================================================
+# MODE 10: SEGONES - TECLA
+# =============================================================================
+import random
+from modes.base import Mode
+
+
+class ModeSegones(Mode):
+    """Mode 10: Segones - Dues notes simultànies amb velocitat i separació progressiva
+
+    Controls:
+        x (CV1/GP26): Velocitat i direcció (7 rangs progressius):
+            - 0.00-0.15: -6 semitons/beat (molt ràpid ↓)
+            - 0.15-0.30: -4 semitons/beat (ràpid ↓)
+            - 0.30-0.45: -2 semitons/beat (lent ↓)
+            - 0.45-0.55: MANTÉ nota (zona morta)
+            - 0.55-0.70: +2 semitons/beat (lent ↑)
+            - 0.70-0.85: +4 semitons/beat (ràpid ↑)
+            - 0.85-1.00: +6 semitons/beat (molt ràpid ↑)
+
+        y (CV2/GP27): Separació harmònica entre PWM1 i PWM2 (7 rangs):
+            - 0.00-0.15: 1-2 semitons (segones)
+            - 0.15-0.30: 3-4 semitons (terceres)
+            - 0.30-0.45: 5-6 semitons (quartes/trítono)
+            - 0.45-0.55: 7 semitons (quinta justa)
+            - 0.55-0.70: 8-9 semitons (sextes)
+            - 0.70-0.85: 10-11 semitons (sèptimes)
+            - 0.85-1.00: 12 semitons (octava)
+
+    Notes:
+        - PWM1 toca la nota base en evolució contínua
+        - PWM2 toca la nota base + separació harmònica
+        - Zona morta central permet mantenir notes estables
+    """
+
+    __slots__ = ("nota_anterior",)
+
+    NUMBER = 10
+    NAME = "Segones"
+
+    # Parells d'intervals de cada rang de separació
+    SEGONES = (1, 2)     # Segona menor/major
+    TERCERES = (3, 4)    # Tercera menor/major
+    QUARTES = (5, 6)     # Quarta/trítono
+    SEXTES = (8, 9)      # Sexta menor/major
+    SEPTIMES = (10, 11)  # Sèptima menor/major
+
+    def __init__(self, hardware, config, midi_handler):
+        super().__init__(hardware, config, midi_handler)
+        self.nota_anterior = None
+
+    def enter(self):
+        # Inicialitzar estat si no existeix
+        if self.nota_anterior is None:
+            self.nota_anterior = 12 * self.cfg.octava
+
+    def tick(self, x, y, sleep_time, cx, cy):
+        frame = self.frame
+        # CV1: Velocitat i direcció amb 7 rangs progressius
+        direccio_pct = frame.nx
+
+        # CV2: Separació harmònica amb 7 rangs progressius
+        separacio_pct = frame.ny
+
+        if separacio_pct < 0.15:
+            separacio = random.choice(self.SEGONES)  # Segona menor/major
+        elif separacio_pct < 0.30:
+            separacio = random.choice(self.TERCERES)  # Tercera menor/major
+        elif separacio_pct < 0.45:
+            separacio = random.choice(self.QUARTES)  # Quarta/trítono
+        elif separacio_pct <= 0.55:
+            separacio = 7  # Quinta justa (zona central)
+        elif separacio_pct < 0.70:
+            separacio = random.choice(self.SEXTES)  # Sexta menor/major
+        elif separacio_pct < 0.85:
+            separacio = random.choice(self.SEPTIMES)  # Sèptima menor/major
+        else:
+            separacio = 12  # Octava
+
+        # Calcular nova nota segons velocitat amb 7 rangs
+        if direccio_pct < 0.15:
+            nova_nota = self.nota_anterior - 6  # Molt ràpid avall
+        elif direccio_pct < 0.30:
+            nova_nota = self.nota_anterior - 4  # Ràpid avall
+        elif direccio_pct < 0.45:
+            nova_nota = self.nota_anterior - 2  # Lent avall
+        elif direccio_pct <= 0.55:
+            nova_nota = self.nota_anterior  # Zona morta: mantenir
+        elif direccio_pct < 0.70:
+            nova_nota = self.nota_anterior + 2  # Lent amunt
+        elif direccio_pct < 0.85:
+            nova_nota = self.nota_anterior + 4  # Ràpid amunt
+        else:
+            nova_nota = self.nota_anterior + 6  # Molt ràpid amunt
+
+        # Mantenir dins del rang MIDI
+        nova_nota = max(0, min(127, nova_nota))
+        if nova_nota <= 0:
+            nova_nota = 2
+        elif nova_nota >= 127:
+            nova_nota = 125
+
+        self.nota_anterior = nova_nota
+
+        # Tocar nota amb dues freqüències simultànies:
+        # PWM1 = nota base (via freqharm_base global)
+        # PWM2 = nota base + separacio (via freq1 paràmetre)
+        # PWM3 = nota base (via freq2=0)
+
+        # Caos
+        if self.cfg.caos == 1 and self.cfg.caos_note != 0:
+            octava_new = random.randint(0, 8)
+            self.midi.play_note_full(nova_nota, 1, octava_new, sleep_time * 500,
+                                      0, separacio, 0)  # freq1=separacio
+
+        # Nota principal amb dues freqüències
+        self.midi.play_note_full(nova_nota, 1, self.cfg.octava, sleep_time * 500,
+                                  0, separacio, 0)  # freq1=separacio per PWM2
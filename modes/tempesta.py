@@ -0,0 +1,82 @@
+# =============================================================================
+# MODE 3: TEMPESTA - TECLA
+# =============================================================================
+# Controls:
+#   CV1 (GP26): Intensitat lluvia (0-127)
+#   CV2 (GP27): Freqüència llamps (0-127)
+#   Slider (GP28): BPM
+# =============================================================================
+import random
+from modes.base import Mode
+
+
+class ModeTempesta(Mode):
+    """Mode 3: Tempesta
+
+    Controls:
+        x (CV1/GP26): Intensitat pluja
+        y (CV2/GP27): Freqüència llamps
+    """
+
+    __slots__ = ()
+
+    NUMBER = 3
+    NAME = "Tempesta"
+
+    ESCALA_TORMENTA = (0, 3, 5, 7, 10)
+
+    def tick(self, x, y, sleep_time, cx, cy):
+        frame = self.frame
+        escala_tormenta = self.ESCALA_TORMENTA
+
+        # Convertir voltatges (distribució uniforme)
+        intensidad_lluvia = frame.nx * 127
+        frecuencia_rayos = frame.ny * 127
+
+        # Calcular nota base dins de l'octava actual
+        nota_min = 12 * self.cfg.octava
+        nota_max = min(nota_min + 11, 127)
+        nota_base = nota_min + int(intensidad_lluvia * 0.09)
+        nota_base = max(nota_min, min(nota_max, nota_base))
+
+        # Decidir si toca un llamp (aleatori segons freqüència)
+        if random.randint(0, 1000) < (frecuencia_rayos * 8):  # Probabilitat 0-101.6%
+            # LLAMP! Generar arpegi ascendent o descendent
+            direccion = 1 if random.random() > 0.3 else -1  # 70% amunt, 30% avall
+
+            # Tocar totes les notes de l'arpegi ràpidament
+            # (per índex: recórrer la taula al revés sense crear-ne una còpia)
+            ultim = len(escala_tormenta) - 1
+            i = 0
+            while i <= ultim:
+                intervalo = escala_tormenta[i if direccion > 0 else ultim - i]
+                i += 1
+                multiplicador = max(1, min(3, i))  # Intensificar el llamp
+                nota_relampago = nota_base + (intervalo * direccion * multiplicador)
+                nota_relampago = max(nota_min, min(nota_max, nota_relampago))
+
+                # Mode CAOS: llamps en octaves aleatòries
+                if self.cfg.caos == 1:
+                    octava_new = random.randint(0, 8)
+                    if self.cfg.caos_note != 0:
+                        self.midi.play_note_full(nota_relampago, 1, octava_new, sleep_time * 500,
+                                                  0, self.cfg.freqharm1, self.cfg.freqharm2)
+                else:
+                    # Toca nota del llamp
+                    self.midi.play_note_full(nota_relampago, 1, self.cfg.octava, sleep_time * 500,
+                                              0, self.cfg.freqharm1, self.cfg.freqharm2)
+        else:
+            # PLUJA: Notes constants amb petites variacions
+            variacion_lluvia = random.randint(-3, 3)  # Variació aleatòria ±3 semitons
+            nota_lluvia = max(nota_min, min(nota_max, nota_base + variacion_lluvia))
+
+            # Mode CAOS: pluja en octaves aleatòries
+            if self.cfg.caos == 1:
+                octava_new = random.randint(0, 8)
+                if self.cfg.caos_note != 0:
+                    self.midi.play_note_full(nota_lluvia, 1, octava_new, sleep_time * 500,
+                                              0, self.cfg.freqharm1, self.cfg.freqharm2)
+            else:
+                # Toca nota de la pluja
+                self.midi.play_note_full(nota_lluvia, 1, self.cfg.octava, sleep_time * 500,
+                                          0, self.cfg.freqharm1, self.cfg.freqharm2)
@@ -20,8 +20,76 @@ def generar_ritmo_euclideo(pulsos, pasos):
         grupos = nuevos_grupos
     return [item for sublist in grupos for item in sublist]
 
-def mandelbrot_to_midi(cx, cy, max_iter=200):
-    """Convierte coordenadas Mandelbrot a nota MIDI"""
+# =============================================================================
+# SERVEI DE PATRONS EUCLIDIANS MEMORITZATS
+# =============================================================================
+# generar_ritmo_euclideo() crea llistes niades a cada crida. Els modes que
+# consulten el ritme a cada tick fan servir euclid_pattern(), que guarda els
+# patrons ja calculats com a bytearray (1 byte per step) en una cache LRU
+# limitada. La clau és un enter empaquetat (sense tuples): una consulta amb
+# els mateixos CVs no crea cap objecte nou.
+# =============================================================================
+EUCLID_CACHE_SIZE = 48  # Patrons màxims en memòria (48 x <=256 bytes)
+
+_euclid_cache = {}       # clau empaquetada -> bytearray
+_euclid_order = []       # claus per ordre d'ús (la menys recent primer)
+_euclid_last_key = -1    # Camí ràpid: última clau consultada
+_euclid_last = None
+
+def _euclid_key(pulsos, pasos, rotacio):
+    return (pulsos << 16) | (pasos << 8) | rotacio
+
+def euclid_pattern(pulsos, pasos, rotacio=0):
+    """Retorna el patró euclidià (bytearray de 0/1) des de la cache LRU
+
+    El bytearray retornat és compartit: s'ha de tractar com a només lectura.
+
+    Args:
+        pulsos: Nombre de pulsos actius
+        pasos: Llargada del patró (1-255)
+        rotacio: Steps de rotació cap a l'esquerra
+    """
+    global _euclid_last_key, _euclid_last
+
+    if pasos <= 0 or pasos > 255 or pulsos < 0:
+        # Fora del rang empaquetable: calcular sense cache
+        return bytearray(generar_ritmo_euclideo(pulsos, pasos))
+    if pulsos > pasos:
+        pulsos = pasos
+    rotacio %= pasos
+
+    key = _euclid_key(pulsos, pasos, rotacio)
+    if key == _euclid_last_key:
+        return _euclid_last
+
+    pattern = _euclid_cache.get(key)
+    if pattern is None:
+        base = generar_ritmo_euclideo(pulsos, pasos)
+        pattern = bytearray(pasos)
+        for i in range(pasos):
+            pattern[i] = base[(i + rotacio) % pasos]
+        if len(_euclid_order) >= EUCLID_CACHE_SIZE:
+            del _euclid_cache[_euclid_order.pop(0)]
+        _euclid_cache[key] = pattern
+    else:
+        # Promocionar a més recent
+        _euclid_order.remove(key)
+    _euclid_order.append(key)
+
+    _euclid_last_key = key
+    _euclid_last = pattern
+    return pattern
+
+def euclid_cache_clear():
+    """Buida la cache de patrons euclidians"""
+    global _euclid_last_key, _euclid_last
+    _euclid_cache.clear()
+    del _euclid_order[:]
+    _euclid_last_key = -1
+    _euclid_last = None
+
+def mandelbrot_iterations(cx, cy, max_iter=200):
+    """Iteracions d'escapament del conjunt de Mandelbrot al punt (cx, cy)"""
     x, y = 0.0, 0.0
     iteration = 0
     while x*x + y*y <= 4 and iteration < max_iter:
@@ -29,7 +97,111 @@ def mandelbrot_to_midi(cx, cy, max_iter=200):
         y = 2*x*y + cy
         x = x_new
         iteration += 1
-    return iteration % 60 + 32
+    return iteration
+
+def mandelbrot_to_midi(cx, cy, max_iter=200):
+    """Convierte coordenadas Mandelbrot a nota MIDI"""
+    return mandelbrot_iterations(cx, cy, max_iter) % 60 + 32
+
+# =============================================================================
+# GRAELLA MANDELBROT QUANTITZADA
+# =============================================================================
+# Els modes 1 i 8 consulten el fractal a cada tick. La graella guarda les
+# iteracions d'escapament de 128x128 punts de l'espai de control [-1.5, 1.5]²
+# (un pas de ~0.024, per sota del soroll de l'ADC) en un bytearray de 16 KB.
+#
+# La graella s'assigna en carregar els modes 1 i 8 (mandelbrot_grid_alloc()
+# des del constructor, dins de ModeLoader: la comprovació de memòria lliure
+# la veu i un MemoryError va al reintent del carregador, no al mig d'un
+# tick). La tasca "fractal" del planificador (LOW, main.py) l'omple amb
+# mandelbrot_grid_fill() quan hi ha marge abans del pròxim deadline; una
+# cel·la encara no calculada que es consulta en un tick fa el càlcul exacte
+# (com abans) i les següents són una sola indexació.
+# =============================================================================
+MANDEL_GRID_SIZE = 128
+MANDEL_MIN = -1.5
+MANDEL_MAX = 1.5
+MANDEL_MAX_ITER = 200
+MANDEL_EMPTY = 0  # Cel·la encara no calculada (sempre hi ha >= 1 iteració)
+
+_MANDEL_STEP = (MANDEL_MAX - MANDEL_MIN) / (MANDEL_GRID_SIZE - 1)
+_MANDEL_SCALE = (MANDEL_GRID_SIZE - 1) / (MANDEL_MAX - MANDEL_MIN)
+
+_mandel_grid = None   # bytearray(128*128), mandelbrot_grid_alloc()
+_mandel_fill_pos = 0  # Següent cel·la per mandelbrot_grid_fill()
+
+def mandelbrot_grid_alloc():
+    """Assigna la graella (16 KB) si encara no existeix"""
+    global _mandel_grid
+    if _mandel_grid is None:
+        _mandel_grid = bytearray(MANDEL_GRID_SIZE * MANDEL_GRID_SIZE)
+    return _mandel_grid
+
+def _mandel_cell(ix, iy):
+    """Iteracions de la cel·la (ix, iy), calculant-la si cal"""
+    grid = _mandel_grid
+    if grid is None:
+        # Sense graella (cap mode fractal carregat): càlcul exacte sense desar
+        return mandelbrot_iterations(MANDEL_MIN + ix * _MANDEL_STEP,
+                                     MANDEL_MIN + iy * _MANDEL_STEP,
+                                     MANDEL_MAX_ITER)
+    idx = iy * MANDEL_GRID_SIZE + ix
+    value = grid[idx]
+    if value == MANDEL_EMPTY:
+        value = mandelbrot_iterations(MANDEL_MIN + ix * _MANDEL_STEP,
+                                      MANDEL_MIN + iy * _MANDEL_STEP,
+                                      MANDEL_MAX_ITER)
+        grid[idx] = value
+    return value
+
+def _mandel_coord(c):
+    """Coordenada del fractal -> posició contínua a la graella (0-127)"""
+    pos = (c - MANDEL_MIN) * _MANDEL_SCALE
+    if pos < 0:
+        return 0.0
+    if pos > MANDEL_GRID_SIZE - 1:
+        return float(MANDEL_GRID_SIZE - 1)
+    return pos
+
+def mandelbrot_grid_note(cx, cy, bilinear=False):
+    """Nota MIDI del fractal consultant la graella quantitzada
+
+    Args:
+        cx, cy: Coordenades del fractal (-1.5 a 1.5)
+        bilinear: False = cel·la més propera, True = interpolació bilineal
+            de les iteracions de les 4 cel·les veïnes
+    """
+    px = _mandel_coord(cx)
+    py = _mandel_coord(cy)
+
+    if not bilinear:
+        return _mandel_cell(int(px + 0.5), int(py + 0.5)) % 60 + 32
+
+    ix = int(px)
+    iy = int(py)
+    ix1 = ix + 1 if ix < MANDEL_GRID_SIZE - 1 else ix
+    iy1 = iy + 1 if iy < MANDEL_GRID_SIZE - 1 else iy
+    fx = px - ix
+    fy = py - iy
+    top = _mandel_cell(ix, iy) * (1 - fx) + _mandel_cell(ix1, iy) * fx
+    bottom = _mandel_cell(ix, iy1) * (1 - fx) + _mandel_cell(ix1, iy1) * fx
+    iterations = int(top * (1 - fy) + bottom * fy + 0.5)
+    return iterations % 60 + 32
+
+def mandelbrot_grid_fill(cells=MANDEL_GRID_SIZE):
+    """Calcula fins a `cells` cel·les pendents, fila a fila
+
+    Retorna True quan la graella és completa (o si no està assignada).
+    """
+    global _mandel_fill_pos
+    if _mandel_grid is None:
+        return True
+    total = MANDEL_GRID_SIZE * MANDEL_GRID_SIZE
+    end = min(_mandel_fill_pos + cells, total)
+    for idx in range(_mandel_fill_pos, end):
+        _mandel_cell(idx % MANDEL_GRID_SIZE, idx // MANDEL_GRID_SIZE)
+    _mandel_fill_pos = end
+    return end >= total
 
 def sinusoidal_value_2(iteration, ampli, base_frequency):
     """Genera valor sinusoidal para modulación"""
@@ -41,20 +213,22 @@ def sinusoidal_value_2(iteration, ampli, base_frequency):
     value = amplitude * math.sin(phase) + offset
     return max(min(round(value), max_value), min_value)
 
+# Intervals per perfil harmònic (fila) i tensió (columna): taula constant,
+# harmonic_next_note() es crida a cada tick del mode Cosmos
+HARMONIC_INTERVALS = (
+    (3, 4, 7, 12),
+    (2, 5, 9, 16),
+    (1, 6, 11, 19),
+    (8, 14, 17, 23),
+    (10, 15, 20, 24),
+    (13, 18, 21, 22),
+)
+
 def harmonic_next_note(x, y, previous_note=0):
     """Genera siguiente nota basada en armonía"""
-    intervals = {
-        0: [3, 4, 7, 12],
-        1: [2, 5, 9, 16],
-        2: [1, 6, 11, 19],
-        3: [8, 14, 17, 23],
-        4: [10, 15, 20, 24],
-        5: [13, 18, 21, 22]
-    }
-    
     harmonic_profile = min(x // 21, 5)
     tension = min(y // 32, 3)
-    selected_interval = intervals[harmonic_profile][tension]
+    selected_interval = HARMONIC_INTERVALS[harmonic_profile][tension]
     direction = 1 if (x ^ y) % 2 else -1
     base_note = previous_note + (direction * selected_interval)
     harmonic_variation = int((x % 16) - (y % 16))
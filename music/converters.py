@@ -1,9 +1,34 @@
 # =============================================================================
 # CONVERSIONS MUSICALS - TECLA
 # =============================================================================
+from array import array
+
+# -----------------------------------------------------------------------------
+# Taules precalculades (es construeixen una sola vegada en importar el mòdul)
+# -----------------------------------------------------------------------------
+# Evitem pow/round i la creació de diccionaris al camí crític de disparar notes.
+# Els valors es calculen amb les mateixes fórmules que abans: resultat idèntic.
+
+HARMONIC_COUNT = 13  # Uníson (0) fins a Octava (12 semitons)
+
+# Nota MIDI (0-127) -> freqüència PWM en Hz (enter)
+MIDI_FREQ_TABLE = array("H", [round(440 * (2 ** ((n - 69) / 12))) for n in range(128)])
+
+# Nota MIDI (0-127) × harmònic (0-12) -> nota transposada (índex nota*13+harmònic)
+HARMONIC_NOTE_TABLE = bytearray(
+    (n + h) if n + h < 127 else n
+    for n in range(128)
+    for h in range(HARMONIC_COUNT)
+)
+
+# Duty cycle en percentatge (0-99) -> valor PWM de 16 bits
+DUTY_CYCLE_TABLE = array("H", [int((p / 100.0) * 65535) for p in range(100)])
+
 
 def midi_to_frequency(midi_note):
     """Convierte nota MIDI a frecuencia en Hz"""
+    if 0 <= midi_note < 128:
+        return MIDI_FREQ_TABLE[midi_note]
     return round(440 * (2 ** ((midi_note - 69) / 12)))
 
 def midi_to_note_name(midi_note):
@@ -20,24 +45,16 @@ def midi_to_note_name(midi_note):
     return f"{note_names[note_index]}{octave}"
 
 def apply_harmonic_interval(note, harmonic_type):
-    """Aplica intervalo armónico a nota MIDI"""
-    harmonic_intervals = {
-        0: 0,    # Unísono - 0 semitons
-        1: 1,    # Segona menor - 1 semitó
-        2: 2,    # Segona major - 2 semitons
-        3: 3,    # Tercera menor - 3 semitons
-        4: 4,    # Tercera major - 4 semitons
-        5: 5,    # Quarta justa - 5 semitons
-        6: 6,    # Trítono - 6 semitons
-        7: 7,    # Quinta justa - 7 semitons
-        8: 8,    # Sisena menor - 8 semitons
-        9: 9,    # Sisena major - 9 semitons
-        10: 10,  # Sèptima menor - 10 semitons
-        11: 11,  # Sèptima major - 11 semitons
-        12: 12   # Octava - 12 semitons
-    }
+    """Aplica intervalo armónico a nota MIDI
     
-    harmonic = harmonic_intervals.get(harmonic_type, 0)
+    Intervals 0-12 semitons (uníson fins a octava); qualsevol altre valor
+    es tracta com a uníson. Si la nota resultant arriba a 127 es manté l'original.
+    """
+    if 0 <= note < 128 and 0 <= harmonic_type < HARMONIC_COUNT:
+        return HARMONIC_NOTE_TABLE[note * HARMONIC_COUNT + harmonic_type]
+
+    # Fora de taula: mateix càlcul que la taula
+    harmonic = harmonic_type if harmonic_type in range(HARMONIC_COUNT) else 0
     nota_modificada = note + harmonic
     
     if nota_modificada >= 127:
@@ -45,6 +62,12 @@ def apply_harmonic_interval(note, harmonic_type):
     
     return nota_modificada
 
+def duty_percent_to_cycle(percent):
+    """Converteix duty cycle de percentatge (1-99) a valor PWM (655-64880)"""
+    if 0 <= percent < 100:
+        return DUTY_CYCLE_TABLE[percent]
+    return int((percent / 100.0) * 65535)
+
 def map_value(value, in_min, in_max, out_min, out_max):
     """Mapea un valor de un rango a otro amb protecció de divisió"""
     if in_max == in_min: